@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            dev.bench_import_time
+:Synopsis:          Benchmark that measures the time required to import the PyDPlus package in a new interpreter
+:Usage:             ``python dev/bench_import_time.py [--statement STATEMENT] [--runs RUNS] [--budget-ms BUDGET_MS]``
+:Example:           ``python dev/bench_import_time.py --statement 'from pydplus import PyDPlus' --runs 20``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Define the modules that should not be loaded by a plain import of the package
+HEAVY_MODULES = ('requests', 'jwt', 'cryptography', 'yaml', 'sqlite3', 'httpx')
+
+# Define the source directory so that the benchmark measures the working tree rather than an installed package
+SOURCE_DIRECTORY = Path(__file__).resolve().parent.parent / 'src'
+
+
+def _run_with_importtime(statement: str) -> list[tuple[int, str]]:
+    """Run a statement with ``python -X importtime`` and return the cumulative time and name of the top-level imports."""
+    _python_path = os.pathsep.join(filter(None, (str(SOURCE_DIRECTORY), os.environ.get('PYTHONPATH'))))
+    _result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=_python_path),
+        text=True,
+    )
+    _imports = []
+    for _line in _result.stderr.splitlines():
+        if not _line.startswith('import time:') or _line.count('|') != 2:
+            continue
+        _self_us, _cumulative_us, _module = _line.removeprefix('import time:').split('|')
+        if _cumulative_us.strip().isdigit():
+            _imports.append((int(_cumulative_us), _module))
+    return _imports
+
+
+def measure_import_time(statement: str) -> tuple[float, list[str]]:
+    """Measure the time spent on the imports performed by a statement in a new interpreter.
+
+    The imports performed by the interpreter at startup are measured separately and excluded from the result.
+
+    :param statement: The import statement to execute (e.g. ``import pydplus``)
+    :type statement: str
+    :returns: The import time in milliseconds and the names of the heavy modules that were imported
+    """
+    _startup_modules = {_module.strip() for _cumulative_us, _module in _run_with_importtime('pass')}
+    _imports = _run_with_importtime(statement)
+
+    # Only the top-level imports (i.e. those not nested within another import) are counted to avoid counting twice
+    _total_us = sum(
+        _cumulative_us
+        for _cumulative_us, _module in _imports
+        if not _module.startswith('  ') and _module.strip() not in _startup_modules
+    )
+    _heavy_modules = [_module.strip() for _cumulative_us, _module in _imports if _module.strip() in HEAVY_MODULES]
+    return _total_us / 1000, _heavy_modules
+
+
+def main() -> int:
+    """Run the benchmark and report the import time statistics.
+
+    :returns: The exit code (``1`` if the median import time exceeds the budget)
+    """
+    _parser = argparse.ArgumentParser(description='Measure the time required to import the pydplus package.')
+    _parser.add_argument('--statement', default='import pydplus', help="the statement to measure ('import pydplus')")
+    _parser.add_argument('--runs', type=int, default=10, help='the number of interpreters to start (10)')
+    _parser.add_argument('--budget-ms', type=float, default=None, help='fail when the median exceeds this many ms')
+    _args = _parser.parse_args()
+
+    # Perform a warm-up run so that the bytecode cache does not skew the first measurement
+    measure_import_time(_args.statement)
+    _timings = []
+    _heavy_modules: list[str] = []
+    for _ in range(_args.runs):
+        _milliseconds, _heavy_modules = measure_import_time(_args.statement)
+        _timings.append(_milliseconds)
+
+    _median = statistics.median(_timings)
+    print(f'Statement:      {_args.statement}')
+    print(f'Runs:           {_args.runs}')
+    print(f'Median:         {_median:.1f} ms')
+    print(f'Min / Max:      {min(_timings):.1f} ms / {max(_timings):.1f} ms')
+    print(f'Heavy modules:  {", ".join(_heavy_modules) if _heavy_modules else "none"}')
+    if _args.budget_ms is not None and _median > _args.budget_ms:
+        print(f'The median import time exceeds the budget of {_args.budget_ms:.1f} ms', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            dev.bench_json_codecs
+:Synopsis:          Benchmark that compares the installed JSON codecs when encoding payloads and decoding responses
+:Usage:             ``python dev/bench_json_codecs.py [--users USERS] [--runs RUNS]``
+:Example:           ``python dev/bench_json_codecs.py --users 5000 --runs 20``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Define the source directory so that the benchmark measures the working tree rather than an installed package
+SOURCE_DIRECTORY = Path(__file__).resolve().parent.parent / 'src'
+sys.path.insert(0, str(SOURCE_DIRECTORY))
+
+from pydplus.utils.json_codec import get_available_json_codecs, get_json_codec  # noqa: E402
+
+
+def build_user_list(users: int) -> list[dict[str, Any]]:
+    """Build a list of user records that resembles a large user lookup or report response.
+
+    :param users: The number of user records
+    :type users: int
+    :returns: The list of user records
+    """
+    return [
+        {
+            'id': f'{_index:08x}-5f3a-4c1e-9d2b-{_index:012x}',
+            'emailAddress': f'user.{_index}@example.com',
+            'firstName': 'Zoë',
+            'lastName': f'User {_index}',
+            'userStatus': 'Enabled' if _index % 7 else 'Disabled',
+            'markDeleted': False,
+            'lastLoginTime': 1760659200 + _index,
+            'groups': [f'group-{_index % 10}', f'group-{_index % 13}'],
+            'attributes': {'department': 'Engineering', 'costCenter': _index % 100, 'score': _index / 3},
+        }
+        for _index in range(users)
+    ]
+
+
+def _time_call(func: Callable[[], Any], runs: int) -> float:
+    """Return the median duration of a call in milliseconds."""
+    _timings = []
+    for _ in range(runs):
+        _start = time.perf_counter()
+        func()
+        _timings.append((time.perf_counter() - _start) * 1000)
+    return statistics.median(_timings)
+
+
+def measure_codecs(users: int, runs: int) -> list[tuple[str, float, float, int]]:
+    """Measure the encoding and decoding time of every installed JSON codec.
+
+    :param users: The number of user records in the measured document
+    :type users: int
+    :param runs: The number of times each operation is timed
+    :type runs: int
+    :returns: The codec name, median encoding time (ms), median decoding time (ms), and encoded size (bytes)
+    """
+    _document = build_user_list(users)
+    _results = []
+    for _name in get_available_json_codecs():
+        _codec = get_json_codec(_name)
+        _encoded = _codec.dumps(_document)
+        # Perform a warm-up call so that lazy initialization does not skew the first measurement
+        _codec.loads(_encoded)
+        _encode_ms = _time_call(lambda: _codec.dumps(_document), runs)
+        _decode_ms = _time_call(lambda: _codec.loads(_encoded), runs)
+        _results.append((_name, _encode_ms, _decode_ms, len(_encoded)))
+    return _results
+
+
+def main() -> int:
+    """Run the benchmark and report the results of each installed JSON codec.
+
+    :returns: The exit code
+    """
+    _parser = argparse.ArgumentParser(description='Compare the JSON codecs available to the pydplus package.')
+    _parser.add_argument('--users', type=int, default=10000, help='the number of user records to encode (10000)')
+    _parser.add_argument('--runs', type=int, default=10, help='the number of times each operation is timed (10)')
+    _args = _parser.parse_args()
+
+    _results = measure_codecs(_args.users, _args.runs)
+    _baseline = {_name: (_encode_ms, _decode_ms) for _name, _encode_ms, _decode_ms, _size in _results}['json']
+    print(f'Users: {_args.users}    Runs: {_args.runs}    Automatic codec: {get_json_codec().name}')
+    print(f'{"Codec":<10}{"Encode (ms)":>14}{"Decode (ms)":>14}{"Speedup":>16}{"Size (bytes)":>15}')
+    for _name, _encode_ms, _decode_ms, _size in _results:
+        _speedup = f'{_baseline[0] / _encode_ms:.1f}x / {_baseline[1] / _decode_ms:.1f}x'
+        print(f'{_name:<10}{_encode_ms:>14.2f}{_decode_ms:>14.2f}{_speedup:>16}{_size:>15}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,14 +4,42 @@
 :Synopsis:          This is the ``__init__`` module for the pydplus package
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     30 Mar 2026
+:Modified Date:     17 Oct 2026
 """
 
-from . import core
-from .core import PyDPlus
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .utils import version
 
+if TYPE_CHECKING:
+    from . import core
+    from .core import PyDPlus
+
 __all__ = ['core', 'PyDPlus']
 
-# Define the package version by pulling from the pydplus.utils.version module
-__version__ = version.get_full_version()
+# Define the attributes that are imported on first access (PEP 562) so that importing the package stays lightweight
+_LAZY_ATTRIBUTES = {
+    'core': ('.core', None),
+    'PyDPlus': ('.core', 'PyDPlus'),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client module and its attributes, or resolve the package version, when they are first accessed."""
+    if name == '__version__':
+        # The version is pulled from the pydplus.utils.version module, which caches it after the first lookup
+        return version.get_full_version()
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    _module_name, _attribute_name = _LAZY_ATTRIBUTES[name]
+    _module = importlib.import_module(_module_name, __name__)
+    _value = _module if _attribute_name is None else getattr(_module, _attribute_name)
+    globals()[name] = _value
+    return _value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {'__version__'})
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""
+:Package:           pydplus.aio
+:Synopsis:          This module includes the asyncio client and its asynchronous API and user functions
+:Usage:             ``from pydplus.aio import AsyncPyDPlus``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+__all__ = ['api', 'core', 'users', 'AsyncPyDPlus']
+
+# Import modules automatically when aio module is imported
+from . import api, core, users
+from .core import AsyncPyDPlus
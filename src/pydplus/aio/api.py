@@ -0,0 +1,554 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.aio.api
+:Synopsis:          Defines the asynchronous functions associated with the RSA ID Plus API
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional, Union
+
+from .. import api as sync_api
+from .. import constants as const
+from .. import errors
+from ..utils.retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+def create_async_client(
+    pool_maxsize: int = const.CLIENT_SETTINGS.DEFAULT_ASYNC_POOL_MAXSIZE,
+    keep_alive: bool = const.CLIENT_SETTINGS.DEFAULT_KEEP_ALIVE_VALUE,
+    verify_ssl: bool = const.DEFAULT_VERIFY_SSL,
+):
+    """Create an ``httpx.AsyncClient`` with a shared connection pool to reuse connections across API calls.
+
+    .. note::
+       The `httpx <https://www.python-httpx.org/>`__ package is an optional dependency that can be installed
+       with the ``async`` extra. (e.g. ``pip install pydplus[async]``)
+
+    :param pool_maxsize: The maximum number of concurrent connections in the pool (``100`` by default)
+    :type pool_maxsize: int
+    :param keep_alive: Determines if connections should be kept alive between API calls (``True`` by default)
+    :type keep_alive: bool
+    :param verify_ssl: Determines if SSL connections should be verified (``True`` by default)
+    :type verify_ssl: bool
+    :returns: The configured ``httpx.AsyncClient`` object
+    :raises: :py:exc:`ImportError`,
+             :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    try:
+        import httpx
+    except ImportError as exc:
+        error_msg = "The 'httpx' package must be installed to use the asyncio client (pip install pydplus[async])"
+        logger.error("The 'httpx' package must be installed to use the asyncio client")
+        raise ImportError(error_msg) from exc
+
+    if not isinstance(pool_maxsize, int) or isinstance(pool_maxsize, bool):
+        error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=const.CLIENT_SETTINGS.POOL_MAXSIZE, data_type='int')
+        logger.error('A connection pool setting is an invalid data type')
+        raise TypeError(error_msg)
+    if pool_maxsize < 1:
+        error_msg = f"The '{const.CLIENT_SETTINGS.POOL_MAXSIZE}' value must be a positive integer"
+        logger.error('A connection pool setting must be a positive integer')
+        raise ValueError(error_msg)
+    if not isinstance(keep_alive, bool):
+        error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=const.CLIENT_SETTINGS.KEEP_ALIVE, data_type='bool')
+        logger.error("The 'keep_alive' setting is an invalid data type")
+        raise TypeError(error_msg)
+
+    limits = httpx.Limits(
+        max_connections=pool_maxsize,
+        max_keepalive_connections=pool_maxsize if keep_alive else 0,
+    )
+    return httpx.AsyncClient(limits=limits, verify=verify_ssl)
+
+
+async def get(
+    pydp_object,
+    endpoint: str,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    api_type: str = const.DEFAULT_API_TYPE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    return_json: bool = True,
+    allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+):
+    """Perform an asynchronous GET request against the ID Plus tenant.
+
+    :param pydp_object: The instantiated asynchronous pydplus object
+    :type pydp_object: class[pydplus.aio.AsyncPyDPlus]
+    :param endpoint: The API endpoint to query
+    :type endpoint: str
+    :param params: The query parameters (where applicable)
+    :type params: dict, None
+    :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+    :type headers: dict, None
+    :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+    :type api_type: str
+    :param timeout: The timeout period in seconds (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+    :type return_json: bool
+    :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                  (If not explicitly defined then ``True`` if Strict Mode is disabled)
+    :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
+    :returns: The API response in JSON format or as an ``httpx`` response object
+    :raises: :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`,
+             :py:exc:`errors.exceptions.InvalidFieldError`
+    """
+    return await _perform_api_call(
+        pydp_object=pydp_object,
+        method=const.API_REQUEST_TYPES.GET,
+        endpoint=endpoint,
+        params=params,
+        headers=headers,
+        api_type=api_type,
+        timeout=timeout,
+        show_full_error=show_full_error,
+        return_json=return_json,
+        allow_failed_response=allow_failed_response,
+        retry_policy=retry_policy,
+        idempotent=idempotent,
+    )
+
+
+async def api_call_with_payload(
+    pydp_object,
+    method: str,
+    endpoint: str,
+    payload: Union[Optional[dict], Optional[str]] = None,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    api_type: str = const.DEFAULT_API_TYPE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    return_json: bool = True,
+    allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+):
+    """Perform an asynchronous API call with payload against the ID Plus tenant.
+
+    :param pydp_object: The instantiated asynchronous pydplus object
+    :type pydp_object: class[pydplus.aio.AsyncPyDPlus]
+    :param method: The API method (``post``, ``put``, or ``patch``)
+    :type method: str
+    :param endpoint: The API endpoint to query
+    :type endpoint: str
+    :param payload: The payload to leverage in the API call
+    :type payload: dict, str, None
+    :param params: The query parameters (where applicable)
+    :type params: dict, None
+    :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+    :type headers: dict, None
+    :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+    :type api_type: str
+    :param timeout: The timeout period in seconds (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+    :type return_json: bool
+    :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                  (If not explicitly defined then ``True`` if Strict Mode is disabled)
+    :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
+    :returns: The API response in JSON format or as an ``httpx`` response object
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`errors.exceptions.APIMethodError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`,
+             :py:exc:`errors.exceptions.InvalidFieldError`
+    """
+    _validate_payload_method(method, payload)
+    return await _perform_api_call(
+        pydp_object=pydp_object,
+        method=method.upper(),
+        endpoint=endpoint,
+        payload=payload,
+        params=params,
+        headers=headers,
+        api_type=api_type,
+        timeout=timeout,
+        show_full_error=show_full_error,
+        return_json=return_json,
+        allow_failed_response=allow_failed_response,
+        retry_policy=retry_policy,
+        idempotent=idempotent,
+    )
+
+
+async def post(
+    pydp_object,
+    endpoint: str,
+    payload: Union[Optional[dict], Optional[str]] = None,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    api_type: str = const.DEFAULT_API_TYPE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    return_json: bool = True,
+    allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+):
+    """Perform an asynchronous POST call with payload against the ID Plus tenant.
+
+    :param pydp_object: The instantiated asynchronous pydplus object
+    :type pydp_object: class[pydplus.aio.AsyncPyDPlus]
+    :param endpoint: The API endpoint to query
+    :type endpoint: str
+    :param payload: The payload to leverage in the API call
+    :type payload: dict, str, None
+    :param params: The query parameters (where applicable)
+    :type params: dict, None
+    :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+    :type headers: dict, None
+    :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+    :type api_type: str
+    :param timeout: The timeout period in seconds (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+    :type return_json: bool
+    :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                  (If not explicitly defined then ``True`` if Strict Mode is disabled)
+    :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
+    :returns: The API response in JSON format or as an ``httpx`` response object
+    :raises: :py:exc:`errors.exceptions.APIMethodError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`,
+             :py:exc:`errors.exceptions.InvalidFieldError`
+    """
+    return await api_call_with_payload(
+        pydp_object=pydp_object,
+        method=const.API_REQUEST_TYPES.POST,
+        endpoint=endpoint,
+        payload=payload,
+        params=params,
+        headers=headers,
+        api_type=api_type,
+        timeout=timeout,
+        show_full_error=show_full_error,
+        return_json=return_json,
+        allow_failed_response=allow_failed_response,
+        retry_policy=retry_policy,
+        idempotent=idempotent,
+    )
+
+
+async def patch(
+    pydp_object,
+    endpoint: str,
+    payload: Union[Optional[dict], Optional[str]] = None,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    api_type: str = const.DEFAULT_API_TYPE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    return_json: bool = True,
+    allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+):
+    """Perform an asynchronous PATCH call with payload against the ID Plus tenant.
+
+    :param pydp_object: The instantiated asynchronous pydplus object
+    :type pydp_object: class[pydplus.aio.AsyncPyDPlus]
+    :param endpoint: The API endpoint to query
+    :type endpoint: str
+    :param payload: The payload to leverage in the API call
+    :type payload: dict, str, None
+    :param params: The query parameters (where applicable)
+    :type params: dict, None
+    :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+    :type headers: dict, None
+    :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+    :type api_type: str
+    :param timeout: The timeout period in seconds (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+    :type return_json: bool
+    :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                  (If not explicitly defined then ``True`` if Strict Mode is disabled)
+    :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
+    :returns: The API response in JSON format or as an ``httpx`` response object
+    :raises: :py:exc:`errors.exceptions.APIMethodError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`,
+             :py:exc:`errors.exceptions.InvalidFieldError`
+    """
+    return await api_call_with_payload(
+        pydp_object=pydp_object,
+        method=const.API_REQUEST_TYPES.PATCH,
+        endpoint=endpoint,
+        payload=payload,
+        params=params,
+        headers=headers,
+        api_type=api_type,
+        timeout=timeout,
+        show_full_error=show_full_error,
+        return_json=return_json,
+        allow_failed_response=allow_failed_response,
+        retry_policy=retry_policy,
+        idempotent=idempotent,
+    )
+
+
+async def put(
+    pydp_object,
+    endpoint: str,
+    payload: Union[Optional[dict], Optional[str]] = None,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    api_type: str = const.DEFAULT_API_TYPE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    return_json: bool = True,
+    allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+):
+    """Perform an asynchronous PUT call with payload against the ID Plus tenant.
+
+    :param pydp_object: The instantiated asynchronous pydplus object
+    :type pydp_object: class[pydplus.aio.AsyncPyDPlus]
+    :param endpoint: The API endpoint to query
+    :type endpoint: str
+    :param payload: The payload to leverage in the API call
+    :type payload: dict, str, None
+    :param params: The query parameters (where applicable)
+    :type params: dict, None
+    :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+    :type headers: dict, None
+    :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+    :type api_type: str
+    :param timeout: The timeout period in seconds (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+    :type return_json: bool
+    :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                  (If not explicitly defined then ``True`` if Strict Mode is disabled)
+    :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
+    :returns: The API response in JSON format or as an ``httpx`` response object
+    :raises: :py:exc:`errors.exceptions.APIMethodError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`,
+             :py:exc:`errors.exceptions.InvalidFieldError`
+    """
+    return await api_call_with_payload(
+        pydp_object=pydp_object,
+        method=const.API_REQUEST_TYPES.PUT,
+        endpoint=endpoint,
+        payload=payload,
+        params=params,
+        headers=headers,
+        api_type=api_type,
+        timeout=timeout,
+        show_full_error=show_full_error,
+        return_json=return_json,
+        allow_failed_response=allow_failed_response,
+        retry_policy=retry_policy,
+        idempotent=idempotent,
+    )
+
+
+def _validate_payload_method(_method: str, _payload: Union[Optional[dict], Optional[str]]) -> None:
+    """Validate the API method and payload data type before performing an API call with payload."""
+    _valid_methods = (const.API_REQUEST_TYPES.POST, const.API_REQUEST_TYPES.PATCH, const.API_REQUEST_TYPES.PUT)
+    if isinstance(_method, str) and _method.upper() == const.API_REQUEST_TYPES.GET:
+        _error_msg = 'The GET API call method is not valid when a payload has been provided.'
+        logger.error('The GET API call method is not valid when a payload has been provided')
+        raise errors.exceptions.APIMethodError(_error_msg)
+    if not isinstance(_method, str) or _method.upper() not in _valid_methods:
+        _error_msg = 'A valid API call method (POST or PATCH or PUT) must be defined.'
+        logger.error('A valid API call method must be defined')
+        raise errors.exceptions.APIMethodError(_error_msg)
+    if not isinstance(_payload, (dict, str)):
+        _error_msg = f'The API payload must be a dictionary or string (provided: {type(_payload)})'
+        logger.error('The API payload must be a dictionary or string')
+        raise TypeError(_error_msg)
+
+
+async def _get_headers(
+    _pydp_object,
+    _additional_headers: Optional[dict] = None,
+    _api_type: str = const.DEFAULT_API_TYPE,
+    _force_token_refresh: bool = const.AUTH_VALUES.OAUTH_DEFAULT_FORCE_REFRESH,
+    _rejected_headers: Optional[dict] = None,
+) -> dict:
+    """Return the appropriate HTTP headers to use for asynchronous API calls."""
+    _additional_headers = {} if _additional_headers is None else _additional_headers
+    _headers = dict(_pydp_object.base_headers) if isinstance(_pydp_object.base_headers, dict) else {}
+
+    if sync_api._is_admin_oauth_request(_pydp_object, _api_type):
+        if _force_token_refresh:
+            _headers = dict(await _pydp_object.refresh_oauth_token(rejected_headers=_rejected_headers))
+        else:
+            _headers = dict(await _pydp_object._ensure_oauth_headers())
+    elif sync_api._is_renewable_legacy_request(_pydp_object):
+        # Signing a legacy JWT does not perform any I/O so the synchronous methods are used
+        if _force_token_refresh:
+            _headers = dict(_pydp_object.refresh_legacy_token(rejected_headers=_rejected_headers))
+        else:
+            _headers = dict(_pydp_object._ensure_legacy_headers())
+
+    _headers.update(_additional_headers)
+    return _headers
+
+
+async def _send_request(
+    _pydp_object,
+    _method: str,
+    _full_api_url: str,
+    _headers: dict,
+    _params: dict,
+    _timeout: int,
+    _payload: Union[Optional[dict], Optional[str]] = None,
+):
+    """Send a single request through the shared asynchronous connection pool of the client object."""
+    _rate_limiter = getattr(_pydp_object, 'rate_limiter', None)
+    if _rate_limiter is not None:
+        await _rate_limiter.acquire_async()
+    # Encode dictionary payloads with the JSON codec of the client object (when defined) rather than the httpx package
+    _json_codec = sync_api._get_json_codec(_pydp_object)
+    if isinstance(_payload, dict) and _json_codec is not None:
+        _payload = _json_codec.dumps(_payload)
+        _headers = {const.HEADERS.CONTENT_TYPE: const.CONTENT_TYPES.JSON, **_headers}
+    _request_kwargs = {'headers': _headers, 'params': _params, 'timeout': _timeout}
+    if isinstance(_payload, dict):
+        _request_kwargs['json'] = _payload
+    elif isinstance(_payload, (str, bytes)):
+        _request_kwargs['content'] = _payload
+    return await _pydp_object.session.request(_method, _full_api_url, **_request_kwargs)
+
+
+def _get_retryable_exceptions() -> tuple:
+    """Return the ``httpx`` exceptions that indicate a transient connection failure which may be retried."""
+    try:
+        import httpx
+    except ImportError:
+        return ()
+    return (httpx.TransportError,)
+
+
+async def _send_with_retries(
+    _pydp_object,
+    _method: str,
+    _full_api_url: str,
+    _headers: dict,
+    _params: dict,
+    _timeout: int,
+    _payload: Union[Optional[dict], Optional[str]] = None,
+    _retry_policy: Optional[RetryPolicy] = None,
+    _idempotent: Optional[bool] = None,
+):
+    """Send a request and retry transient failures with backoff without blocking the event loop."""
+    _retryable_exceptions = _get_retryable_exceptions()
+    _attempt = 1
+    while True:
+        try:
+            _response = await _send_request(_pydp_object, _method, _full_api_url, _headers, _params, _timeout, _payload)
+        except _retryable_exceptions:
+            if _retry_policy is None or not _retry_policy.should_retry_exception(_method, _attempt, _idempotent):
+                raise
+            _delay = _retry_policy.get_delay(_attempt)
+        else:
+            if _retry_policy is None or not _retry_policy.should_retry_response(_method, _response, _attempt, _idempotent):
+                return _response
+            _delay = _retry_policy.get_delay(_attempt, _response)
+        logger.warning(
+            f'The API call failed with a transient error and will be retried in {_delay:.2f} seconds (attempt {_attempt})'
+        )
+        await asyncio.sleep(_delay)
+        _attempt += 1
+
+
+async def _perform_api_call(
+    pydp_object,
+    method: str,
+    endpoint: str,
+    payload: Union[Optional[dict], Optional[str]] = None,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    api_type: str = const.DEFAULT_API_TYPE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    return_json: bool = True,
+    allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+):
+    """Perform an asynchronous API call and examine the response using the same semantics as the synchronous client."""
+    # Define the parameters as an empty dictionary if none are provided
+    params = {} if params is None else params
+
+    # Define the headers
+    additional_headers = {} if headers is None else dict(headers)
+    request_headers = await _get_headers(pydp_object, _additional_headers=additional_headers, _api_type=api_type)
+
+    # Perform the API call
+    full_api_url = sync_api._get_full_api_url(pydp_object, endpoint, api_type)
+    retry_policy = sync_api._get_retry_policy(pydp_object, retry_policy)
+    response = await _send_with_retries(
+        pydp_object, method, full_api_url, request_headers, params, timeout, payload, retry_policy, idempotent
+    )
+
+    # Retry once after a forced OAuth token refresh or legacy JWT renewal when the token is rejected.
+    if sync_api._should_retry_after_401(pydp_object, api_type, response):
+        logger.debug('The access token was rejected and will be refreshed before trying the API call again')
+        request_headers = await _get_headers(
+            pydp_object,
+            _additional_headers=additional_headers,
+            _api_type=api_type,
+            _force_token_refresh=True,
+            _rejected_headers=request_headers,
+        )
+        response = await _send_with_retries(
+            pydp_object, method, full_api_url, request_headers, params, timeout, payload, retry_policy, idempotent
+        )
+
+    # Examine the result
+    allow_failed_response = sync_api._should_allow_failed_responses(pydp_object, allow_failed_response)
+    if response.status_code >= 300 and not allow_failed_response:
+        sync_api._raise_status_code_exception(response, method, show_full_error)
+    if return_json:
+        response = sync_api._convert_response_to_json(response, allow_failed_response, sync_api._get_json_codec(pydp_object))
+    return response
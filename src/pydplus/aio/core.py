@@ -0,0 +1,763 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.aio.core
+:Synopsis:          This module performs the core operations of the asyncio client
+:Usage:             ``from pydplus.aio import AsyncPyDPlus``
+:Example:           ``async with AsyncPyDPlus() as pydp:``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional, Tuple
+
+from .. import auth, errors
+from .. import constants as const
+from ..core import PyDPlus
+from ..utils.retry import RetryPolicy
+from . import api
+from . import users as users_module
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPyDPlus(PyDPlus):
+    """Class for the asyncio client object.
+
+    The connection info, environment variables, helper settings and Strict Mode are resolved exactly as they are
+    with the :py:class:`pydplus.PyDPlus` client object, while API calls are awaited and performed through a single
+    ``httpx.AsyncClient`` connection pool that is shared by every coroutine using the object.
+
+    .. note::
+       The `httpx <https://www.python-httpx.org/>`__ package is an optional dependency that can be installed
+       with the ``async`` extra. (e.g. ``pip install pydplus[async]``)
+
+    .. note::
+       The audit log methods are only available with the :py:class:`pydplus.PyDPlus` client object, so the
+       ``audit`` attribute of the asyncio client object is ``None``.
+
+    :param args: Positional arguments that are passed to the :py:class:`pydplus.PyDPlus` client object
+    :param auto_connect: Determines if the connection should be established automatically when the first API call is
+                         awaited (``True`` by default)
+    :type auto_connect: bool
+    :param pool_maxsize: The maximum number of concurrent connections in the shared pool (``100`` by default)
+    :type pool_maxsize: int
+    :param kwargs: Keyword arguments that are passed to the :py:class:`pydplus.PyDPlus` client object
+    :returns: None
+    :raises: :py:exc:`ImportError`,
+             :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`pydplus.errors.exceptions.MissingRequiredDataError`
+    """
+
+    def __init__(
+        self,
+        *args,
+        auto_connect: bool = const.CLIENT_SETTINGS.DEFAULT_AUTO_CONNECT_VALUE,
+        pool_maxsize: int = const.CLIENT_SETTINGS.DEFAULT_ASYNC_POOL_MAXSIZE,
+        **kwargs,
+    ):
+        """Instantiate the asyncio client object."""
+        # The connection cannot be awaited during instantiation so it is established lazily by the first API call
+        super().__init__(*args, auto_connect=False, pool_maxsize=pool_maxsize, **kwargs)
+        self.auto_connect = auto_connect
+        self._connect_lock = asyncio.Lock()
+        self._oauth_lock = asyncio.Lock()
+
+    def __enter__(self):
+        """Prevent the asyncio client object from being used as a synchronous context manager."""
+        _error_msg = "The AsyncPyDPlus object must be used with 'async with' rather than 'with'"
+        logger.error('The asyncio client object must be used as an asynchronous context manager')
+        raise TypeError(_error_msg)
+
+    async def __aenter__(self) -> AsyncPyDPlus:
+        """Return the client object when used as an asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the client object when exiting the asynchronous context manager."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared connection pool and release any connections held by the client object.
+
+        :returns: None
+        """
+        await self._stop_oauth_refresher_async()
+        if self.session is not None:
+            await self.session.aclose()
+            logger.debug('The shared connection pool for the asyncio client object has been closed')
+
+    def _start_oauth_refresher(self) -> None:
+        """Start the background task that refreshes the OAuth access token before it expires (when enabled)."""
+        if not self._should_refresh_oauth_in_background():
+            return
+        if self._oauth_refresher is not None and not self._oauth_refresher.done():
+            return
+        self._oauth_refresher = asyncio.get_running_loop().create_task(self._run_oauth_refresher())
+        logger.debug('Started the background OAuth access token refresh')
+
+    async def _stop_oauth_refresher_async(self) -> None:
+        """Cancel the background task that refreshes the OAuth access token (if running)."""
+        _refresher, self._oauth_refresher = self._oauth_refresher, None
+        if _refresher is None or _refresher.done():
+            return
+        _refresher.cancel()
+        try:
+            await _refresher
+        except asyncio.CancelledError:
+            pass
+        logger.debug('Stopped the background OAuth access token refresh')
+
+    async def _run_oauth_refresher(self) -> None:
+        """Refresh the OAuth access token in the background until the task is cancelled."""
+        _delay = None
+        _scheduled_headers = None
+        while True:
+            if _delay is None:
+                # Capture the headers of the token being refreshed so that a token replaced in the meantime is kept
+                _scheduled_headers = dict(self.base_headers)
+                _delay = auth._get_oauth_refresh_delay(self._oauth_token_data, self.oauth_refresh_ratio)
+            await asyncio.sleep(_delay)
+            try:
+                # The refresh is skipped if the token has already been replaced since it was scheduled
+                await self.refresh_oauth_token(rejected_headers=_scheduled_headers)
+                _delay = None
+            except Exception as exc:
+                exc_type = errors.handlers.get_exception_type(exc)
+                logger.error(f'Failed to refresh the OAuth access token in the background due to a {exc_type} exception')
+                _delay = const.AUTH_VALUES._OAUTH_REFRESH_RETRY_SECONDS
+
+    def _create_session(self, _pool_connections: int, _pool_maxsize: int, _keep_alive: bool):
+        """Create the shared asynchronous connection pool that is reused by all API calls and OAuth token requests."""
+        return api.create_async_client(_pool_maxsize, _keep_alive, self.verify_ssl)
+
+    def _import_user_class(self):
+        """Allow the :py:class:`pydplus.aio.AsyncPyDPlus.User` class to be utilized within the core object."""
+        return AsyncPyDPlus.User(self)
+
+    def _import_audit_class(self):
+        """Disable the audit log methods, which perform synchronous API calls that cannot use the asyncio client."""
+        return None
+
+    async def _ensure_oauth_headers(self, force_refresh: bool = False, rejected_headers: Optional[dict] = None) -> dict[str, str]:
+        """Ensure valid OAuth headers are available for Administration API calls.
+
+        :param force_refresh: Forces an access-token refresh and bypasses the token cache (``False`` by default)
+        :type force_refresh: bool
+        :param rejected_headers: The headers of a request whose access token was rejected, which allows a forced
+                                 refresh to be skipped when the token has already been replaced by another coroutine
+        :type rejected_headers: dict, None
+        :returns: The base headers containing a valid OAuth access token
+        """
+        if self.connection_type != const.CONNECTION_INFO.OAUTH:
+            return self.base_headers
+        async with self._oauth_lock:
+            if force_refresh and auth._was_access_token_replaced(self.base_headers, rejected_headers):
+                logger.debug('The rejected OAuth access token was already refreshed by another coroutine')
+                force_refresh = False
+            base_headers, self._oauth_token_data = await auth.get_oauth_headers_async(
+                connection_info=self.connection_info,
+                client=self.session,
+                token_data=self._oauth_token_data,
+                force_refresh=force_refresh,
+                token_store=self.token_store,
+            )
+            self.base_headers = base_headers
+        return base_headers
+
+    async def refresh_oauth_token(self, rejected_headers: Optional[dict] = None) -> dict[str, str]:
+        """Force refresh the OAuth access token and return updated base headers.
+
+        :param rejected_headers: The headers of a request whose access token was rejected (optional)
+        :type rejected_headers: dict, None
+        :returns: The base headers containing the refreshed OAuth access token
+        """
+        return await self._ensure_oauth_headers(force_refresh=True, rejected_headers=rejected_headers)
+
+    async def _check_if_connected(self) -> None:
+        """Check to see if the object is connected to the tenant and connects or raises an exception if not."""
+        if self.connected:
+            return
+        if self.auto_connect:
+            async with self._connect_lock:
+                if not self.connected:
+                    self.connected, self.base_headers = await self.connect()
+            return
+        _error_msg = 'Must be connected to the tenant before performing an API call. Call the connect() method.'
+        logger.error('The client must be connected before performing an API call')
+        raise errors.exceptions.APIConnectionError(_error_msg)
+
+    async def connect(self) -> Tuple[bool, dict[str, str]]:
+        """Connect to the RSA ID Plus tenant using the Legacy API or OAuth method.
+
+        :returns: Boolean value indicating if connection was established and dictionary with base API headers
+        :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                 :py:exc:`errors.exceptions.FeatureNotConfiguredError`
+        """
+        base_headers = self.base_headers
+        connected = self.connected
+        if connected and self.connection_type != const.CLIENT_SETTINGS.CONNECTION_TYPE_OAUTH:
+            logger.debug('The client is already connected to the RSA ID Plus tenant')
+            return connected, base_headers
+
+        if self.connection_type == const.CLIENT_SETTINGS.CONNECTION_TYPE_LEGACY:
+            # Connect to the tenant using the legacy API method (no network request is required)
+            try:
+                base_headers = self._ensure_legacy_headers()
+                self._oauth_token_data = None
+                connected = True
+            except Exception as exc:
+                exc_type = type(exc).__name__
+                error_msg = f'Failed to connect using Legacy API due to the following {exc_type} exception'
+                logger.error('Failed to connect using Legacy API')
+                raise errors.exceptions.APIConnectionError(error_msg)
+        elif self.connection_type == const.CLIENT_SETTINGS.CONNECTION_TYPE_OAUTH:
+            # Connect to the tenant using the OAuth method
+            try:
+                base_headers = await self._ensure_oauth_headers(force_refresh=connected)
+                connected = True
+                self._start_oauth_refresher()
+            except Exception as exc:
+                exc_type = type(exc).__name__
+                error_msg = f'Failed to connect using OAuth due to the following {exc_type} exception'
+                logger.error('Failed to connect using OAuth')
+                raise errors.exceptions.APIConnectionError(error_msg)
+        else:
+            error_msg = 'Unsupported connection_type configured'
+            logger.error('Unsupported connection_type configured')
+            raise errors.exceptions.APIConnectionError(error_msg)
+        self.connected, self.base_headers = connected, base_headers
+        return connected, base_headers
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        api_type: str = const.ADMIN_API_TYPE,
+        timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        show_full_error: bool = True,
+        return_json: bool = True,
+        allow_failed_response: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+    ):
+        """Perform an asynchronous GET request against the ID Plus tenant.
+
+        :param endpoint: The API endpoint to query
+        :type endpoint: str
+        :param params: The query parameters (where applicable)
+        :type params: dict, None
+        :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+        :type headers: dict, None
+        :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+        :type api_type: str
+        :param timeout: The timeout period in seconds (defaults to ``30``)
+        :type timeout: int
+        :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+        :type show_full_error: bool
+        :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+        :type return_json: bool
+        :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                      (If not explicitly defined then ``True`` if Strict Mode is disabled)
+        :type allow_failed_response: bool, None
+        :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+        :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+        :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+        :type idempotent: bool, None
+        :returns: The API response in JSON format or as an ``httpx`` response object
+        :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                 :py:exc:`errors.exceptions.APIRequestError`,
+                 :py:exc:`errors.exceptions.APIResponseConversionError`,
+                 :py:exc:`errors.exceptions.InvalidFieldError`
+        """
+        await self._check_if_connected()
+        return await api.get(
+            self,
+            endpoint=endpoint,
+            params=params,
+            headers=headers,
+            api_type=api_type,
+            timeout=timeout,
+            show_full_error=show_full_error,
+            return_json=return_json,
+            allow_failed_response=allow_failed_response,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+        )
+
+    async def patch(
+        self,
+        endpoint: str,
+        payload: dict,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        api_type: str = const.ADMIN_API_TYPE,
+        timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        show_full_error: bool = True,
+        return_json: bool = True,
+        allow_failed_response: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+    ):
+        """Perform an asynchronous PATCH call with payload against the ID Plus tenant.
+
+        :param endpoint: The API endpoint to query
+        :type endpoint: str
+        :param payload: The payload to leverage in the API call
+        :type payload: dict
+        :param params: The query parameters (where applicable)
+        :type params: dict, None
+        :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+        :type headers: dict, None
+        :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+        :type api_type: str
+        :param timeout: The timeout period in seconds (defaults to ``30``)
+        :type timeout: int
+        :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+        :type show_full_error: bool
+        :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+        :type return_json: bool
+        :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                      (If not explicitly defined then ``True`` if Strict Mode is disabled)
+        :type allow_failed_response: bool, None
+        :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+        :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+        :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+        :type idempotent: bool, None
+        :returns: The API response in JSON format or as an ``httpx`` response object
+        :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                 :py:exc:`errors.exceptions.APIMethodError`,
+                 :py:exc:`errors.exceptions.APIRequestError`,
+                 :py:exc:`errors.exceptions.APIResponseConversionError`,
+                 :py:exc:`errors.exceptions.InvalidFieldError`
+        """
+        await self._check_if_connected()
+        return await api.patch(
+            self,
+            endpoint=endpoint,
+            payload=payload,
+            params=params,
+            headers=headers,
+            api_type=api_type,
+            timeout=timeout,
+            show_full_error=show_full_error,
+            return_json=return_json,
+            allow_failed_response=allow_failed_response,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        payload: dict,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        api_type: str = const.ADMIN_API_TYPE,
+        timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        show_full_error: bool = True,
+        return_json: bool = True,
+        allow_failed_response: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+    ):
+        """Perform an asynchronous POST call with payload against the ID Plus tenant.
+
+        :param endpoint: The API endpoint to query
+        :type endpoint: str
+        :param payload: The payload to leverage in the API call
+        :type payload: dict
+        :param params: The query parameters (where applicable)
+        :type params: dict, None
+        :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+        :type headers: dict, None
+        :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+        :type api_type: str
+        :param timeout: The timeout period in seconds (defaults to ``30``)
+        :type timeout: int
+        :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+        :type show_full_error: bool
+        :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+        :type return_json: bool
+        :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                      (If not explicitly defined then ``True`` if Strict Mode is disabled)
+        :type allow_failed_response: bool, None
+        :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+        :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+        :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+        :type idempotent: bool, None
+        :returns: The API response in JSON format or as an ``httpx`` response object
+        :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                 :py:exc:`errors.exceptions.APIMethodError`,
+                 :py:exc:`errors.exceptions.APIRequestError`,
+                 :py:exc:`errors.exceptions.APIResponseConversionError`,
+                 :py:exc:`errors.exceptions.InvalidFieldError`
+        """
+        await self._check_if_connected()
+        return await api.post(
+            self,
+            endpoint=endpoint,
+            payload=payload,
+            params=params,
+            headers=headers,
+            api_type=api_type,
+            timeout=timeout,
+            show_full_error=show_full_error,
+            return_json=return_json,
+            allow_failed_response=allow_failed_response,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+        )
+
+    async def put(
+        self,
+        endpoint: str,
+        payload: dict,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        api_type: str = const.ADMIN_API_TYPE,
+        timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        show_full_error: bool = True,
+        return_json: bool = True,
+        allow_failed_response: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+    ):
+        """Perform an asynchronous PUT call with payload against the ID Plus tenant.
+
+        :param endpoint: The API endpoint to query
+        :type endpoint: str
+        :param payload: The payload to leverage in the API call
+        :type payload: dict
+        :param params: The query parameters (where applicable)
+        :type params: dict, None
+        :param headers: Specific API headers to use when performing the API call (beyond the base headers)
+        :type headers: dict, None
+        :param api_type: Indicates if the ``admin`` (default) or ``auth`` API will be leveraged.
+        :type api_type: str
+        :param timeout: The timeout period in seconds (defaults to ``30``)
+        :type timeout: int
+        :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+        :type show_full_error: bool
+        :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+        :type return_json: bool
+        :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                      (If not explicitly defined then ``True`` if Strict Mode is disabled)
+        :type allow_failed_response: bool, None
+        :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+        :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+        :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+        :type idempotent: bool, None
+        :returns: The API response in JSON format or as an ``httpx`` response object
+        :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                 :py:exc:`errors.exceptions.APIMethodError`,
+                 :py:exc:`errors.exceptions.APIRequestError`,
+                 :py:exc:`errors.exceptions.APIResponseConversionError`,
+                 :py:exc:`errors.exceptions.InvalidFieldError`
+        """
+        await self._check_if_connected()
+        return await api.put(
+            self,
+            endpoint=endpoint,
+            payload=payload,
+            params=params,
+            headers=headers,
+            api_type=api_type,
+            timeout=timeout,
+            show_full_error=show_full_error,
+            return_json=return_json,
+            allow_failed_response=allow_failed_response,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+        )
+
+    class User:
+        """Class containing asynchronous user-related methods."""
+
+        def __init__(self, pydp_object) -> None:
+            """Initialize the :py:class:`pydplus.aio.AsyncPyDPlus.User` inner class object.
+
+            :param pydp_object: The core :py:class:`pydplus.aio.AsyncPyDPlus` object
+            :type pydp_object: class[pydplus.aio.AsyncPyDPlus]
+            :returns: None
+            """
+            self.pydp_object: AsyncPyDPlus = pydp_object
+
+        async def get_user_details(
+            self,
+            email: str,
+            search_unsynced: Optional[bool] = None,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            return_json: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ):
+            """Retrieve the details for a specific user based on their email address.
+
+            :param email: The email address of the user for whom to retrieve details
+            :type email: str
+            :param search_unsynced: Indicates if the user search should include unsynchronized users (optional)
+            :type search_unsynced: bool, None
+            :param timeout: The timeout period in seconds (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+            :type return_json: bool
+            :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                          (If not explicitly defined then ``True`` if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The user details in JSON format or the API response as an ``httpx`` response object
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.APIMethodError`,
+                     :py:exc:`errors.exceptions.APIRequestError`,
+                     :py:exc:`errors.exceptions.APIResponseConversionError`,
+                     :py:exc:`errors.exceptions.InvalidFieldError`
+            """
+            await self.pydp_object._check_if_connected()
+            return await users_module.get_user_details(
+                self.pydp_object,
+                email=email,
+                search_unsynced=search_unsynced,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                return_json=return_json,
+                allow_failed_response=allow_failed_response,
+            )
+
+        async def get_user_id(
+            self,
+            email: Optional[str] = None,
+            user_details: Optional[dict] = None,
+            search_unsynced: Optional[bool] = None,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+        ) -> str:
+            """Retrieve the User ID associated with a specific user.
+
+            :param email: The email address of the user for whom to retrieve details
+            :type email: str, None
+            :param user_details: The user details data from the :py:func:`pydplus.aio.users.get_user_details` function
+            :type user_details: dict, None
+            :param search_unsynced: Indicates if the user search should include unsynchronized users (optional)
+            :type search_unsynced: bool, None
+            :param timeout: The timeout period in seconds (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :returns: The User ID for the given user as a string (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+                      or an empty string if the User ID could not be retrieved successfully
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.APIMethodError`,
+                     :py:exc:`errors.exceptions.APIRequestError`,
+                     :py:exc:`errors.exceptions.APIResponseConversionError`,
+                     :py:exc:`errors.exceptions.InvalidFieldError`,
+                     :py:exc:`errors.exceptions.MissingRequiredDataError`
+            """
+            await self.pydp_object._check_if_connected()
+            return await users_module.get_user_id(
+                self.pydp_object,
+                email=email,
+                user_details=user_details,
+                search_unsynced=search_unsynced,
+                timeout=timeout,
+                show_full_error=show_full_error,
+            )
+
+        async def enable_user(
+            self,
+            user_id: str,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            return_json: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ):
+            """Enable a user that is currently disabled.
+
+            :param user_id: The ID of an existing user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_id: str
+            :param timeout: The timeout period in seconds (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+            :type return_json: bool
+            :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                          (If not explicitly defined then ``True`` if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The API response in JSON format or as an ``httpx`` response object
+            :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.APIMethodError`,
+                     :py:exc:`errors.exceptions.APIRequestError`,
+                     :py:exc:`errors.exceptions.APIResponseConversionError`,
+                     :py:exc:`errors.exceptions.InvalidFieldError`
+            """
+            await self.pydp_object._check_if_connected()
+            return await users_module.enable_user(
+                self.pydp_object,
+                user_id=user_id,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                return_json=return_json,
+                allow_failed_response=allow_failed_response,
+            )
+
+        async def disable_user(
+            self,
+            user_id: str,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            return_json: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ):
+            """Disable a user that is currently enabled.
+
+            :param user_id: The ID of an existing user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_id: str
+            :param timeout: The timeout period in seconds (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+            :type return_json: bool
+            :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                          (If not explicitly defined then ``True`` if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The API response in JSON format or as an ``httpx`` response object
+            :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.APIMethodError`,
+                     :py:exc:`errors.exceptions.APIRequestError`,
+                     :py:exc:`errors.exceptions.APIResponseConversionError`,
+                     :py:exc:`errors.exceptions.InvalidFieldError`
+            """
+            await self.pydp_object._check_if_connected()
+            return await users_module.disable_user(
+                self.pydp_object,
+                user_id=user_id,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                return_json=return_json,
+                allow_failed_response=allow_failed_response,
+            )
+
+        async def synchronize_user(
+            self,
+            user_id: str,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            return_json: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ):
+            """Synchronize the details of a user between an identity source and the Cloud Access Service.
+
+            :param user_id: The ID of an existing user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_id: str
+            :param timeout: The timeout period in seconds (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+            :type return_json: bool
+            :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                          (If not explicitly defined then ``True`` if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The API response in JSON format or as an ``httpx`` response object
+            :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.APIMethodError`,
+                     :py:exc:`errors.exceptions.APIRequestError`,
+                     :py:exc:`errors.exceptions.APIResponseConversionError`,
+                     :py:exc:`errors.exceptions.InvalidFieldError`
+            """
+            await self.pydp_object._check_if_connected()
+            return await users_module.synchronize_user(
+                self.pydp_object,
+                user_id=user_id,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                return_json=return_json,
+                allow_failed_response=allow_failed_response,
+            )
+
+        async def mark_deleted(
+            self,
+            user_id: str,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            return_json: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ):
+            """Mark a specific user to be deleted during the next automated bulk deletion process.
+
+            :param user_id: The ID of an existing user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_id: str
+            :param timeout: The timeout period in seconds (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+            :type return_json: bool
+            :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                          (If not explicitly defined then ``True`` if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The API response in JSON format or as an ``httpx`` response object
+            :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.APIMethodError`,
+                     :py:exc:`errors.exceptions.APIRequestError`,
+                     :py:exc:`errors.exceptions.APIResponseConversionError`,
+                     :py:exc:`errors.exceptions.InvalidFieldError`
+            """
+            await self.pydp_object._check_if_connected()
+            return await users_module.mark_deleted(
+                self.pydp_object,
+                user_id=user_id,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                return_json=return_json,
+                allow_failed_response=allow_failed_response,
+            )
+
+        async def unmark_deleted(
+            self,
+            user_id: str,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            return_json: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ):
+            """Unmark a specific user that was flagged to be deleted.
+
+            :param user_id: The ID of an existing user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_id: str
+            :param timeout: The timeout period in seconds (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param return_json: Determines if the response should be returned in JSON format (defaults to ``True``)
+            :type return_json: bool
+            :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                          (If not explicitly defined then ``True`` if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The API response in JSON format or as an ``httpx`` response object
+            :raises: :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.APIMethodError`,
+                     :py:exc:`errors.exceptions.APIRequestError`,
+                     :py:exc:`errors.exceptions.APIResponseConversionError`,
+                     :py:exc:`errors.exceptions.InvalidFieldError`
+            """
+            await self.pydp_object._check_if_connected()
+            return await users_module.unmark_deleted(
+                self.pydp_object,
+                user_id=user_id,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                return_json=return_json,
+                allow_failed_response=allow_failed_response,
+            )
@@ -3,22 +3,36 @@
 :Module:            pydplus.api
 :Synopsis:          Defines the basic functions associated with the RSA ID Plus API
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     30 Jun 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
+import hashlib
+import json
 import logging
+import time
+from collections.abc import Callable, Iterator
 from typing import Optional, Union
 
 import requests
 
 from . import constants as const
 from . import errors
+from .utils.coalesce import RequestCoalescer
+from .utils.json_codec import JsonCodec
+from .utils.json_stream import iter_json_array
+from .utils.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
+# Define the exceptions that indicate a transient connection failure which may be retried
+_RETRYABLE_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
 
 def get(
     pydp_object,
@@ -30,6 +44,10 @@ def get(
     show_full_error: bool = True,
     return_json: bool = True,
     allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+    coalesce: Optional[bool] = None,
+    stream: bool = False,
 ):
     """Perform a GET request against the ID Plus tenant.
 
@@ -52,11 +70,59 @@ def get(
     :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                   (If not explicitly defined then ``True`` if Strict Mode is disabled)
     :type allow_failed_response: bool, None
-    :returns: The API response in JSON format or as a ``requests`` object
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
+    :param coalesce: Determines if concurrent identical API calls should share a single request and its result
+                     (``True`` by default when supported by the client object and ``return_json`` is ``True``)
+    :type coalesce: bool, None
+    :param stream: Determines if the response body should be streamed rather than downloaded immediately, in which
+                   case a generator that yields the elements of the top-level JSON array is returned (or the response
+                   object, which must be closed by the caller, when ``return_json`` is ``False``)
+                   (``False`` by default)
+    :type stream: bool
+    :returns: The API response in JSON format, as a ``requests`` object, or as a generator of JSON array elements
     :raises: :py:exc:`errors.exceptions.APIRequestError`,
              :py:exc:`errors.exceptions.APIResponseConversionError`,
              :py:exc:`errors.exceptions.InvalidFieldError`
     """
+    # Streamed responses are consumed by a single caller, so they are never coalesced
+    if stream:
+        coalesce = False
+
+    # Share the result of an identical API call that is already in progress when applicable
+    request_coalescer = _get_request_coalescer(pydp_object, const.API_REQUEST_TYPES.GET, coalesce, return_json)
+    if request_coalescer is not None:
+        coalesce_key = _get_coalesce_key(
+            pydp_object,
+            _method=const.API_REQUEST_TYPES.GET,
+            _endpoint=endpoint,
+            _api_type=api_type,
+            _params=params,
+            _headers=headers,
+            _show_full_error=show_full_error,
+            _return_json=return_json,
+            _allow_failed_response=allow_failed_response,
+        )
+        if coalesce_key is not None:
+            perform_get = functools.partial(
+                get,
+                pydp_object,
+                endpoint=endpoint,
+                params=params,
+                headers=headers,
+                api_type=api_type,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                return_json=return_json,
+                allow_failed_response=allow_failed_response,
+                retry_policy=retry_policy,
+                idempotent=idempotent,
+                coalesce=False,
+            )
+            return request_coalescer.run(coalesce_key, perform_get, copy_result=_copy_json_result)
+
     # Define the parameters as an empty dictionary if none are provided
     params = {} if params is None else params
 
@@ -70,28 +136,48 @@ def get(
 
     # Perform the API call
     full_api_url = _get_full_api_url(pydp_object, endpoint, api_type)
-    response = requests.get(full_api_url, headers=request_headers, params=params, timeout=timeout, verify=pydp_object.verify_ssl)
+    http_client = _get_http_client(pydp_object)
+    retry_policy = _get_retry_policy(pydp_object, retry_policy)
+
+    def _send_get_request(_request_headers: dict):
+        """Send the GET request once the client-side rate limit permits it."""
+        _wait_for_rate_limit(pydp_object)
+        # The stream argument is only passed when needed so that the default request remains unchanged
+        _stream_kwargs = {'stream': True} if stream else {}
+        return http_client.get(
+            full_api_url,
+            headers=_request_headers,
+            params=params,
+            timeout=timeout,
+            verify=pydp_object.verify_ssl,
+            **_stream_kwargs,
+        )
+
+    response = _send_with_retries(
+        functools.partial(_send_get_request, request_headers), const.API_REQUEST_TYPES.GET, retry_policy, idempotent
+    )
 
-    # Retry once after a forced OAuth token refresh when the token is rejected.
-    if _should_retry_oauth_401(pydp_object, api_type, response):
-        logger.debug('The OAuth token was rejected and will be refreshed before trying the API call again')
+    # Retry once after a forced OAuth token refresh or legacy JWT renewal when the token is rejected.
+    if _should_retry_after_401(pydp_object, api_type, response):
+        logger.debug('The access token was rejected and will be refreshed before trying the API call again')
         request_headers = _get_headers(
             pydp_object,
             _additional_headers=additional_headers,
             _api_type=api_type,
-            _force_oauth_refresh=True,
+            _force_token_refresh=True,
+            _rejected_headers=request_headers,
         )
-        response = requests.get(
-            full_api_url, headers=request_headers, params=params, timeout=timeout, verify=pydp_object.verify_ssl
+        _close_response(response)
+        response = _send_with_retries(
+            functools.partial(_send_get_request, request_headers), const.API_REQUEST_TYPES.GET, retry_policy, idempotent
         )
 
     # Examine the result
-    allow_failed_response = _should_allow_failed_responses(pydp_object, allow_failed_response)
-    if response.status_code >= 300 and not allow_failed_response:
-        _raise_status_code_exception(response, const.API_REQUEST_TYPES.GET, show_full_error)
-    if return_json:
-        response = _convert_response_to_json(response, allow_failed_response)
-    return response
+    if stream and return_json:
+        return _examine_streamed_response(pydp_object, response, show_full_error, allow_failed_response)
+    return _examine_response(
+        pydp_object, response, const.API_REQUEST_TYPES.GET, show_full_error, return_json, allow_failed_response
+    )
 
 
 def api_call_with_payload(
@@ -106,6 +192,9 @@ def api_call_with_payload(
     show_full_error: bool = True,
     return_json: bool = True,
     allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+    coalesce: Optional[bool] = None,
 ):
     """Perform an API call with payload against the ID Plus tenant.
 
@@ -132,6 +221,13 @@ def api_call_with_payload(
     :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                   (If not explicitly defined then ``True`` if Strict Mode is disabled)
     :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
+    :param coalesce: Determines if concurrent identical API calls should share a single request and its result
+                     (``False`` by default as only read-only calls such as user lookups should be coalesced)
+    :type coalesce: bool, None
     :returns: The API response in JSON format or as a ``requests`` object
     :raises: :py:exc:`TypeError`,
              :py:exc:`errors.exceptions.APIMethodError`,
@@ -139,6 +235,40 @@ def api_call_with_payload(
              :py:exc:`errors.exceptions.APIResponseConversionError`,
              :py:exc:`errors.exceptions.InvalidFieldError`
     """
+    # Share the result of an identical API call that is already in progress when applicable
+    request_coalescer = _get_request_coalescer(pydp_object, method, coalesce, return_json)
+    if request_coalescer is not None:
+        coalesce_key = _get_coalesce_key(
+            pydp_object,
+            _method=method,
+            _endpoint=endpoint,
+            _api_type=api_type,
+            _params=params,
+            _headers=headers,
+            _payload=payload,
+            _show_full_error=show_full_error,
+            _return_json=return_json,
+            _allow_failed_response=allow_failed_response,
+        )
+        if coalesce_key is not None:
+            perform_api_call = functools.partial(
+                api_call_with_payload,
+                pydp_object,
+                method=method,
+                endpoint=endpoint,
+                payload=payload,
+                params=params,
+                headers=headers,
+                api_type=api_type,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                return_json=return_json,
+                allow_failed_response=allow_failed_response,
+                retry_policy=retry_policy,
+                idempotent=idempotent,
+                coalesce=False,
+            )
+            return request_coalescer.run(coalesce_key, perform_api_call, copy_result=_copy_json_result)
 
     def _raise_exception_for_payload():
         """Raise a :py:exc:`TypeError` exception when the payload is an invalid data type."""
@@ -159,43 +289,32 @@ def api_call_with_payload(
 
     # Perform the API call
     full_api_url = _get_full_api_url(pydp_object, endpoint, api_type)
-    response = _perform_api_call_with_payload(
+    retry_policy = _get_retry_policy(pydp_object, retry_policy)
+    send_request = functools.partial(
+        _perform_api_call_with_payload,
         pydp_object=pydp_object,
         method=method,
         payload=payload,
         params=params,
-        headers=request_headers,
         timeout=timeout,
         full_api_url=full_api_url,
         raise_payload_exception=_raise_exception_for_payload,
     )
+    response = _send_with_retries(functools.partial(send_request, headers=request_headers), method, retry_policy, idempotent)
 
-    # Retry once after a forced OAuth token refresh when the token is rejected.
-    if response is not None and _should_retry_oauth_401(pydp_object, api_type, response):
+    # Retry once after a forced OAuth token refresh or legacy JWT renewal when the token is rejected.
+    if response is not None and _should_retry_after_401(pydp_object, api_type, response):
         request_headers = _get_headers(
             pydp_object,
             _additional_headers=additional_headers,
             _api_type=api_type,
-            _force_oauth_refresh=True,
-        )
-        response = _perform_api_call_with_payload(
-            pydp_object=pydp_object,
-            method=method,
-            payload=payload,
-            params=params,
-            headers=request_headers,
-            timeout=timeout,
-            full_api_url=full_api_url,
-            raise_payload_exception=_raise_exception_for_payload,
+            _force_token_refresh=True,
+            _rejected_headers=request_headers,
         )
+        response = _send_with_retries(functools.partial(send_request, headers=request_headers), method, retry_policy, idempotent)
 
     # Examine the result
-    allow_failed_response = _should_allow_failed_responses(pydp_object, allow_failed_response)
-    if response and response.status_code >= 300 and not allow_failed_response:
-        _raise_status_code_exception(response, method, show_full_error)
-    if response and return_json:
-        response = _convert_response_to_json(response, allow_failed_response)
-    return response
+    return _examine_response(pydp_object, response, method, show_full_error, return_json, allow_failed_response)
 
 
 def post(
@@ -209,6 +328,9 @@ def post(
     show_full_error: bool = True,
     return_json: bool = True,
     allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
+    coalesce: Optional[bool] = None,
 ):
     """Perform a POST call with payload against the ID Plus tenant.
 
@@ -233,6 +355,13 @@ def post(
     :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                   (If not explicitly defined then ``True`` if Strict Mode is disabled)
     :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
+    :param coalesce: Determines if concurrent identical API calls should share a single request and its result
+                     (``False`` by default as only read-only calls such as user lookups should be coalesced)
+    :type coalesce: bool, None
     :returns: The API response in JSON format or as a ``requests`` object
     :raises: :py:exc:`errors.exceptions.APIMethodError`,
              :py:exc:`errors.exceptions.APIRequestError`,
@@ -251,6 +380,9 @@ def post(
         show_full_error=show_full_error,
         return_json=return_json,
         allow_failed_response=allow_failed_response,
+        retry_policy=retry_policy,
+        idempotent=idempotent,
+        coalesce=coalesce,
     )
 
 
@@ -265,6 +397,8 @@ def patch(
     show_full_error: bool = True,
     return_json: bool = True,
     allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
 ):
     """Perform a PATCH call with payload against the ID Plus tenant.
 
@@ -289,6 +423,10 @@ def patch(
     :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                   (If not explicitly defined then ``True`` if Strict Mode is disabled)
     :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
     :returns: The API response in JSON format or as a ``requests`` object
     :raises: :py:exc:`errors.exceptions.APIMethodError`,
              :py:exc:`errors.exceptions.APIRequestError`,
@@ -307,6 +445,8 @@ def patch(
         show_full_error=show_full_error,
         return_json=return_json,
         allow_failed_response=allow_failed_response,
+        retry_policy=retry_policy,
+        idempotent=idempotent,
     )
 
 
@@ -321,6 +461,8 @@ def put(
     show_full_error: bool = True,
     return_json: bool = True,
     allow_failed_response: Optional[bool] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    idempotent: Optional[bool] = None,
 ):
     """Perform a PUT call with payload against the ID Plus tenant.
 
@@ -345,6 +487,10 @@ def put(
     :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                   (If not explicitly defined then ``True`` if Strict Mode is disabled)
     :type allow_failed_response: bool, None
+    :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+    :type idempotent: bool, None
     :returns: The API response in JSON format or as a ``requests`` object
     :raises: :py:exc:`errors.exceptions.APIMethodError`,
              :py:exc:`errors.exceptions.APIRequestError`,
@@ -363,9 +509,140 @@ def put(
         show_full_error=show_full_error,
         return_json=return_json,
         allow_failed_response=allow_failed_response,
+        retry_policy=retry_policy,
+        idempotent=idempotent,
     )
 
 
+def create_session(
+    pool_connections: int = const.CLIENT_SETTINGS.DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = const.CLIENT_SETTINGS.DEFAULT_POOL_MAXSIZE,
+    keep_alive: bool = const.CLIENT_SETTINGS.DEFAULT_KEEP_ALIVE_VALUE,
+) -> requests.Session:
+    """Create a ``requests`` session with a pooled HTTP adapter to reuse connections across API calls.
+
+    :param pool_connections: The number of connection pools (i.e. hosts) to cache (``10`` by default)
+    :type pool_connections: int
+    :param pool_maxsize: The maximum number of connections to keep open per host (``10`` by default)
+    :type pool_maxsize: int
+    :param keep_alive: Determines if connections should be kept alive between API calls (``True`` by default)
+    :type keep_alive: bool
+    :returns: The configured ``requests.Session`` object
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    for _setting, _value in (
+        (const.CLIENT_SETTINGS.POOL_CONNECTIONS, pool_connections),
+        (const.CLIENT_SETTINGS.POOL_MAXSIZE, pool_maxsize),
+    ):
+        if not isinstance(_value, int) or isinstance(_value, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=_setting, data_type='int')
+            logger.error('A connection pool setting is an invalid data type')
+            raise TypeError(_error_msg)
+        if _value < 1:
+            _error_msg = f"The '{_setting}' value must be a positive integer"
+            logger.error('A connection pool setting must be a positive integer')
+            raise ValueError(_error_msg)
+    if not isinstance(keep_alive, bool):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=const.CLIENT_SETTINGS.KEEP_ALIVE, data_type='bool')
+        logger.error("The 'keep_alive' setting is an invalid data type")
+        raise TypeError(_error_msg)
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount(const.URLS.HTTPS, adapter)
+    session.mount(const.URLS.HTTP, adapter)
+    if not keep_alive:
+        session.headers[const.HEADERS.CONNECTION] = const.HEADERS.CONNECTION_CLOSE
+    return session
+
+
+def _get_http_client(_pydp_object):
+    """Return the pooled session for the client object or the ``requests`` module when no session is defined."""
+    _session = getattr(_pydp_object, 'session', None)
+    return _session if _session is not None else requests
+
+
+def _wait_for_rate_limit(_pydp_object) -> None:
+    """Wait until the client-side rate limit of the client object (if configured) permits another API call."""
+    _rate_limiter = getattr(_pydp_object, 'rate_limiter', None)
+    if _rate_limiter is not None:
+        _rate_limiter.acquire()
+
+
+def _get_json_codec(_pydp_object) -> Optional[JsonCodec]:
+    """Return the JSON codec of the client object, or ``None`` to let the ``requests`` package handle JSON."""
+    _json_codec = getattr(_pydp_object, const.CLIENT_SETTINGS.JSON_CODEC, None)
+    return _json_codec if isinstance(_json_codec, JsonCodec) else None
+
+
+def _get_retry_policy(_pydp_object, _retry_policy: Optional[RetryPolicy] = None) -> Optional[RetryPolicy]:
+    """Return the retry policy defined for the API call or the retry policy of the client object (if any).
+
+    :param _pydp_object: The instantiated pydplus object
+    :type _pydp_object: class[pydplus.PyDPlus]
+    :param _retry_policy: The retry policy explicitly defined for the API call (optional)
+    :type _retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :returns: The retry policy to use or ``None`` if API calls should not be retried
+    :raises: :py:exc:`TypeError`
+    """
+    _retry_policy = getattr(_pydp_object, const.CLIENT_SETTINGS.RETRY_POLICY, None) if _retry_policy is None else _retry_policy
+    if _retry_policy is not None and not isinstance(_retry_policy, RetryPolicy):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+            param=const.CLIENT_SETTINGS.RETRY_POLICY, data_type='RetryPolicy'
+        )
+        logger.error("The 'retry_policy' value is an invalid data type")
+        raise TypeError(_error_msg)
+    return _retry_policy
+
+
+def _send_with_retries(
+    _send_request: Callable[[], requests.Response],
+    _method: str,
+    _retry_policy: Optional[RetryPolicy] = None,
+    _idempotent: Optional[bool] = None,
+):
+    """Send a request and retry transient failures with backoff according to the retry policy.
+
+    :param _send_request: Function that sends a single request and returns the response
+    :type _send_request: Callable
+    :param _method: The API request type (e.g. ``GET``, ``POST``, ``PUT``, etc.)
+    :type _method: str
+    :param _retry_policy: The retry policy to apply (the request is only sent once if ``None``)
+    :type _retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param _idempotent: Explicitly indicates whether the API call is idempotent (defined by the method if ``None``)
+    :type _idempotent: bool, None
+    :returns: The response of the final attempt
+    :raises: :py:exc:`requests.exceptions.ConnectionError`,
+             :py:exc:`requests.exceptions.Timeout`
+    """
+    _attempt = 1
+    while True:
+        try:
+            _response = _send_request()
+        except _RETRYABLE_EXCEPTIONS:
+            if _retry_policy is None or not _retry_policy.should_retry_exception(_method, _attempt, _idempotent):
+                raise
+            _delay = _retry_policy.get_delay(_attempt)
+        else:
+            if _retry_policy is None or not _retry_policy.should_retry_response(_method, _response, _attempt, _idempotent):
+                return _response
+            _delay = _retry_policy.get_delay(_attempt, _response)
+            _close_response(_response)
+        logger.warning(
+            f'The API call failed with a transient error and will be retried in {_delay:.2f} seconds (attempt {_attempt})'
+        )
+        time.sleep(_delay)
+        _attempt += 1
+
+
+def _close_response(_response) -> None:
+    """Close a discarded response to release its connection, which matters when the response body is streamed."""
+    _close = getattr(_response, 'close', None)
+    if callable(_close):
+        _close()
+
+
 def _should_allow_failed_responses(_pydp_object, _allow_failed_response: Optional[bool]) -> bool:
     """Determine if failed responses are allowed based on the defined value or strict mode setting."""
     # Only define the value if not already defined
@@ -392,31 +669,51 @@ def _is_admin_oauth_request(_pydp_object, _api_type: str) -> bool:
     )
 
 
-def _should_retry_oauth_401(_pydp_object, _api_type: str, _response) -> bool:
-    """Return whether a failed response is eligible for OAuth token refresh retry."""
+def _is_renewable_legacy_request(_pydp_object) -> bool:
+    """Return whether the request uses a Legacy API connection whose JWT can be renewed by the client object."""
+    return getattr(_pydp_object, const.CLIENT_SETTINGS.CONNECTION_TYPE, None) == const.CONNECTION_INFO.LEGACY and callable(
+        getattr(_pydp_object, '_ensure_legacy_headers', None)
+    )
+
+
+def _should_retry_after_401(_pydp_object, _api_type: str, _response) -> bool:
+    """Return whether a failed response is eligible for an OAuth token refresh or legacy JWT renewal retry."""
     return (
-        _is_admin_oauth_request(_pydp_object, _api_type)
+        (_is_admin_oauth_request(_pydp_object, _api_type) or _is_renewable_legacy_request(_pydp_object))
         and _response is not None
         and getattr(_response, const.RESPONSE_KEYS.STATUS_CODE, None) == 401
     )
 
 
+def _connect_if_deferred(_pydp_object) -> None:
+    """Connect the client object to the tenant when its connection has been deferred until the first API call."""
+    if getattr(_pydp_object, 'lazy_connect', False) is True and getattr(_pydp_object, 'connected', True) is False:
+        _pydp_object._check_if_connected()
+
+
 def _get_headers(
     _pydp_object,
     _additional_headers: Optional[dict] = None,
     _api_type: str = const.DEFAULT_API_TYPE,
     _header_type: str = const.DEFAULT_HEADER_TYPE,
-    _force_oauth_refresh: bool = const.AUTH_VALUES.OAUTH_DEFAULT_FORCE_REFRESH,
+    _force_token_refresh: bool = const.AUTH_VALUES.OAUTH_DEFAULT_FORCE_REFRESH,
+    _rejected_headers: Optional[dict] = None,
 ) -> dict:
     """Return the appropriate HTTP headers to use for different types of API calls."""
+    _connect_if_deferred(_pydp_object)
     _additional_headers = {} if _additional_headers is None else _additional_headers
     _headers = dict(_pydp_object.base_headers) if isinstance(_pydp_object.base_headers, dict) else {}
 
     if _is_admin_oauth_request(_pydp_object, _api_type):
-        if _force_oauth_refresh:
-            _headers = _pydp_object.refresh_oauth_token()
+        if _force_token_refresh:
+            _headers = dict(_pydp_object.refresh_oauth_token(rejected_headers=_rejected_headers))
+        else:
+            _headers = dict(_pydp_object._ensure_oauth_headers())
+    elif _is_renewable_legacy_request(_pydp_object):
+        if _force_token_refresh:
+            _headers = dict(_pydp_object.refresh_legacy_token(rejected_headers=_rejected_headers))
         else:
-            _headers = _pydp_object._ensure_oauth_headers()
+            _headers = dict(_pydp_object._ensure_legacy_headers())
 
     # TODO: Define additional headers as needed based on header type
     _headers.update(_additional_headers)
@@ -439,35 +736,44 @@ def _perform_api_call_with_payload(
         logger.error('A full API URL must be defined before calling _perform_api_call_with_payload()')
         raise errors.exceptions.APIMethodError(error_msg)
 
+    http_client = _get_http_client(pydp_object)
+    if isinstance(payload, (dict, str)):
+        _wait_for_rate_limit(pydp_object)
+
+    # Encode dictionary payloads with the JSON codec of the client object (when defined) rather than the requests package
+    json_codec = _get_json_codec(pydp_object)
+    if isinstance(payload, dict) and json_codec is not None:
+        payload = json_codec.dumps(payload)
+        headers = {const.HEADERS.CONTENT_TYPE: const.CONTENT_TYPES.JSON, **(headers or {})}
     if isinstance(method, str) and method.upper() == const.API_REQUEST_TYPES.POST:
         if isinstance(payload, dict):
-            return requests.post(
+            return http_client.post(
                 full_api_url, json=payload, headers=headers, params=params, timeout=timeout, verify=pydp_object.verify_ssl
             )
-        if isinstance(payload, str):
-            return requests.post(
+        if isinstance(payload, (str, bytes)):
+            return http_client.post(
                 full_api_url, data=payload, headers=headers, params=params, timeout=timeout, verify=pydp_object.verify_ssl
             )
         if callable(raise_payload_exception):
             raise_payload_exception()
     elif isinstance(method, str) and method.upper() == const.API_REQUEST_TYPES.PATCH:
         if isinstance(payload, dict):
-            return requests.patch(
+            return http_client.patch(
                 full_api_url, json=payload, headers=headers, params=params, timeout=timeout, verify=pydp_object.verify_ssl
             )
-        if isinstance(payload, str):
-            return requests.patch(
+        if isinstance(payload, (str, bytes)):
+            return http_client.patch(
                 full_api_url, data=payload, headers=headers, params=params, timeout=timeout, verify=pydp_object.verify_ssl
             )
         if callable(raise_payload_exception):
             raise_payload_exception()
     elif isinstance(method, str) and method.upper() == const.API_REQUEST_TYPES.PUT:
         if isinstance(payload, dict):
-            return requests.put(
+            return http_client.put(
                 full_api_url, json=payload, headers=headers, params=params, timeout=timeout, verify=pydp_object.verify_ssl
             )
-        if isinstance(payload, str):
-            return requests.put(
+        if isinstance(payload, (str, bytes)):
+            return http_client.put(
                 full_api_url, data=payload, headers=headers, params=params, timeout=timeout, verify=pydp_object.verify_ssl
             )
         if callable(raise_payload_exception):
@@ -516,6 +822,123 @@ def _get_full_api_url(_pydp_object, _endpoint: str, _api_type: str = const.DEFAU
     return f'{_base_url}{_endpoint}'
 
 
+def _get_request_coalescer(
+    _pydp_object, _method: str, _coalesce: Optional[bool], _return_json: bool = True
+) -> Optional[RequestCoalescer]:
+    """Return the request coalescer of the client object when the API call should be coalesced.
+
+    Only GET requests are coalesced by default, while API calls with a payload must explicitly opt in. API calls that
+    return the response object are never coalesced, as a single response object cannot be shared between callers.
+    """
+    if not _return_json:
+        return None
+    if _coalesce is None:
+        _coalesce = isinstance(_method, str) and _method.upper() == const.API_REQUEST_TYPES.GET
+    _request_coalescer = getattr(_pydp_object, 'request_coalescer', None)
+    return _request_coalescer if _coalesce and isinstance(_request_coalescer, RequestCoalescer) else None
+
+
+def _get_coalesce_key(
+    _pydp_object,
+    _method: str,
+    _endpoint: str,
+    _api_type: str,
+    _params: Optional[dict] = None,
+    _headers: Optional[dict] = None,
+    _payload: Union[Optional[dict], Optional[str]] = None,
+    _show_full_error: bool = True,
+    _return_json: bool = True,
+    _allow_failed_response: Optional[bool] = None,
+) -> Optional[tuple]:
+    """Return the key that identifies identical API calls, or ``None`` if the request data cannot be serialized.
+
+    The key consists of the method, URL, and options that affect the returned value, along with a hash of the query
+    parameters, headers, and payload.
+    """
+    try:
+        _request_data = json.dumps([_params or {}, _headers or {}, _payload], sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return (
+        _method.upper(),
+        _get_full_api_url(_pydp_object, _endpoint, _api_type),
+        hashlib.sha256(_request_data.encode(const.UTF8_ENCODING)).hexdigest(),
+        _show_full_error,
+        _return_json,
+        _should_allow_failed_responses(_pydp_object, _allow_failed_response),
+    )
+
+
+def _copy_json_result(_result):
+    """Return a copy of a coalesced JSON result so that callers cannot modify the result returned to other callers."""
+    return copy.deepcopy(_result) if isinstance(_result, (dict, list)) else _result
+
+
+def _examine_response(
+    _pydp_object,
+    _response,
+    _method: str,
+    _show_full_error: bool = True,
+    _return_json: bool = True,
+    _allow_failed_response: Optional[bool] = None,
+):
+    """Raise an exception for a failed API response when appropriate and return the response in the requested format.
+
+    :param _pydp_object: The instantiated pydplus object
+    :type _pydp_object: class[pydplus.PyDPlus]
+    :param _response: The API response (if any)
+    :param _method: The API request type (``GET``, ``POST``, ``PATCH``, ``PUT``, or ``DELETE``)
+    :type _method: str
+    :param _show_full_error: Determine if the full error message should be reported (``True`` by default)
+    :type _show_full_error: bool
+    :param _return_json: Determines if the response should be returned in JSON format (``True`` by default)
+    :type _return_json: bool
+    :param _allow_failed_response: Indicates that failed responses should return and should not raise an exception
+                                   (If not explicitly defined then ``True`` if Strict Mode is disabled)
+    :type _allow_failed_response: bool, None
+    :returns: The API response in JSON format or as a response object
+    :raises: :py:exc:`pydplus.errors.exceptions.APIRequestError`,
+             :py:exc:`pydplus.errors.exceptions.APIResponseConversionError`
+    """
+    _allow_failed_response = _should_allow_failed_responses(_pydp_object, _allow_failed_response)
+    if _response is not None and _response.status_code >= 300 and not _allow_failed_response:
+        _raise_status_code_exception(_response, _method, _show_full_error)
+    if _response is not None and _return_json:
+        _response = _convert_response_to_json(_response, _allow_failed_response, _get_json_codec(_pydp_object))
+    return _response
+
+
+def _examine_streamed_response(
+    _pydp_object,
+    _response,
+    _show_full_error: bool = True,
+    _allow_failed_response: Optional[bool] = None,
+):
+    """Return a generator that parses the elements of a streamed JSON array response one at a time.
+
+    Failed responses are handled the same way as responses that are not streamed, so they raise an exception or are
+    returned in JSON format (when failed responses are allowed).
+    """
+    if _response.status_code >= 300:
+        with contextlib.closing(_response):
+            return _examine_response(
+                _pydp_object, _response, const.API_REQUEST_TYPES.GET, _show_full_error, True, _allow_failed_response
+            )
+    return _iterate_json_array_response(_response)
+
+
+def _iterate_json_array_response(_response) -> Iterator:
+    """Yield the elements of a streamed JSON array response and close the response once it has been consumed."""
+    with contextlib.closing(_response):
+        try:
+            yield from iter_json_array(_response.iter_content(chunk_size=const.DEFAULT_STREAM_CHUNK_SIZE))
+        except ValueError as _exc:
+            _exc_type = errors.handlers.get_exception_type(_exc)
+            _error_msg = f'Failed to parse the streamed API response as a JSON array due to the following {_exc_type} exception'
+            logger.error('Failed to parse the streamed API response as a JSON array')
+            raise errors.exceptions.APIResponseConversionError(_error_msg) from _exc
+
+
 def _raise_status_code_exception(_response, _method: str, _show_full_error: bool = True) -> None:
     """Raise an exception when a non-OK status code is returned for an API call.
 
@@ -534,19 +957,23 @@ def _raise_status_code_exception(_response, _method: str, _show_full_error: bool
     raise errors.exceptions.APIRequestError(_exc_msg)
 
 
-def _convert_response_to_json(_response, _allow_failed_response: bool = False):
+def _convert_response_to_json(_response, _allow_failed_response: bool = False, _json_codec: Optional[JsonCodec] = None):
     """Attempt to convert an API response to JSON format and raises an exception if unsuccessful.
 
     :param _response: The API response
     :param _allow_failed_response: Determines if failed responses are accepted (``False`` by default) or if an
                                   exception should be raised if the conversion fails
     :type _allow_failed_response: bool
+    :param _json_codec: The JSON codec used to decode the response (the ``requests`` package decodes it by default)
+    :type _json_codec: pydplus.utils.json_codec.JsonCodec, None
     :returns: The API response converted to a JSON dictionary (or returned unchanged if the conversion failed and
               no exception was raised)
     :raises: :py:exc:`pydplus.errors.exceptions.APIResponseConversionError`
     """
     try:
-        _response = _response.json()
+        # Response objects that do not expose their raw content are decoded by their own json() method
+        _content = getattr(_response, 'content', None) if _json_codec is not None else None
+        _response = _json_codec.loads(_content) if isinstance(_content, bytes) else _response.json()
     except Exception as _exc:
         _exc_type = errors.handlers.get_exception_type(_exc)
         _error_msg = f'Failed to convert the API response to JSON format due to the following {_exc_type} exception'
@@ -0,0 +1,868 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.audit
+:Synopsis:          Defines the functions used to export the administrator and user event audit logs
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import datetime
+import functools
+import hashlib
+import heapq
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from . import api, errors
+from . import constants as const
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the events of a time slice within its queue
+_SLICE_DONE = object()
+
+
+@dataclass(slots=True)
+class AuditCheckpoint:
+    """The position of an audit log export, which allows an interrupted export to resume where it stopped.
+
+    :param log_type: The type of audit logs being exported (``admin`` or ``user``)
+    :type log_type: str
+    :param start_time: The time after which the exported events occurred (ISO 8601 format)
+    :type start_time: str
+    :param end_time: The time on or before which the exported events occurred (ISO 8601 format)
+    :type end_time: str
+    :param page_size: The number of events retrieved with each API call
+    :type page_size: int
+    :param page_number: The number of the page (starting at ``0``) that contains the next event to export
+    :type page_number: int
+    :param page_offset: The number of events within that page that have already been exported
+    :type page_offset: int
+    :param events_exported: The total number of events that have been exported
+    :type events_exported: int
+    :param last_event_time: The timestamp of the last event that was exported (when known)
+    :type last_event_time: str, None
+    :param completed: Indicates if every event within the time range has been exported
+    :type completed: bool
+    """
+
+    # Define the class variables
+    log_type: str
+    start_time: str
+    end_time: str
+    page_size: int
+    page_number: int = 0
+    page_offset: int = 0
+    events_exported: int = 0
+    last_event_time: Optional[str] = None
+    completed: bool = False
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional[AuditCheckpoint]:
+        """Load a checkpoint from a file.
+
+        :param path: The path to the checkpoint file
+        :type path: str, pathlib.Path
+        :returns: The checkpoint or ``None`` if the file does not exist
+        :raises: :py:exc:`ValueError`
+        """
+        return _load_state_file(cls, path, 'audit export checkpoint')
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the checkpoint atomically to a file that is only readable by the current user (``0600``).
+
+        :param path: The path to the checkpoint file
+        :type path: str, pathlib.Path
+        :returns: None
+        """
+        _save_state_file(self, path)
+
+
+@dataclass(slots=True)
+class AuditHighWaterMark:
+    """The position of an audit log tail, which allows each poll to retrieve only the events that are new.
+
+    Events that occurred during the second of the most recent event (i.e. the boundary second) are retrieved again
+    by the next poll, as more events may be logged during that second, and their IDs are used to skip the events that
+    were already yielded.
+
+    :param log_type: The type of audit logs being tailed (``admin`` or ``user``)
+    :type log_type: str
+    :param boundary_time: The start of the second of the most recent event (ISO 8601 format)
+    :type boundary_time: str
+    :param boundary_event_ids: The IDs of the events yielded for the boundary second (bounded by
+                               ``MAX_BOUNDARY_EVENT_IDS``)
+    :type boundary_event_ids: list[str]
+    :param events_yielded: The total number of events that have been yielded
+    :type events_yielded: int
+    """
+
+    # Define the class variables
+    log_type: str
+    boundary_time: str
+    boundary_event_ids: list[str] = field(default_factory=list)
+    events_yielded: int = 0
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional[AuditHighWaterMark]:
+        """Load a high-water mark from a state file.
+
+        :param path: The path to the state file
+        :type path: str, pathlib.Path
+        :returns: The high-water mark or ``None`` if the file does not exist
+        :raises: :py:exc:`ValueError`
+        """
+        return _load_state_file(cls, path, 'audit tail state')
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the high-water mark atomically to a state file that is only readable by the current user (``0600``).
+
+        :param path: The path to the state file
+        :type path: str, pathlib.Path
+        :returns: None
+        """
+        _save_state_file(self, path)
+
+
+def export_logs(
+    pydp_object,
+    log_type: str,
+    start_time: Union[str, datetime.datetime],
+    end_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+    page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+    checkpoint_path: Union[Optional[str], Optional[Path]] = None,
+    prefetch: bool = True,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+) -> Iterator[dict]:
+    """Export the audit log events within a time range, yielding the events lazily page by page.
+
+    .. note::
+       Only the current page and (when ``prefetch`` is enabled) the next page are held in memory, so memory usage
+       remains flat regardless of the number of exported events.
+
+    .. note::
+       When a checkpoint file is provided, the position of the export is saved after each page and whenever the
+       export stops (e.g. when the generator is closed or an exception is raised), and an export with the same log
+       type, start time, and page size resumes after the last event that was yielded. The end time is also stored in
+       the checkpoint file, so it does not need to be provided again when it was defined as the time of the first call.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param log_type: The type of audit logs to export (``admin`` or ``user``)
+    :type log_type: str
+    :param start_time: The time after which the events occurred (naive times are considered to be in UTC)
+    :type start_time: str, datetime.datetime
+    :param end_time: The time on or before which the events occurred (the current time by default)
+    :type end_time: str, datetime.datetime, None
+    :param page_size: The number of events to retrieve with each API call (``100`` by default)
+    :type page_size: int
+    :param checkpoint_path: The path to a file in which to save the position of the export (optional)
+    :type checkpoint_path: str, pathlib.Path, None
+    :param prefetch: Determines if the next page should be retrieved while the current page is being consumed
+                     (``True`` by default)
+    :type prefetch: bool
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :returns: Generator that yields the audit log events in JSON format
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`errors.exceptions.DataMismatchError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`
+    """
+    # Validate the arguments before the first event is requested so that invalid values are reported immediately
+    _endpoint = _get_log_endpoint(log_type)
+    _page_size = _validate_page_size(page_size)
+    _start_time = _format_audit_time(start_time, 'start_time')
+    _end_time = None if end_time is None else _format_audit_time(end_time, 'end_time')
+    _checkpoint = _get_checkpoint(checkpoint_path, log_type, _start_time, _end_time, _page_size)
+    return _export_checkpointed_logs(pydp_object, _endpoint, _checkpoint, checkpoint_path, prefetch, timeout)
+
+
+def export_admin_logs(
+    pydp_object,
+    start_time: Union[str, datetime.datetime],
+    end_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+    page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+    checkpoint_path: Union[Optional[str], Optional[Path]] = None,
+    prefetch: bool = True,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+) -> Iterator[dict]:
+    """Export the administrator audit log events within a time range, yielding the events lazily page by page.
+
+    .. note::
+       This function requires the ``rsa.audit.admin`` OAuth scope. Refer to :py:func:`pydplus.audit.export_logs`
+       for details about the checkpoint file.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param start_time: The time after which the events occurred (naive times are considered to be in UTC)
+    :type start_time: str, datetime.datetime
+    :param end_time: The time on or before which the events occurred (the current time by default)
+    :type end_time: str, datetime.datetime, None
+    :param page_size: The number of events to retrieve with each API call (``100`` by default)
+    :type page_size: int
+    :param checkpoint_path: The path to a file in which to save the position of the export (optional)
+    :type checkpoint_path: str, pathlib.Path, None
+    :param prefetch: Determines if the next page should be retrieved while the current page is being consumed
+                     (``True`` by default)
+    :type prefetch: bool
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :returns: Generator that yields the administrator audit log events in JSON format
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`errors.exceptions.DataMismatchError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`
+    """
+    return export_logs(
+        pydp_object,
+        log_type=const.AUDIT_SETTINGS.ADMIN,
+        start_time=start_time,
+        end_time=end_time,
+        page_size=page_size,
+        checkpoint_path=checkpoint_path,
+        prefetch=prefetch,
+        timeout=timeout,
+    )
+
+
+def export_user_event_logs(
+    pydp_object,
+    start_time: Union[str, datetime.datetime],
+    end_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+    page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+    checkpoint_path: Union[Optional[str], Optional[Path]] = None,
+    prefetch: bool = True,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+) -> Iterator[dict]:
+    """Export the user event audit log events within a time range, yielding the events lazily page by page.
+
+    .. note::
+       This function requires the ``rsa.audit.user`` OAuth scope. Refer to :py:func:`pydplus.audit.export_logs`
+       for details about the checkpoint file.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param start_time: The time after which the events occurred (naive times are considered to be in UTC)
+    :type start_time: str, datetime.datetime
+    :param end_time: The time on or before which the events occurred (the current time by default)
+    :type end_time: str, datetime.datetime, None
+    :param page_size: The number of events to retrieve with each API call (``100`` by default)
+    :type page_size: int
+    :param checkpoint_path: The path to a file in which to save the position of the export (optional)
+    :type checkpoint_path: str, pathlib.Path, None
+    :param prefetch: Determines if the next page should be retrieved while the current page is being consumed
+                     (``True`` by default)
+    :type prefetch: bool
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :returns: Generator that yields the user event audit log events in JSON format
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`errors.exceptions.DataMismatchError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`
+    """
+    return export_logs(
+        pydp_object,
+        log_type=const.AUDIT_SETTINGS.USER,
+        start_time=start_time,
+        end_time=end_time,
+        page_size=page_size,
+        checkpoint_path=checkpoint_path,
+        prefetch=prefetch,
+        timeout=timeout,
+    )
+
+
+def export_logs_parallel(
+    pydp_object,
+    log_type: str,
+    start_time: Union[str, datetime.datetime],
+    end_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+    slices: int = const.AUDIT_SETTINGS.DEFAULT_SLICES,
+    page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+) -> Iterator[dict]:
+    """Export the audit log events within a time range using concurrent API calls for non-overlapping time slices.
+
+    The time range is split into equal, non-overlapping time slices that are exported concurrently by worker threads
+    through the client object (and therefore within its rate limit), and the events of the slices are merged back
+    into chronological order as they are consumed.
+
+    .. note::
+       Each worker thread holds at most two pages of events, so memory usage remains flat regardless of the number of
+       exported events. The events within a slice are expected to be returned by the API in chronological order.
+
+    .. note::
+       Checkpoint files are not supported by parallel exports. Use the :py:func:`pydplus.audit.export_logs` function
+       when an interrupted export must resume where it stopped.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param log_type: The type of audit logs to export (``admin`` or ``user``)
+    :type log_type: str
+    :param start_time: The time after which the events occurred (naive times are considered to be in UTC)
+    :type start_time: str, datetime.datetime
+    :param end_time: The time on or before which the events occurred (the current time by default)
+    :type end_time: str, datetime.datetime, None
+    :param slices: The number of time slices (and worker threads) into which the time range is split (``4`` by default)
+    :type slices: int
+    :param page_size: The number of events to retrieve with each API call (``100`` by default)
+    :type page_size: int
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :returns: Generator that yields the audit log events in JSON format and in chronological order
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`
+    """
+    # Validate the arguments before the first event is requested so that invalid values are reported immediately
+    _endpoint = _get_log_endpoint(log_type)
+    _page_size = _validate_page_size(page_size)
+    _slice_count = _validate_slices(slices)
+    _start_time = _parse_audit_time(start_time, 'start_time')
+    _end_time = datetime.datetime.now(datetime.UTC) if end_time is None else _parse_audit_time(end_time, 'end_time')
+    if _end_time <= _start_time:
+        _error_msg = "The 'end_time' value must be later than the 'start_time' value"
+        logger.error("The 'end_time' value must be later than the 'start_time' value")
+        raise ValueError(_error_msg)
+    _slices = [
+        AuditCheckpoint(log_type=log_type, start_time=_slice_start, end_time=_slice_end, page_size=_page_size)
+        for _slice_start, _slice_end in _split_time_range(_start_time, _end_time, _slice_count)
+    ]
+    return _export_slices(pydp_object, _endpoint, _slices, timeout)
+
+
+def poll_logs(
+    pydp_object,
+    log_type: str,
+    state_path: Union[str, Path],
+    start_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+    page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+) -> Iterator[dict]:
+    """Retrieve the audit log events that occurred since the previous poll, as recorded by a high-water mark.
+
+    .. note::
+       The high-water mark is saved to the state file whenever the poll stops (including when the generator is
+       closed or an exception is raised), so the next poll starts after the last event that was yielded. The events
+       are expected to be returned by the API in chronological order. At most ``MAX_BOUNDARY_EVENT_IDS`` event IDs are kept
+       for the boundary second, so the events of a busier second may be yielded again by the next poll.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param log_type: The type of audit logs to retrieve (``admin`` or ``user``)
+    :type log_type: str
+    :param state_path: The path to the file in which the high-water mark is saved
+    :type state_path: str, pathlib.Path
+    :param start_time: The time after which events are retrieved when the state file does not exist yet
+                       (the current time by default)
+    :type start_time: str, datetime.datetime, None
+    :param page_size: The number of events to retrieve with each API call (``100`` by default)
+    :type page_size: int
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :returns: Generator that yields the new audit log events in JSON format
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`errors.exceptions.DataMismatchError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`
+    """
+    # Validate the arguments before the first event is requested so that invalid values are reported immediately
+    _endpoint = _get_log_endpoint(log_type)
+    _page_size = _validate_page_size(page_size)
+    _high_water_mark = _get_high_water_mark(state_path, log_type, start_time)
+    return _poll_new_events(pydp_object, _endpoint, _high_water_mark, state_path, _page_size, timeout)
+
+
+def follow_logs(
+    pydp_object,
+    log_type: str,
+    state_path: Union[str, Path],
+    start_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+    poll_interval: Union[int, float] = const.AUDIT_SETTINGS.DEFAULT_POLL_INTERVAL,
+    max_polls: Optional[int] = None,
+    stop_event: Optional[threading.Event] = None,
+    page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+) -> Iterator[dict]:
+    """Follow the audit logs by polling for new events at a regular interval, yielding each event once.
+
+    .. note::
+       Each poll is performed with the :py:func:`pydplus.audit.poll_logs` function, so the high-water mark in the
+       state file allows the tail to continue where it stopped after the process is restarted.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param log_type: The type of audit logs to follow (``admin`` or ``user``)
+    :type log_type: str
+    :param state_path: The path to the file in which the high-water mark is saved
+    :type state_path: str, pathlib.Path
+    :param start_time: The time after which events are retrieved when the state file does not exist yet
+                       (the current time by default)
+    :type start_time: str, datetime.datetime, None
+    :param poll_interval: The number of seconds to wait between polls (``60`` by default)
+    :type poll_interval: int, float
+    :param max_polls: The number of polls after which the generator stops (no limit by default)
+    :type max_polls: int, None
+    :param stop_event: An event that stops the generator once it is set (instead of waiting for the next poll)
+    :type stop_event: threading.Event, None
+    :param page_size: The number of events to retrieve with each API call (``100`` by default)
+    :type page_size: int
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :returns: Generator that yields the new audit log events in JSON format
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`errors.exceptions.DataMismatchError`,
+             :py:exc:`errors.exceptions.APIRequestError`,
+             :py:exc:`errors.exceptions.APIResponseConversionError`
+    """
+    if not isinstance(poll_interval, (int, float)) or isinstance(poll_interval, bool) or poll_interval < 0:
+        _error_msg = "The 'poll_interval' value must be a number of seconds that is not negative"
+        logger.error("The 'poll_interval' value is invalid")
+        raise ValueError(_error_msg)
+    _stop_event = threading.Event() if stop_event is None else stop_event
+
+    # Perform the first poll immediately so that invalid arguments are reported when the function is called
+    _first_poll = poll_logs(pydp_object, log_type, state_path, start_time, page_size, timeout)
+    return _follow_polls(
+        functools.partial(poll_logs, pydp_object, log_type, state_path, None, page_size, timeout),
+        _first_poll,
+        poll_interval,
+        max_polls,
+        _stop_event,
+    )
+
+
+def _get_log_endpoint(_log_type: str) -> str:
+    """Return the export endpoint for a type of audit logs."""
+    if _log_type == const.AUDIT_SETTINGS.ADMIN:
+        return const.REST_PATHS.ADMIN_LOGS_EXPORT
+    if _log_type == const.AUDIT_SETTINGS.USER:
+        return const.REST_PATHS.USER_EVENT_LOGS_EXPORT
+    _valid_values = ','.join(sorted(const.AUDIT_SETTINGS.VALID_LOG_TYPES))
+    _error_msg = f"The 'log_type' value is invalid (Expected one of: {_valid_values})"
+    logger.error("The 'log_type' value is invalid")
+    raise ValueError(_error_msg)
+
+
+def _validate_page_size(_page_size: int) -> int:
+    """Validate the number of events to retrieve with each API call."""
+    if not isinstance(_page_size, int) or isinstance(_page_size, bool):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='page_size', data_type='int')
+        logger.error("The 'page_size' value is an invalid data type")
+        raise TypeError(_error_msg)
+    if _page_size < 1:
+        _error_msg = "The 'page_size' value must be greater than 0"
+        logger.error("The 'page_size' value must be greater than 0")
+        raise ValueError(_error_msg)
+    return _page_size
+
+
+def _parse_audit_time(_value: Union[str, datetime.datetime], _param: str) -> datetime.datetime:
+    """Convert a time value to a timezone-aware datetime object, considering naive times to be in UTC."""
+    if isinstance(_value, str):
+        try:
+            _value = datetime.datetime.fromisoformat(_value.strip())
+        except ValueError as _exc:
+            _error_msg = f"The '{_param}' value is not a valid ISO 8601 time"
+            logger.error(f"The '{_param}' value is not a valid ISO 8601 time")
+            raise ValueError(_error_msg) from _exc
+    elif not isinstance(_value, datetime.datetime):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=_param, data_type='datetime or str')
+        logger.error(f"The '{_param}' value is an invalid data type")
+        raise TypeError(_error_msg)
+    return _value if _value.tzinfo is not None else _value.replace(tzinfo=datetime.UTC)
+
+
+def _format_audit_time(_value: Union[str, datetime.datetime], _param: str) -> str:
+    """Convert a time value to the ISO 8601 format (with milliseconds and a UTC offset) expected by the API."""
+    return _parse_audit_time(_value, _param).isoformat(timespec=const.AUDIT_SETTINGS.TIME_SPEC)
+
+
+def _validate_slices(_slices: int) -> int:
+    """Validate the number of time slices into which the time range of a parallel export is split."""
+    if not isinstance(_slices, int) or isinstance(_slices, bool):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='slices', data_type='int')
+        logger.error("The 'slices' value is an invalid data type")
+        raise TypeError(_error_msg)
+    if _slices < 1:
+        _error_msg = "The 'slices' value must be greater than 0"
+        logger.error("The 'slices' value must be greater than 0")
+        raise ValueError(_error_msg)
+    return _slices
+
+
+def _split_time_range(
+    _start_time: datetime.datetime,
+    _end_time: datetime.datetime,
+    _slices: int,
+) -> list[tuple[str, str]]:
+    """Split a time range into non-overlapping slices of (nearly) equal duration formatted for the API.
+
+    Each slice starts after the time on or before which the previous slice ends, and the boundaries are formatted
+    once so that rounding to milliseconds cannot introduce gaps or overlaps between the slices.
+    """
+    _duration = _end_time - _start_time
+    _boundaries = [_format_audit_time(_start_time + _duration * _index / _slices, 'start_time') for _index in range(_slices)]
+    _boundaries.append(_format_audit_time(_end_time, 'end_time'))
+    # Slices that are shorter than a millisecond are dropped as their formatted boundaries are identical
+    return [(_start, _end) for _start, _end in zip(_boundaries, _boundaries[1:]) if _start != _end]
+
+
+def _get_event_sort_key(_event: Any) -> datetime.datetime:
+    """Return the time of an audit log event used to merge the events of several slices in chronological order."""
+    _event_time = _event.get(const.RESPONSE_KEYS.EVENT_LOG_DATE) if isinstance(_event, dict) else None
+    if isinstance(_event_time, str):
+        with contextlib.suppress(ValueError):
+            return _parse_audit_time(_event_time, const.RESPONSE_KEYS.EVENT_LOG_DATE)
+    return datetime.datetime.min.replace(tzinfo=datetime.UTC)
+
+
+def _get_checkpoint(
+    _checkpoint_path: Union[Optional[str], Optional[Path]],
+    _log_type: str,
+    _start_time: str,
+    _end_time: Optional[str],
+    _page_size: int,
+) -> AuditCheckpoint:
+    """Load the checkpoint of a matching interrupted export or create the checkpoint for a new export."""
+    _checkpoint = AuditCheckpoint.load(_checkpoint_path) if _checkpoint_path is not None else None
+    if _checkpoint is None:
+        _end_time = _end_time or _format_audit_time(datetime.datetime.now(datetime.UTC), 'end_time')
+        return AuditCheckpoint(log_type=_log_type, start_time=_start_time, end_time=_end_time, page_size=_page_size)
+
+    # Only resume an export that was performed with the same values, as the page positions would otherwise differ
+    _expected = (_log_type, _start_time, _end_time or _checkpoint.end_time, _page_size)
+    if (_checkpoint.log_type, _checkpoint.start_time, _checkpoint.end_time, _checkpoint.page_size) != _expected:
+        _error_msg = f'The audit export checkpoint file belongs to a different export: {_checkpoint_path}'
+        logger.error('The audit export checkpoint file belongs to a different export')
+        raise errors.exceptions.DataMismatchError(_error_msg)
+    logger.debug('The audit export will resume from the checkpoint file')
+    return _checkpoint
+
+
+def _export_checkpointed_logs(
+    _pydp_object,
+    _endpoint: str,
+    _checkpoint: AuditCheckpoint,
+    _checkpoint_path: Union[Optional[str], Optional[Path]],
+    _prefetch: bool,
+    _timeout: int,
+) -> Iterator[dict]:
+    """Yield the audit log events from the position of a checkpoint and keep the checkpoint up to date."""
+    if _checkpoint.completed:
+        logger.debug('The audit export checkpoint indicates that the export has already been completed')
+        return
+    _pages = _iterate_log_pages(_pydp_object, _endpoint, _checkpoint, _prefetch, _timeout)
+    try:
+        for _page_number, _events in _pages:
+            # Skip the events of a resumed page that were already exported before the interruption
+            for _event in _events[_checkpoint.page_offset :]:
+                # The position is updated before the event is yielded as the consumer may stop at any yield
+                _checkpoint.page_offset += 1
+                _checkpoint.events_exported += 1
+                if isinstance(_event, dict) and _event.get(const.RESPONSE_KEYS.EVENT_LOG_DATE):
+                    _checkpoint.last_event_time = _event[const.RESPONSE_KEYS.EVENT_LOG_DATE]
+                yield _event
+            _checkpoint.page_number, _checkpoint.page_offset = _page_number + 1, 0
+            if _checkpoint_path is not None:
+                _checkpoint.save(_checkpoint_path)
+        _checkpoint.completed = True
+    finally:
+        _pages.close()
+        if _checkpoint_path is not None:
+            _checkpoint.save(_checkpoint_path)
+
+
+def _iterate_log_pages(
+    _pydp_object,
+    _endpoint: str,
+    _checkpoint: AuditCheckpoint,
+    _prefetch: bool,
+    _timeout: int,
+) -> Iterator[tuple[int, list]]:
+    """Yield the page number and events of each page, optionally retrieving the next page in a background thread."""
+    _get_page = functools.partial(
+        _get_log_page,
+        _pydp_object,
+        _endpoint,
+        _start_time=_checkpoint.start_time,
+        _end_time=_checkpoint.end_time,
+        _page_size=_checkpoint.page_size,
+        _timeout=_timeout,
+    )
+    _executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix=const.AUDIT_SETTINGS.PREFETCH_THREAD_NAME_PREFIX)
+        if _prefetch
+        else None
+    )
+    _page_number = _checkpoint.page_number
+    _next_page: Optional[Future] = _executor.submit(_get_page, _page_number) if _executor is not None else None
+    try:
+        while True:
+            _events, _total_pages = _next_page.result() if _next_page is not None else _get_page(_page_number)
+            if _total_pages is None:
+                _has_next_page = len(_events) >= _checkpoint.page_size
+            else:
+                _has_next_page = bool(_events) and _page_number + 1 < _total_pages
+
+            # Retrieve the next page while the events of the current page are consumed (at most two pages are held)
+            _next_page = None
+            if _has_next_page and _executor is not None:
+                _next_page = _executor.submit(_get_page, _page_number + 1)
+            yield _page_number, _events
+            if not _has_next_page:
+                return
+            _page_number += 1
+    finally:
+        if _executor is not None:
+            # Do not wait for a prefetched page that will not be consumed when the export stops early
+            _executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_high_water_mark(
+    _state_path: Union[str, Path],
+    _log_type: str,
+    _start_time: Union[Optional[str], Optional[datetime.datetime]],
+) -> AuditHighWaterMark:
+    """Load the high-water mark of a tail from its state file or create the high-water mark for a new tail."""
+    _high_water_mark = AuditHighWaterMark.load(_state_path)
+    if _high_water_mark is None:
+        _start = datetime.datetime.now(datetime.UTC) if _start_time is None else _parse_audit_time(_start_time, 'start_time')
+        _boundary_time = _format_audit_time(_start.replace(microsecond=0), 'start_time')
+        return AuditHighWaterMark(log_type=_log_type, boundary_time=_boundary_time)
+    if _high_water_mark.log_type != _log_type:
+        _error_msg = f'The audit tail state file belongs to a different log type: {_state_path}'
+        logger.error('The audit tail state file belongs to a different log type')
+        raise errors.exceptions.DataMismatchError(_error_msg)
+    return _high_water_mark
+
+
+def _get_event_id(_event: Any) -> str:
+    """Return the ID of an audit log event, or a digest of its content when the event does not include an ID."""
+    if isinstance(_event, dict) and _event.get(const.RESPONSE_KEYS.ID) is not None:
+        return str(_event[const.RESPONSE_KEYS.ID])
+    return hashlib.sha256(json.dumps(_event, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _poll_new_events(
+    _pydp_object,
+    _endpoint: str,
+    _high_water_mark: AuditHighWaterMark,
+    _state_path: Union[str, Path],
+    _page_size: int,
+    _timeout: int,
+) -> Iterator[dict]:
+    """Yield the events that are newer than the high-water mark and advance the high-water mark as they are yielded."""
+    _boundary = _parse_audit_time(_high_water_mark.boundary_time, 'boundary_time')
+    _boundary_ids = deque(_high_water_mark.boundary_event_ids, maxlen=const.AUDIT_SETTINGS.MAX_BOUNDARY_EVENT_IDS)
+    _seen_ids = set(_boundary_ids)
+
+    # The time range starts just before the boundary second so that late events logged during that second are included
+    _window = AuditCheckpoint(
+        log_type=_high_water_mark.log_type,
+        start_time=_format_audit_time(_boundary - datetime.timedelta(milliseconds=1), 'start_time'),
+        end_time=_format_audit_time(datetime.datetime.now(datetime.UTC), 'end_time'),
+        page_size=_page_size,
+    )
+    _pages = _iterate_log_pages(_pydp_object, _endpoint, _window, True, _timeout)
+    try:
+        for _page_number, _events in _pages:
+            for _event in _events:
+                # Events without a valid timestamp are considered to have occurred during the boundary second
+                _event_second = _get_event_sort_key(_event).replace(microsecond=0)
+                _event_second = _boundary if _event_second.year == datetime.MINYEAR else _event_second
+                _event_id = _get_event_id(_event)
+                if _event_second < _boundary or (_event_second == _boundary and _event_id in _seen_ids):
+                    continue
+                if _event_second > _boundary:
+                    # A new boundary second starts, so only the IDs of the events during that second must be kept
+                    _boundary = _event_second
+                    _boundary_ids.clear()
+                    _seen_ids.clear()
+                if len(_boundary_ids) == _boundary_ids.maxlen:
+                    _seen_ids.discard(_boundary_ids[0])
+                _boundary_ids.append(_event_id)
+                _seen_ids.add(_event_id)
+                _high_water_mark.boundary_time = _format_audit_time(_boundary, 'boundary_time')
+                _high_water_mark.boundary_event_ids = list(_boundary_ids)
+                _high_water_mark.events_yielded += 1
+                yield _event
+    finally:
+        _pages.close()
+        _high_water_mark.save(_state_path)
+
+
+def _follow_polls(
+    _poll: functools.partial,
+    _first_poll: Iterator[dict],
+    _poll_interval: Union[int, float],
+    _max_polls: Optional[int],
+    _stop_event: threading.Event,
+) -> Iterator[dict]:
+    """Yield the events of successive polls, waiting for the poll interval between them."""
+    yield from _first_poll
+    _polls = 1
+    while (_max_polls is None or _polls < _max_polls) and not _stop_event.wait(_poll_interval):
+        yield from _poll()
+        _polls += 1
+
+
+def _load_state_file(_cls: type, _path: Union[str, Path], _description: str) -> Any:
+    """Load a checkpoint or high-water mark from a JSON state file and return ``None`` if the file does not exist."""
+    try:
+        with open(_path, encoding=const.UTF8_ENCODING) as _file:
+            _data = json.load(_file)
+    except FileNotFoundError:
+        return None
+    try:
+        return _cls(**_data)
+    except TypeError as _exc:
+        _error_msg = f'The {_description} file is invalid: {_path}'
+        logger.error(f'The {_description} file is invalid')
+        raise ValueError(_error_msg) from _exc
+
+
+def _save_state_file(_state: Any, _path: Union[str, Path]) -> None:
+    """Write a checkpoint or high-water mark atomically to a JSON state file with ``0600`` permissions."""
+    _path = Path(_path)
+    # Temporary files are created with 0600 permissions and renamed so that an interruption never leaves a partial file
+    _file_descriptor, _temp_path = tempfile.mkstemp(dir=_path.parent, prefix=f'.{_path.name}.')
+    try:
+        with os.fdopen(_file_descriptor, 'w', encoding=const.UTF8_ENCODING) as _file:
+            json.dump(dataclasses.asdict(_state), _file)
+        os.replace(_temp_path, _path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(_temp_path)
+        raise
+
+
+def _export_slices(
+    _pydp_object,
+    _endpoint: str,
+    _slices: list[AuditCheckpoint],
+    _timeout: int,
+) -> Iterator[dict]:
+    """Export the time slices concurrently and yield their events merged in chronological order."""
+    _stop = threading.Event()
+    _queues = [queue.Queue(maxsize=const.AUDIT_SETTINGS.SLICE_QUEUE_SIZE) for _ in _slices]
+    _executor = ThreadPoolExecutor(
+        max_workers=max(len(_slices), 1),
+        thread_name_prefix=const.AUDIT_SETTINGS.PREFETCH_THREAD_NAME_PREFIX,
+    )
+    try:
+        for _slice, _queue in zip(_slices, _queues):
+            _executor.submit(_fetch_slice, _pydp_object, _endpoint, _slice, _timeout, _queue, _stop)
+        # The heap holds a single event per slice while the slices are merged (k-way merge)
+        yield from heapq.merge(*(_read_slice(_queue) for _queue in _queues), key=_get_event_sort_key)
+    finally:
+        # Stop the worker threads when the export completes, fails, or is closed before every event is consumed
+        _stop.set()
+        _executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _fetch_slice(
+    _pydp_object,
+    _endpoint: str,
+    _slice: AuditCheckpoint,
+    _timeout: int,
+    _queue: queue.Queue,
+    _stop: threading.Event,
+) -> None:
+    """Retrieve the pages of a time slice and add them to its queue until the slice is exported or the export stops."""
+    try:
+        for _page_number, _events in _iterate_log_pages(_pydp_object, _endpoint, _slice, False, _timeout):
+            if not _put_until_stopped(_queue, _events, _stop):
+                return
+        _put_until_stopped(_queue, _SLICE_DONE, _stop)
+    except Exception as _exc:
+        # The exception is raised again in the thread that consumes the events
+        _put_until_stopped(_queue, _exc, _stop)
+
+
+def _put_until_stopped(_queue: queue.Queue, _item: Any, _stop: threading.Event) -> bool:
+    """Add an item to a bounded queue once it has room and return ``False`` if the export stops in the meantime."""
+    while not _stop.is_set():
+        try:
+            _queue.put(_item, timeout=const.AUDIT_SETTINGS.SLICE_QUEUE_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_slice(_queue: queue.Queue) -> Iterator[dict]:
+    """Yield the events of a time slice from its queue as the pages are retrieved."""
+    while True:
+        _item = _queue.get()
+        if _item is _SLICE_DONE:
+            return
+        if isinstance(_item, Exception):
+            raise _item
+        yield from _item
+
+
+def _get_log_page(
+    _pydp_object,
+    _endpoint: str,
+    _page_number: int,
+    _start_time: str,
+    _end_time: str,
+    _page_size: int,
+    _timeout: int,
+) -> tuple[list, Optional[int]]:
+    """Retrieve a page of audit log events and return the events with the total number of pages (when provided)."""
+    _params = {
+        const.QUERY_PARAMS.START_TIME_AFTER: _start_time,
+        const.QUERY_PARAMS.END_TIME_ON_OR_BEFORE: _end_time,
+        const.QUERY_PARAMS.PAGE_NUMBER: _page_number,
+        const.QUERY_PARAMS.PAGE_SIZE: _page_size,
+    }
+    _response = api.get(
+        pydp_object=_pydp_object,
+        endpoint=_endpoint,
+        params=_params,
+        api_type=const.ADMIN_API_TYPE,
+        timeout=_timeout,
+        return_json=True,
+        allow_failed_response=False,
+        idempotent=True,
+        coalesce=False,
+    )
+    return _extract_page_events(_response)
+
+
+def _extract_page_events(_response: Any) -> tuple[list, Optional[int]]:
+    """Return the events and the total number of pages (when provided) from a page of audit log events."""
+    if isinstance(_response, list):
+        return _response, None
+    if not isinstance(_response, dict):
+        _error_msg = 'The audit log response is not a JSON object or array'
+        logger.error('The audit log response is not a JSON object or array')
+        raise errors.exceptions.APIResponseConversionError(_error_msg)
+    _events = _response.get(const.RESPONSE_KEYS.ELEMENTS) or []
+    _total_pages = _response.get(const.RESPONSE_KEYS.TOTAL_PAGES)
+    return _events, _total_pages if isinstance(_total_pages, int) else None
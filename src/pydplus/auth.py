@@ -5,30 +5,44 @@
 :Usage:             ``from pydplus import auth``
 :Example:           ``jwt_string = auth.get_legacy_jwt_string(base_url, connection_info)``
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     30 Jun 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import concurrent.futures
+import contextlib
 import datetime
+import hashlib
 import json
 import logging
-from typing import Any, Optional, Tuple, Union
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Union
 from uuid import uuid4
 
-import jwt
 import requests
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
 
 from . import constants as const
 from . import errors
+from .token_store import TokenStore, get_token_store_key
 from .utils import core_utils
 
+# The jwt and cryptography packages are imported when a JWT is first signed to keep the package import lightweight
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
 logger = logging.getLogger(__name__)
 
+# Parsed signing keys shared by every client object in the process
+_SIGNING_KEY_CACHE: OrderedDict[tuple, Any] = OrderedDict()
+_SIGNING_KEY_CACHE_LOCK = threading.Lock()
+
 
 def get_legacy_jwt_string(base_url: str, connection_info: dict) -> str:
     """Retrieve the JWT string used for Legacy API connections.
@@ -44,12 +58,47 @@ def get_legacy_jwt_string(base_url: str, connection_info: dict) -> str:
     access_id, private_key_full_path, private_key_pem = _extract_legacy_connection_info(connection_info)
     jwt_claims = _define_jwt_claims(access_id, base_url)
     private_key = _load_private_key(private_key_full_path, private_key_pem)
-    jwt_string = jwt.encode(
-        payload=jwt_claims,
-        key=private_key,
-        algorithm=const.AUTH_VALUES.LEGACY_KEY_ALGORITHM,
-    )
-    return jwt_string
+    return _encode_legacy_jwt(jwt_claims, private_key)
+
+
+def get_legacy_access_token(
+    base_url: str,
+    connection_info: dict,
+    token_data: Optional[dict[str, Any]] = None,
+    force_refresh: bool = False,
+    private_key: Optional[RSAPrivateKey] = None,
+) -> dict[str, Any]:
+    """Retrieve a signed JWT for Legacy API connections along with its expiration metadata.
+
+    The existing JWT is reused until it is close to expiring, at which point a new JWT is signed.
+
+    :param base_url: The base URL for the Cloud Administration API
+    :type base_url: str
+    :param connection_info: Dictionary containing the connection information for the tenant
+    :type connection_info: dict
+    :param token_data: Existing JWT metadata to reuse when still valid
+    :type token_data: dict, None
+    :param force_refresh: Forces a new JWT to be signed even if the existing JWT is still valid (``False`` by default)
+    :type force_refresh: bool
+    :param private_key: The parsed private key used to sign the JWT (loaded from the connection info if not defined)
+    :type private_key: cryptography.hazmat.primitives.asymmetric.rsa.RSAPrivateKey, None
+    :returns: Dictionary containing the JWT and its expiration metadata
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`FileNotFoundError`,
+             :py:exc:`errors.exceptions.MissingRequiredDataError`
+    """
+    if not force_refresh and _is_legacy_token_valid(token_data):
+        return token_data
+    access_id, private_key_full_path, private_key_pem = _extract_legacy_connection_info(connection_info)
+    if private_key is None:
+        private_key = _load_private_key(private_key_full_path, private_key_pem)
+    jwt_claims = _define_jwt_claims(access_id, base_url)
+    logger.debug('A new JWT is being signed for the Legacy API connection')
+    return {
+        const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN: _encode_legacy_jwt(jwt_claims, private_key),
+        const.AUTH_FIELDS.OAUTH_EXPIRES_IN: const.AUTH_VALUES.LEGACY_DEFAULT_EXPIRATION,
+        const.AUTH_FIELDS.OAUTH_EXPIRES_AT: int(jwt_claims[const.AUTH_FIELDS.JWT_EXP].timestamp()),
+    }
 
 
 def get_legacy_headers(
@@ -88,6 +137,8 @@ def get_oauth_headers(
     token_data: Optional[dict[str, Any]] = None,
     force_refresh: bool = const.AUTH_VALUES.OAUTH_DEFAULT_FORCE_REFRESH,
     timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    session: Optional[requests.Session] = None,
+    token_store: Optional[TokenStore] = None,
 ) -> Tuple[dict[str, str], dict[str, Any]]:
     """Construct OAuth headers for Administration API calls.
 
@@ -101,6 +152,10 @@ def get_oauth_headers(
     :type force_refresh: bool
     :param timeout: The timeout period in seconds to use for token endpoint requests (``30`` by default)
     :type timeout: int
+    :param session: The pooled session to use for token endpoint requests (a new connection is used if not defined)
+    :type session: requests.Session, None
+    :param token_store: The token store used to share access tokens with other client objects or processes (optional)
+    :type token_store: pydplus.token_store.TokenStore, None
     :returns: A tuple containing the headers dictionary and token metadata
     :raises: :py:exc:`TypeError`,
              :py:exc:`ValueError`,
@@ -114,25 +169,66 @@ def get_oauth_headers(
         token_data=token_data,
         force_refresh=force_refresh,
         timeout=timeout,
+        session=session,
+        token_store=token_store,
     )
 
-    access_token = token_data.get(const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN)
-    token_type = token_data.get(const.AUTH_FIELDS.OAUTH_TOKEN_TYPE, const.AUTH_VALUES.OAUTH_TOKEN_TYPE_BEARER)
-    if not isinstance(access_token, str) or not access_token:
-        error_msg = 'The OAuth token response did not include a valid access token'
-        logger.error('The OAuth token response did not include a valid access token')
-        raise errors.exceptions.APIConnectionError(error_msg)
+    return _build_oauth_headers(token_data), token_data
 
-    authorization_header_value = (
-        const.AUTH_SCHEMES.BEARER.format(token=access_token)
-        if token_type.lower() == const.AUTH_VALUES.OAUTH_TOKEN_TYPE_BEARER.lower()
-        else f'{token_type} {access_token}'
-    )
-    headers = {
-        const.HEADERS.AUTHORIZATION: authorization_header_value,
-        const.HEADERS.CONTENT_TYPE: const.CONTENT_TYPES.JSON,
-    }
-    return headers, token_data
+
+async def get_oauth_headers_async(
+    connection_info: dict,
+    client,
+    token_data: Optional[dict[str, Any]] = None,
+    force_refresh: bool = const.AUTH_VALUES.OAUTH_DEFAULT_FORCE_REFRESH,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    token_store: Optional[TokenStore] = None,
+) -> Tuple[dict[str, str], dict[str, Any]]:
+    """Construct OAuth headers for Administration API calls using an asynchronous HTTP client.
+
+    .. note::
+       The token store is accessed and its lock is acquired in a worker thread so that the event loop is not blocked
+       while another client object or process is requesting a new token.
+
+    :param connection_info: Dictionary containing the connection information for the tenant
+    :type connection_info: dict
+    :param client: The asynchronous HTTP client (e.g. ``httpx.AsyncClient``) to use for token endpoint requests
+    :param token_data: Existing OAuth token metadata to reuse when still valid
+    :type token_data: dict, None
+    :param force_refresh: Forces an access-token refresh and bypasses the token cache (``False`` by default)
+    :type force_refresh: bool
+    :param timeout: The timeout period in seconds to use for token endpoint requests (``30`` by default)
+    :type timeout: int
+    :param token_store: The token store used to share access tokens with other client objects or processes (optional)
+    :type token_store: pydplus.token_store.TokenStore, None
+    :returns: A tuple containing the headers dictionary and token metadata
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`errors.exceptions.APIConnectionError`,
+             :py:exc:`errors.exceptions.FeatureNotConfiguredError`,
+             :py:exc:`errors.exceptions.MissingRequiredDataError`
+    """
+    oauth_connection_info = _extract_oauth_connection_info(connection_info)
+    requested_scope = oauth_connection_info[const.CONNECTION_INFO.OAUTH_SCOPE]
+
+    if not force_refresh and _is_oauth_token_valid(token_data, _expected_scope=requested_scope):
+        return _build_oauth_headers(token_data), token_data
+
+    if token_store is None:
+        token_data = await _request_oauth_access_token_async(oauth_connection_info, client, timeout)
+        return _build_oauth_headers(token_data), token_data
+
+    _store_key = _get_oauth_token_store_key(oauth_connection_info)
+    async with _hold_token_store_lock_async(token_store, _store_key):
+        _stored_token_data = await asyncio.to_thread(token_store.get, _store_key)
+        if _is_oauth_token_valid(_stored_token_data, _expected_scope=requested_scope) and (
+            not force_refresh or not _is_same_access_token(_stored_token_data, token_data)
+        ):
+            logger.debug('The OAuth access token was retrieved from the token store')
+            return _build_oauth_headers(_stored_token_data), _stored_token_data
+        token_data = await _request_oauth_access_token_async(oauth_connection_info, client, timeout)
+        await asyncio.to_thread(token_store.set, _store_key, token_data)
+    return _build_oauth_headers(token_data), token_data
 
 
 def get_oauth_access_token(
@@ -141,9 +237,15 @@ def get_oauth_access_token(
     token_data: Optional[dict[str, Any]] = None,
     force_refresh: bool = const.AUTH_VALUES.OAUTH_DEFAULT_FORCE_REFRESH,
     timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    session: Optional[requests.Session] = None,
+    token_store: Optional[TokenStore] = None,
 ) -> dict[str, Any]:
     """Retrieve an OAuth access token and associated metadata.
 
+    .. note::
+       When a token store is provided, a valid token stored by another client object or process is reused rather
+       than requesting a new token, and the token store lock ensures that only one new token is requested at a time.
+
     :param connection_info: Dictionary containing the connection information for the tenant
     :type connection_info: dict
     :param verify_ssl: Determines if SSL certificates should be verified during token requests (``True`` by default)
@@ -154,6 +256,10 @@ def get_oauth_access_token(
     :type force_refresh: bool
     :param timeout: The timeout period in seconds to use for token endpoint requests (``30`` by default)
     :type timeout: int
+    :param session: The pooled session to use for token endpoint requests (a new connection is used if not defined)
+    :type session: requests.Session, None
+    :param token_store: The token store used to share access tokens with other client objects or processes (optional)
+    :type token_store: pydplus.token_store.TokenStore, None
     :returns: OAuth token metadata containing token and expiration values
     :raises: :py:exc:`TypeError`,
              :py:exc:`ValueError`,
@@ -171,11 +277,45 @@ def get_oauth_access_token(
     else:
         logger.debug('The OAuth access token is no longer valid and will be refreshed')
 
-    return _request_oauth_access_token(
-        oauth_connection_info=oauth_connection_info,
-        verify_ssl=verify_ssl,
-        timeout=timeout,
-    )
+    if token_store is None:
+        return _request_oauth_access_token(
+            oauth_connection_info=oauth_connection_info,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            session=session,
+        )
+
+    _store_key = _get_oauth_token_store_key(oauth_connection_info)
+    with token_store.lock(_store_key):
+        _stored_token_data = token_store.get(_store_key)
+        if _is_oauth_token_valid(_stored_token_data, _expected_scope=requested_scope) and (
+            not force_refresh or not _is_same_access_token(_stored_token_data, token_data)
+        ):
+            logger.debug('The OAuth access token was retrieved from the token store')
+            return _stored_token_data
+        token_data = _request_oauth_access_token(
+            oauth_connection_info=oauth_connection_info,
+            verify_ssl=verify_ssl,
+            timeout=timeout,
+            session=session,
+        )
+        token_store.set(_store_key, token_data)
+    return token_data
+
+
+def clear_signing_key_cache() -> None:
+    """Clear the cache of parsed signing keys so that key material is loaded again on its next use.
+
+    .. note::
+       Key files are cached by their path and modification time, so a rotated key file is loaded automatically.
+       The cache only needs to be cleared when key material must be discarded from memory (e.g. after a key
+       has been revoked).
+
+    :returns: None
+    """
+    with _SIGNING_KEY_CACHE_LOCK:
+        _SIGNING_KEY_CACHE.clear()
+    logger.debug('The signing key cache has been cleared')
 
 
 def _extract_legacy_connection_info(_connection_info: dict) -> Tuple[str, Optional[str], Optional[str]]:
@@ -294,9 +434,30 @@ def _define_jwt_claims(_access_id: str, _base_url: str) -> dict:
     return _claims_data
 
 
+def _encode_legacy_jwt(_jwt_claims: dict, _private_key: RSAPrivateKey) -> str:
+    """Sign the JWT claims with the private key to generate the JWT string used for Legacy API connections."""
+    import jwt
+
+    return jwt.encode(
+        payload=_jwt_claims,
+        key=_private_key,
+        algorithm=const.AUTH_VALUES.LEGACY_KEY_ALGORITHM,
+    )
+
+
+def _load_legacy_private_key(_connection_info: dict) -> RSAPrivateKey:
+    """Load the private key defined in the connection info that is used to sign JWTs for Legacy API connections."""
+    _access_id, _private_key_full_path, _private_key_pem = _extract_legacy_connection_info(_connection_info)
+    return _load_private_key(_private_key_full_path, _private_key_pem)
+
+
 def _load_private_key(_key_path: Optional[str] = None, _key_pem: Optional[str] = None) -> RSAPrivateKey:
     """Load the private key file for use in generating the JWT string.
 
+    .. note::
+       The parsed private key is cached by the hash of the PEM value or by the path and modification time of the
+       private key file, so it is only parsed again when the key material changes.
+
     :param _key_path: The full path to the private key
     :type _key_path: str, None
     :param _key_pem: The private key in PEM format
@@ -306,10 +467,11 @@ def _load_private_key(_key_path: Optional[str] = None, _key_pem: Optional[str] =
              :py:exc:`pydplus.errors.exceptions.MissingRequiredDataError`
     """
     if _key_pem:
-        _private_key = serialization.load_pem_private_key(
-            _key_pem.encode(const.UTF8_ENCODING), password=None, backend=default_backend()
+        _key_data = _key_pem.encode(const.UTF8_ENCODING)
+        return _get_cached_signing_key(
+            ('pem', hashlib.sha256(_key_data).hexdigest()),
+            lambda: _load_pem_private_key(_key_data),
         )
-        return _private_key
 
     if not _key_path:
         _error_msg = 'A private key file path or private key PEM value must be defined'
@@ -320,9 +482,66 @@ def _load_private_key(_key_path: Optional[str] = None, _key_pem: Optional[str] =
         _error_msg = 'The configured private key file does not exist and cannot be used for authentication'
         logger.error('The configured private key file does not exist and cannot be used for authentication')
         raise FileNotFoundError(_error_msg)
+    return _get_cached_signing_key(_get_key_file_cache_key('pem_file', _key_path), lambda: _read_private_key_file(_key_path))
+
+
+def _read_private_key_file(_key_path: str) -> RSAPrivateKey:
+    """Read and parse a private key file in PEM format."""
     with open(_key_path, 'rb') as _key_file:
-        _private_key = serialization.load_pem_private_key(_key_file.read(), password=None, backend=default_backend())
-    return _private_key
+        return _load_pem_private_key(_key_file.read())
+
+
+def _load_pem_private_key(_key_data: bytes) -> RSAPrivateKey:
+    """Parse an unencrypted private key in PEM format."""
+    from cryptography.hazmat.primitives import serialization
+
+    return serialization.load_pem_private_key(_key_data, password=None)
+
+
+def _get_key_file_cache_key(_key_kind: str, _key_path: str) -> tuple:
+    """Return the signing key cache key for a key file, which changes whenever the file is replaced or modified."""
+    _stat = os.stat(_key_path)
+    return _key_kind, os.path.realpath(_key_path), _stat.st_mtime_ns, _stat.st_size
+
+
+def _get_cached_signing_key(_cache_key: tuple, _loader: Callable[[], Any]) -> Any:
+    """Return the cached value for a cache key or load, cache, and return it when it is not already cached.
+
+    :param _cache_key: The key that identifies the key material
+    :type _cache_key: tuple
+    :param _loader: Function that loads and parses the key material when it is not cached
+    :type _loader: Callable
+    :returns: The cached or newly loaded value
+    """
+    with _SIGNING_KEY_CACHE_LOCK:
+        if _cache_key in _SIGNING_KEY_CACHE:
+            _SIGNING_KEY_CACHE.move_to_end(_cache_key)
+            return _SIGNING_KEY_CACHE[_cache_key]
+
+    # Parse the key material outside the lock as parsing an RSA key is comparatively slow
+    _value = _loader()
+    with _SIGNING_KEY_CACHE_LOCK:
+        _SIGNING_KEY_CACHE[_cache_key] = _value
+        _SIGNING_KEY_CACHE.move_to_end(_cache_key)
+        while len(_SIGNING_KEY_CACHE) > const.AUTH_VALUES._SIGNING_KEY_CACHE_MAX_SIZE:
+            _SIGNING_KEY_CACHE.popitem(last=False)
+    return _value
+
+
+def _get_jwk_thumbprint(_private_key_jwk: dict[str, Any]) -> str:
+    """Return the JWK thumbprint (RFC 7638) that identifies the key pair represented by JWK data."""
+    if _private_key_jwk.get(const.AUTH_FIELDS.JWA_KEY_TYPE) == const.AUTH_VALUES.JWA_EC:
+        _members = (
+            const.AUTH_FIELDS.JWA_EC_CURVE,
+            const.AUTH_FIELDS.JWA_KEY_TYPE,
+            const.AUTH_FIELDS.JWA_EC_X_COORDINATE,
+            const.AUTH_FIELDS.JWA_EC_Y_COORDINATE,
+        )
+    else:
+        _members = (const.AUTH_FIELDS.JWA_RSA_EXPONENT, const.AUTH_FIELDS.JWA_KEY_TYPE, const.AUTH_FIELDS.JWA_RSA_MODULUS)
+    _thumbprint_data = json.dumps({_member: _private_key_jwk.get(_member) for _member in _members}, separators=(',', ':'))
+    _digest = hashlib.sha256(_thumbprint_data.encode(const.UTF8_ENCODING)).digest()
+    return base64.urlsafe_b64encode(_digest).rstrip(b'=').decode(const.UTF8_ENCODING)
 
 
 def _normalize_oauth_grant_type(_grant_type: Optional[str]) -> str:
@@ -424,8 +643,11 @@ def _load_oauth_private_key_jwk(
             _error_msg = 'The configured OAuth private-key JWK file does not exist'
             logger.error('The configured OAuth private-key JWK file does not exist')
             raise FileNotFoundError(_error_msg)
-        with open(_full_key_path, encoding=const.UTF8_ENCODING) as _jwk_file:
-            _parsed_jwk = json.load(_jwk_file)
+        _parsed_jwk = _get_cached_signing_key(
+            _get_key_file_cache_key('jwk_file', _full_key_path), lambda: _read_oauth_private_key_file(_full_key_path)
+        )
+        # Return a copy so the cached JWK data cannot be modified by the caller
+        _parsed_jwk = dict(_parsed_jwk) if isinstance(_parsed_jwk, dict) else _parsed_jwk
 
     if _parsed_jwk is None:
         _error_msg = (
@@ -473,10 +695,20 @@ def _load_oauth_private_key_jwk(
     return _parsed_jwk
 
 
+def _read_oauth_private_key_file(_full_key_path: str) -> Any:
+    """Read and parse an OAuth private-key JWK file."""
+    with open(_full_key_path, encoding=const.UTF8_ENCODING) as _jwk_file:
+        return json.load(_jwk_file)
+
+
 def _convert_oauth_jwk_to_signing_key(_private_key_jwk: dict[str, Any]):
-    """Convert JWK key material to a signing key supported by PyJWT."""
+    """Convert JWK key material to a signing key supported by PyJWT (cached by the JWK thumbprint)."""
+    import jwt
+
     try:
-        return jwt.PyJWK.from_dict(_private_key_jwk).key
+        return _get_cached_signing_key(
+            ('jwk', _get_jwk_thumbprint(_private_key_jwk)), lambda: jwt.PyJWK.from_dict(_private_key_jwk).key
+        )
     except Exception as _exc:
         _exc_type = core_utils.get_exception_type(_exc)
         _error_msg = f'Failed to parse OAuth private key JWK data due to {_exc_type} exception'
@@ -513,6 +745,8 @@ def _create_private_key_jwt_client_assertion(
     if _private_key_jwk.get(const.AUTH_FIELDS.JWK_KEY_ID):
         _headers[const.AUTH_FIELDS.JWK_KEY_ID] = _private_key_jwk[const.AUTH_FIELDS.JWK_KEY_ID]
 
+    import jwt
+
     try:
         return jwt.encode(
             payload=_jwt_claims,
@@ -533,12 +767,94 @@ def _get_oauth_token_endpoint(_issuer_url: str) -> str:
     return const.URLS.OAUTH_TOKEN.format(issuer_url=_normalized_issuer)
 
 
+def _build_oauth_headers(_token_data: dict[str, Any]) -> dict[str, str]:
+    """Construct the API headers for a given set of OAuth token metadata."""
+    _access_token = _token_data.get(const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN)
+    _token_type = _token_data.get(const.AUTH_FIELDS.OAUTH_TOKEN_TYPE, const.AUTH_VALUES.OAUTH_TOKEN_TYPE_BEARER)
+    if not isinstance(_access_token, str) or not _access_token:
+        _error_msg = 'The OAuth token response did not include a valid access token'
+        logger.error('The OAuth token response did not include a valid access token')
+        raise errors.exceptions.APIConnectionError(_error_msg)
+
+    _authorization_header_value = (
+        const.AUTH_SCHEMES.BEARER.format(token=_access_token)
+        if _token_type.lower() == const.AUTH_VALUES.OAUTH_TOKEN_TYPE_BEARER.lower()
+        else f'{_token_type} {_access_token}'
+    )
+    return {
+        const.HEADERS.AUTHORIZATION: _authorization_header_value,
+        const.HEADERS.CONTENT_TYPE: const.CONTENT_TYPES.JSON,
+    }
+
+
 def _request_oauth_access_token(
     oauth_connection_info: dict[str, Any],
     verify_ssl: bool = const.DEFAULT_VERIFY_SSL,
     timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    session: Optional[requests.Session] = None,
 ) -> dict[str, Any]:
     """Request an OAuth access token from the configured token endpoint."""
+    _token_endpoint, _headers, _request_data = _prepare_oauth_token_request(oauth_connection_info)
+    _http_client = session if session is not None else requests
+    _response = _http_client.post(
+        _token_endpoint,
+        headers=_headers,
+        data=_request_data,
+        timeout=timeout,
+        verify=verify_ssl,
+    )
+    return _process_oauth_token_response(_response, oauth_connection_info[const.CONNECTION_INFO.OAUTH_SCOPE])
+
+
+async def _request_oauth_access_token_async(
+    oauth_connection_info: dict[str, Any],
+    client,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+) -> dict[str, Any]:
+    """Request an OAuth access token from the configured token endpoint using an asynchronous HTTP client."""
+    logger.debug('The OAuth access token will be requested using the asynchronous client')
+    _token_endpoint, _headers, _request_data = _prepare_oauth_token_request(oauth_connection_info)
+    _response = await client.post(_token_endpoint, headers=_headers, data=_request_data, timeout=timeout)
+    return _process_oauth_token_response(_response, oauth_connection_info[const.CONNECTION_INFO.OAUTH_SCOPE])
+
+
+def _get_oauth_token_store_key(oauth_connection_info: dict[str, Any]) -> str:
+    """Return the token store key for the issuer URL, Client ID, and scope of the OAuth connection info."""
+    return get_token_store_key(
+        oauth_connection_info[const.CONNECTION_INFO.OAUTH_ISSUER_URL],
+        oauth_connection_info[const.CONNECTION_INFO.OAUTH_CLIENT_ID],
+        oauth_connection_info[const.CONNECTION_INFO.OAUTH_SCOPE],
+    )
+
+
+@contextlib.asynccontextmanager
+async def _hold_token_store_lock_async(_token_store: TokenStore, _store_key: str) -> AsyncIterator[None]:
+    """Hold the lock of a token store for a key after acquiring it in a dedicated thread rather than the event loop.
+
+    The lock is not acquired through the default executor, as coroutines waiting for the lock could otherwise occupy
+    every worker thread and prevent the coroutine holding the lock from accessing the token store.
+    """
+    _lock = _token_store.lock(_store_key)
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='pydplus-token-store-lock')
+    try:
+        _acquire = asyncio.get_running_loop().run_in_executor(_executor, _lock.__enter__)
+    finally:
+        # The thread exits once the lock has been acquired
+        _executor.shutdown(wait=False)
+    try:
+        await asyncio.shield(_acquire)
+    except asyncio.CancelledError:
+        # The worker thread cannot be interrupted, so the lock is released as soon as it has been acquired
+        _acquire.add_done_callback(lambda _future: _future.exception() or _lock.__exit__(None, None, None))
+        raise
+    try:
+        yield
+    finally:
+        _lock.__exit__(None, None, None)
+
+
+def _prepare_oauth_token_request(oauth_connection_info: dict[str, Any]) -> Tuple[str, dict[str, str], dict[str, str]]:
+    """Return the token endpoint, headers, and form data to use when requesting an OAuth access token."""
     _issuer_url = oauth_connection_info[const.CONNECTION_INFO.OAUTH_ISSUER_URL]
     _client_id = oauth_connection_info[const.CONNECTION_INFO.OAUTH_CLIENT_ID]
     _scope = oauth_connection_info[const.CONNECTION_INFO.OAUTH_SCOPE]
@@ -581,14 +897,11 @@ def _request_oauth_access_token(
         const.HEADERS.ACCEPT: const.CONTENT_TYPES.JSON,
         const.HEADERS.CONTENT_TYPE: const.CONTENT_TYPES.FORM_URLENCODED_UTF8,
     }
-    _response = requests.post(
-        _token_endpoint,
-        headers=_headers,
-        data=_request_data,
-        timeout=timeout,
-        verify=verify_ssl,
-    )
+    return _token_endpoint, _headers, _request_data
+
 
+def _process_oauth_token_response(_response, _scope: str) -> dict[str, Any]:
+    """Validate and parse the response from an OAuth token endpoint request."""
     if _response.status_code >= 300:
         _error_msg = f'The OAuth token request failed with a {_response.status_code} status code.'
         logger.error('The OAuth token request failed')
@@ -637,6 +950,56 @@ def _parse_oauth_token_response(_response_data: dict[str, Any]) -> dict[str, Any
     }
 
 
+def _get_oauth_refresh_delay(
+    _token_data: Optional[dict[str, Any]],
+    _refresh_ratio: float = const.AUTH_VALUES.OAUTH_DEFAULT_REFRESH_RATIO,
+) -> float:
+    """Return the number of seconds until the OAuth access token should be proactively refreshed.
+
+    The refresh is scheduled once the given fraction of the token lifetime has elapsed, and always before the token
+    would otherwise be refreshed lazily at request time.
+    """
+    _min_interval = const.AUTH_VALUES._OAUTH_REFRESH_MIN_INTERVAL_SECONDS
+    if not isinstance(_token_data, dict):
+        return _min_interval
+    _expires_in = _token_data.get(const.AUTH_FIELDS.OAUTH_EXPIRES_IN)
+    _expires_at = _token_data.get(const.AUTH_FIELDS.OAUTH_EXPIRES_AT)
+    if not isinstance(_expires_in, (int, float)) or not isinstance(_expires_at, (int, float)):
+        return _min_interval
+    _refresh_at = min(
+        _expires_at - _expires_in * (1 - _refresh_ratio),
+        _expires_at - const.AUTH_VALUES._OAUTH_TOKEN_EXPIRY_BUFFER_SECONDS,
+    )
+    return max(_min_interval, _refresh_at - datetime.datetime.now(datetime.UTC).timestamp())
+
+
+def _was_access_token_replaced(_current_headers: Optional[dict], _rejected_headers: Optional[dict]) -> bool:
+    """Return whether the access token in the current headers differs from the token that was rejected."""
+    if not isinstance(_current_headers, dict) or not isinstance(_rejected_headers, dict):
+        return False
+    _current_authorization = _current_headers.get(const.HEADERS.AUTHORIZATION)
+    return bool(_current_authorization) and _current_authorization != _rejected_headers.get(const.HEADERS.AUTHORIZATION)
+
+
+def _is_same_access_token(_token_data: Optional[dict[str, Any]], _other_token_data: Optional[dict[str, Any]]) -> bool:
+    """Return whether two sets of token metadata contain the same access token."""
+    if not isinstance(_token_data, dict) or not isinstance(_other_token_data, dict):
+        return False
+    _access_token = _token_data.get(const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN)
+    return _access_token is not None and _access_token == _other_token_data.get(const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN)
+
+
+def _is_legacy_token_valid(_token_data: Optional[dict[str, Any]]) -> bool:
+    """Return whether a legacy JWT is still valid and not yet due to be renewed."""
+    if not isinstance(_token_data, dict) or not _token_data.get(const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN):
+        return False
+    _expires_at = _token_data.get(const.AUTH_FIELDS.OAUTH_EXPIRES_AT)
+    if not isinstance(_expires_at, (int, float)):
+        return False
+    _now = int(datetime.datetime.now(datetime.UTC).timestamp())
+    return _expires_at > (_now + const.AUTH_VALUES._LEGACY_TOKEN_RENEWAL_BUFFER_SECONDS)
+
+
 def _is_oauth_token_valid(
     _token_data: Optional[dict[str, Any]],
     _expected_scope: Optional[str] = None,
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.bulk
+:Synopsis:          Defines the functions used to perform bulk operations with a bounded pool of worker threads
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from . import constants as const
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class BulkResult:
+    """The outcome of a single item within a bulk operation.
+
+    :param item: The input item (e.g. email address or user ID) that was processed
+    :type item: Any
+    :param success: Indicates if the operation succeeded for the item
+    :type success: bool
+    :param result: The value returned by the operation when successful
+    :type result: Any
+    :param error: The exception raised by the operation when unsuccessful
+    :type error: Exception, None
+    :param status_code: The HTTP status code of the API response for the item (when applicable)
+    :type status_code: int, None
+    """
+
+    # Define the class variables
+    item: Any
+    success: bool
+    result: Any = None
+    error: Optional[Exception] = None
+    status_code: Optional[int] = None
+
+
+@dataclass(slots=True)
+class BulkReport:
+    """The per-item results and throughput statistics for a completed bulk operation.
+
+    :param results: The :py:class:`pydplus.bulk.BulkResult` objects in the same order as the (deduplicated) input items
+    :type results: list[pydplus.bulk.BulkResult]
+    :param elapsed_seconds: The wall-clock duration of the bulk operation in seconds
+    :type elapsed_seconds: float
+    """
+
+    # Define the class variables
+    results: list[BulkResult]
+    elapsed_seconds: float
+
+    @property
+    def total(self) -> int:
+        """Return the number of items that were processed."""
+        return len(self.results)
+
+    @property
+    def succeeded(self) -> int:
+        """Return the number of items for which the operation succeeded."""
+        return sum(1 for _result in self.results if _result.success)
+
+    @property
+    def failed(self) -> int:
+        """Return the number of items for which the operation failed."""
+        return self.total - self.succeeded
+
+    @property
+    def failures(self) -> list[BulkResult]:
+        """Return the results for the items for which the operation failed."""
+        return [_result for _result in self.results if not _result.success]
+
+    @property
+    def items_per_second(self) -> float:
+        """Return the throughput of the bulk operation in items per second."""
+        return self.total / self.elapsed_seconds if self.elapsed_seconds > 0 else float(self.total)
+
+
+def run_bulk_operation(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+) -> list[BulkResult]:
+    """Perform an operation for each unique item using a bounded pool of worker threads.
+
+    A failure for one item is captured in its :py:class:`pydplus.bulk.BulkResult` object rather than aborting the
+    remaining items in the batch.
+
+    :param func: The function to call with each item
+    :type func: Callable
+    :param items: The items to process (duplicate values are only processed once)
+    :type items: Iterable
+    :param max_workers: The maximum number of concurrent worker threads (``10`` by default)
+    :type max_workers: int
+    :returns: List of :py:class:`pydplus.bulk.BulkResult` objects in the same order as the (deduplicated) input items
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    unique_items = _deduplicate_items(items)
+    results = {_result.item: _result for _result in iter_bulk_operation(func, unique_items, max_workers)}
+    return [results[_item] for _item in unique_items]
+
+
+def run_bulk_report(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    result_handler: Optional[Callable[[BulkResult], None]] = None,
+) -> BulkReport:
+    """Perform an operation for each unique item and return the per-item results with throughput statistics.
+
+    :param func: The function to call with each item
+    :type func: Callable
+    :param items: The items to process (duplicate values are only processed once)
+    :type items: Iterable
+    :param max_workers: The maximum number of concurrent worker threads (``10`` by default)
+    :type max_workers: int
+    :param result_handler: Optional function called with each :py:class:`pydplus.bulk.BulkResult` object before the
+                           statistics are calculated, which can be used to examine or update the result
+    :type result_handler: Callable, None
+    :returns: The :py:class:`pydplus.bulk.BulkReport` object for the completed operation
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    start_time = time.perf_counter()
+    results = run_bulk_operation(func, items, max_workers)
+    if result_handler is not None:
+        for _result in results:
+            result_handler(_result)
+    report = BulkReport(results=results, elapsed_seconds=time.perf_counter() - start_time)
+    logger.info(
+        f'Completed a bulk operation for {report.total} items ({report.succeeded} succeeded, {report.failed} failed) '
+        f'in {report.elapsed_seconds:.2f} seconds ({report.items_per_second:.1f} items per second)'
+    )
+    return report
+
+
+def iter_bulk_operation(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+) -> Iterator[BulkResult]:
+    """Perform an operation for each unique item and yield the results as they complete.
+
+    Items are submitted to the worker threads through a bounded window of pending operations (twice the number of
+    workers), so the number of pending operations and unconsumed results is proportional to the concurrency rather
+    than to the number of items.
+
+    :param func: The function to call with each item
+    :type func: Callable
+    :param items: The items to process (duplicate values are only processed once)
+    :type items: Iterable
+    :param max_workers: The maximum number of concurrent worker threads (``10`` by default)
+    :type max_workers: int
+    :returns: Generator of :py:class:`pydplus.bulk.BulkResult` objects in the order they complete
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    _validate_max_workers(max_workers)
+    unique_items = _deduplicate_items(items)
+    if not unique_items:
+        return
+    workers = min(max_workers, len(unique_items))
+    max_in_flight = workers * const.CLIENT_SETTINGS.BULK_IN_FLIGHT_PER_WORKER
+    remaining_items = iter(unique_items)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = set()
+        while True:
+            # Refill the window of pending operations as the previous operations complete
+            for _item in remaining_items:
+                pending.add(executor.submit(_run_item, func, _item))
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        # Pending work is cancelled if the caller stops consuming the results early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _validate_max_workers(_max_workers: int) -> None:
+    """Ensure the maximum number of worker threads is a positive integer."""
+    if not isinstance(_max_workers, int) or isinstance(_max_workers, bool):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=const.CLIENT_SETTINGS.MAX_WORKERS, data_type='int')
+        logger.error("The 'max_workers' value is an invalid data type")
+        raise TypeError(_error_msg)
+    if _max_workers < 1:
+        _error_msg = f"The '{const.CLIENT_SETTINGS.MAX_WORKERS}' value must be a positive integer"
+        logger.error("The 'max_workers' value must be a positive integer")
+        raise ValueError(_error_msg)
+
+
+def _deduplicate_items(_items: Iterable) -> list:
+    """Return the unique items while preserving the order in which they were first provided."""
+    if isinstance(_items, (str, bytes)):
+        _error_msg = 'The items for a bulk operation must be provided as an iterable (e.g. list) rather than a string'
+        logger.error('The items for a bulk operation must be provided as a non-string iterable')
+        raise TypeError(_error_msg)
+    return list(dict.fromkeys(_items))
+
+
+def _run_item(_func: Callable[[Any], Any], _item: Any) -> BulkResult:
+    """Perform the operation for a single item and capture the outcome."""
+    try:
+        return BulkResult(item=_item, success=True, result=_func(_item))
+    except Exception as exc:
+        logger.debug('A bulk operation item failed and the exception was captured in its result')
+        return BulkResult(item=_item, success=False, error=exc)
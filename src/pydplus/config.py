@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.config
+:Synopsis:          Defines the immutable snapshot of a resolved client configuration
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Optional
+
+from . import constants as const
+from .credentials import IDPlusLegacyKeyMaterial
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ClientConfig:
+    """The resolved configuration of a client object, which can be reused to instantiate further client objects.
+
+    The configuration is produced once by the resolution of the helper settings, environment variables, and
+    arguments when a :py:class:`pydplus.core.PyDPlus` object is instantiated, and is available from its ``config``
+    attribute or from the :py:func:`pydplus.core.resolve_client_config` function. Passing it to the ``config``
+    parameter of the client object skips that resolution, and the object can be pickled to ship it to worker processes.
+
+    .. note::
+       The connection info is stored as a read-only copy (with read-only nested mappings and tuples in place of lists)
+       and a new dictionary is created when it is applied to a client object, so changes to the dictionary never affect
+       the configuration or the client objects that use it. The connection info and legacy key material are not
+       included in the hash of the configuration.
+
+    :param base_url: The base URL leveraged when performing Administration API calls
+    :type base_url: str
+    :param admin_base_url: The base URL for the Administration API
+    :type admin_base_url: str
+    :param auth_base_url: The base URL for the Authentication API (when defined)
+    :type auth_base_url: str, None
+    :param connection_type: The connection type used to authenticate (``oauth`` or ``legacy``)
+    :type connection_type: str
+    :param connection_info: The resolved connection info dictionary (stored as a read-only mapping)
+    :type connection_info: dict
+    :param oauth_api_type: The API type used when inferring OAuth issuer URL values
+    :type oauth_api_type: str
+    :param strict_mode: Determines if failed API calls should raise exceptions
+    :type strict_mode: bool
+    :param verify_ssl: Determines if SSL certificates should be verified
+    :type verify_ssl: bool
+    :param tenant_name: The name of the tenant (when defined)
+    :type tenant_name: str, None
+    :param env: The name of the environment (when defined)
+    :type env: str, None
+    :param rate_limit: The client-side rate limit in API calls per second (when rate limiting is enabled)
+    :type rate_limit: float, None
+    :param rate_limit_burst: The burst size of the client-side rate limiter (when defined)
+    :type rate_limit_burst: int, None
+    :param legacy_key_material: The parsed legacy key material (when defined)
+    :type legacy_key_material: pydplus.credentials.IDPlusLegacyKeyMaterial, None
+    """
+
+    # Define the class variables
+    base_url: str
+    admin_base_url: str
+    auth_base_url: Optional[str]
+    connection_type: str
+    connection_info: Mapping[str, Any] = field(repr=False, hash=False)
+    oauth_api_type: str = const.AUTH_API_TYPE
+    strict_mode: bool = False
+    verify_ssl: bool = True
+    tenant_name: Optional[str] = None
+    env: Optional[str] = None
+    rate_limit: Optional[float] = None
+    rate_limit_burst: Optional[int] = None
+    legacy_key_material: Optional[IDPlusLegacyKeyMaterial] = field(default=None, repr=False, hash=False)
+
+    def __post_init__(self) -> None:
+        """Validate the configuration and copy the connection info so that the configuration cannot be changed."""
+        if not isinstance(self.connection_info, Mapping):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='connection_info', data_type='dict')
+            logger.error("The 'connection_info' value is an invalid data type")
+            raise TypeError(_error_msg)
+        if self.connection_type not in const.CONNECTION_INFO.VALID_CONNECTION_TYPES:
+            _expected_types = ','.join(const.CONNECTION_INFO.VALID_CONNECTION_TYPES)
+            _error_msg = f"The 'connection_type' value is invalid (Expected one of: {_expected_types})"
+            logger.error('The connection type is invalid')
+            raise ValueError(_error_msg)
+
+        # The dataclass is frozen, so the read-only copy must be assigned using the object class
+        object.__setattr__(self, 'connection_info', _freeze(self.connection_info))
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state used to pickle the configuration, as read-only mappings cannot be pickled."""
+        _state = {_field.name: getattr(self, _field.name) for _field in dataclasses.fields(self)}
+        _state['connection_info'] = self.get_connection_info()
+        return _state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the configuration from its pickled state."""
+        for _name, _value in state.items():
+            object.__setattr__(self, _name, _value)
+        object.__setattr__(self, 'connection_info', _freeze(self.connection_info))
+
+    @property
+    def admin_base_rest_url(self) -> str:
+        """Return the Administration API base REST URL to use in API calls."""
+        return self.admin_base_url + const.REST_PATHS.ADMIN_BASE
+
+    @property
+    def auth_base_rest_url(self) -> Optional[str]:
+        """Return the Authentication API base REST URL to use in API calls (when the base URL is defined)."""
+        return self.auth_base_url + const.REST_PATHS.AUTH_BASE if self.auth_base_url else None
+
+    def get_connection_info(self) -> dict[str, Any]:
+        """Return a copy of the connection info that can be safely modified.
+
+        :returns: A deep copy of the connection info dictionary
+        """
+        return _thaw(self.connection_info)
+
+
+class _FrozenList(tuple):
+    """Read-only copy of a list that is converted back to a list by the :py:func:`_thaw` function."""
+
+    __slots__ = ()
+
+
+class _FrozenSet(frozenset):
+    """Read-only copy of a set that is converted back to a set by the :py:func:`_thaw` function."""
+
+    __slots__ = ()
+
+
+def _freeze(_value: Any) -> Any:
+    """Return a read-only deep copy of a value, converting mappings, lists, and sets to read-only equivalents.
+
+    Lists and sets are converted to private subclasses of ``tuple`` and ``frozenset`` so that the :py:func:`_thaw`
+    function restores their original type while tuples and frozen sets are left as they are.
+    """
+    if isinstance(_value, Mapping):
+        return MappingProxyType({_key: _freeze(_item) for _key, _item in _value.items()})
+    if isinstance(_value, list):
+        return _FrozenList(_freeze(_item) for _item in _value)
+    if isinstance(_value, tuple):
+        return tuple(_freeze(_item) for _item in _value)
+    if isinstance(_value, set):
+        return _FrozenSet(_value)
+    return _value
+
+
+def _thaw(_value: Any) -> Any:
+    """Return a modifiable deep copy of a value created by the :py:func:`_freeze` function."""
+    if isinstance(_value, Mapping):
+        return {_key: _thaw(_item) for _key, _item in _value.items()}
+    if isinstance(_value, _FrozenList):
+        return [_thaw(_item) for _item in _value]
+    if isinstance(_value, tuple):
+        return tuple(_thaw(_item) for _item in _value)
+    if isinstance(_value, _FrozenSet):
+        return set(_value)
+    return _value
@@ -4,7 +4,7 @@
 :Synopsis:          Constants that are utilized throughout the package
 :Created By:        Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     01 Apr 2026
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
@@ -208,6 +208,37 @@ class ClientSettings:
     STRICT_MODE: ClassVar[str] = 'strict_mode'
     VERIFY_SSL: ClassVar[str] = 'verify_ssl'
 
+    # Connection pool properties
+    POOL_CONNECTIONS: ClassVar[str] = 'pool_connections'
+    POOL_MAXSIZE: ClassVar[str] = 'pool_maxsize'
+    KEEP_ALIVE: ClassVar[str] = 'keep_alive'
+
+    # Bulk operation properties
+    MAX_WORKERS: ClassVar[str] = 'max_workers'
+
+    # Rate limit properties
+    RATE_LIMIT: ClassVar[str] = 'rate_limit'
+    RATE_LIMIT_BURST: ClassVar[str] = 'rate_limit_burst'
+
+    # Retry properties
+    RETRY_POLICY: ClassVar[str] = 'retry_policy'
+
+    # OAuth background refresh properties
+    OAUTH_AUTO_REFRESH: ClassVar[str] = 'oauth_auto_refresh'
+    OAUTH_REFRESH_RATIO: ClassVar[str] = 'oauth_refresh_ratio'
+
+    # OAuth token store properties
+    TOKEN_STORE: ClassVar[str] = 'token_store'
+
+    # Request coalescing properties
+    COALESCE_REQUESTS: ClassVar[str] = 'coalesce_requests'
+
+    # Deferred connection properties
+    LAZY_CONNECT: ClassVar[str] = 'lazy_connect'
+
+    # JSON codec properties
+    JSON_CODEC: ClassVar[str] = 'json_codec'
+
     # Connection types
     CONNECTION_TYPE_LEGACY: ClassVar[str] = 'legacy'
     CONNECTION_TYPE_OAUTH: ClassVar[str] = 'oauth'
@@ -215,6 +246,15 @@ class ClientSettings:
     # Default values
     DEFAULT_AUTO_CONNECT_VALUE = True
     DEFAULT_VERIFY_SSL_VALUE = True
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_KEEP_ALIVE_VALUE = True
+    DEFAULT_ASYNC_POOL_MAXSIZE = 100
+    DEFAULT_BULK_MAX_WORKERS = 10
+    BULK_IN_FLIGHT_PER_WORKER = 2
+    DEFAULT_OAUTH_AUTO_REFRESH_VALUE = False
+    DEFAULT_COALESCE_REQUESTS_VALUE = True
+    DEFAULT_LAZY_CONNECT_VALUE = False
 
 
 # -------------------------------
@@ -235,6 +275,9 @@ class HelperSettings:
     VALID_YAML_TRUE_VALUES: ClassVar[frozenset[str]] = frozenset({'yes', 'true'})
     VALID_YAML_FALSE_VALUES: ClassVar[frozenset[str]] = frozenset({'no', 'false'})
 
+    # Maximum number of parsed helper files retained in memory
+    _HELPER_FILE_CACHE_MAX_SIZE: ClassVar[int] = 32
+
     # Helper field names
     ENV_NAME: ClassVar[str] = 'env'
     TENANT_NAME: ClassVar[str] = 'tenant_name'
@@ -244,6 +287,8 @@ class HelperSettings:
     CONNECTION_TYPE: ClassVar[str] = 'connection_type'
     STRICT_MODE: ClassVar[str] = 'strict_mode'
     VERIFY_SSL: str = 'verify_ssl'
+    RATE_LIMIT: ClassVar[str] = 'rate_limit'
+    RATE_LIMIT_BURST: ClassVar[str] = 'rate_limit_burst'
     OAUTH_SCOPE_PRESET: ClassVar[str] = 'scope_preset'
     LEGACY_OAUTH_SCOPE_PRESET: ClassVar[str] = 'oauth_scope_preset'
     ENV_VARIABLES: ClassVar[str] = 'env_variables'
@@ -255,6 +300,8 @@ class HelperSettings:
             CONNECTION_TYPE,
             STRICT_MODE,
             VERIFY_SSL,
+            RATE_LIMIT,
+            RATE_LIMIT_BURST,
         }
     )
 
@@ -289,6 +336,8 @@ class HelperSettings:
     ENV_OAUTH_PRIVATE_KEY_JWK: ClassVar[str] = 'oauth_private_key_jwk'
     ENV_STRICT_MODE: ClassVar[str] = 'strict_mode'
     ENV_VERIFY_SSL: ClassVar[str] = 'verify_ssl'
+    ENV_RATE_LIMIT: ClassVar[str] = 'rate_limit'
+    ENV_RATE_LIMIT_BURST: ClassVar[str] = 'rate_limit_burst'
 
     # Environment variable default values
     ENV_DEFAULT_ENV_NAME: ClassVar[str] = 'PYDPLUS_ENV_NAME'
@@ -314,6 +363,8 @@ class HelperSettings:
     ENV_DEFAULT_OAUTH_PRIVATE_KEY_JWK: ClassVar[str] = 'PYDPLUS_OAUTH_PRIVATE_KEY_JWK'
     ENV_DEFAULT_STRICT_MODE: ClassVar[str] = 'PYDPLUS_STRICT_MODE'
     ENV_DEFAULT_VERIFY_SSL: ClassVar[str] = 'PYDPLUS_VERIFY_SSL'
+    ENV_DEFAULT_RATE_LIMIT: ClassVar[str] = 'PYDPLUS_RATE_LIMIT'
+    ENV_DEFAULT_RATE_LIMIT_BURST: ClassVar[str] = 'PYDPLUS_RATE_LIMIT_BURST'
 
     # Environment variable default mapping
     ENV_VARIABLE_DEFAULT_MAPPING: ClassVar[Mapping[str, str]] = MappingProxyType(
@@ -341,6 +392,8 @@ class HelperSettings:
             ENV_OAUTH_PRIVATE_KEY_JWK: ENV_DEFAULT_OAUTH_PRIVATE_KEY_JWK,
             ENV_STRICT_MODE: ENV_DEFAULT_STRICT_MODE,
             ENV_VERIFY_SSL: ENV_DEFAULT_VERIFY_SSL,
+            ENV_RATE_LIMIT: ENV_DEFAULT_RATE_LIMIT,
+            ENV_RATE_LIMIT_BURST: ENV_DEFAULT_RATE_LIMIT_BURST,
         }
     )
 
@@ -411,6 +464,8 @@ class EnvVariables:
     # General Settings
     STRICT_MODE: ClassVar[str] = 'PYDPLUS_STRICT_MODE'
     VERIFY_SSL: ClassVar[str] = 'PYDPLUS_VERIFY_SSL'
+    RATE_LIMIT: ClassVar[str] = 'PYDPLUS_RATE_LIMIT'
+    RATE_LIMIT_BURST: ClassVar[str] = 'PYDPLUS_RATE_LIMIT_BURST'
 
     # Authentication / Connection
     CONNECTION_TYPE: ClassVar[str] = 'PYDPLUS_CONNECTION_TYPE'
@@ -443,6 +498,8 @@ class EnvVariables:
     # General Settings
     CUSTOM_STRICT_MODE: ClassVar[str] = 'PYDPLUS_{env_name}_STRICT_MODE'  # Vars: env_name
     CUSTOM_VERIFY_SSL: ClassVar[str] = 'PYDPLUS_{env_name}_VERIFY_SSL'  # Vars: env_name
+    CUSTOM_RATE_LIMIT: ClassVar[str] = 'PYDPLUS_{env_name}_RATE_LIMIT'  # Vars: env_name
+    CUSTOM_RATE_LIMIT_BURST: ClassVar[str] = 'PYDPLUS_{env_name}_RATE_LIMIT_BURST'  # Vars: env_name
 
     # Authentication / Connection
     CUSTOM_CONNECTION_TYPE: ClassVar[str] = 'PYDPLUS_{env_name}_CONNECTION_TYPE'  # Vars: env_name
@@ -475,6 +532,8 @@ class EnvVariables:
     # General Settings
     PROD_STRICT_MODE: ClassVar[str] = CUSTOM_STRICT_MODE.format(env_name=PROD_ENVIRONMENT)
     PROD_VERIFY_SSL: ClassVar[str] = CUSTOM_VERIFY_SSL.format(env_name=PROD_ENVIRONMENT)
+    PROD_RATE_LIMIT: ClassVar[str] = CUSTOM_RATE_LIMIT.format(env_name=PROD_ENVIRONMENT)
+    PROD_RATE_LIMIT_BURST: ClassVar[str] = CUSTOM_RATE_LIMIT_BURST.format(env_name=PROD_ENVIRONMENT)
 
     # Authentication / Connection
     PROD_CONNECTION_TYPE: ClassVar[str] = CONNECTION_TYPE.format(env_name=PROD_ENVIRONMENT)
@@ -507,6 +566,8 @@ class EnvVariables:
     # General Settings
     DEV_STRICT_MODE: ClassVar[str] = CUSTOM_STRICT_MODE.format(env_name=DEV_ENVIRONMENT)
     DEV_VERIFY_SSL: ClassVar[str] = CUSTOM_VERIFY_SSL.format(env_name=DEV_ENVIRONMENT)
+    DEV_RATE_LIMIT: ClassVar[str] = CUSTOM_RATE_LIMIT.format(env_name=DEV_ENVIRONMENT)
+    DEV_RATE_LIMIT_BURST: ClassVar[str] = CUSTOM_RATE_LIMIT_BURST.format(env_name=DEV_ENVIRONMENT)
 
     # Authentication / Connection
     DEV_CONNECTION_TYPE: ClassVar[str] = CONNECTION_TYPE.format(env_name=DEV_ENVIRONMENT)
@@ -552,6 +613,8 @@ class EnvVariables:
     OAUTH_PRIVATE_KEY_JWK_FIELD: ClassVar[str] = 'oauth_private_key_jwk'
     STRICT_MODE_FIELD: ClassVar[str] = 'strict_mode'
     VERIFY_SSL_FIELD: ClassVar[str] = 'verify_ssl'
+    RATE_LIMIT_FIELD: ClassVar[str] = 'rate_limit'
+    RATE_LIMIT_BURST_FIELD: ClassVar[str] = 'rate_limit_burst'
 
     # Environment mapping
     MAPPING: ClassVar[Mapping[str, Mapping[str, str]]] = MappingProxyType(
@@ -579,6 +642,8 @@ class EnvVariables:
                 OAUTH_PRIVATE_KEY_JWK_FIELD: OAUTH_PRIVATE_KEY_JWK,
                 STRICT_MODE_FIELD: STRICT_MODE,
                 VERIFY_SSL_FIELD: VERIFY_SSL,
+                RATE_LIMIT_FIELD: RATE_LIMIT,
+                RATE_LIMIT_BURST_FIELD: RATE_LIMIT_BURST,
             },
             PROD_ENVIRONMENT: {
                 BASE_URL_FIELD: PROD_BASE_URL,
@@ -602,6 +667,8 @@ class EnvVariables:
                 OAUTH_PRIVATE_KEY_JWK_FIELD: PROD_OAUTH_PRIVATE_KEY_JWK,
                 STRICT_MODE_FIELD: PROD_STRICT_MODE,
                 VERIFY_SSL_FIELD: PROD_VERIFY_SSL,
+                RATE_LIMIT_FIELD: PROD_RATE_LIMIT,
+                RATE_LIMIT_BURST_FIELD: PROD_RATE_LIMIT_BURST,
             },
             DEV_ENVIRONMENT: {
                 BASE_URL_FIELD: DEV_BASE_URL,
@@ -625,6 +692,8 @@ class EnvVariables:
                 OAUTH_PRIVATE_KEY_JWK_FIELD: DEV_OAUTH_PRIVATE_KEY_JWK,
                 STRICT_MODE_FIELD: DEV_STRICT_MODE,
                 VERIFY_SSL_FIELD: DEV_VERIFY_SSL,
+                RATE_LIMIT_FIELD: DEV_RATE_LIMIT,
+                RATE_LIMIT_BURST_FIELD: DEV_RATE_LIMIT_BURST,
             },
             CUSTOM_ENVIRONMENT: {
                 BASE_URL_FIELD: CUSTOM_BASE_URL,
@@ -648,6 +717,8 @@ class EnvVariables:
                 OAUTH_PRIVATE_KEY_JWK_FIELD: CUSTOM_OAUTH_PRIVATE_KEY_JWK,
                 STRICT_MODE_FIELD: CUSTOM_STRICT_MODE,
                 VERIFY_SSL_FIELD: CUSTOM_VERIFY_SSL,
+                RATE_LIMIT_FIELD: CUSTOM_RATE_LIMIT,
+                RATE_LIMIT_BURST_FIELD: CUSTOM_RATE_LIMIT_BURST,
             },
         }
     )
@@ -687,6 +758,8 @@ class EnvVariables:
             OAUTH_PRIVATE_KEY_JWK_FIELD,
             STRICT_MODE_FIELD,
             VERIFY_SSL_FIELD,
+            RATE_LIMIT_FIELD,
+            RATE_LIMIT_BURST_FIELD,
         }
     )
 
@@ -1052,6 +1125,7 @@ DEFAULT_API_TYPE: Final[str] = ADMIN_API_TYPE
 DEFAULT_STRICT_MODE: Final[bool] = True
 DEFAULT_VERIFY_SSL: Final[bool] = True
 DEFAULT_HEADER_TYPE: Final[str] = 'default'
+DEFAULT_STREAM_CHUNK_SIZE: Final[int] = 64 * 1024
 
 # Validation criteria
 VALID_API_TYPES: Final[frozenset[str]] = frozenset(
@@ -1198,6 +1272,7 @@ class AuthValues:
     # Legacy default values
     LEGACY_KEY_ALGORITHM: ClassVar[str] = RSA_KEY_ALGORITHM
     LEGACY_DEFAULT_EXPIRATION: ClassVar[int] = 3600
+    _LEGACY_TOKEN_RENEWAL_BUFFER_SECONDS: ClassVar[int] = 300
 
     # OAuth default values
     OAUTH_DEFAULT_GRANT_TYPE: ClassVar[str] = 'Client Credentials'
@@ -1208,6 +1283,12 @@ class AuthValues:
     OAUTH_DEFAULT_TOKEN_EXPIRATION: ClassVar[int] = 3600
     _OAUTH_TOKEN_EXPIRY_BUFFER_SECONDS: ClassVar[int] = 30
     _OAUTH_ASSERTION_LIFETIME_SECONDS: ClassVar[int] = 300
+    OAUTH_DEFAULT_REFRESH_RATIO: ClassVar[float] = 0.75
+    _OAUTH_REFRESH_MIN_INTERVAL_SECONDS: ClassVar[int] = 5
+    _OAUTH_REFRESH_RETRY_SECONDS: ClassVar[int] = 30
+
+    # Maximum number of parsed signing keys retained in memory
+    _SIGNING_KEY_CACHE_MAX_SIZE: ClassVar[int] = 32
 
     # JSON Web Algorithm (JWA) Property Values (RFC 7518)
     JWA_EC: ClassVar[str] = 'EC'  # DSS
@@ -1229,6 +1310,130 @@ class ApiRequestTypes:
     DELETE: ClassVar[str] = 'DELETE'
 
 
+# -----------------------------
+# HTTP Retry Settings
+# -----------------------------
+@dataclass(frozen=True)
+class RetrySettings:
+    """Default values used by the :py:class:`pydplus.utils.retry.RetryPolicy` class."""
+
+    # Status codes
+    TOO_MANY_REQUESTS: ClassVar[int] = 429
+
+    # Default values
+    DEFAULT_MAX_ATTEMPTS: ClassVar[int] = 3
+    DEFAULT_BACKOFF_FACTOR: ClassVar[float] = 0.5
+    DEFAULT_MAX_BACKOFF: ClassVar[float] = 60.0
+    DEFAULT_RETRY_STATUS_CODES: ClassVar[frozenset[int]] = frozenset({429, 502, 503, 504})
+    DEFAULT_RETRY_METHODS: ClassVar[frozenset[str]] = frozenset({'GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'})
+
+
+# -----------------------------
+# Cache Settings
+# -----------------------------
+@dataclass(frozen=True)
+class CacheSettings:
+    """Default values used by the :py:class:`pydplus.utils.cache.TTLCache` class and the user lookup cache."""
+
+    # Default values
+    DEFAULT_MAXSIZE: ClassVar[int] = 1024
+    DEFAULT_TTL: ClassVar[float] = 300.0
+    DEFAULT_NEGATIVE_TTL: ClassVar[float] = 60.0
+
+    # Status codes
+    NOT_FOUND: ClassVar[int] = 404
+
+
+# -----------------------------
+# OAuth Token Store Settings
+# -----------------------------
+@dataclass(frozen=True)
+class TokenStoreSettings:
+    """Default values used by the OAuth token stores in the :py:mod:`pydplus.token_store` module."""
+
+    # File token store values
+    DEFAULT_DIRECTORY_PARTS: ClassVar[tuple[str, ...]] = ('.cache', 'pydplus', 'tokens')
+    DIRECTORY_MODE: ClassVar[int] = 0o700
+    FILE_MODE: ClassVar[int] = 0o600
+    TOKEN_FILE_EXTENSION: ClassVar[str] = '.json'
+    LOCK_FILE_EXTENSION: ClassVar[str] = '.lock'
+
+
+# -----------------------------
+# User Index Settings
+# -----------------------------
+@dataclass(frozen=True)
+class UserIndexSettings:
+    """Default values used by the persistent user index in the :py:mod:`pydplus.user_index` module."""
+
+    # Index file values
+    DEFAULT_DIRECTORY_PARTS: ClassVar[tuple[str, ...]] = ('.cache', 'pydplus', 'user_index')
+    DEFAULT_FILE_NAME: ClassVar[str] = 'user_index.sqlite3'
+    TENANT_FILE_NAME_TEMPLATE: ClassVar[str] = 'user_index_{tenant}.sqlite3'
+    DIRECTORY_MODE: ClassVar[int] = 0o700
+    FILE_MODE: ClassVar[int] = 0o600
+
+    # Default values
+    DEFAULT_MAX_AGE: ClassVar[float] = 86400.0
+    BUSY_TIMEOUT_SECONDS: ClassVar[float] = 30.0
+    QUERY_BATCH_SIZE: ClassVar[int] = 500
+
+
+# -----------------------------
+# Audit Log Settings
+# -----------------------------
+@dataclass(frozen=True)
+class AuditSettings:
+    """Default values used by the audit log exports in the :py:mod:`pydplus.audit` module."""
+
+    # Log types
+    ADMIN: ClassVar[str] = 'admin'
+    USER: ClassVar[str] = 'user'
+    VALID_LOG_TYPES: ClassVar[frozenset[str]] = frozenset({ADMIN, USER})
+
+    # Default values
+    DEFAULT_PAGE_SIZE: ClassVar[int] = 100
+    TIME_SPEC: ClassVar[str] = 'milliseconds'
+    PREFETCH_THREAD_NAME_PREFIX: ClassVar[str] = 'pydplus-audit'
+
+    # Parallel export values
+    DEFAULT_SLICES: ClassVar[int] = 4
+    SLICE_QUEUE_SIZE: ClassVar[int] = 2
+    SLICE_QUEUE_POLL_SECONDS: ClassVar[float] = 0.1
+
+    # Tailing values
+    DEFAULT_POLL_INTERVAL: ClassVar[float] = 60.0
+    MAX_BOUNDARY_EVENT_IDS: ClassVar[int] = 10000
+
+
+# -----------------------------
+# JSON Codec Settings
+# -----------------------------
+@dataclass(frozen=True)
+class JsonCodecSettings:
+    """Names of the JSON codecs defined in the :py:mod:`pydplus.utils.json_codec` module."""
+
+    # Codec names
+    AUTO: ClassVar[str] = 'auto'
+    ORJSON: ClassVar[str] = 'orjson'
+    MSGSPEC: ClassVar[str] = 'msgspec'
+    STDLIB: ClassVar[str] = 'json'
+
+    # Codecs in order of preference when the codec is selected automatically
+    PREFERRED_CODECS: ClassVar[tuple[str, ...]] = (ORJSON, MSGSPEC, STDLIB)
+
+
+# -----------------------------
+# Download Settings
+# -----------------------------
+@dataclass(frozen=True)
+class DownloadSettings:
+    """Default values used when writing streamed API responses in the :py:mod:`pydplus.utils.download` module."""
+
+    DEFAULT_CHECKSUM_ALGORITHM: ClassVar[str] = 'sha256'
+    GZIP_COMPRESS_LEVEL: ClassVar[int] = 6
+
+
 # -----------------------------
 # HTTP Header Fields / Names
 # -----------------------------
@@ -1247,6 +1452,11 @@ class Headers:
     ACCEPT: ClassVar[str] = 'Accept'
     ACCEPT_ENCODING: ClassVar[str] = 'Accept-Encoding'
     ACCEPT_LANGUAGE: ClassVar[str] = 'Accept-Language'
+    CONNECTION: ClassVar[str] = 'Connection'
+    RETRY_AFTER: ClassVar[str] = 'Retry-After'
+
+    # Header values
+    CONNECTION_CLOSE: ClassVar[str] = 'close'
 
 
 # -----------------------------
@@ -1372,6 +1582,10 @@ class RestPaths:
     USER_STATUS: ClassVar[str] = USER_BY_ID + '/userStatus'  # Vars: user_id
     USER_SYNC: ClassVar[str] = USERS + '/sync'  # Vars: user_id
 
+    # Audit log endpoint paths
+    ADMIN_LOGS_EXPORT: ClassVar[str] = 'v1/adminlog/exportlogs'
+    USER_EVENT_LOGS_EXPORT: ClassVar[str] = 'v1/usereventlog/exportlogs'
+
 
 # --------------------------------------
 # REST API Query Parameters and values
@@ -1394,6 +1608,12 @@ class QueryParams:
     SEARCH_UNSYNCED: ClassVar[str] = 'searchUnsynched'
     USER_STATUS: ClassVar[str] = 'userStatus'
 
+    # Audit log parameter names
+    START_TIME_AFTER: ClassVar[str] = 'startTimeAfter'
+    END_TIME_ON_OR_BEFORE: ClassVar[str] = 'endTimeOnOrBefore'
+    PAGE_NUMBER: ClassVar[str] = 'pageNumber'
+    PAGE_SIZE: ClassVar[str] = 'pageSize'
+
 
 # -----------------------------
 # REST API Payload Values
@@ -1418,6 +1638,13 @@ class ResponseKeys:
     ID: ClassVar[str] = 'id'
     STATUS_CODE: ClassVar[str] = 'status_code'
 
+    # Paginated response keys / fields
+    ELEMENTS: ClassVar[str] = 'elements'
+    TOTAL_PAGES: ClassVar[str] = 'totalPages'
+
+    # Audit log event keys / fields
+    EVENT_LOG_DATE: ClassVar[str] = 'eventLogDate'
+
 
 # -----------------------------
 # Exported namespaces
@@ -1449,6 +1676,7 @@ API_REQUEST_TYPES: Final[ApiRequestTypes] = ApiRequestTypes()
 AUTH_FIELDS: Final[AuthFields] = AuthFields()
 AUTH_SCHEMES: Final[AuthSchemes] = AuthSchemes()
 AUTH_VALUES: Final[AuthValues] = AuthValues()
+CACHE_SETTINGS: Final[CacheSettings] = CacheSettings()
 OAUTH_SCOPES: Final[OauthScopes] = OauthScopes()
 CONTENT_TYPES: Final[ContentTypes] = ContentTypes()
 ENCODING_TYPES: Final[EncodingTypes] = EncodingTypes()
@@ -1457,4 +1685,10 @@ LANGUAGES: Final[Languages] = Languages()
 PAYLOAD_VALUES: Final[PayloadValues] = PayloadValues()
 QUERY_PARAMS: Final[QueryParams] = QueryParams()
 RESPONSE_KEYS: Final[ResponseKeys] = ResponseKeys()
+RETRY_SETTINGS: Final[RetrySettings] = RetrySettings()
 REST_PATHS: Final[RestPaths] = RestPaths()
+TOKEN_STORE_SETTINGS: Final[TokenStoreSettings] = TokenStoreSettings()
+USER_INDEX_SETTINGS: Final[UserIndexSettings] = UserIndexSettings()
+AUDIT_SETTINGS: Final[AuditSettings] = AuditSettings()
+DOWNLOAD_SETTINGS: Final[DownloadSettings] = DownloadSettings()
+JSON_CODEC_SETTINGS: Final[JsonCodecSettings] = JsonCodecSettings()
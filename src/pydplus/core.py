@@ -5,25 +5,38 @@
 :Usage:             ``from pydplus import PyDPlus``
 :Example:           ``pydp = PyDPlus()``
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     30 Jun 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
 
+import datetime
+import hashlib
 import logging
 import os
+import threading
 import urllib.parse
-from collections.abc import Iterable, Mapping
+import weakref
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any, Optional, Tuple, Union
 
 from . import api, auth, errors
+from . import audit as audit_module
 from . import constants as const
 from . import users as users_module
+from .bulk import BulkReport, BulkResult
+from .config import ClientConfig
 from .credentials import IDPlusLegacyKeyMaterial
+from .token_store import MemoryTokenStore, TokenStore
+from .user_index import UserIndex
 from .utils import core_utils
+from .utils.coalesce import RequestCoalescer
 from .utils.helper import get_helper_settings
+from .utils.json_codec import JsonCodec, get_json_codec
+from .utils.rate_limit import TokenBucket
+from .utils.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +115,14 @@ class PyDPlus:
     :param auto_connect: Determines if an API connection should be established when the object is instantiated
                          (``True`` by default)
     :type auto_connect: bool
+    :param lazy_connect: Determines if the API connection should be deferred until the first API call, which then
+                         connects exactly once even when performed concurrently by several threads (``False`` by default)
+
+                         .. note::
+                            Instantiation then only resolves the configuration and does not perform any network
+                            calls or sign any JWTs, and the ``auto_connect`` value is ignored.
+
+    :type lazy_connect: bool
     :param strict_mode: Determines if failed API responses should result in an exception being raised
                         (``False`` by default)
     :type strict_mode: bool, None
@@ -109,6 +130,69 @@ class PyDPlus:
     :type env_variables: dict, None
     :param helper: Optionally provide the file path for a helper file used to define the object configuration
     :type helper: str, tuple, list, set, dict, None
+    :param pool_connections: The number of connection pools (i.e. hosts) the client session should cache (``10`` by default)
+    :type pool_connections: int
+    :param pool_maxsize: The maximum number of connections the client session should keep open per host
+                         (``10`` by default)
+    :type pool_maxsize: int
+    :param keep_alive: Determines if connections should be kept alive and reused between API calls (``True`` by default)
+    :type keep_alive: bool
+    :param rate_limit: The maximum sustained number of API calls per second the client object should perform
+                       (no limit by default)
+
+                       .. note::
+                          The limit is shared by every API call performed with the client object, including the
+                          calls performed concurrently by the bulk functions.
+
+    :type rate_limit: int, float, None
+    :param rate_limit_burst: The maximum number of API calls that can be performed back-to-back before the rate limit
+                             is applied (defaults to the rate limit rounded up to the nearest whole number)
+    :type rate_limit_burst: int, None
+    :param retry_policy: The policy used to retry API calls after transient failures such as ``429`` and ``503``
+                         responses or connection errors (a default ``RetryPolicy()`` object by default, which makes
+                         up to three attempts with exponential backoff for ``GET``, ``PUT``, ``DELETE``, ``HEAD``,
+                         and ``OPTIONS`` calls that fail with a ``429``, ``502``, ``503``, or ``504`` response or a
+                         connection error)
+
+                         .. note::
+                            Retries can be disabled by providing a policy with a single attempt.
+                            (e.g. ``RetryPolicy(max_attempts=1)``)
+
+    :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+    :param oauth_auto_refresh: Determines if the OAuth access token should be refreshed proactively in the background
+                               before it expires so that API calls never wait for a token request (``False`` by default)
+
+                               .. note::
+                                  The background refresh is stopped when the :py:meth:`pydplus.PyDPlus.close` method
+                                  is called or when the client object is used as a context manager.
+
+    :type oauth_auto_refresh: bool
+    :param oauth_refresh_ratio: The fraction of the token lifetime (``expires_in``) after which the OAuth access token
+                                is refreshed in the background (``0.75`` by default)
+    :type oauth_refresh_ratio: float
+    :param token_store: The store used to cache the OAuth access token by issuer URL, Client ID, and scope
+                        (a memory token store dedicated to the client object by default)
+
+                        .. note::
+                           A :py:class:`pydplus.token_store.FileTokenStore` object allows the worker processes on a
+                           host to share a single valid access token rather than each requesting its own token.
+
+    :type token_store: pydplus.token_store.TokenStore, None
+    :param coalesce_requests: Determines if concurrent identical GET requests and user lookups that return JSON should
+                              share a single API call and its result (``True`` by default)
+    :type coalesce_requests: bool
+    :param config: A configuration that was already resolved (e.g. the ``config`` attribute of another client object)
+
+                   .. note::
+                      The helper settings, environment variables, and the arguments that define the connection,
+                      URLs, environment, ``strict_mode``, ``verify_ssl``, and rate limit are not resolved again
+                      and are ignored when a configuration is provided.
+
+    :type config: pydplus.config.ClientConfig, None
+    :param json_codec: The name of the JSON codec (``auto``, ``orjson``, ``msgspec``, or ``json``) or a custom
+                       :py:class:`pydplus.utils.json_codec.JsonCodec` object used to encode API payloads and decode
+                       API responses (``auto`` by default, which uses the fastest installed codec)
+    :type json_codec: str, pydplus.utils.json_codec.JsonCodec
     :returns: The instantiated PyDPlus object
     :raises: :py:exc:`TypeError`,
              :py:exc:`ValueError`,
@@ -140,6 +224,19 @@ class PyDPlus:
         helper: Union[Optional[str], Optional[tuple], Optional[list], Optional[set], Optional[dict]] = None,
         oauth_api_type: Optional[str] = None,
         oauth_issuer_url: Optional[str] = None,
+        pool_connections: int = const.CLIENT_SETTINGS.DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = const.CLIENT_SETTINGS.DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = const.CLIENT_SETTINGS.DEFAULT_KEEP_ALIVE_VALUE,
+        rate_limit: Union[Optional[int], Optional[float]] = None,
+        rate_limit_burst: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        oauth_auto_refresh: bool = const.CLIENT_SETTINGS.DEFAULT_OAUTH_AUTO_REFRESH_VALUE,
+        oauth_refresh_ratio: float = const.AUTH_VALUES.OAUTH_DEFAULT_REFRESH_RATIO,
+        token_store: Optional[TokenStore] = None,
+        coalesce_requests: bool = const.CLIENT_SETTINGS.DEFAULT_COALESCE_REQUESTS_VALUE,
+        lazy_connect: bool = const.CLIENT_SETTINGS.DEFAULT_LAZY_CONNECT_VALUE,
+        config: Optional[ClientConfig] = None,
+        json_codec: Union[str, JsonCodec] = const.JSON_CODEC_SETTINGS.AUTO,
     ):
         """Instantiate the core client object."""
         # Define the initial properties and settings
@@ -147,86 +244,166 @@ class PyDPlus:
         self._env_variables = {}
         self.base_headers = {}
         self.auto_connect = auto_connect
+        self.config = None
         self.connected = False
         self.connection_type = None
+        self._connect_lock = threading.Lock()
+        self.json_codec = None
         self.env = None
+        self._legacy_lock = threading.Lock()
+        self._legacy_private_key = None
+        self._legacy_token_data = None
+        self._oauth_lock = threading.Lock()
+        self._oauth_refresher = None
+        self._oauth_refresher_stop = threading.Event()
         self._oauth_token_data = None
         self.oauth_api_type = const.AUTH_API_TYPE
+        self.rate_limit = None
+        self.rate_limit_burst = None
+        self.rate_limiter = None
+        self.request_coalescer = None
+        self.retry_policy = None
+        self.session = None
         self.strict_mode = strict_mode
         self.tenant_name = tenant_name
+        self.token_store = None
 
-        # Check for a supplied helper file and extract the configuration settings if found
-        self._get_helper_settings(helper)
+        if config is None:
+            # Check for a supplied helper file and extract the configuration settings if found
+            self._get_helper_settings(helper)
 
-        # Define the environment if explicitly defined as an argument, helper setting, or environment variable
-        self._get_env_name(env)
+            # Define the environment if explicitly defined as an argument, helper setting, or environment variable
+            self._get_env_name(env)
 
-        # Define the environment variable names to retrieve when defined
-        self._define_env_variable_names(env_variables)
+            # Define the environment variable names to retrieve when defined
+            self._define_env_variable_names(env_variables)
 
-        # Check for any defined environment variables using the environment variable names defined above
-        self._get_env_variables()
+            # Check for any defined environment variables using the environment variable names defined above
+            self._get_env_variables()
 
-        # Define the strict_mode setting using a passed argument, helper setting, or environment variable
-        self._define_strict_mode(strict_mode)  # Defines self.strict_mode
+            # Define the strict_mode setting using a passed argument, helper setting, or environment variable
+            self._define_strict_mode(strict_mode)  # Defines self.strict_mode
 
-        # Define the verify_ssl value either from a user-defined setting or using the default value
-        self._get_verify_ssl_setting(verify_ssl)  # Defines self.verify_ssl
+            # Define the verify_ssl value either from a user-defined setting or using the default value
+            self._get_verify_ssl_setting(verify_ssl)  # Defines self.verify_ssl
 
-        # Define the legacy key material when applicable
-        self.legacy_key_material = self._parse_legacy_key_material(legacy_key_material, connection_info)
+            # Define the client-side rate limit using a passed argument, helper setting, or environment variable
+            self._define_rate_limit(rate_limit, rate_limit_burst)  # Defines self.rate_limit, self.rate_limit_burst
 
-        # Use parsed key material as a base URL fallback when no explicit values were provided
-        if self.legacy_key_material:
-            if not base_url:
-                base_url = self.legacy_key_material.admin_rest_api_url  # Base URL will be parsed below
-            if not base_admin_url:
-                base_admin_url = self.legacy_key_material.admin_rest_api_url  # Base Admin URL will be parsed below
+            # Define the legacy key material when applicable
+            self.legacy_key_material = self._parse_legacy_key_material(legacy_key_material, connection_info)
 
-        # Define the base_url value or raise an exception if it cannot be defined
-        self._define_base_url(base_url)  # Defines self.base_url
+            # Use parsed key material as a base URL fallback when no explicit values were provided
+            if self.legacy_key_material:
+                if not base_url:
+                    base_url = self.legacy_key_material.admin_rest_api_url  # Base URL will be parsed below
+                if not base_admin_url:
+                    base_admin_url = self.legacy_key_material.admin_rest_api_url  # Base Admin URL will be parsed below
 
-        # Define the admin_base_url (required) and auth_base_url (optional) values
-        self._define_base_urls(base_admin_url, base_auth_url)  # Defines self.admin_base_url, self.auth_base_url
+            # Define the base_url value or raise an exception if it cannot be defined
+            self._define_base_url(base_url)  # Defines self.base_url
 
-        # Define the Administration API base REST URL to use in API calls
-        self.admin_base_rest_url = self.admin_base_url + const.REST_PATHS.ADMIN_BASE
+            # Define the admin_base_url (required) and auth_base_url (optional) values
+            self._define_base_urls(base_admin_url, base_auth_url)  # Defines self.admin_base_url, self.auth_base_url
 
-        # Define the Authentication API base URL to use in API calls
-        self.auth_base_rest_url = self.auth_base_url + const.REST_PATHS.AUTH_BASE if self.auth_base_url else None
+            # Define the Administration API base REST URL to use in API calls
+            self.admin_base_rest_url = self.admin_base_url + const.REST_PATHS.ADMIN_BASE
 
-        # Define which API type should be used when inferring OAuth issuer URL values
-        self._define_oauth_api_type(oauth_api_type)  # Defines self.oauth_api_type
+            # Define the Authentication API base URL to use in API calls
+            self.auth_base_rest_url = self.auth_base_url + const.REST_PATHS.AUTH_BASE if self.auth_base_url else None
 
-        # Check for provided connection info and define the class object attribute
-        self._validate_connection_info(
-            connection_info,
-            private_key,
-            legacy_access_id,
-            oauth_client_id,
-            oauth_issuer_url,
-            oauth_private_key,
-            oauth_private_key_jwk,
-            oauth_scope,
-            oauth_scope_preset,
-            self.legacy_key_material,
-        )
+            # Define which API type should be used when inferring OAuth issuer URL values
+            self._define_oauth_api_type(oauth_api_type)  # Defines self.oauth_api_type
+
+            # Check for provided connection info and define the class object attribute
+            self._validate_connection_info(
+                connection_info,
+                private_key,
+                legacy_access_id,
+                oauth_client_id,
+                oauth_issuer_url,
+                oauth_private_key,
+                oauth_private_key_jwk,
+                oauth_scope,
+                oauth_scope_preset,
+                self.legacy_key_material,
+            )
+
+            # Define the connection type that should be used to authenticate
+            self._get_connection_type(connection_type)  # Defines self.connection_type
+
+            # Capture the resolved configuration so that further client objects can skip the resolution above
+            self.config = self._create_client_config()
+        else:
+            # Apply a configuration that was already resolved, skipping the helper settings and environment variables
+            self._apply_client_config(config)  # Defines self.config and the resolved settings
+
+        # Define the client-side rate limiter that is shared by every API call (rate limiting is disabled by default)
+        self.rate_limiter = self._create_rate_limiter()
+
+        # Define the policy used to retry API calls after transient failures
+        self._define_retry_policy(retry_policy)  # Defines self.retry_policy
+
+        # Define whether the OAuth access token should be refreshed in the background before it expires
+        self._define_oauth_refresh_settings(oauth_auto_refresh, oauth_refresh_ratio)
+
+        # Define the store used to cache the OAuth access token and optionally share it with other processes
+        self._define_token_store(token_store)  # Defines self.token_store
+
+        # Define whether concurrent identical read-only API calls should share a single request
+        self._define_request_coalescer(coalesce_requests)  # Defines self.request_coalescer
+
+        # Define whether the connection should be deferred until the first API call
+        self._define_lazy_connect(lazy_connect)  # Defines self.lazy_connect
+
+        # Define the JSON codec used to encode API payloads and decode API responses
+        self._define_json_codec(json_codec)  # Defines self.json_codec
 
-        # Define the connection type that should be used to authenticate
-        self._get_connection_type(connection_type)  # Defines self.connection_type
+        # Define the pooled session that is reused by all API calls and OAuth token requests
+        self.session = self._create_session(pool_connections, pool_maxsize, keep_alive)
 
-        # Connect to the tenant (if auto-connect is enabled) and retrieve the base API headers
-        if self.auto_connect:
-            self.connected, self.base_headers = self.connect()
-            # TODO: Figure out how to connect after instantiation and update self.connected and self.base_headers
+        # Connect to the tenant (if auto-connect is enabled) and retrieve the base API headers, unless the connection
+        # is deferred until the first API call
+        if self.lazy_connect:
+            logger.debug('The connection to the tenant will be established by the first API call')
+        elif self.auto_connect:
+            self.connect()
 
         # Import inner object classes so their methods can be called from the primary object
         self.users: PyDPlus.User = self._import_user_class()
+        self.audit: PyDPlus.Audit = self._import_audit_class()
+
+    def __enter__(self) -> PyDPlus:
+        """Return the client object when used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the client object when exiting the context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled session and the user index, releasing any connections held by the client object.
+
+        :returns: None
+        """
+        self._stop_oauth_refresher()
+        if self.session is not None:
+            self.session.close()
+            logger.debug('The pooled session for the client object has been closed')
+        self.users.disable_user_index()
+
+    def _create_session(self, _pool_connections: int, _pool_maxsize: int, _keep_alive: bool):
+        """Create the pooled session that is reused by all API calls and OAuth token requests."""
+        return api.create_session(_pool_connections, _pool_maxsize, _keep_alive)
 
     def _import_user_class(self):
         """Allow the :py:class:`pydplus.core.PyDPlus.User` class to be utilized within the core object."""
         return PyDPlus.User(self)
 
+    def _import_audit_class(self):
+        """Allow the :py:class:`pydplus.core.PyDPlus.Audit` class to be utilized within the core object."""
+        return PyDPlus.Audit(self)
+
     def _get_helper_settings(self, _helper):
         """Retrieve the settings from a helper configuration file if passed as an argument."""
         if _helper:
@@ -470,6 +647,210 @@ class PyDPlus:
             self.strict_mode = const.DEFAULT_STRICT_MODE
             _log_default_setting(setting)
 
+    def _get_rate_limit_value(self, _setting: str, _helper_field: str, _env_field: str, _value_from_arg, _value_type: type):
+        """Retrieve a rate limit setting from a passed argument, helper setting, or environment variable."""
+        methods = const.ARGUMENT_VALUES.PROVIDED_METHODS  # arg, helper, or env
+        if _value_from_arg is not None:
+            _log_configured_setting(_setting, methods[0])
+            return _value_from_arg
+        if self._helper_settings and self._helper_settings.get(_helper_field) is not None:
+            _log_configured_setting(_setting, methods[1])
+            return self._helper_settings.get(_helper_field)
+        if self._env_variables and self._env_variables.get(_env_field) not in (None, ''):
+            # Environment variables are always strings and must be converted to the expected numeric type
+            try:
+                _value = _value_type(self._env_variables.get(_env_field))
+            except ValueError:
+                _error_msg = f"The environment variable for the '{_setting}' setting must be a number"
+                logger.error('A rate limit environment variable must be a number')
+                raise ValueError(_error_msg) from None
+            _log_configured_setting(_setting, methods[2])
+            return _value
+        _log_default_setting(_setting)
+        return None
+
+    def _define_rate_limit(
+        self,
+        _rate_limit_from_arg: Union[Optional[int], Optional[float]],
+        _rate_limit_burst_from_arg: Optional[int],
+    ) -> None:
+        """Define the client-side rate limiter using passed arguments, helper settings, or environment variables."""
+        _rate_limit = self._get_rate_limit_value(
+            const.CLIENT_SETTINGS.RATE_LIMIT,
+            const.HELPER_SETTINGS.RATE_LIMIT,
+            const.ENV_VARIABLES.RATE_LIMIT_FIELD,
+            _rate_limit_from_arg,
+            float,
+        )
+        _rate_limit_burst = self._get_rate_limit_value(
+            const.CLIENT_SETTINGS.RATE_LIMIT_BURST,
+            const.HELPER_SETTINGS.RATE_LIMIT_BURST,
+            const.ENV_VARIABLES.RATE_LIMIT_BURST_FIELD,
+            _rate_limit_burst_from_arg,
+            int,
+        )
+
+        self.rate_limit, self.rate_limit_burst = _rate_limit, _rate_limit_burst
+
+    def _create_rate_limiter(self) -> Optional[TokenBucket]:
+        """Create the rate limiter when a rate limit has been configured (rate limiting is disabled by default)."""
+        if self.rate_limit is None:
+            return None
+        return TokenBucket(rate=self.rate_limit, burst=self.rate_limit_burst)
+
+    def _create_client_config(self) -> ClientConfig:
+        """Create the immutable snapshot of the configuration resolved for the client object."""
+        return ClientConfig(
+            base_url=self.base_url,
+            admin_base_url=self.admin_base_url,
+            auth_base_url=self.auth_base_url,
+            connection_type=self.connection_type,
+            connection_info=self.connection_info,
+            oauth_api_type=self.oauth_api_type,
+            strict_mode=self.strict_mode,
+            verify_ssl=self.verify_ssl,
+            tenant_name=self.tenant_name,
+            env=self.env,
+            rate_limit=self.rate_limit,
+            rate_limit_burst=self.rate_limit_burst,
+            legacy_key_material=self.legacy_key_material,
+        )
+
+    def _apply_client_config(self, _config: ClientConfig) -> None:
+        """Define the resolved settings of the client object using a configuration that was already resolved."""
+        if not isinstance(_config, ClientConfig):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='config', data_type='ClientConfig')
+            logger.error("The 'config' value is an invalid data type")
+            raise TypeError(_error_msg)
+        self.config = _config
+        self.base_url = _config.base_url
+        self.admin_base_url = _config.admin_base_url
+        self.auth_base_url = _config.auth_base_url
+        self.admin_base_rest_url = _config.admin_base_rest_url
+        self.auth_base_rest_url = _config.auth_base_rest_url
+        self.connection_type = _config.connection_type
+        self.connection_info = _config.get_connection_info()  # Copied so the client object cannot alter the config
+        self.oauth_api_type = _config.oauth_api_type
+        self.strict_mode = _config.strict_mode
+        self.verify_ssl = _config.verify_ssl
+        self.tenant_name = _config.tenant_name
+        self.env = _config.env
+        self.rate_limit = _config.rate_limit
+        self.rate_limit_burst = _config.rate_limit_burst
+        self.legacy_key_material = _config.legacy_key_material
+        logger.debug('Configured the client object using a configuration that was already resolved')
+
+    def _define_retry_policy(self, _retry_policy_from_arg: Optional[RetryPolicy]) -> None:
+        """Define the retry policy using a passed argument or the default retry policy."""
+        setting = const.CLIENT_SETTINGS.RETRY_POLICY
+        if _retry_policy_from_arg is None:
+            self.retry_policy = RetryPolicy()
+            _log_default_setting(setting)
+        elif isinstance(_retry_policy_from_arg, RetryPolicy):
+            self.retry_policy = _retry_policy_from_arg
+            _log_configured_setting(setting, const.ARGUMENT_VALUES.PROVIDED_METHODS[0])
+        else:
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=setting, data_type='RetryPolicy')
+            logger.error("The 'retry_policy' value is an invalid data type")
+            raise TypeError(_error_msg)
+
+    def _define_oauth_refresh_settings(self, _oauth_auto_refresh: bool, _oauth_refresh_ratio: float) -> None:
+        """Validate and define the settings for the background OAuth access token refresh."""
+        if not isinstance(_oauth_auto_refresh, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+                param=const.CLIENT_SETTINGS.OAUTH_AUTO_REFRESH, data_type='bool'
+            )
+            logger.error("The 'oauth_auto_refresh' value is an invalid data type")
+            raise TypeError(_error_msg)
+        if not isinstance(_oauth_refresh_ratio, (int, float)) or isinstance(_oauth_refresh_ratio, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+                param=const.CLIENT_SETTINGS.OAUTH_REFRESH_RATIO, data_type='float'
+            )
+            logger.error("The 'oauth_refresh_ratio' value is an invalid data type")
+            raise TypeError(_error_msg)
+        if not 0 < _oauth_refresh_ratio < 1:
+            _error_msg = f"The '{const.CLIENT_SETTINGS.OAUTH_REFRESH_RATIO}' value must be greater than 0 and less than 1"
+            logger.error("The 'oauth_refresh_ratio' value must be greater than 0 and less than 1")
+            raise ValueError(_error_msg)
+        self.oauth_auto_refresh = _oauth_auto_refresh
+        self.oauth_refresh_ratio = float(_oauth_refresh_ratio)
+
+    def _define_token_store(self, _token_store_from_arg: Optional[TokenStore]) -> None:
+        """Define the OAuth token store using a passed argument or a memory token store for the client object."""
+        setting = const.CLIENT_SETTINGS.TOKEN_STORE
+        if _token_store_from_arg is None:
+            self.token_store = MemoryTokenStore()
+            _log_default_setting(setting)
+        elif isinstance(_token_store_from_arg, TokenStore):
+            self.token_store = _token_store_from_arg
+            _log_configured_setting(setting, const.ARGUMENT_VALUES.PROVIDED_METHODS[0])
+        else:
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=setting, data_type='TokenStore')
+            logger.error("The 'token_store' value is an invalid data type")
+            raise TypeError(_error_msg)
+
+    def _define_request_coalescer(self, _coalesce_requests: bool) -> None:
+        """Define the request coalescer when concurrent identical read-only API calls should share a single request."""
+        if not isinstance(_coalesce_requests, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+                param=const.CLIENT_SETTINGS.COALESCE_REQUESTS, data_type='bool'
+            )
+            logger.error("The 'coalesce_requests' value is an invalid data type")
+            raise TypeError(_error_msg)
+        self.request_coalescer = RequestCoalescer() if _coalesce_requests else None
+
+    def _define_lazy_connect(self, _lazy_connect: bool) -> None:
+        """Define whether the connection to the tenant should be deferred until the first API call."""
+        if not isinstance(_lazy_connect, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+                param=const.CLIENT_SETTINGS.LAZY_CONNECT, data_type='bool'
+            )
+            logger.error("The 'lazy_connect' value is an invalid data type")
+            raise TypeError(_error_msg)
+        self.lazy_connect = _lazy_connect
+
+    def _define_json_codec(self, _json_codec: Union[str, JsonCodec]) -> None:
+        """Define the JSON codec used to encode API payloads and decode API responses."""
+        if isinstance(_json_codec, JsonCodec):
+            self.json_codec = _json_codec
+        elif isinstance(_json_codec, str):
+            self.json_codec = get_json_codec(_json_codec)
+        else:
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+                param=const.CLIENT_SETTINGS.JSON_CODEC, data_type='str or JsonCodec'
+            )
+            logger.error("The 'json_codec' value is an invalid data type")
+            raise TypeError(_error_msg)
+        logger.debug(f"The '{self.json_codec.name}' JSON codec will be used by the client object")
+
+    def _should_refresh_oauth_in_background(self) -> bool:
+        """Return whether the OAuth access token should be refreshed in the background for the client object."""
+        return self.oauth_auto_refresh and self.connection_type == const.CONNECTION_INFO.OAUTH
+
+    def _start_oauth_refresher(self) -> None:
+        """Start the background thread that refreshes the OAuth access token before it expires (when enabled)."""
+        if not self._should_refresh_oauth_in_background():
+            return
+        if self._oauth_refresher is not None and self._oauth_refresher.is_alive():
+            return
+        self._oauth_refresher_stop.clear()
+        self._oauth_refresher = threading.Thread(
+            target=_run_oauth_refresher,
+            args=(weakref.ref(self), self._oauth_refresher_stop),
+            name='pydplus-oauth-refresher',
+            daemon=True,
+        )
+        self._oauth_refresher.start()
+        logger.debug('Started the background OAuth access token refresh')
+
+    def _stop_oauth_refresher(self) -> None:
+        """Stop the background thread that refreshes the OAuth access token (if running)."""
+        self._oauth_refresher_stop.set()
+        if self._oauth_refresher is not None and self._oauth_refresher is not threading.current_thread():
+            self._oauth_refresher.join()
+            logger.debug('Stopped the background OAuth access token refresh')
+        self._oauth_refresher = None
+
     def _check_for_connection_type_mismatch(self):
         if self.legacy_key_material and self.connection_type == const.CONNECTION_INFO.OAUTH:
             _warn_msg = (
@@ -1013,25 +1394,96 @@ class PyDPlus:
         # Return the updated connection info dictionary
         return _partial_connection_info
 
-    def _ensure_oauth_headers(self, force_refresh: bool = False) -> dict[str, str]:
-        """Ensure valid OAuth headers are available for Administration API calls."""
+    def _ensure_oauth_headers(self, force_refresh: bool = False, rejected_headers: Optional[dict] = None) -> dict[str, str]:
+        """Ensure valid OAuth headers are available for Administration API calls.
+
+        Only one token refresh is performed at a time, and threads that are waiting for the lock reuse the token
+        obtained by the refresh that was already in progress rather than requesting another token.
+
+        :param force_refresh: Forces an access-token refresh and bypasses the token cache (``False`` by default)
+        :type force_refresh: bool
+        :param rejected_headers: The headers of a request whose access token was rejected, which allows a forced
+                                 refresh to be skipped when the token has already been replaced by another thread
+        :type rejected_headers: dict, None
+        :returns: The base headers containing a valid OAuth access token
+        """
         if self.connection_type != const.CONNECTION_INFO.OAUTH:
             return self.base_headers
-        base_headers, self._oauth_token_data = auth.get_oauth_headers(
-            connection_info=self.connection_info,
-            verify_ssl=self.verify_ssl,
-            token_data=self._oauth_token_data,
-            force_refresh=force_refresh,
-        )
-        self.base_headers = base_headers
+        with self._oauth_lock:
+            if force_refresh and auth._was_access_token_replaced(self.base_headers, rejected_headers):
+                logger.debug('The rejected OAuth access token was already refreshed by another thread')
+                force_refresh = False
+            base_headers, self._oauth_token_data = auth.get_oauth_headers(
+                connection_info=self.connection_info,
+                verify_ssl=self.verify_ssl,
+                token_data=self._oauth_token_data,
+                force_refresh=force_refresh,
+                session=self.session,
+                token_store=self.token_store,
+            )
+            self.base_headers = base_headers
         return base_headers
 
-    def refresh_oauth_token(self) -> dict[str, str]:
-        """Force refresh the OAuth access token and return updated base headers."""
-        return self._ensure_oauth_headers(force_refresh=True)
+    def _ensure_legacy_headers(self, force_refresh: bool = False, rejected_headers: Optional[dict] = None) -> dict[str, str]:
+        """Ensure headers with a JWT that is not close to expiring are available for Legacy API calls.
+
+        The private key is parsed once and kept in memory so that renewing the JWT only requires signing new claims.
+
+        :param force_refresh: Forces a new JWT to be signed even if the existing JWT is still valid (``False`` by default)
+        :type force_refresh: bool
+        :param rejected_headers: The headers of a request whose JWT was rejected, which allows a forced renewal to be
+                                 skipped when the JWT has already been replaced by another thread
+        :type rejected_headers: dict, None
+        :returns: The base headers containing a valid JWT
+        """
+        if self.connection_type != const.CONNECTION_INFO.LEGACY:
+            return self.base_headers
+        if not force_refresh and auth._is_legacy_token_valid(self._legacy_token_data):
+            return self.base_headers
+        with self._legacy_lock:
+            if force_refresh and auth._was_access_token_replaced(self.base_headers, rejected_headers):
+                logger.debug('The rejected JWT was already renewed by another thread')
+                force_refresh = False
+            if force_refresh or not auth._is_legacy_token_valid(self._legacy_token_data):
+                if self._legacy_private_key is None:
+                    self._legacy_private_key = auth._load_legacy_private_key(self.connection_info)
+                token_data = auth.get_legacy_access_token(
+                    base_url=self.base_url,
+                    connection_info=self.connection_info,
+                    force_refresh=True,
+                    private_key=self._legacy_private_key,
+                )
+                # The headers are updated before the token data so the unlocked validity check never pairs new
+                # token data with outdated headers
+                self.base_headers = auth.get_legacy_headers(jwt_string=token_data[const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN])
+                self._legacy_token_data = token_data
+        return self.base_headers
+
+    def refresh_legacy_token(self, rejected_headers: Optional[dict] = None) -> dict[str, str]:
+        """Force a new JWT to be signed for Legacy API calls and return updated base headers.
+
+        :param rejected_headers: The headers of a request whose JWT was rejected (optional)
+        :type rejected_headers: dict, None
+        :returns: The base headers containing the renewed JWT
+        """
+        return self._ensure_legacy_headers(force_refresh=True, rejected_headers=rejected_headers)
+
+    def refresh_oauth_token(self, rejected_headers: Optional[dict] = None) -> dict[str, str]:
+        """Force refresh the OAuth access token and return updated base headers.
+
+        :param rejected_headers: The headers of a request whose access token was rejected (optional)
+        :type rejected_headers: dict, None
+        :returns: The base headers containing the refreshed OAuth access token
+        """
+        return self._ensure_oauth_headers(force_refresh=True, rejected_headers=rejected_headers)
 
     def _check_if_connected(self) -> None:
-        """Check to see if the object is connected to the tenant and raises an exception if not."""
+        """Check if the object is connected to the tenant and connect when deferred or raise an exception otherwise."""
+        if not self.connected and self.lazy_connect:
+            # Only the first thread connects while any concurrent threads wait and then reuse the connection
+            with self._connect_lock:
+                if not self.connected:
+                    self.connect()
         if not self.connected:
             _error_msg = 'Must be connected to the tenant before performing an API call. Call the connect() method.'
             logger.error('The client must be connected before performing an API call')
@@ -1040,6 +1492,10 @@ class PyDPlus:
     def connect(self) -> Tuple[bool, dict[str, str]]:
         """Connect to the RSA ID Plus tenant using the Legacy API or OAuth method.
 
+        .. note::
+           The ``connected`` and ``base_headers`` attributes of the client object are updated once connected, so this
+           method can be called after instantiating the object with ``auto_connect=False``.
+
         :returns: Boolean value indicating if connection was established and dictionary with base API headers
         :raises: :py:exc:`errors.exceptions.APIConnectionError`,
                  :py:exc:`errors.exceptions.FeatureNotConfiguredError`
@@ -1053,7 +1509,7 @@ class PyDPlus:
         if self.connection_type == const.CLIENT_SETTINGS.CONNECTION_TYPE_LEGACY:
             # Connect to the tenant using the legacy API method
             try:
-                base_headers = auth.get_legacy_headers(base_url=self.base_url, connection_info=self.connection_info)
+                base_headers = self._ensure_legacy_headers()
                 self._oauth_token_data = None
                 connected = True
             except Exception as exc:
@@ -1066,6 +1522,7 @@ class PyDPlus:
             try:
                 base_headers = self._ensure_oauth_headers(force_refresh=connected)
                 connected = True
+                self._start_oauth_refresher()
             except Exception as exc:
                 exc_type = type(exc).__name__
                 error_msg = f'Failed to connect using OAuth due to the following {exc_type} exception'
@@ -1075,6 +1532,7 @@ class PyDPlus:
             error_msg = 'Unsupported connection_type configured'
             logger.error('Unsupported connection_type configured')
             raise errors.exceptions.APIConnectionError(error_msg)
+        self.connected, self.base_headers = connected, base_headers
         return connected, base_headers
 
     def get(
@@ -1087,6 +1545,9 @@ class PyDPlus:
         show_full_error: bool = True,
         return_json: bool = True,
         allow_failed_response: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
+        stream: bool = False,
     ):
         """Perform a GET request against the ID Plus tenant.
 
@@ -1107,7 +1568,16 @@ class PyDPlus:
         :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                       (If not explicitly defined then ``True`` if Strict Mode is disabled)
         :type allow_failed_response: bool, None
-        :returns: The API response in JSON format or as a ``requests`` object
+        :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+        :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+        :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+        :type idempotent: bool, None
+        :param stream: Determines if the response body should be streamed rather than downloaded immediately, in which
+                       case a generator that yields the elements of the top-level JSON array is returned (or the
+                       response object, which must be closed by the caller, when ``return_json`` is ``False``)
+                       (``False`` by default)
+        :type stream: bool
+        :returns: The API response in JSON format, as a ``requests`` object, or as a generator of JSON array elements
         :raises: :py:exc:`errors.exceptions.APIConnectionError`,
                  :py:exc:`errors.exceptions.APIRequestError`,
                  :py:exc:`errors.exceptions.APIResponseConversionError`,
@@ -1124,6 +1594,9 @@ class PyDPlus:
             show_full_error=show_full_error,
             return_json=return_json,
             allow_failed_response=allow_failed_response,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+            stream=stream,
         )
 
     def patch(
@@ -1137,6 +1610,8 @@ class PyDPlus:
         show_full_error: bool = True,
         return_json: bool = True,
         allow_failed_response: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
     ):
         """Perform a PATCH call with payload against the ID Plus tenant.
 
@@ -1159,6 +1634,10 @@ class PyDPlus:
         :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                       (If not explicitly defined then ``True`` if Strict Mode is disabled)
         :type allow_failed_response: bool, None
+        :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+        :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+        :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+        :type idempotent: bool, None
         :returns: The API response in JSON format or as a ``requests`` object
         :raises: :py:exc:`errors.exceptions.APIConnectionError`,
                  :py:exc:`errors.exceptions.APIMethodError`,
@@ -1178,6 +1657,8 @@ class PyDPlus:
             show_full_error=show_full_error,
             return_json=return_json,
             allow_failed_response=allow_failed_response,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
         )
 
     def post(
@@ -1191,6 +1672,8 @@ class PyDPlus:
         show_full_error: bool = True,
         return_json: bool = True,
         allow_failed_response: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
     ):
         """Perform a POST call with payload against the ID Plus tenant.
 
@@ -1213,6 +1696,10 @@ class PyDPlus:
         :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                       (If not explicitly defined then ``True`` if Strict Mode is disabled)
         :type allow_failed_response: bool, None
+        :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+        :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+        :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+        :type idempotent: bool, None
         :returns: The API response in JSON format or as a ``requests`` object
         :raises: :py:exc:`errors.exceptions.APIConnectionError`,
                  :py:exc:`errors.exceptions.APIMethodError`,
@@ -1232,6 +1719,8 @@ class PyDPlus:
             show_full_error=show_full_error,
             return_json=return_json,
             allow_failed_response=allow_failed_response,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
         )
 
     def put(
@@ -1245,6 +1734,8 @@ class PyDPlus:
         show_full_error: bool = True,
         return_json: bool = True,
         allow_failed_response: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
     ):
         """Perform a PUT call with payload against the ID Plus tenant.
 
@@ -1267,6 +1758,10 @@ class PyDPlus:
         :param allow_failed_response: Indicates that failed responses should return and should not raise an exception
                                       (If not explicitly defined then ``True`` if Strict Mode is disabled)
         :type allow_failed_response: bool, None
+        :param retry_policy: The retry policy to use for the API call (defaults to the retry policy of the client object)
+        :type retry_policy: pydplus.utils.retry.RetryPolicy, None
+        :param idempotent: Indicates if the API call can be safely retried (defined by the API method when not specified)
+        :type idempotent: bool, None
         :returns: The API response in JSON format or as a ``requests`` object
         :raises: :py:exc:`errors.exceptions.APIConnectionError`,
                  :py:exc:`errors.exceptions.APIMethodError`,
@@ -1286,6 +1781,8 @@ class PyDPlus:
             show_full_error=show_full_error,
             return_json=return_json,
             allow_failed_response=allow_failed_response,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
         )
 
     class User:
@@ -1299,6 +1796,122 @@ class PyDPlus:
             :returns: None
             """
             self.pydp_object: PyDPlus = pydp_object
+            self.lookup_cache: Optional[users_module.UserLookupCache] = None
+            self.user_index: Optional[UserIndex] = None
+
+        def enable_lookup_cache(
+            self,
+            maxsize: int = const.CACHE_SETTINGS.DEFAULT_MAXSIZE,
+            ttl: Union[int, float] = const.CACHE_SETTINGS.DEFAULT_TTL,
+            negative_ttl: Union[int, float] = const.CACHE_SETTINGS.DEFAULT_NEGATIVE_TTL,
+        ) -> users_module.UserLookupCache:
+            """Enable the cache of user lookups by email address (replacing any existing cache).
+
+            .. note::
+               The cache is used by the user detail and User ID lookup methods (including the bulk lookup methods),
+               and the cached lookups for a user are discarded when the user is enabled, disabled, synchronized, or
+               (un)marked as deleted.
+
+            :param maxsize: The maximum number of lookups retained by the cache (``1024`` by default)
+            :type maxsize: int
+            :param ttl: The number of seconds after which successful lookups expire (``300`` by default)
+            :type ttl: int, float
+            :param negative_ttl: The number of seconds after which ``404`` (i.e. not found) lookups expire
+                                 (``60`` by default)
+            :type negative_ttl: int, float
+            :returns: The :py:class:`pydplus.users.UserLookupCache` object, which exposes the ``hits`` and ``misses``
+                      counters
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`
+            """
+            self.lookup_cache = users_module.UserLookupCache(maxsize=maxsize, ttl=ttl, negative_ttl=negative_ttl)
+            return self.lookup_cache
+
+        def disable_lookup_cache(self) -> None:
+            """Disable the cache of user lookups and discard the cached lookups.
+
+            :returns: None
+            """
+            if self.lookup_cache is not None:
+                self.lookup_cache.clear()
+            self.lookup_cache = None
+
+        def enable_user_index(
+            self,
+            path: Union[Optional[str], Optional[Path]] = None,
+            max_age: Union[int, float] = const.USER_INDEX_SETTINGS.DEFAULT_MAX_AGE,
+        ) -> UserIndex:
+            """Enable the persistent index of email addresses to User IDs (replacing any existing index).
+
+            .. note::
+               The index is populated by the user lookup methods (including the bulk lookup methods), the User ID
+               lookup methods resolve the email addresses with fresh entries without calling the API, and the entries
+               for a user become stale when the user is enabled, disabled, synchronized, or (un)marked as deleted.
+
+            :param path: The path to the SQLite database file (defaults to a file specific to the tenant in the
+                         ``~/.cache/pydplus/user_index`` directory)
+            :type path: str, pathlib.Path, None
+            :param max_age: The number of seconds after which entries are stale and looked up again (``86400`` by default)
+            :type max_age: int, float
+            :returns: The :py:class:`pydplus.user_index.UserIndex` object, which exposes the ``hits`` and ``misses``
+                      counters
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`sqlite3.Error`
+            """
+            if path is None:
+                _directory = Path.home().joinpath(*const.USER_INDEX_SETTINGS.DEFAULT_DIRECTORY_PARTS)
+                _tenant = hashlib.sha256(str(self.pydp_object.admin_base_rest_url).encode(const.UTF8_ENCODING))
+                path = _directory / const.USER_INDEX_SETTINGS.TENANT_FILE_NAME_TEMPLATE.format(tenant=_tenant.hexdigest()[:16])
+            self.disable_user_index()
+            self.user_index = UserIndex(path=path, max_age=max_age)
+            return self.user_index
+
+        def disable_user_index(self) -> None:
+            """Disable the persistent user index and close its database file (the file itself is retained).
+
+            :returns: None
+            """
+            if self.user_index is not None:
+                self.user_index.close()
+            self.user_index = None
+
+        def refresh_user_index(
+            self,
+            emails: Iterable[str],
+            max_age: Union[Optional[int], Optional[float]] = None,
+            max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+        ) -> list[BulkResult]:
+            """Look up the users whose entries in the user index are missing or stale so that the index is refreshed.
+
+            :param emails: The email addresses of the users to keep current in the user index
+            :type emails: Iterable[str]
+            :param max_age: The number of seconds after which entries are stale (defaults to the maximum age of the index)
+            :type max_age: int, float, None
+            :param max_workers: The maximum number of concurrent lookups (``10`` by default)
+            :type max_workers: int
+            :param timeout: The timeout period in seconds for each lookup (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :returns: List of :py:class:`pydplus.bulk.BulkResult` objects (with the user details in JSON format as
+                      the result) for the email addresses that were looked up
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.FeatureNotConfiguredError`
+            """
+            self.pydp_object._check_if_connected()
+            return users_module.refresh_user_index(
+                self.pydp_object,
+                emails=emails,
+                max_age=max_age,
+                max_workers=max_workers,
+                timeout=timeout,
+                show_full_error=show_full_error,
+            )
 
         def get_user_details(
             self,
@@ -1383,6 +1996,78 @@ class PyDPlus:
                 show_full_error=show_full_error,
             )
 
+        def get_user_details_many(
+            self,
+            emails: Iterable[str],
+            max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+            search_unsynced: Optional[bool] = None,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+        ) -> list[BulkResult]:
+            """Retrieve the details for multiple users concurrently based on their email addresses.
+
+            :param emails: The email addresses of the users for whom to retrieve details
+            :type emails: Iterable[str]
+            :param max_workers: The maximum number of concurrent lookups (``10`` by default)
+            :type max_workers: int
+            :param search_unsynced: Indicates if the user search should include unsynchronized users (optional)
+            :type search_unsynced: bool, None
+            :param timeout: The timeout period in seconds for each lookup (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :returns: List of :py:class:`pydplus.bulk.BulkResult` objects (with the user details in JSON format as
+                      the result) in the same order as the provided email addresses
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`
+            """
+            self.pydp_object._check_if_connected()
+            return users_module.get_user_details_many(
+                self.pydp_object,
+                emails=emails,
+                max_workers=max_workers,
+                search_unsynced=search_unsynced,
+                timeout=timeout,
+                show_full_error=show_full_error,
+            )
+
+        def get_user_ids_many(
+            self,
+            emails: Iterable[str],
+            max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+            search_unsynced: Optional[bool] = None,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+        ) -> list[BulkResult]:
+            """Retrieve the User IDs for multiple users concurrently based on their email addresses.
+
+            :param emails: The email addresses of the users for whom to retrieve the User IDs
+            :type emails: Iterable[str]
+            :param max_workers: The maximum number of concurrent lookups (``10`` by default)
+            :type max_workers: int
+            :param search_unsynced: Indicates if the user search should include unsynchronized users (optional)
+            :type search_unsynced: bool, None
+            :param timeout: The timeout period in seconds for each lookup (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :returns: List of :py:class:`pydplus.bulk.BulkResult` objects (with the User ID string as the result) in
+                      the same order as the provided email addresses
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`
+            """
+            self.pydp_object._check_if_connected()
+            return users_module.get_user_ids_many(
+                self.pydp_object,
+                emails=emails,
+                max_workers=max_workers,
+                search_unsynced=search_unsynced,
+                timeout=timeout,
+                show_full_error=show_full_error,
+            )
+
         def enable_user(
             self,
             user_id: str,
@@ -1583,6 +2268,466 @@ class PyDPlus:
                 allow_failed_response=allow_failed_response,
             )
 
+        def enable_users(
+            self,
+            user_ids: Iterable[str],
+            max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ) -> BulkReport:
+            """Enable multiple users concurrently that are currently disabled.
+
+            :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_ids: Iterable[str]
+            :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+            :type max_workers: int
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param allow_failed_response: Indicates that failed responses should be returned in the result for the user
+                                          rather than captured as an exception (If not explicitly defined then ``True``
+                                          if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`
+            """
+            self.pydp_object._check_if_connected()
+            return users_module.enable_users(
+                self.pydp_object,
+                user_ids=user_ids,
+                max_workers=max_workers,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                allow_failed_response=allow_failed_response,
+            )
+
+        def disable_users(
+            self,
+            user_ids: Iterable[str],
+            max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ) -> BulkReport:
+            """Disable multiple users concurrently that are currently enabled.
+
+            :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_ids: Iterable[str]
+            :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+            :type max_workers: int
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param allow_failed_response: Indicates that failed responses should be returned in the result for the user
+                                          rather than captured as an exception (If not explicitly defined then ``True``
+                                          if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`
+            """
+            self.pydp_object._check_if_connected()
+            return users_module.disable_users(
+                self.pydp_object,
+                user_ids=user_ids,
+                max_workers=max_workers,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                allow_failed_response=allow_failed_response,
+            )
+
+        def synchronize_users(
+            self,
+            user_ids: Iterable[str],
+            max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ) -> BulkReport:
+            """Synchronize the details of multiple users concurrently between an identity source and the Cloud Access Service.
+
+            :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_ids: Iterable[str]
+            :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+            :type max_workers: int
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param allow_failed_response: Indicates that failed responses should be returned in the result for the user
+                                          rather than captured as an exception (If not explicitly defined then ``True``
+                                          if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`
+            """
+            self.pydp_object._check_if_connected()
+            return users_module.synchronize_users(
+                self.pydp_object,
+                user_ids=user_ids,
+                max_workers=max_workers,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                allow_failed_response=allow_failed_response,
+            )
+
+        def mark_users_deleted(
+            self,
+            user_ids: Iterable[str],
+            max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ) -> BulkReport:
+            """Mark multiple users concurrently to be deleted during the next automated bulk deletion process.
+
+            :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_ids: Iterable[str]
+            :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+            :type max_workers: int
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param allow_failed_response: Indicates that failed responses should be returned in the result for the user
+                                          rather than captured as an exception (If not explicitly defined then ``True``
+                                          if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`
+            """
+            self.pydp_object._check_if_connected()
+            return users_module.mark_users_deleted(
+                self.pydp_object,
+                user_ids=user_ids,
+                max_workers=max_workers,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                allow_failed_response=allow_failed_response,
+            )
+
+        def unmark_users_deleted(
+            self,
+            user_ids: Iterable[str],
+            max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+            show_full_error: bool = True,
+            allow_failed_response: Optional[bool] = None,
+        ) -> BulkReport:
+            """Unmark multiple users concurrently that were flagged to be deleted.
+
+            :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+            :type user_ids: Iterable[str]
+            :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+            :type max_workers: int
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+            :type show_full_error: bool
+            :param allow_failed_response: Indicates that failed responses should be returned in the result for the user
+                                          rather than captured as an exception (If not explicitly defined then ``True``
+                                          if Strict Mode is disabled)
+            :type allow_failed_response: bool, None
+            :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`
+            """
+            self.pydp_object._check_if_connected()
+            return users_module.unmark_users_deleted(
+                self.pydp_object,
+                user_ids=user_ids,
+                max_workers=max_workers,
+                timeout=timeout,
+                show_full_error=show_full_error,
+                allow_failed_response=allow_failed_response,
+            )
+
+    class Audit:
+        """Class containing audit log methods."""
+
+        def __init__(self, pydp_object) -> None:
+            """Initialize the :py:class:`pydplus.core.PyDPlus.Audit` inner class object.
+
+            :param pydp_object: The core :py:class:`pydplus.PyDPlus` object
+            :type pydp_object: class[pydplus.PyDPlus]
+            :returns: None
+            """
+            self.pydp_object: PyDPlus = pydp_object
+
+        def export_admin_logs(
+            self,
+            start_time: Union[str, datetime.datetime],
+            end_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+            page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+            checkpoint_path: Union[Optional[str], Optional[Path]] = None,
+            prefetch: bool = True,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        ) -> Iterator[dict]:
+            """Export the administrator audit log events within a time range, yielding the events lazily page by page.
+
+            .. note::
+               This method requires the ``rsa.audit.admin`` OAuth scope. Refer to :py:func:`pydplus.audit.export_logs`
+               for details about the checkpoint file.
+
+            :param start_time: The time after which the events occurred (naive times are considered to be in UTC)
+            :type start_time: str, datetime.datetime
+            :param end_time: The time on or before which the events occurred (the current time by default)
+            :type end_time: str, datetime.datetime, None
+            :param page_size: The number of events to retrieve with each API call (``100`` by default)
+            :type page_size: int
+            :param checkpoint_path: The path to a file in which to save the position of the export (optional)
+            :type checkpoint_path: str, pathlib.Path, None
+            :param prefetch: Determines if the next page should be retrieved while the current page is being consumed
+                             (``True`` by default)
+            :type prefetch: bool
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :returns: Generator that yields the administrator audit log events in JSON format
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.DataMismatchError`
+            """
+            self.pydp_object._check_if_connected()
+            return audit_module.export_admin_logs(
+                self.pydp_object,
+                start_time=start_time,
+                end_time=end_time,
+                page_size=page_size,
+                checkpoint_path=checkpoint_path,
+                prefetch=prefetch,
+                timeout=timeout,
+            )
+
+        def export_user_event_logs(
+            self,
+            start_time: Union[str, datetime.datetime],
+            end_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+            page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+            checkpoint_path: Union[Optional[str], Optional[Path]] = None,
+            prefetch: bool = True,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        ) -> Iterator[dict]:
+            """Export the user event audit log events within a time range, yielding the events lazily page by page.
+
+            .. note::
+               This method requires the ``rsa.audit.user`` OAuth scope. Refer to :py:func:`pydplus.audit.export_logs`
+               for details about the checkpoint file.
+
+            :param start_time: The time after which the events occurred (naive times are considered to be in UTC)
+            :type start_time: str, datetime.datetime
+            :param end_time: The time on or before which the events occurred (the current time by default)
+            :type end_time: str, datetime.datetime, None
+            :param page_size: The number of events to retrieve with each API call (``100`` by default)
+            :type page_size: int
+            :param checkpoint_path: The path to a file in which to save the position of the export (optional)
+            :type checkpoint_path: str, pathlib.Path, None
+            :param prefetch: Determines if the next page should be retrieved while the current page is being consumed
+                             (``True`` by default)
+            :type prefetch: bool
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :returns: Generator that yields the user event audit log events in JSON format
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.DataMismatchError`
+            """
+            self.pydp_object._check_if_connected()
+            return audit_module.export_user_event_logs(
+                self.pydp_object,
+                start_time=start_time,
+                end_time=end_time,
+                page_size=page_size,
+                checkpoint_path=checkpoint_path,
+                prefetch=prefetch,
+                timeout=timeout,
+            )
+
+        def export_logs_parallel(
+            self,
+            log_type: str,
+            start_time: Union[str, datetime.datetime],
+            end_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+            slices: int = const.AUDIT_SETTINGS.DEFAULT_SLICES,
+            page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        ) -> Iterator[dict]:
+            """Export the audit log events within a time range using concurrent API calls for non-overlapping time slices.
+
+            .. note::
+               The events of the time slices are merged back into chronological order and the API calls remain within
+               the rate limit of the client object. Refer to :py:func:`pydplus.audit.export_logs_parallel` for details.
+
+            :param log_type: The type of audit logs to export (``admin`` or ``user``)
+            :type log_type: str
+            :param start_time: The time after which the events occurred (naive times are considered to be in UTC)
+            :type start_time: str, datetime.datetime
+            :param end_time: The time on or before which the events occurred (the current time by default)
+            :type end_time: str, datetime.datetime, None
+            :param slices: The number of time slices (and worker threads) into which the time range is split
+                           (``4`` by default)
+            :type slices: int
+            :param page_size: The number of events to retrieve with each API call (``100`` by default)
+            :type page_size: int
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :returns: Generator that yields the audit log events in JSON format and in chronological order
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`
+            """
+            self.pydp_object._check_if_connected()
+            return audit_module.export_logs_parallel(
+                self.pydp_object,
+                log_type=log_type,
+                start_time=start_time,
+                end_time=end_time,
+                slices=slices,
+                page_size=page_size,
+                timeout=timeout,
+            )
+
+        def poll_logs(
+            self,
+            log_type: str,
+            state_path: Union[str, Path],
+            start_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+            page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        ) -> Iterator[dict]:
+            """Retrieve the audit log events that occurred since the previous poll, as recorded by a high-water mark.
+
+            .. note::
+               The high-water mark is saved to the state file whenever the poll stops. Refer to
+               :py:func:`pydplus.audit.poll_logs` for details.
+
+            :param log_type: The type of audit logs to retrieve (``admin`` or ``user``)
+            :type log_type: str
+            :param state_path: The path to the file in which the high-water mark is saved
+            :type state_path: str, pathlib.Path
+            :param start_time: The time after which events are retrieved when the state file does not exist yet
+                               (the current time by default)
+            :type start_time: str, datetime.datetime, None
+            :param page_size: The number of events to retrieve with each API call (``100`` by default)
+            :type page_size: int
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :returns: Generator that yields the new audit log events in JSON format
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.DataMismatchError`
+            """
+            self.pydp_object._check_if_connected()
+            return audit_module.poll_logs(
+                self.pydp_object,
+                log_type=log_type,
+                state_path=state_path,
+                start_time=start_time,
+                page_size=page_size,
+                timeout=timeout,
+            )
+
+        def follow_logs(
+            self,
+            log_type: str,
+            state_path: Union[str, Path],
+            start_time: Union[Optional[str], Optional[datetime.datetime]] = None,
+            poll_interval: Union[int, float] = const.AUDIT_SETTINGS.DEFAULT_POLL_INTERVAL,
+            max_polls: Optional[int] = None,
+            stop_event: Optional[threading.Event] = None,
+            page_size: int = const.AUDIT_SETTINGS.DEFAULT_PAGE_SIZE,
+            timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+        ) -> Iterator[dict]:
+            """Follow the audit logs by polling for new events at a regular interval, yielding each event once.
+
+            .. note::
+               Refer to :py:func:`pydplus.audit.follow_logs` for details.
+
+            :param log_type: The type of audit logs to follow (``admin`` or ``user``)
+            :type log_type: str
+            :param state_path: The path to the file in which the high-water mark is saved
+            :type state_path: str, pathlib.Path
+            :param start_time: The time after which events are retrieved when the state file does not exist yet
+                               (the current time by default)
+            :type start_time: str, datetime.datetime, None
+            :param poll_interval: The number of seconds to wait between polls (``60`` by default)
+            :type poll_interval: int, float
+            :param max_polls: The number of polls after which the generator stops (no limit by default)
+            :type max_polls: int, None
+            :param stop_event: An event that stops the generator once it is set
+            :type stop_event: threading.Event, None
+            :param page_size: The number of events to retrieve with each API call (``100`` by default)
+            :type page_size: int
+            :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+            :type timeout: int
+            :returns: Generator that yields the new audit log events in JSON format
+            :raises: :py:exc:`TypeError`,
+                     :py:exc:`ValueError`,
+                     :py:exc:`errors.exceptions.APIConnectionError`,
+                     :py:exc:`errors.exceptions.DataMismatchError`
+            """
+            self.pydp_object._check_if_connected()
+            return audit_module.follow_logs(
+                self.pydp_object,
+                log_type=log_type,
+                state_path=state_path,
+                start_time=start_time,
+                poll_interval=poll_interval,
+                max_polls=max_polls,
+                stop_event=stop_event,
+                page_size=page_size,
+                timeout=timeout,
+            )
+
+
+def _run_oauth_refresher(_client_ref: weakref.ref, _stop_event: threading.Event) -> None:
+    """Refresh the OAuth access token of a client object in the background until it is closed or garbage collected.
+
+    :param _client_ref: Weak reference to the client object so the background thread does not keep it alive
+    :type _client_ref: weakref.ref
+    :param _stop_event: The event that is set when the background refresh should stop
+    :type _stop_event: threading.Event
+    :returns: None
+    """
+    _delay = None
+    _scheduled_headers = None
+    while True:
+        _client = _client_ref()
+        if _client is None:
+            return
+        if _delay is None:
+            # Capture the headers of the token being refreshed so that a token replaced in the meantime is kept
+            _scheduled_headers = dict(_client.base_headers)
+            _delay = auth._get_oauth_refresh_delay(_client._oauth_token_data, _client.oauth_refresh_ratio)
+        _client = None
+        if _stop_event.wait(_delay):
+            return
+        _client = _client_ref()
+        if _client is None:
+            return
+        try:
+            # The refresh is skipped if the token has already been replaced since it was scheduled
+            _client.refresh_oauth_token(rejected_headers=_scheduled_headers)
+            _delay = None
+        except Exception as _exc:
+            _exc_type = errors.handlers.get_exception_type(_exc)
+            logger.error(f'Failed to refresh the OAuth access token in the background due to a {_exc_type} exception')
+            _delay = const.AUTH_VALUES._OAUTH_REFRESH_RETRY_SECONDS
+        _client = None
+
 
 def compile_connection_info(
     base_url: Optional[str] = None,
@@ -1729,6 +2874,27 @@ def compile_connection_info(
     return connection_info
 
 
+def resolve_client_config(**kwargs) -> ClientConfig:
+    """Resolve the client configuration once so that it can be reused to instantiate client objects cheaply.
+
+    .. note::
+       The returned :py:class:`pydplus.config.ClientConfig` object can be pickled and passed to the ``config``
+       parameter of the :py:class:`pydplus.core.PyDPlus` class (e.g. within worker processes), which then skips
+       parsing the helper file, reading the environment variables, and compiling the connection info.
+
+    :param kwargs: The keyword arguments that define the configuration, which are the same as those of the
+                   :py:class:`pydplus.core.PyDPlus` class (e.g. ``helper``, ``env``, ``connection_info``, etc.)
+    :returns: The resolved client configuration
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`pydplus.errors.exceptions.MissingRequiredDataError`
+    """
+    # The configuration is resolved by a client object that never connects to the tenant
+    kwargs.update(auto_connect=False, lazy_connect=False)
+    with PyDPlus(**kwargs) as _pydp_object:
+        return _pydp_object.config
+
+
 def _infer_auth_base_url_from_admin_base_url(_admin_base_url: Optional[str]) -> Optional[str]:
     """Infer an Authentication API base URL from a matching Administration API base URL."""
     if not isinstance(_admin_base_url, str) or not _admin_base_url:
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.token_store
+:Synopsis:          Defines the stores used to cache and share OAuth access tokens between client objects and processes
+:Usage:             ``from pydplus.token_store import FileTokenStore``
+:Example:           ``pydp = PyDPlus(token_store=FileTokenStore())``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from . import constants as const
+from . import errors
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - fcntl is unavailable on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def get_token_store_key(issuer_url: str, client_id: str, scope: str) -> str:
+    """Return the key used to store the OAuth access token for a given issuer, client, and scope.
+
+    .. note::
+       The key is a SHA-256 digest so that the issuer URL and Client ID are not exposed in the key itself (e.g. in
+       the names of the files created by the :py:class:`pydplus.token_store.FileTokenStore` class).
+
+    :param issuer_url: The OAuth issuer URL used to request the access token
+    :type issuer_url: str
+    :param client_id: The OAuth Client ID used to request the access token
+    :type client_id: str
+    :param scope: The ``+``-delimited OAuth scope string requested for the access token
+    :type scope: str
+    :returns: The token store key
+    """
+    _scope = '+'.join(sorted(set(scope.replace(' ', '+').split('+')) - {''}))
+    _key_data = '\n'.join((issuer_url, client_id, _scope))
+    return hashlib.sha256(_key_data.encode(const.UTF8_ENCODING)).hexdigest()
+
+
+class TokenStore(ABC):
+    """Base class for the stores that cache OAuth access tokens by issuer URL, Client ID, and scope.
+
+    Custom backends (e.g. Redis or memcached) can be used by subclassing this class and implementing the
+    :py:meth:`get`, :py:meth:`set`, and :py:meth:`delete` methods. Backends that are shared by several processes
+    should also override the :py:meth:`lock` method so that only one process requests a new token at a time.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the token data stored for a key.
+
+        :param key: The token store key returned by the :py:func:`pydplus.token_store.get_token_store_key` function
+        :type key: str
+        :returns: The stored token data, or ``None`` if no token data is stored for the key
+        """
+
+    @abstractmethod
+    def set(self, key: str, token_data: dict[str, Any]) -> None:
+        """Store the token data for a key.
+
+        :param key: The token store key returned by the :py:func:`pydplus.token_store.get_token_store_key` function
+        :type key: str
+        :param token_data: The OAuth token metadata to store
+        :type token_data: dict
+        :returns: None
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the token data stored for a key (if any).
+
+        :param key: The token store key returned by the :py:func:`pydplus.token_store.get_token_store_key` function
+        :type key: str
+        :returns: None
+        """
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock for a key while a new access token is requested and stored.
+
+        The base implementation does not perform any locking.
+
+        :param key: The token store key returned by the :py:func:`pydplus.token_store.get_token_store_key` function
+        :type key: str
+        :returns: Context manager that holds the lock until it exits
+        """
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    """Thread-safe token store that keeps OAuth access tokens in the memory of the current process.
+
+    .. note::
+       Each client object uses its own memory token store by default. A single instance can be passed to several
+       client objects via the ``token_store`` parameter so that they share their access tokens.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate the memory token store object."""
+        self._tokens: dict[str, dict[str, Any]] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}()'
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return a copy of the token data stored for a key."""
+        with self._lock:
+            _token_data = self._tokens.get(key)
+        return dict(_token_data) if _token_data is not None else None
+
+    def set(self, key: str, token_data: dict[str, Any]) -> None:
+        """Store a copy of the token data for a key."""
+        with self._lock:
+            self._tokens[key] = dict(token_data)
+
+    def delete(self, key: str) -> None:
+        """Remove the token data stored for a key (if any)."""
+        with self._lock:
+            self._tokens.pop(key, None)
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock for a key that is shared by every thread using the token store."""
+        with self._lock:
+            _key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with _key_lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """Token store that shares OAuth access tokens between the processes on a host using files on disk.
+
+    Each token is written atomically to its own JSON file that is only readable by the current user (``0600``) in a
+    directory that is only accessible by the current user (``0700``), and an exclusive file lock ensures that only
+    one process requests a new token at a time while the others wait and then reuse the token it stored.
+
+    .. note::
+       This token store relies on the :py:mod:`fcntl` module and is therefore only supported on POSIX systems.
+
+    :param directory: The directory in which the token files are stored (``~/.cache/pydplus/tokens`` by default)
+    :type directory: str, pathlib.Path, None
+    :raises: :py:exc:`PermissionError`,
+             :py:exc:`pydplus.errors.exceptions.CurrentlyUnsupportedError`
+    """
+
+    def __init__(self, directory: Union[Optional[str], Optional[Path]] = None) -> None:
+        """Instantiate the file token store object."""
+        if fcntl is None:
+            _error_msg = 'The file token store requires file locking support that is unavailable on this platform'
+            logger.error('The file token store is unsupported on this platform')
+            raise errors.exceptions.CurrentlyUnsupportedError(message=_error_msg)
+        if directory is None:
+            directory = Path.home().joinpath(*const.TOKEN_STORE_SETTINGS.DEFAULT_DIRECTORY_PARTS)
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=const.TOKEN_STORE_SETTINGS.DIRECTORY_MODE, parents=True, exist_ok=True)
+        _restrict_directory_permissions(self.directory)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(directory={str(self.directory)!r})'
+
+    def _get_path(self, _key: str, _extension: str) -> Path:
+        """Return the path to a token or lock file for a key."""
+        return self.directory / f'{_key}{_extension}'
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the token data stored in the token file for a key."""
+        _token_path = self._get_path(key, const.TOKEN_STORE_SETTINGS.TOKEN_FILE_EXTENSION)
+        try:
+            with open(_token_path, encoding=const.UTF8_ENCODING) as _file:
+                _token_data = json.load(_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning('The stored OAuth token could not be read and will be ignored')
+            return None
+        return _token_data if isinstance(_token_data, dict) else None
+
+    def set(self, key: str, token_data: dict[str, Any]) -> None:
+        """Write the token data atomically to the token file for a key."""
+        _token_path = self._get_path(key, const.TOKEN_STORE_SETTINGS.TOKEN_FILE_EXTENSION)
+        # Temporary files are created with 0600 permissions and renamed so readers never see a partial file
+        _file_descriptor, _temp_path = tempfile.mkstemp(dir=self.directory, prefix=f'.{key}.')
+        try:
+            with os.fdopen(_file_descriptor, 'w', encoding=const.UTF8_ENCODING) as _file:
+                json.dump(token_data, _file)
+            os.replace(_temp_path, _token_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(_temp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        """Remove the token file for a key (if any)."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._get_path(key, const.TOKEN_STORE_SETTINGS.TOKEN_FILE_EXTENSION))
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive file lock for a key that is shared by every process using the same directory."""
+        _lock_path = self._get_path(key, const.TOKEN_STORE_SETTINGS.LOCK_FILE_EXTENSION)
+        _file_descriptor = os.open(_lock_path, os.O_RDWR | os.O_CREAT, const.TOKEN_STORE_SETTINGS.FILE_MODE)
+        try:
+            fcntl.flock(_file_descriptor, fcntl.LOCK_EX)
+            yield
+        finally:
+            # Closing the file descriptor also releases the lock
+            os.close(_file_descriptor)
+
+
+def _restrict_directory_permissions(_directory: Path) -> None:
+    """Ensure a token directory is only accessible by the current user, as existing directories keep their mode."""
+    if not _directory.stat().st_mode & 0o077:
+        return
+    try:
+        os.chmod(_directory, const.TOKEN_STORE_SETTINGS.DIRECTORY_MODE)
+    except OSError as _exc:
+        _error_msg = f"The token store directory '{_directory}' is accessible by other users and could not be restricted"
+        logger.error('The token store directory is accessible by other users and could not be restricted')
+        raise PermissionError(_error_msg) from _exc
+    logger.debug('The permissions of the token store directory were restricted to the current user')
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.user_index
+:Synopsis:          Defines the persistent index of email addresses to User IDs that avoids repeated user lookups
+:Usage:             ``from pydplus.user_index import UserIndex``
+:Example:           ``user_index = UserIndex('/path/to/user_index.sqlite3', max_age=86400)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from . import constants as const
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_STATEMENTS = (
+    'CREATE TABLE IF NOT EXISTS users (email TEXT PRIMARY KEY, user_id TEXT NOT NULL, details TEXT, last_seen REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS users_user_id ON users (user_id)',
+)
+
+
+@dataclass(slots=True)
+class UserIndexEntry:
+    """A user stored in the persistent user index.
+
+    :param email: The normalized (i.e. lowercase) email address of the user
+    :type email: str
+    :param user_id: The ID of the user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+    :type user_id: str
+    :param details: The user details returned by the most recent lookup of the user (if available)
+    :type details: dict, None
+    :param last_seen: The time (in seconds since the epoch) when the user was last looked up
+    :type last_seen: float
+    """
+
+    # Define the class variables
+    email: str
+    user_id: str
+    details: Optional[dict[str, Any]]
+    last_seen: float
+
+    @property
+    def age(self) -> float:
+        """Return the number of seconds that have elapsed since the user was last looked up."""
+        return max(time.time() - self.last_seen, 0.0)
+
+
+class UserIndex:
+    """Thread-safe index of email addresses to User IDs and last-seen user details stored in a SQLite database file.
+
+    The index is populated by the user lookup functions when it is enabled on a client object, and entries are
+    considered stale once they are older than the maximum age so that they are refreshed by the next lookup. As the
+    index is persisted to a single file, it can be reused by later jobs and shared by the processes on a host.
+
+    .. note::
+       Email addresses are normalized to lowercase and an index should only contain the users of a single tenant.
+       The user lookup functions only use the index for lookups that do not search unsynchronized users.
+
+    :param path: The path to the SQLite database file (``~/.cache/pydplus/user_index/user_index.sqlite3`` by default)
+    :type path: str, pathlib.Path, None
+    :param max_age: The number of seconds after which entries are stale (``86400`` by default)
+    :type max_age: int, float
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`sqlite3.Error`
+    """
+
+    def __init__(
+        self,
+        path: Union[Optional[str], Optional[Path]] = None,
+        max_age: Union[int, float] = const.USER_INDEX_SETTINGS.DEFAULT_MAX_AGE,
+    ) -> None:
+        """Instantiate the user index object."""
+        self.max_age = _validate_max_age(max_age)
+        if path is None:
+            path = Path.home().joinpath(
+                *const.USER_INDEX_SETTINGS.DEFAULT_DIRECTORY_PARTS, const.USER_INDEX_SETTINGS.DEFAULT_FILE_NAME
+            )
+        self.path = Path(path)
+        self.path.parent.mkdir(mode=const.USER_INDEX_SETTINGS.DIRECTORY_MODE, parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        # Create the database file so that it is only accessible by the current user before SQLite opens it
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, const.USER_INDEX_SETTINGS.FILE_MODE))
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(
+            self.path,
+            timeout=const.USER_INDEX_SETTINGS.BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+        )
+        with self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            for _statement in _SCHEMA_STATEMENTS:
+                self._connection.execute(_statement)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(path={str(self.path)!r}, max_age={self.max_age!r})'
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._get_connection().execute('SELECT COUNT(*) FROM users').fetchone()[0]
+
+    def __enter__(self) -> UserIndex:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the database connection (the lock must already be held)."""
+        if self._connection is None:
+            _error_msg = 'The user index has been closed'
+            logger.error('The user index has been closed')
+            raise sqlite3.ProgrammingError(_error_msg)
+        return self._connection
+
+    def _get_oldest_fresh_time(self, _max_age: Union[Optional[int], Optional[float]]) -> float:
+        """Return the earliest last-seen time at which an entry is still fresh."""
+        return time.time() - (self.max_age if _max_age is None else _validate_max_age(_max_age))
+
+    def get(self, email: str, max_age: Union[Optional[int], Optional[float]] = None) -> Optional[UserIndexEntry]:
+        """Return the entry for an email address if it is present and not stale, and record a hit or miss.
+
+        :param email: The email address of the user
+        :type email: str
+        :param max_age: The number of seconds after which the entry is stale (defaults to the maximum age of the index)
+        :type max_age: int, float, None
+        :returns: The :py:class:`pydplus.user_index.UserIndexEntry` object, or ``None`` if the entry is missing or stale
+        :raises: :py:exc:`TypeError`,
+                 :py:exc:`ValueError`
+        """
+        return self.get_many([email], max_age=max_age).get(email)
+
+    def get_many(
+        self,
+        emails: Iterable[str],
+        max_age: Union[Optional[int], Optional[float]] = None,
+    ) -> dict[str, UserIndexEntry]:
+        """Return the entries for multiple email addresses that are present and not stale, and record hits and misses.
+
+        :param emails: The email addresses of the users
+        :type emails: Iterable[str]
+        :param max_age: The number of seconds after which entries are stale (defaults to the maximum age of the index)
+        :type max_age: int, float, None
+        :returns: Dictionary of :py:class:`pydplus.user_index.UserIndexEntry` objects keyed by the provided email
+                  addresses, which omits the email addresses with missing or stale entries
+        :raises: :py:exc:`TypeError`,
+                 :py:exc:`ValueError`
+        """
+        _oldest_fresh_time = self._get_oldest_fresh_time(max_age)
+        _emails = {_email: _normalize_email(_email) for _email in dict.fromkeys(emails)}
+        _normalized_emails = list(dict.fromkeys(_emails.values()))
+        _entries: dict[str, UserIndexEntry] = {}
+        _batch_size = const.USER_INDEX_SETTINGS.QUERY_BATCH_SIZE
+        with self._lock:
+            _connection = self._get_connection()
+            for _start in range(0, len(_normalized_emails), _batch_size):
+                _batch = _normalized_emails[_start : _start + _batch_size]
+                _rows = _connection.execute(
+                    'SELECT email, user_id, details, last_seen FROM users '
+                    f'WHERE last_seen > ? AND email IN ({", ".join("?" * len(_batch))})',
+                    (_oldest_fresh_time, *_batch),
+                )
+                for _email, _user_id, _details, _last_seen in _rows:
+                    _entries[_email] = UserIndexEntry(_email, _user_id, _load_details(_details), _last_seen)
+            _found = {_email: _entries[_normalized] for _email, _normalized in _emails.items() if _normalized in _entries}
+            self.hits += len(_found)
+            self.misses += len(_emails) - len(_found)
+        return _found
+
+    def get_stale_emails(self, emails: Iterable[str], max_age: Union[Optional[int], Optional[float]] = None) -> list[str]:
+        """Return the email addresses that are missing from the index or have stale entries (i.e. need to be refreshed).
+
+        :param emails: The email addresses of the users
+        :type emails: Iterable[str]
+        :param max_age: The number of seconds after which entries are stale (defaults to the maximum age of the index)
+        :type max_age: int, float, None
+        :returns: List of the (deduplicated) email addresses in their original order
+        :raises: :py:exc:`TypeError`,
+                 :py:exc:`ValueError`
+        """
+        _emails = list(dict.fromkeys(emails))
+        _fresh_entries = self.get_many(_emails, max_age=max_age)
+        return [_email for _email in _emails if _email not in _fresh_entries]
+
+    def set(self, email: str, user_id: str, details: Optional[dict[str, Any]] = None) -> None:
+        """Store (or refresh) the entry for an email address.
+
+        :param email: The email address of the user
+        :type email: str
+        :param user_id: The ID of the user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+        :type user_id: str
+        :param details: The user details returned by the lookup of the user (optional)
+        :type details: dict, None
+        :returns: None
+        """
+        self.set_many([(email, user_id, details)])
+
+    def set_many(self, entries: Iterable[tuple[str, str, Optional[dict[str, Any]]]]) -> None:
+        """Store (or refresh) the entries for multiple email addresses in a single transaction.
+
+        :param entries: Tuples with the email address, User ID, and (optional) user details of each user
+        :type entries: Iterable[tuple]
+        :returns: None
+        """
+        _now = time.time()
+        _rows = [
+            (_normalize_email(_email), _user_id, json.dumps(_details) if _details is not None else None, _now)
+            for _email, _user_id, _details in entries
+        ]
+        with self._lock:
+            with self._get_connection() as _connection:
+                _connection.executemany('INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?)', _rows)
+
+    def discard(self, email: str) -> None:
+        """Remove the entry for an email address (if present).
+
+        :param email: The email address of the user
+        :type email: str
+        :returns: None
+        """
+        with self._lock:
+            with self._get_connection() as _connection:
+                _connection.execute('DELETE FROM users WHERE email = ?', (_normalize_email(email),))
+
+    def expire_user(self, user_id: str) -> int:
+        """Mark the entries for a user as stale so that they are refreshed by the next lookup.
+
+        :param user_id: The ID of the user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+        :type user_id: str
+        :returns: The number of entries that were marked as stale
+        """
+        with self._lock:
+            with self._get_connection() as _connection:
+                return _connection.execute('UPDATE users SET last_seen = 0 WHERE user_id = ?', (user_id,)).rowcount
+
+    def prune(self, max_age: Union[Optional[int], Optional[float]] = None) -> int:
+        """Remove the stale entries from the index.
+
+        :param max_age: The number of seconds after which entries are stale (defaults to the maximum age of the index)
+        :type max_age: int, float, None
+        :returns: The number of entries that were removed
+        :raises: :py:exc:`TypeError`,
+                 :py:exc:`ValueError`
+        """
+        _oldest_fresh_time = self._get_oldest_fresh_time(max_age)
+        with self._lock:
+            with self._get_connection() as _connection:
+                return _connection.execute('DELETE FROM users WHERE last_seen <= ?', (_oldest_fresh_time,)).rowcount
+
+    def clear(self) -> None:
+        """Remove every entry from the index and reset the hit and miss counters.
+
+        :returns: None
+        """
+        with self._lock:
+            with self._get_connection() as _connection:
+                _connection.execute('DELETE FROM users')
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """Close the connection to the database file.
+
+        :returns: None
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _normalize_email(_email: str) -> str:
+    """Return the normalized form of an email address used as the key of the index."""
+    if not isinstance(_email, str):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='email', data_type='str')
+        logger.error("The 'email' value is an invalid data type")
+        raise TypeError(_error_msg)
+    return _email.strip().lower()
+
+
+def _load_details(_details: Optional[str]) -> Optional[dict[str, Any]]:
+    """Return the stored user details as a dictionary (or ``None`` if unavailable or unreadable)."""
+    if _details is None:
+        return None
+    try:
+        _details = json.loads(_details)
+    except ValueError:
+        logger.warning('The stored user details could not be read and will be ignored')
+        return None
+    return _details if isinstance(_details, dict) else None
+
+
+def _validate_max_age(_max_age: Union[int, float]) -> float:
+    """Validate a maximum age value and return it as a float."""
+    if not isinstance(_max_age, (int, float)) or isinstance(_max_age, bool):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='max_age', data_type='float')
+        logger.error("The 'max_age' value is an invalid data type")
+        raise TypeError(_error_msg)
+    if not _max_age > 0 or math.isinf(_max_age):
+        _error_msg = "The 'max_age' value must be a positive number"
+        logger.error("The 'max_age' value must be a positive number")
+        raise ValueError(_error_msg)
+    return float(_max_age)
@@ -3,21 +3,65 @@
 :Module:            pydplus.users
 :Synopsis:          Defines the user-related functions associated with the RSA ID Plus API
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     30 Jun 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
 
+import copy
 import logging
+from collections.abc import Iterable
 from typing import Optional, Union
 
-from . import api, errors
+from . import api, bulk, errors
 from . import constants as const
+from .user_index import UserIndex, _normalize_email
+from .utils.cache import TTLCache, _validate_ttl
 
 logger = logging.getLogger(__name__)
 
 
+class UserLookupCache(TTLCache):
+    """Cache of user lookup results keyed by email address that is used by the user lookup functions when enabled.
+
+    Successful lookups are cached for the default time-to-live (TTL), while lookups that return a ``404`` (i.e. not
+    found) response are cached for the shorter negative TTL so that new users are found soon after they are created.
+    Enabling, disabling, synchronizing, or (un)marking a user as deleted invalidates the cached lookups for that user.
+
+    :param maxsize: The maximum number of lookups retained by the cache (``1024`` by default)
+    :type maxsize: int
+    :param ttl: The number of seconds after which successful lookups expire (``300`` by default)
+    :type ttl: int, float
+    :param negative_ttl: The number of seconds after which ``404`` lookups expire (``60`` by default)
+    :type negative_ttl: int, float
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+
+    def __init__(
+        self,
+        maxsize: int = const.CACHE_SETTINGS.DEFAULT_MAXSIZE,
+        ttl: Union[int, float] = const.CACHE_SETTINGS.DEFAULT_TTL,
+        negative_ttl: Union[int, float] = const.CACHE_SETTINGS.DEFAULT_NEGATIVE_TTL,
+    ) -> None:
+        """Instantiate the user lookup cache object."""
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.negative_ttl = _validate_ttl(negative_ttl)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(maxsize={self.maxsize!r}, ttl={self.ttl!r}, negative_ttl={self.negative_ttl!r})'
+
+    def invalidate_user(self, user_id: str) -> int:
+        """Remove the cached lookups for a specific user.
+
+        :param user_id: The ID of the user (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+        :type user_id: str
+        :returns: The number of cached lookups that were removed
+        """
+        return self.discard_where(lambda _key, _lookup: _lookup[0] == user_id)
+
+
 def get_user_details(
     pydp_object,
     email: str,
@@ -52,26 +96,61 @@ def get_user_details(
              :py:exc:`errors.exceptions.InvalidFieldError`
     """
     # Define the payload
-    payload: dict[str, Union[str, bool]] = {
-        const.QUERY_PARAMS.EMAIL: email,
-    }
-    if search_unsynced is not None:
-        if not isinstance(search_unsynced, bool):
-            error_msg = f'The value of the search_unsynced parameter must be Boolean. (Provided: {type(search_unsynced)})'
-            logger.error('The search_unsynced parameter must be Boolean')
-            raise TypeError(error_msg)
-        payload[const.QUERY_PARAMS.SEARCH_UNSYNCED] = search_unsynced
-
-    # Perform the API call and return the response in JSON format
-    return api.post(
-        pydp_object=pydp_object,
-        endpoint=const.REST_PATHS.USERS_LOOKUP,
-        payload=payload,
-        api_type=const.ADMIN_API_TYPE,
-        timeout=timeout,
-        show_full_error=show_full_error,
-        return_json=return_json,
-        allow_failed_response=allow_failed_response,
+    payload = _define_user_lookup_payload(email, search_unsynced)
+
+    # Perform the API call and return the response in JSON format (the lookup is read-only and can be safely retried
+    # and coalesced with identical concurrent lookups)
+    lookup_cache = _get_lookup_cache(pydp_object)
+    user_index = _get_user_index(pydp_object, search_unsynced)
+    if lookup_cache is None and user_index is None:
+        return api.post(
+            pydp_object=pydp_object,
+            endpoint=const.REST_PATHS.USERS_LOOKUP,
+            payload=payload,
+            api_type=const.ADMIN_API_TYPE,
+            timeout=timeout,
+            show_full_error=show_full_error,
+            return_json=return_json,
+            allow_failed_response=allow_failed_response,
+            idempotent=True,
+            coalesce=True,
+        )
+
+    # Use the cached lookup result when available and examine it as if the API call was just performed (the cache
+    # only holds parsed results, so lookups that return the response object always perform the API call)
+    cache_key = (_normalize_email(email), search_unsynced)
+    cached_lookup = lookup_cache.get(cache_key) if lookup_cache is not None and return_json else None
+    if cached_lookup is not None:
+        response = cached_lookup[1]
+    else:
+
+        def _perform_lookup():
+            _response = api.post(
+                pydp_object=pydp_object,
+                endpoint=const.REST_PATHS.USERS_LOOKUP,
+                payload=payload,
+                api_type=const.ADMIN_API_TYPE,
+                timeout=timeout,
+                return_json=False,
+                allow_failed_response=True,
+                idempotent=True,
+            )
+            if return_json:
+                _response = _parse_lookup_response(_response)
+            if lookup_cache is not None:
+                _cache_lookup_response(lookup_cache, cache_key, _response)
+            if user_index is not None:
+                _index_lookup_response(user_index, email, _response)
+            return _response
+
+        # Concurrent cache misses for the same user share a single lookup and its parsed result
+        request_coalescer = api._get_request_coalescer(pydp_object, const.API_REQUEST_TYPES.POST, True, return_json)
+        if request_coalescer is not None:
+            response = request_coalescer.run((const.REST_PATHS.USERS_LOOKUP, *cache_key), _perform_lookup)
+        else:
+            response = _perform_lookup()
+    return api._examine_response(
+        pydp_object, response, const.API_REQUEST_TYPES.POST, show_full_error, return_json, allow_failed_response
     )
 
 
@@ -112,6 +191,13 @@ def get_user_id(
         logger.error('An email address or user details dictionary must be provided to retrieve a user ID')
         raise errors.exceptions.MissingRequiredDataError(error_msg)
 
+    # Use the User ID from the user index when it is enabled and has a fresh entry for the email address
+    user_index = _get_user_index(pydp_object, search_unsynced)
+    if not user_details and user_index is not None:
+        user_index_entry = user_index.get(email)
+        if user_index_entry is not None:
+            return user_index_entry.user_id
+
     # Retrieve the user details if not provided
     if not user_details:
         user_details = get_user_details(
@@ -124,11 +210,280 @@ def get_user_id(
         )
 
     # Locate and return the user ID if possible
-    if not user_details or not isinstance(user_details, dict) or const.RESPONSE_KEYS.ID not in user_details:
-        error_msg = 'Failed to retrieve the user ID for the queried user. An empty string will be returned for the ID.'
+    return _extract_user_id(user_details)
+
+
+def get_user_details_many(
+    pydp_object,
+    emails: Iterable[str],
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    search_unsynced: Optional[bool] = None,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+) -> list[bulk.BulkResult]:
+    """Retrieve the details for multiple users concurrently based on their email addresses.
+
+    Duplicate email addresses are only looked up once, and a failed lookup is captured in the result for that
+    email address rather than aborting the remaining lookups.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param emails: The email addresses of the users for whom to retrieve details
+    :type emails: Iterable[str]
+    :param max_workers: The maximum number of concurrent lookups (``10`` by default)
+    :type max_workers: int
+    :param search_unsynced: Indicates if the user search should include unsynchronized users (optional)
+    :type search_unsynced: bool, None
+    :param timeout: The timeout period in seconds for each lookup (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :returns: List of :py:class:`pydplus.bulk.BulkResult` objects (with the user details in JSON format as the
+              result) in the same order as the provided email addresses
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+
+    def _lookup(_email: str):
+        return get_user_details(
+            pydp_object=pydp_object,
+            email=_email,
+            search_unsynced=search_unsynced,
+            timeout=timeout,
+            show_full_error=show_full_error,
+            allow_failed_response=False,
+        )
+
+    return bulk.run_bulk_operation(_lookup, emails, max_workers)
+
+
+def get_user_ids_many(
+    pydp_object,
+    emails: Iterable[str],
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    search_unsynced: Optional[bool] = None,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+) -> list[bulk.BulkResult]:
+    """Retrieve the User IDs for multiple users concurrently based on their email addresses.
+
+    Duplicate email addresses are only looked up once, and a failed lookup is captured in the result for that
+    email address rather than aborting the remaining lookups. When the user index is enabled, the User IDs with fresh
+    entries in the index are resolved locally and only the missing or stale entries are looked up.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param emails: The email addresses of the users for whom to retrieve the User IDs
+    :type emails: Iterable[str]
+    :param max_workers: The maximum number of concurrent lookups (``10`` by default)
+    :type max_workers: int
+    :param search_unsynced: Indicates if the user search should include unsynchronized users (optional)
+    :type search_unsynced: bool, None
+    :param timeout: The timeout period in seconds for each lookup (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :returns: List of :py:class:`pydplus.bulk.BulkResult` objects (with the User ID string as the result) in the
+              same order as the provided email addresses
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+
+    # Resolve the fresh entries in the user index (when enabled) with a single query per batch of email addresses
+    emails = list(emails)
+    user_index = _get_user_index(pydp_object, search_unsynced)
+    indexed_entries = user_index.get_many(emails) if user_index is not None else {}
+
+    def _lookup(_email: str) -> str:
+        if _email in indexed_entries:
+            return indexed_entries[_email].user_id
+        _user_details = get_user_details(
+            pydp_object=pydp_object,
+            email=_email,
+            search_unsynced=search_unsynced,
+            timeout=timeout,
+            show_full_error=show_full_error,
+            allow_failed_response=False,
+        )
+        _user_id = _extract_user_id(_user_details)
+        if not _user_id:
+            raise errors.exceptions.NotFoundResponseError('A User ID could not be found for the email address')
+        return _user_id
+
+    return bulk.run_bulk_operation(_lookup, emails, max_workers)
+
+
+def refresh_user_index(
+    pydp_object,
+    emails: Iterable[str],
+    max_age: Union[Optional[int], Optional[float]] = None,
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+) -> list[bulk.BulkResult]:
+    """Look up the users whose entries in the user index are missing or stale so that the index is refreshed.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param emails: The email addresses of the users to keep current in the user index
+    :type emails: Iterable[str]
+    :param max_age: The number of seconds after which entries are stale (defaults to the maximum age of the index)
+    :type max_age: int, float, None
+    :param max_workers: The maximum number of concurrent lookups (``10`` by default)
+    :type max_workers: int
+    :param timeout: The timeout period in seconds for each lookup (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :returns: List of :py:class:`pydplus.bulk.BulkResult` objects (with the user details in JSON format as the
+              result) for the email addresses that were looked up
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`errors.exceptions.FeatureNotConfiguredError`
+    """
+    user_index = _get_user_index(pydp_object)
+    if user_index is None:
+        error_msg = 'The user index must be enabled before it can be refreshed.'
+        logger.error('The user index must be enabled before it can be refreshed')
+        raise errors.exceptions.FeatureNotConfiguredError(error_msg)
+
+    # Only the email addresses with missing or stale entries are looked up, which stores them in the user index
+    stale_emails = user_index.get_stale_emails(emails, max_age=max_age)
+    logger.debug(f'{len(stale_emails)} user index entries are missing or stale and will be refreshed')
+    return get_user_details_many(
+        pydp_object,
+        stale_emails,
+        max_workers=max_workers,
+        timeout=timeout,
+        show_full_error=show_full_error,
+    )
+
+
+def _get_lookup_cache(_pydp_object) -> Optional[UserLookupCache]:
+    """Return the user lookup cache of the client object when it has been enabled."""
+    _lookup_cache = getattr(getattr(_pydp_object, 'users', None), 'lookup_cache', None)
+    return _lookup_cache if isinstance(_lookup_cache, UserLookupCache) else None
+
+
+class _CachedLookupResponse:
+    """Parsed user lookup response that is stored in the user lookup cache in place of the response object.
+
+    Each call to the :py:meth:`json` method returns a new copy of the parsed response so that callers cannot modify
+    the result returned to other callers.
+    """
+
+    __slots__ = ('status_code', 'text', '_user_details')
+
+    def __init__(self, _status_code: int, _text: str, _user_details) -> None:
+        self.status_code = _status_code
+        self.text = _text
+        self._user_details = _user_details
+
+    def json(self):
+        """Return a copy of the parsed user lookup response."""
+        return copy.deepcopy(self._user_details)
+
+
+def _parse_lookup_response(_response):
+    """Return the parsed user lookup response, or the response object itself if it could not be parsed."""
+    try:
+        _user_details = _response.json()
+    except Exception:
+        logger.debug('The user lookup response could not be parsed')
+        return _response
+    return _CachedLookupResponse(_response.status_code, getattr(_response, 'text', ''), _user_details)
+
+
+def _cache_lookup_response(_lookup_cache: UserLookupCache, _cache_key: tuple, _response) -> None:
+    """Cache a successful user lookup result, or a ``404`` result using the negative time-to-live."""
+    _status_code = getattr(_response, const.RESPONSE_KEYS.STATUS_CODE, None)
+    if _status_code != const.CACHE_SETTINGS.NOT_FOUND and not (isinstance(_status_code, int) and _status_code < 300):
+        return
+    _cached_response = _response if isinstance(_response, _CachedLookupResponse) else _parse_lookup_response(_response)
+    if not isinstance(_cached_response, _CachedLookupResponse):
+        logger.debug('The user lookup response will not be cached')
+        return
+    _user_details = _cached_response._user_details
+    if _status_code == const.CACHE_SETTINGS.NOT_FOUND:
+        _lookup_cache.set(_cache_key, (None, _cached_response), ttl=_lookup_cache.negative_ttl)
+    elif isinstance(_user_details, dict) and _user_details.get(const.RESPONSE_KEYS.ID):
+        _lookup_cache.set(_cache_key, (_user_details[const.RESPONSE_KEYS.ID], _cached_response))
+
+
+def _invalidate_cached_user(_pydp_object, _user_id: str) -> None:
+    """Remove the cached lookups and expire the user index entries for a user whose status has been changed."""
+    _lookup_cache = _get_lookup_cache(_pydp_object)
+    if _lookup_cache is not None:
+        _lookup_cache.invalidate_user(_user_id)
+    _user_index = _get_user_index(_pydp_object)
+    if _user_index is not None:
+        _user_index.expire_user(_user_id)
+
+
+def _get_user_index(_pydp_object, _search_unsynced: Optional[bool] = None) -> Optional[UserIndex]:
+    """Return the user index of the client object when it has been enabled and applies to the lookup.
+
+    The user index only holds the results of lookups of synchronized users, so it is not used by the lookups that
+    also search unsynchronized users.
+    """
+    if _search_unsynced:
+        return None
+    _user_index = getattr(getattr(_pydp_object, 'users', None), 'user_index', None)
+    return _user_index if isinstance(_user_index, UserIndex) else None
+
+
+def _index_lookup_response(_user_index: UserIndex, _email: str, _response) -> None:
+    """Store the User ID and details from a successful user lookup in the user index, or remove a ``404`` lookup."""
+    _status_code = getattr(_response, const.RESPONSE_KEYS.STATUS_CODE, None)
+    if _status_code == const.CACHE_SETTINGS.NOT_FOUND:
+        _user_index.discard(_email)
+    elif isinstance(_status_code, int) and _status_code < 300:
+        try:
+            _user_details = _response.json()
+        except Exception:
+            logger.debug('The user lookup response could not be parsed and will not be indexed')
+            return
+        if isinstance(_user_details, dict) and _user_details.get(const.RESPONSE_KEYS.ID):
+            _user_index.set(_email, _user_details[const.RESPONSE_KEYS.ID], _user_details)
+
+
+def _define_user_lookup_payload(_email: str, _search_unsynced: Optional[bool] = None) -> dict[str, Union[str, bool]]:
+    """Define the payload used to look up a user by their email address."""
+    _payload: dict[str, Union[str, bool]] = {
+        const.QUERY_PARAMS.EMAIL: _email,
+    }
+    if _search_unsynced is not None:
+        if not isinstance(_search_unsynced, bool):
+            _error_msg = f'The value of the search_unsynced parameter must be Boolean. (Provided: {type(_search_unsynced)})'
+            logger.error('The search_unsynced parameter must be Boolean')
+            raise TypeError(_error_msg)
+        _payload[const.QUERY_PARAMS.SEARCH_UNSYNCED] = _search_unsynced
+    return _payload
+
+
+def _extract_user_id(_user_details) -> str:
+    """Return the User ID from a user details dictionary or an empty string if it is not present."""
+    if not _user_details or not isinstance(_user_details, dict) or const.RESPONSE_KEYS.ID not in _user_details:
+        _error_msg = 'Failed to retrieve the user ID for the queried user. An empty string will be returned for the ID.'
         logger.error('Failed to retrieve the user ID for the queried user')
         return ''
-    return user_details.get(const.RESPONSE_KEYS.ID, '')
+    return _user_details.get(const.RESPONSE_KEYS.ID, '')
+
+
+def _define_user_status_payload(_action: str) -> dict[str, str]:
+    """Define the payload used to enable or disable a user based on the action to perform."""
+    if _action.lower() not in const.ARGUMENT_VALUES.VALID_USER_STATUS_ACTIONS:
+        _error_msg = 'The action value is not valid when enabling or disabling a user. '
+        _error_msg += f"(Expected: '{const.ARGUMENT_VALUES.ENABLE}', '{const.ARGUMENT_VALUES.DISABLE}')"
+        logger.error('The user status action value is invalid')
+        raise errors.exceptions.InvalidPayloadValueError(_error_msg)
+    if _action.lower() == const.ARGUMENT_VALUES.ENABLE:
+        _status = const.PAYLOAD_VALUES.ENABLED
+    else:
+        _status = const.PAYLOAD_VALUES.DISABLED
+    return {
+        const.QUERY_PARAMS.USER_STATUS: _status,
+    }
 
 
 def _update_user_status(
@@ -169,30 +524,22 @@ def _update_user_status(
     _endpoint = const.REST_PATHS.USER_STATUS.format(user_id=_user_id)
 
     # Identify the action to perform and define the payload accordingly
-    if _action.lower() not in const.ARGUMENT_VALUES.VALID_USER_STATUS_ACTIONS:
-        _error_msg = 'The action value is not valid when enabling or disabling a user. '
-        _error_msg += f"(Expected: '{const.ARGUMENT_VALUES.ENABLE}', '{const.ARGUMENT_VALUES.DISABLE}')"
-        logger.error('The user status action value is invalid')
-        raise errors.exceptions.InvalidPayloadValueError(_error_msg)
-    if _action.lower() == const.ARGUMENT_VALUES.ENABLE:
-        _action = const.PAYLOAD_VALUES.ENABLED
-    else:
-        _action = const.PAYLOAD_VALUES.DISABLED
-    _payload = {
-        const.QUERY_PARAMS.USER_STATUS: _action,
-    }
+    _payload = _define_user_status_payload(_action)
 
-    # Perform the API call and return the response
-    return api.put(
-        pydp_object=_pydp_object,
-        endpoint=_endpoint,
-        payload=_payload,
-        api_type=const.ADMIN_API_TYPE,
-        timeout=_timeout,
-        show_full_error=_show_full_error,
-        return_json=_return_json,
-        allow_failed_response=_allow_failed_response,
-    )
+    # Perform the API call and return the response, discarding the cached lookups for the user afterward
+    try:
+        return api.put(
+            pydp_object=_pydp_object,
+            endpoint=_endpoint,
+            payload=_payload,
+            api_type=const.ADMIN_API_TYPE,
+            timeout=_timeout,
+            show_full_error=_show_full_error,
+            return_json=_return_json,
+            allow_failed_response=_allow_failed_response,
+        )
+    finally:
+        _invalidate_cached_user(_pydp_object, _user_id)
 
 
 def enable_user(
@@ -315,17 +662,20 @@ def synchronize_user(
     payload = ''
     # TODO: Test to see if Content-Length header must be explicitly defined
 
-    # Perform the API call and return the response
-    return api.post(
-        pydp_object=pydp_object,
-        endpoint=endpoint,
-        payload=payload,
-        api_type=const.ADMIN_API_TYPE,
-        timeout=timeout,
-        show_full_error=show_full_error,
-        return_json=return_json,
-        allow_failed_response=allow_failed_response,
-    )
+    # Perform the API call and return the response, discarding the cached lookups for the user afterward
+    try:
+        return api.post(
+            pydp_object=pydp_object,
+            endpoint=endpoint,
+            payload=payload,
+            api_type=const.ADMIN_API_TYPE,
+            timeout=timeout,
+            show_full_error=show_full_error,
+            return_json=return_json,
+            allow_failed_response=allow_failed_response,
+        )
+    finally:
+        _invalidate_cached_user(pydp_object, user_id)
 
 
 def _update_mark_deleted(
@@ -342,17 +692,20 @@ def _update_mark_deleted(
     _endpoint: str = const.REST_PATHS.USER_MARK_DELETED.format(user_id=_user_id)
     _payload: dict[str, bool] = {const.QUERY_PARAMS.MARK_DELETED: _mark_deleted}
 
-    # Perform the API call and return the response
-    return api.put(
-        pydp_object=_pydp_object,
-        endpoint=_endpoint,
-        payload=_payload,
-        api_type=const.ADMIN_API_TYPE,
-        timeout=_timeout,
-        show_full_error=_show_full_error,
-        return_json=_return_json,
-        allow_failed_response=_allow_failed_response,
-    )
+    # Perform the API call and return the response, discarding the cached lookups for the user afterward
+    try:
+        return api.put(
+            pydp_object=_pydp_object,
+            endpoint=_endpoint,
+            payload=_payload,
+            api_type=const.ADMIN_API_TYPE,
+            timeout=_timeout,
+            show_full_error=_show_full_error,
+            return_json=_return_json,
+            allow_failed_response=_allow_failed_response,
+        )
+    finally:
+        _invalidate_cached_user(_pydp_object, _user_id)
 
 
 def mark_deleted(
@@ -439,6 +792,233 @@ def unmark_deleted(
     )
 
 
+def enable_users(
+    pydp_object,
+    user_ids: Iterable[str],
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    allow_failed_response: Optional[bool] = None,
+) -> bulk.BulkReport:
+    """Enable multiple users concurrently that are currently disabled.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+    :type user_ids: Iterable[str]
+    :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+    :type max_workers: int
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param allow_failed_response: Indicates that failed responses should be returned in the result for the user rather
+                                  than captured as an exception (If not explicitly defined then ``True`` if Strict
+                                  Mode is disabled)
+    :type allow_failed_response: bool, None
+    :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    return _run_bulk_user_operation(
+        pydp_object,
+        _func=enable_user,
+        _user_ids=user_ids,
+        _max_workers=max_workers,
+        _timeout=timeout,
+        _show_full_error=show_full_error,
+        _allow_failed_response=allow_failed_response,
+    )
+
+
+def disable_users(
+    pydp_object,
+    user_ids: Iterable[str],
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    allow_failed_response: Optional[bool] = None,
+) -> bulk.BulkReport:
+    """Disable multiple users concurrently that are currently enabled.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+    :type user_ids: Iterable[str]
+    :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+    :type max_workers: int
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param allow_failed_response: Indicates that failed responses should be returned in the result for the user rather
+                                  than captured as an exception (If not explicitly defined then ``True`` if Strict
+                                  Mode is disabled)
+    :type allow_failed_response: bool, None
+    :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    return _run_bulk_user_operation(
+        pydp_object,
+        _func=disable_user,
+        _user_ids=user_ids,
+        _max_workers=max_workers,
+        _timeout=timeout,
+        _show_full_error=show_full_error,
+        _allow_failed_response=allow_failed_response,
+    )
+
+
+def synchronize_users(
+    pydp_object,
+    user_ids: Iterable[str],
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    allow_failed_response: Optional[bool] = None,
+) -> bulk.BulkReport:
+    """Synchronize the details of multiple users concurrently between an identity source and the Cloud Access Service.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+    :type user_ids: Iterable[str]
+    :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+    :type max_workers: int
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param allow_failed_response: Indicates that failed responses should be returned in the result for the user rather
+                                  than captured as an exception (If not explicitly defined then ``True`` if Strict
+                                  Mode is disabled)
+    :type allow_failed_response: bool, None
+    :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    return _run_bulk_user_operation(
+        pydp_object,
+        _func=synchronize_user,
+        _user_ids=user_ids,
+        _max_workers=max_workers,
+        _timeout=timeout,
+        _show_full_error=show_full_error,
+        _allow_failed_response=allow_failed_response,
+    )
+
+
+def mark_users_deleted(
+    pydp_object,
+    user_ids: Iterable[str],
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    allow_failed_response: Optional[bool] = None,
+) -> bulk.BulkReport:
+    """Mark multiple users concurrently to be deleted during the next automated bulk deletion process.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+    :type user_ids: Iterable[str]
+    :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+    :type max_workers: int
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param allow_failed_response: Indicates that failed responses should be returned in the result for the user rather
+                                  than captured as an exception (If not explicitly defined then ``True`` if Strict
+                                  Mode is disabled)
+    :type allow_failed_response: bool, None
+    :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    return _run_bulk_user_operation(
+        pydp_object,
+        _func=mark_deleted,
+        _user_ids=user_ids,
+        _max_workers=max_workers,
+        _timeout=timeout,
+        _show_full_error=show_full_error,
+        _allow_failed_response=allow_failed_response,
+    )
+
+
+def unmark_users_deleted(
+    pydp_object,
+    user_ids: Iterable[str],
+    max_workers: int = const.CLIENT_SETTINGS.DEFAULT_BULK_MAX_WORKERS,
+    timeout: int = const.DEFAULT_API_TIMEOUT_SECONDS,
+    show_full_error: bool = True,
+    allow_failed_response: Optional[bool] = None,
+) -> bulk.BulkReport:
+    """Unmark multiple users concurrently that were flagged to be deleted.
+
+    :param pydp_object: The instantiated pydplus object
+    :type pydp_object: class[pydplus.PyDPlus]
+    :param user_ids: The IDs of existing users (e.g. ``54082ac6-4713-6368-2251-df813c41159f``)
+    :type user_ids: Iterable[str]
+    :param max_workers: The maximum number of concurrent API calls (``10`` by default)
+    :type max_workers: int
+    :param timeout: The timeout period in seconds for each API call (defaults to ``30``)
+    :type timeout: int
+    :param show_full_error: Determines if the full error message should be displayed (defaults to ``True``)
+    :type show_full_error: bool
+    :param allow_failed_response: Indicates that failed responses should be returned in the result for the user rather
+                                  than captured as an exception (If not explicitly defined then ``True`` if Strict
+                                  Mode is disabled)
+    :type allow_failed_response: bool, None
+    :returns: The :py:class:`pydplus.bulk.BulkReport` object with the per-user results and throughput statistics
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    return _run_bulk_user_operation(
+        pydp_object,
+        _func=unmark_deleted,
+        _user_ids=user_ids,
+        _max_workers=max_workers,
+        _timeout=timeout,
+        _show_full_error=show_full_error,
+        _allow_failed_response=allow_failed_response,
+    )
+
+
+def _run_bulk_user_operation(
+    _pydp_object,
+    _func,
+    _user_ids: Iterable[str],
+    _max_workers: int,
+    _timeout: int,
+    _show_full_error: bool,
+    _allow_failed_response: Optional[bool],
+) -> bulk.BulkReport:
+    """Perform a single-user API function for multiple users concurrently and report the outcome for each user."""
+
+    def _perform_operation(_user_id: str):
+        return _func(
+            _pydp_object,
+            user_id=_user_id,
+            timeout=_timeout,
+            show_full_error=_show_full_error,
+            return_json=False,
+            allow_failed_response=_allow_failed_response,
+        )
+
+    def _examine_response(_result: bulk.BulkResult) -> None:
+        # Failed responses that were returned rather than raised (i.e. Strict Mode disabled) are reported as failures
+        if _result.success:
+            _response = _result.result
+            _result.status_code = _response.status_code
+            _result.success = _response.status_code < 300
+            _result.result = api._convert_response_to_json(_response, True, api._get_json_codec(_pydp_object))
+
+    return bulk.run_bulk_report(_perform_operation, _user_ids, _max_workers, result_handler=_examine_response)
+
+
 # def _add_remove_high_risk_users(_pydp_object, _users_list, _action, _timeout=const.DEFAULT_API_TIMEOUT_SECONDS,
 #                                 _show_full_error=True, _return_json=True, _allow_failed_response=None):
 #     # TODO: Finish the function
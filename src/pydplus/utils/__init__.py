@@ -4,7 +4,19 @@
 :Synopsis:       This is the ``__init__`` module for the pydplus.utils modules
 :Created By:     Jeff Shurtliff
 :Last Modified:     Jeff Shurtliff
-:Modified Date:     30 Mar 2026
+:Modified Date:     17 Oct 2026
 """
 
-__all__ = ['core_utils', 'helper', 'log_utils', 'version']
+__all__ = [
+    'cache',
+    'coalesce',
+    'core_utils',
+    'download',
+    'helper',
+    'json_codec',
+    'json_stream',
+    'log_utils',
+    'rate_limit',
+    'retry',
+    'version',
+]
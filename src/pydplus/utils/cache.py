@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.utils.cache
+:Synopsis:          Thread-safe cache with a bounded size and per-entry expiration used to avoid repeated API calls
+:Usage:             ``from pydplus.utils.cache import TTLCache``
+:Example:           ``cache = TTLCache(maxsize=1024, ttl=300)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Optional, Union
+
+from .. import constants as const
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Thread-safe cache that evicts the least recently used entries and expires entries after a time-to-live.
+
+    Each entry expires once its time-to-live (TTL) has elapsed, which is the default TTL of the cache unless a
+    different TTL is provided when the entry is stored. When the cache is full, the least recently used entry is
+    evicted to make room for the new entry.
+
+    :param maxsize: The maximum number of entries retained by the cache (``1024`` by default)
+    :type maxsize: int
+    :param ttl: The default number of seconds after which entries expire (``300`` by default)
+    :type ttl: int, float
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+
+    def __init__(
+        self,
+        maxsize: int = const.CACHE_SETTINGS.DEFAULT_MAXSIZE,
+        ttl: Union[int, float] = const.CACHE_SETTINGS.DEFAULT_TTL,
+    ) -> None:
+        """Instantiate the cache object."""
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='maxsize', data_type='int')
+            logger.error("The 'maxsize' value is an invalid data type")
+            raise TypeError(_error_msg)
+        if maxsize < 1:
+            _error_msg = "The 'maxsize' value must be a positive integer"
+            logger.error("The 'maxsize' value must be a positive integer")
+            raise ValueError(_error_msg)
+        self.maxsize = maxsize
+        self.ttl = _validate_ttl(ttl)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(maxsize={self.maxsize!r}, ttl={self.ttl!r})'
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._remove_expired_entries()
+            return len(self._entries)
+
+    def _remove_expired_entries(self) -> None:
+        """Remove the expired entries from the cache (the lock must already be held)."""
+        _now = time.monotonic()
+        for _key in [_key for _key, (_expires_at, _value) in self._entries.items() if _expires_at <= _now]:
+            del self._entries[_key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for a key and record a cache hit or miss.
+
+        :param key: The cache key
+        :type key: Hashable
+        :param default: The value to return when the key is not cached or has expired (``None`` by default)
+        :returns: The cached value or the default value
+        """
+        with self._lock:
+            _entry = self._entries.get(key)
+            if _entry is not None and _entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _entry[1]
+            if _entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Union[Optional[int], Optional[float]] = None) -> None:
+        """Store a value in the cache.
+
+        :param key: The cache key
+        :type key: Hashable
+        :param value: The value to cache
+        :param ttl: The number of seconds after which the entry expires (defaults to the TTL of the cache)
+        :type ttl: int, float, None
+        :returns: None
+        :raises: :py:exc:`TypeError`,
+                 :py:exc:`ValueError`
+        """
+        _ttl = self.ttl if ttl is None else _validate_ttl(ttl)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + _ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._remove_expired_entries()
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove a key from the cache (if present).
+
+        :param key: The cache key
+        :type key: Hashable
+        :returns: None
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Remove every entry for which a function returns ``True``.
+
+        :param predicate: Function that accepts the key and value of an entry and returns a Boolean value
+        :type predicate: Callable
+        :returns: The number of entries that were removed
+        """
+        with self._lock:
+            _keys = [_key for _key, (_expires_at, _value) in self._entries.items() if predicate(_key, _value)]
+            for _key in _keys:
+                del self._entries[_key]
+        return len(_keys)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache and reset the hit and miss counters.
+
+        :returns: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _validate_ttl(_ttl: Union[int, float]) -> float:
+    """Validate a time-to-live value and return it as a float."""
+    if not isinstance(_ttl, (int, float)) or isinstance(_ttl, bool):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='ttl', data_type='float')
+        logger.error("The 'ttl' value is an invalid data type")
+        raise TypeError(_error_msg)
+    if not _ttl > 0 or math.isinf(_ttl):
+        _error_msg = "The 'ttl' value must be a positive number"
+        logger.error("The 'ttl' value must be a positive number")
+        raise ValueError(_error_msg)
+    return float(_ttl)
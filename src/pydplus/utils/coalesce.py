@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.utils.coalesce
+:Synopsis:          Coalesces concurrent identical calls so that they share a single execution and its result
+:Usage:             ``from pydplus.utils.coalesce import RequestCoalescer``
+:Example:           ``result = coalescer.run(key, func)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlightCall:
+    """A call that is currently being performed along with its outcome once it completes."""
+
+    __slots__ = ('done', 'result', 'exception', 'waiters')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """Thread-safe helper that lets concurrent identical calls share a single execution.
+
+    The first thread to call :py:meth:`run` for a key performs the call, while the threads that call :py:meth:`run`
+    for the same key before it completes wait for and share its result. When the call fails, each waiting thread
+    raises its own copy of the exception (chained to the original exception). Calls that begin after the call has
+    completed are performed again, so results are never reused beyond the calls that overlapped.
+    """
+
+    def __init__(self) -> None:
+        """Instantiate the request coalescer object."""
+        self.coalesced = 0
+        self._in_flight: dict[Hashable, _InFlightCall] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}()'
+
+    def run(self, key: Hashable, func: Callable[[], Any], copy_result: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Perform a call or wait for an identical call that is already in progress and share its result.
+
+        :param key: The key that identifies identical calls
+        :type key: Hashable
+        :param func: Function that performs the call
+        :type func: Callable
+        :param copy_result: Function used to copy the shared result for each waiting caller (optional)
+        :type copy_result: Callable, None
+        :returns: The result of the call
+        """
+        with self._lock:
+            _call = self._in_flight.get(key)
+            _is_leader = _call is None
+            if _is_leader:
+                _call = self._in_flight[key] = _InFlightCall()
+            else:
+                _call.waiters += 1
+                self.coalesced += 1
+
+        if not _is_leader:
+            logger.debug('Waiting for an identical API call that is already in progress')
+            _call.done.wait()
+            if _call.exception is not None:
+                raise _copy_exception(_call.exception)
+            return copy_result(_call.result) if copy_result is not None else _call.result
+
+        try:
+            _call.result = func()
+        except BaseException as _exc:
+            _call.exception = _exc
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            _call.done.set()
+
+        # The original result is shared with the waiting callers so the caller receives its own copy
+        if _call.waiters and copy_result is not None:
+            return copy_result(_call.result)
+        return _call.result
+
+
+def _copy_exception(_exc: BaseException) -> BaseException:
+    """Return a copy of an exception chained to the original so that threads do not raise the same exception instance."""
+    try:
+        _exc_copy = copy.copy(_exc)
+    except Exception:
+        logger.debug('The exception of the coalesced call could not be copied and will be shared')
+        return _exc
+    _exc_copy.__cause__ = _exc
+    return _exc_copy
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.utils.download
+:Synopsis:          Writes streamed API responses to disk in chunks with optional gzip compression and a checksum
+:Usage:             ``from pydplus.utils.download import write_chunks``
+:Example:           ``download = write_chunks(response.iter_content(chunk_size=65536), 'export.csv.gz', compress=True)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from .. import constants as const
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class DownloadResult:
+    """The outcome of a download, including the checksum of the bytes that were written.
+
+    :param path: The path of the file to which the content was written (``None`` for file-like destinations)
+    :type path: pathlib.Path, None
+    :param bytes_received: The number of bytes of content that were received
+    :type bytes_received: int
+    :param bytes_written: The number of bytes written to the destination (after compression, when enabled)
+    :type bytes_written: int
+    :param compressed: Indicates if the content was compressed with gzip while it was written
+    :type compressed: bool
+    :param checksum_algorithm: The name of the hash algorithm used to calculate the checksum
+    :type checksum_algorithm: str
+    :param checksum: The hexadecimal checksum of the bytes written to the destination
+    :type checksum: str
+    """
+
+    # Define the class variables
+    path: Optional[Path]
+    bytes_received: int
+    bytes_written: int
+    compressed: bool
+    checksum_algorithm: str
+    checksum: str
+
+
+class _ChecksumWriter:
+    """File-like wrapper that calculates the checksum and size of the bytes written to another file object."""
+
+    def __init__(self, _file: BinaryIO, _hash) -> None:
+        self._file = _file
+        self._hash = _hash
+        self.bytes_written = 0
+
+    def write(self, _data: bytes) -> int:
+        """Write the data to the wrapped file object and update the checksum."""
+        self._hash.update(_data)
+        self.bytes_written += len(_data)
+        self._file.write(_data)
+        return len(_data)
+
+    def flush(self) -> None:
+        """Flush the wrapped file object."""
+        self._file.flush()
+
+
+def write_chunks(
+    chunks: Iterable[bytes],
+    destination: Union[str, Path, BinaryIO],
+    compress: bool = False,
+    checksum_algorithm: str = const.DOWNLOAD_SETTINGS.DEFAULT_CHECKSUM_ALGORITHM,
+) -> DownloadResult:
+    """Write an iterable of byte chunks (e.g. a streamed API response) to a file or file-like object.
+
+    .. note::
+       Only a single chunk is held in memory at a time. When the destination is a path, the content is written to a
+       temporary file that is only readable by the current user (``0600``) and renamed once all chunks have been
+       written, so an interrupted download never leaves a partial file.
+
+    :param chunks: The chunks of content to write (e.g. from ``response.iter_content()``)
+    :type chunks: Iterable[bytes]
+    :param destination: The path of the file or the binary file-like object to which the content is written
+    :type destination: str, pathlib.Path, BinaryIO
+    :param compress: Determines if the content should be compressed with gzip while it is written (``False`` by default)
+    :type compress: bool
+    :param checksum_algorithm: The name of the ``hashlib`` algorithm used to calculate the checksum of the bytes
+                               written to the destination (``sha256`` by default)
+    :type checksum_algorithm: str
+    :returns: The outcome of the download, including its size and checksum
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+    if not isinstance(compress, bool):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='compress', data_type='bool')
+        logger.error("The 'compress' value is an invalid data type")
+        raise TypeError(_error_msg)
+    _hash = _get_checksum_hash(checksum_algorithm)
+    if not isinstance(destination, (str, Path)) and not callable(getattr(destination, 'write', None)):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+            param='destination', data_type='str, pathlib.Path, or binary file-like object'
+        )
+        logger.error("The 'destination' value is an invalid data type")
+        raise TypeError(_error_msg)
+
+    if not isinstance(destination, (str, Path)):
+        _writer = _ChecksumWriter(destination, _hash)
+        _bytes_received = _write_content(chunks, _writer, compress)
+        _path = None
+    else:
+        _path = Path(destination)
+        # Temporary files are created with 0600 permissions and renamed so that an interruption never leaves a partial file
+        _file_descriptor, _temp_path = tempfile.mkstemp(dir=_path.parent, prefix=f'.{_path.name}.')
+        try:
+            with os.fdopen(_file_descriptor, 'wb') as _file:
+                _writer = _ChecksumWriter(_file, _hash)
+                _bytes_received = _write_content(chunks, _writer, compress)
+            os.replace(_temp_path, _path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(_temp_path)
+            raise
+
+    logger.debug(f'The content was downloaded ({_bytes_received} bytes received and {_writer.bytes_written} bytes written)')
+    return DownloadResult(
+        path=_path,
+        bytes_received=_bytes_received,
+        bytes_written=_writer.bytes_written,
+        compressed=compress,
+        checksum_algorithm=_hash.name,
+        checksum=_hash.hexdigest(),
+    )
+
+
+def _get_checksum_hash(_checksum_algorithm: str):
+    """Return a new hash object for the checksum algorithm or raise an exception if the algorithm is not available."""
+    try:
+        return hashlib.new(_checksum_algorithm)
+    except (TypeError, ValueError) as _exc:
+        _error_msg = f"The '{_checksum_algorithm}' checksum algorithm is not available"
+        logger.error('The checksum algorithm is not available')
+        raise ValueError(_error_msg) from _exc
+
+
+def _write_content(_chunks: Iterable[bytes], _writer: _ChecksumWriter, _compress: bool) -> int:
+    """Write the chunks of content (compressing them when requested) and return the number of bytes received."""
+    _bytes_received = 0
+    # The modification time is excluded from the gzip header so that the same content always has the same checksum
+    _output = (
+        gzip.GzipFile(fileobj=_writer, mode='wb', compresslevel=const.DOWNLOAD_SETTINGS.GZIP_COMPRESS_LEVEL, mtime=0)
+        if _compress
+        else contextlib.nullcontext(_writer)
+    )
+    with _output as _target:
+        for _chunk in _chunks:
+            if _chunk:
+                _bytes_received += len(_chunk)
+                _target.write(_chunk)
+    _writer.flush()
+    return _bytes_received
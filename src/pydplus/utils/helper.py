@@ -5,17 +5,19 @@
 :Usage:             ``from pydplus.utils import helper``
 :Example:           ``helper_settings = helper.get_settings('/tmp/helper.yml', 'yaml')``
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     30 Jun 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
-from typing import Optional, Union
-
-import yaml
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Union
 
 from .. import constants as const
 from .. import errors
@@ -23,10 +25,18 @@ from .core_utils import get_file_type
 
 logger = logging.getLogger(__name__)
 
+# Parsed helper files shared by every client object in the process
+_HELPER_FILE_CACHE: OrderedDict[tuple, Any] = OrderedDict()
+_HELPER_FILE_CACHE_LOCK = threading.Lock()
+
 
 def import_helper_file(file_path: str, file_type: str) -> dict:
     """Import a YAML (.yml, .yaml) or JSON (.json) helper config file.
 
+    .. note::
+       The parsed file is cached for the process by its path, modification time, and size, so the file is only parsed
+       again when it changes. A copy of the cached configuration is returned so that callers can safely modify it.
+
     :param file_path: The file path to the YAML file
     :type file_path: str
     :param file_type: Defines the file type as ``yaml``, ``yml``, or ``json``
@@ -35,16 +45,60 @@ def import_helper_file(file_path: str, file_type: str) -> dict:
     :raises: :py:exc:`FileNotFoundError`,
              :py:exc:`pydplus.errors.exceptions.InvalidHelperFileTypeError`
     """
-    with open(file_path) as cfg_file:
-        if file_type.replace('.', '') in (const.FILE_EXTENSIONS.YML, const.FILE_EXTENSIONS.YAML):
-            helper_cfg = yaml.safe_load(cfg_file)
-        elif file_type.replace('.', '') == const.FILE_EXTENSIONS.JSON:
-            helper_cfg = json.load(cfg_file)
+    _file_type = file_type.replace('.', '')
+    _cache_key = _get_helper_file_cache_key(file_path, _file_type)
+    with _HELPER_FILE_CACHE_LOCK:
+        if _cache_key in _HELPER_FILE_CACHE:
+            _HELPER_FILE_CACHE.move_to_end(_cache_key)
+            logger.debug('The helper file was retrieved from the cache')
+            return copy.deepcopy(_HELPER_FILE_CACHE[_cache_key])
+
+    # Parse the file outside the lock as parsing a YAML file is comparatively slow
+    helper_cfg = _parse_helper_file(file_path, _file_type)
+    with _HELPER_FILE_CACHE_LOCK:
+        _HELPER_FILE_CACHE[_cache_key] = helper_cfg
+        _HELPER_FILE_CACHE.move_to_end(_cache_key)
+        while len(_HELPER_FILE_CACHE) > const.HELPER_SETTINGS._HELPER_FILE_CACHE_MAX_SIZE:
+            _HELPER_FILE_CACHE.popitem(last=False)
+    logger.info('The helper file was imported successfully.')
+    return copy.deepcopy(helper_cfg)
+
+
+def clear_helper_file_cache() -> None:
+    """Clear the cache of parsed helper files so that they are parsed again on their next use.
+
+    .. note::
+       Helper files are cached by their path, modification time, and size, so a modified helper file is parsed again
+       automatically. The cache only needs to be cleared when a file is replaced without changing those values.
+
+    :returns: None
+    """
+    with _HELPER_FILE_CACHE_LOCK:
+        _HELPER_FILE_CACHE.clear()
+    logger.debug('The helper file cache has been cleared')
+
+
+def _get_helper_file_cache_key(_file_path: str, _file_type: str) -> tuple:
+    """Return the helper file cache key for a file, which changes whenever the file is replaced or modified."""
+    _stat = os.stat(_file_path)
+    return os.path.realpath(_file_path), _stat.st_mtime_ns, _stat.st_size, _file_type
+
+
+def _parse_helper_file(_file_path: str, _file_type: str) -> dict:
+    """Read and parse a YAML or JSON helper config file."""
+    with open(_file_path) as cfg_file:
+        if _file_type in (const.FILE_EXTENSIONS.YML, const.FILE_EXTENSIONS.YAML):
+            # The yaml package is only imported when a YAML helper file is used to keep the package import lightweight
+            import yaml
+
+            # The LibYAML-based loader is considerably faster and is used whenever PyYAML was built with it
+            _loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            return yaml.load(cfg_file, Loader=_loader)
+        elif _file_type == const.FILE_EXTENSIONS.JSON:
+            return json.load(cfg_file)
         else:
             logger.error('The helper file type is invalid')
             raise errors.exceptions.InvalidHelperFileTypeError()
-    logger.info('The helper file was imported successfully.')
-    return helper_cfg
 
 
 def _convert_yaml_to_bool(_yaml_bool_value: str) -> bool:
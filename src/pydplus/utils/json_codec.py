@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.utils.json_codec
+:Synopsis:          Pluggable JSON codecs used to encode API payloads and decode API responses
+:Usage:             ``from pydplus.utils.json_codec import get_json_codec``
+:Example:           ``codec = get_json_codec('auto')``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Union
+
+from .. import constants as const
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class JsonCodec:
+    """A pair of functions used to encode API payloads to JSON and decode JSON API responses.
+
+    Codecs for the ``orjson`` and ``msgspec`` packages (when installed) and the standard library ``json`` module
+    are available from the :py:func:`pydplus.utils.json_codec.get_json_codec` function, and custom codecs can be
+    defined by passing other functions.
+
+    :param name: The name of the codec
+    :type name: str
+    :param dumps: Function that encodes an object to UTF-8 encoded JSON bytes
+    :type dumps: Callable[[Any], bytes]
+    :param loads: Function that decodes JSON bytes or text to an object
+    :type loads: Callable[[bytes | str], Any]
+    """
+
+    # Define the class variables
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+
+def get_json_codec(name: str = const.JSON_CODEC_SETTINGS.AUTO) -> JsonCodec:
+    """Return the JSON codec with the given name, or the fastest installed codec when the name is ``auto``.
+
+    :param name: The name of the codec (``auto``, ``orjson``, ``msgspec``, or ``json``)
+    :type name: str
+    :returns: The JSON codec
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`,
+             :py:exc:`ImportError`
+    """
+    if not isinstance(name, str):
+        _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='name', data_type='str')
+        logger.error("The 'name' value is an invalid data type")
+        raise TypeError(_error_msg)
+    _name = name.lower()
+    if _name == const.JSON_CODEC_SETTINGS.AUTO:
+        return _load_json_codec(get_available_json_codecs()[0])
+    if _name not in const.JSON_CODEC_SETTINGS.PREFERRED_CODECS:
+        _expected_names = ', '.join((const.JSON_CODEC_SETTINGS.AUTO, *const.JSON_CODEC_SETTINGS.PREFERRED_CODECS))
+        _error_msg = f"The '{name}' JSON codec is not valid (Expected one of: {_expected_names})"
+        logger.error('The JSON codec is not valid')
+        raise ValueError(_error_msg)
+    try:
+        return _load_json_codec(_name)
+    except ImportError as _exc:
+        _error_msg = f"The '{_name}' package must be installed to use the '{_name}' JSON codec"
+        logger.error('The package of the JSON codec is not installed')
+        raise ImportError(_error_msg) from _exc
+
+
+@functools.cache
+def get_available_json_codecs() -> tuple[str, ...]:
+    """Return the names of the installed JSON codecs from the fastest to the slowest.
+
+    :returns: The names of the installed codecs (which always include the standard library ``json`` codec)
+    """
+    _available = []
+    for _name in const.JSON_CODEC_SETTINGS.PREFERRED_CODECS:
+        try:
+            _load_json_codec(_name)
+        except ImportError:
+            continue
+        _available.append(_name)
+    return tuple(_available)
+
+
+@functools.cache
+def _load_json_codec(_name: str) -> JsonCodec:
+    """Import the package of a JSON codec and return the codec (raising an exception if it is not installed)."""
+    if _name == const.JSON_CODEC_SETTINGS.ORJSON:
+        import orjson
+
+        # Non-string keys are converted to strings like the standard library so that payloads are encoded the same way
+        return JsonCodec(
+            name=_name,
+            dumps=functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS),
+            loads=orjson.loads,
+        )
+    if _name == const.JSON_CODEC_SETTINGS.MSGSPEC:
+        import msgspec
+
+        return JsonCodec(name=_name, dumps=msgspec.json.encode, loads=msgspec.json.decode)
+    return JsonCodec(name=const.JSON_CODEC_SETTINGS.STDLIB, dumps=_dumps_with_stdlib, loads=json.loads)
+
+
+def _dumps_with_stdlib(_obj: Any) -> bytes:
+    """Encode an object to JSON bytes the same way as the ``json`` parameter of the ``requests`` package."""
+    return json.dumps(_obj, allow_nan=False).encode(const.UTF8_ENCODING)
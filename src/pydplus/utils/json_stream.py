@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.utils.json_stream
+:Synopsis:          Incrementally parses the elements of a top-level JSON array from a stream of bytes
+:Usage:             ``from pydplus.utils.json_stream import iter_json_array``
+:Example:           ``for element in iter_json_array(response.iter_content(chunk_size=65536)): ...``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import codecs
+import itertools
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Define the characters that may appear between the tokens of a JSON document
+_WHITESPACE = ' \t\n\r'
+_ELEMENT_DELIMITERS = _WHITESPACE + ',]'
+
+
+def iter_json_array(chunks: Iterable[bytes], use_ijson: Optional[bool] = None) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array as they are parsed from an iterable of byte chunks.
+
+    Only the element being parsed and the unparsed remainder of the current chunk are held in memory, so arrays that
+    are much larger than the available memory can be processed one element at a time.
+
+    .. note::
+       The ``ijson`` package is used when it is installed (unless ``use_ijson`` is ``False``), and a parser based on
+       the standard library ``json`` module is used otherwise.
+
+    :param chunks: The chunks of the UTF-8 encoded JSON document (e.g. from ``response.iter_content()``)
+    :type chunks: Iterable[bytes]
+    :param use_ijson: Determines if the ``ijson`` package should be used (used when installed by default)
+    :type use_ijson: bool, None
+    :returns: Generator that yields the elements of the array
+    :raises: :py:exc:`ImportError`,
+             :py:exc:`ValueError`
+    """
+    _ijson = _get_ijson(use_ijson)
+    if _ijson is not None:
+        return _iter_json_array_with_ijson(_ijson, chunks)
+    return _iter_json_array(chunks)
+
+
+def _get_ijson(_use_ijson: Optional[bool]):
+    """Return the ``ijson`` module when it should be used, or ``None`` to use the standard library parser."""
+    if _use_ijson is False:
+        return None
+    try:
+        import ijson
+    except ImportError as _exc:
+        if _use_ijson is True:
+            _error_msg = "The 'ijson' package must be installed to parse JSON arrays with ijson (pip install ijson)"
+            logger.error("The 'ijson' package must be installed to parse JSON arrays with ijson")
+            raise ImportError(_error_msg) from _exc
+        return None
+    return ijson
+
+
+class _ChunkReader:
+    """Minimal binary file-like object that reads from an iterable of byte chunks, as expected by ``ijson``."""
+
+    def __init__(self, _chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(_chunks)
+        self._pending = b''
+
+    def read(self, _size: int = -1) -> bytes:
+        """Return up to the requested number of bytes (or the next chunk when no size is requested)."""
+        while not self._pending:
+            _chunk = next(self._chunks, None)
+            if _chunk is None:
+                return b''
+            self._pending = _chunk
+        if _size is None or _size < 0:
+            _size = len(self._pending)
+        _data, self._pending = self._pending[:_size], self._pending[_size:]
+        return _data
+
+
+class _ArrayParser:
+    """Incremental parser that decodes the elements of a top-level JSON array with the standard library."""
+
+    def __init__(self, _chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(_chunks)
+        # The BOM-aware decoder handles multibyte characters that are split across chunks
+        self._text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def _read_more(self, _min_length: int = 1) -> bool:
+        """Append chunks to the unparsed text until it reaches the minimum length and return ``False`` at the end."""
+        # Discard the text that has already been parsed so that the buffer only holds the unparsed remainder
+        _pending = [self._buffer[self._position :]]
+        _length = len(_pending[0])
+        self._position = 0
+        while not self._eof and _length < _min_length:
+            _chunk = next(self._chunks, None)
+            if _chunk is None:
+                self._eof = True
+                _text = self._text_decoder.decode(b'', final=True)
+            else:
+                _text = self._text_decoder.decode(_chunk)
+            _pending.append(_text)
+            _length += len(_text)
+        self._buffer = ''.join(_pending)
+        return _length > 0
+
+    def _next_token(self) -> Optional[str]:
+        """Skip whitespace and return the next character without consuming it (or ``None`` at the end of the data)."""
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._eof or not self._read_more():
+                return None
+
+    def _decode_element(self) -> Any:
+        """Decode the element at the current position, reading more data until the element is complete."""
+        while True:
+            _remaining = len(self._buffer) - self._position
+            try:
+                _element, _end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number is only complete once it is followed by a delimiter, as it may continue in the next chunk
+                if self._eof or (_end < len(self._buffer) and self._buffer[_end] in _ELEMENT_DELIMITERS):
+                    self._position = _end
+                    return _element
+            # Double the unparsed text before trying again so that large elements are not parsed too many times
+            self._read_more(_min_length=max(2 * _remaining, 1))
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._next_token() != '[':
+            raise ValueError('The JSON document is not an array')
+        self._position += 1
+        if self._next_token() == ']':
+            self._position += 1
+        else:
+            while True:
+                yield self._decode_element()
+                _token = self._next_token()
+                self._position += 1
+                if _token == ']':
+                    break
+                if _token != ',':
+                    raise ValueError(f'Expected a comma or closing bracket in the JSON array (found: {_token!r})')
+                if self._next_token() is None:
+                    raise ValueError('The JSON array ended unexpectedly')
+        if self._next_token() is not None:
+            raise ValueError('Extra data was found after the end of the JSON array')
+
+
+def _iter_json_array(_chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array using the standard library parser."""
+    yield from _ArrayParser(_chunks)
+
+
+def _iter_json_array_with_ijson(_ijson, _chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array using ``ijson`` and raise its parsing errors as ``ValueError``."""
+    try:
+        _events = _ijson.parse(_ChunkReader(_chunks), use_float=True)
+        _first_event = next(_events, None)
+        if _first_event is None or _first_event[1] != 'start_array':
+            raise ValueError('The JSON document is not an array')
+        yield from _ijson.items(itertools.chain((_first_event,), _events), 'item')
+    except _ijson.JSONError as _exc:
+        raise ValueError(f'The JSON array could not be parsed: {_exc}') from _exc
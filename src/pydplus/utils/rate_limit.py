@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.utils.rate_limit
+:Synopsis:          Client-side rate limiting used to pace the API calls performed by a client object
+:Usage:             ``from pydplus.utils.rate_limit import TokenBucket``
+:Example:           ``limiter = TokenBucket(rate=10, burst=20)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Optional, Union
+
+from .. import constants as const
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that limits the rate at which API calls are performed.
+
+    Tokens are replenished continuously at the configured rate up to the burst capacity, and each API call consumes
+    a single token. When no tokens are available the caller waits until its token has been replenished, and waiting
+    callers are served in the order in which they requested a token.
+
+    :param rate: The sustained number of requests permitted per second
+    :type rate: int, float
+    :param burst: The maximum number of requests that can be performed back-to-back (defaults to the rate rounded
+                  up to the nearest whole number)
+    :type burst: int, None
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+
+    def __init__(self, rate: Union[int, float], burst: Optional[int] = None) -> None:
+        """Instantiate the token bucket object."""
+        if not isinstance(rate, (int, float)) or isinstance(rate, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+                param=const.CLIENT_SETTINGS.RATE_LIMIT, data_type='float'
+            )
+            logger.error("The 'rate_limit' value is an invalid data type")
+            raise TypeError(_error_msg)
+        if not rate > 0 or math.isinf(rate):
+            _error_msg = f"The '{const.CLIENT_SETTINGS.RATE_LIMIT}' value must be a positive number"
+            logger.error("The 'rate_limit' value must be a positive number")
+            raise ValueError(_error_msg)
+        burst = max(1, math.ceil(rate)) if burst is None else burst
+        if not isinstance(burst, int) or isinstance(burst, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(
+                param=const.CLIENT_SETTINGS.RATE_LIMIT_BURST, data_type='int'
+            )
+            logger.error("The 'rate_limit_burst' value is an invalid data type")
+            raise TypeError(_error_msg)
+        if burst < 1:
+            _error_msg = f"The '{const.CLIENT_SETTINGS.RATE_LIMIT_BURST}' value must be a positive integer"
+            logger.error("The 'rate_limit_burst' value must be a positive integer")
+            raise ValueError(_error_msg)
+
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(rate={self.rate!r}, burst={self.burst!r})'
+
+    def _reserve(self) -> float:
+        """Reserve a token and return the number of seconds to wait before it may be used."""
+        with self._lock:
+            _now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (_now - self._last_refill) * self.rate)
+            self._last_refill = _now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """Wait (if necessary) until a request is permitted by the rate limit.
+
+        :returns: The number of seconds spent waiting
+        """
+        _wait = self._reserve()
+        if _wait > 0:
+            logger.debug('Waiting for the client-side rate limit before performing the API call')
+            time.sleep(_wait)
+        return _wait
+
+    async def acquire_async(self) -> float:
+        """Wait (if necessary) without blocking the event loop until a request is permitted by the rate limit.
+
+        :returns: The number of seconds spent waiting
+        """
+        _wait = self._reserve()
+        if _wait > 0:
+            logger.debug('Waiting for the client-side rate limit before performing the API call')
+            await asyncio.sleep(_wait)
+        return _wait
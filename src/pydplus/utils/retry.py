@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            pydplus.utils.retry
+:Synopsis:          Retry policy used to retry transient API failures with exponential backoff
+:Usage:             ``from pydplus.utils.retry import RetryPolicy``
+:Example:           ``policy = RetryPolicy(max_attempts=5, backoff_factor=1.0)``
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from .. import constants as const
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Defines when and how API calls are retried after a transient failure.
+
+    Failed API calls are retried when the response has one of the configured status codes or when the connection
+    fails. Only idempotent methods (e.g. ``GET`` and ``PUT``) are retried by default, as retrying a non-idempotent
+    method such as ``POST`` could perform the operation twice. Non-idempotent calls can opt in by passing
+    ``idempotent=True`` to the API call or by adding the method to ``retry_methods``. Responses with a ``429``
+    status code are retried for every method as the request was rejected before it was processed.
+
+    :param max_attempts: The maximum number of attempts including the initial attempt (``3`` by default, and ``1``
+                         disables retries)
+    :type max_attempts: int
+    :param backoff_factor: The base number of seconds used to calculate the exponential backoff (``0.5`` by default)
+    :type backoff_factor: float
+    :param max_backoff: The maximum number of seconds to wait between attempts (``60`` by default)
+    :type max_backoff: float
+    :param jitter: Determines if a random delay between zero and the calculated backoff should be used to avoid
+                   synchronized retries from concurrent callers (``True`` by default)
+    :type jitter: bool
+    :param respect_retry_after: Determines if the ``Retry-After`` response header should define the delay when
+                                present (``True`` by default)
+    :type respect_retry_after: bool
+    :param retry_status_codes: The response status codes that should be retried
+    :type retry_status_codes: frozenset[int]
+    :param retry_methods: The HTTP methods that are considered idempotent and retried by default
+    :type retry_methods: frozenset[str]
+    :raises: :py:exc:`TypeError`,
+             :py:exc:`ValueError`
+    """
+
+    # Define the class variables
+    max_attempts: int = const.RETRY_SETTINGS.DEFAULT_MAX_ATTEMPTS
+    backoff_factor: float = const.RETRY_SETTINGS.DEFAULT_BACKOFF_FACTOR
+    max_backoff: float = const.RETRY_SETTINGS.DEFAULT_MAX_BACKOFF
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_status_codes: frozenset[int] = const.RETRY_SETTINGS.DEFAULT_RETRY_STATUS_CODES
+    retry_methods: frozenset[str] = const.RETRY_SETTINGS.DEFAULT_RETRY_METHODS
+
+    def __post_init__(self) -> None:
+        """Validate the retry policy settings."""
+        if not isinstance(self.max_attempts, int) or isinstance(self.max_attempts, bool):
+            _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param='max_attempts', data_type='int')
+            logger.error("The 'max_attempts' value is an invalid data type")
+            raise TypeError(_error_msg)
+        if self.max_attempts < 1:
+            _error_msg = "The 'max_attempts' value must be a positive integer"
+            logger.error("The 'max_attempts' value must be a positive integer")
+            raise ValueError(_error_msg)
+        for _field in ('backoff_factor', 'max_backoff'):
+            _value = getattr(self, _field)
+            if not isinstance(_value, (int, float)) or isinstance(_value, bool):
+                _error_msg = const._LOG_MESSAGES._MUST_BE_DATA_TYPE_ERROR.format(param=_field, data_type='float')
+                logger.error('A retry backoff setting is an invalid data type')
+                raise TypeError(_error_msg)
+            if _value < 0:
+                _error_msg = f"The '{_field}' value must not be negative"
+                logger.error('A retry backoff setting must not be negative')
+                raise ValueError(_error_msg)
+        # Normalize the collections so they can be compared reliably
+        object.__setattr__(self, 'retry_status_codes', frozenset(self.retry_status_codes))
+        object.__setattr__(self, 'retry_methods', frozenset(_method.upper() for _method in self.retry_methods))
+
+    def is_retryable_method(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """Determine if an API call using a given method may be retried.
+
+        :param method: The API request type (e.g. ``GET``, ``POST``, ``PUT``, etc.)
+        :type method: str
+        :param idempotent: Explicitly indicates whether the API call is idempotent (defined by the method if ``None``)
+        :type idempotent: bool, None
+        :returns: Boolean value indicating if the API call may be retried
+        """
+        if idempotent is not None:
+            return idempotent
+        return isinstance(method, str) and method.upper() in self.retry_methods
+
+    def should_retry_response(self, method: str, response, attempt: int, idempotent: Optional[bool] = None) -> bool:
+        """Determine if an API call should be retried based on its response.
+
+        :param method: The API request type (e.g. ``GET``, ``POST``, ``PUT``, etc.)
+        :type method: str
+        :param response: The API response
+        :param attempt: The number of attempts that have been performed so far
+        :type attempt: int
+        :param idempotent: Explicitly indicates whether the API call is idempotent (defined by the method if ``None``)
+        :type idempotent: bool, None
+        :returns: Boolean value indicating if the API call should be retried
+        """
+        _status_code = getattr(response, const.RESPONSE_KEYS.STATUS_CODE, None)
+        if attempt >= self.max_attempts or _status_code not in self.retry_status_codes:
+            return False
+        return _status_code == const.RETRY_SETTINGS.TOO_MANY_REQUESTS or self.is_retryable_method(method, idempotent)
+
+    def should_retry_exception(self, method: str, attempt: int, idempotent: Optional[bool] = None) -> bool:
+        """Determine if an API call should be retried after a connection error or timeout.
+
+        :param method: The API request type (e.g. ``GET``, ``POST``, ``PUT``, etc.)
+        :type method: str
+        :param attempt: The number of attempts that have been performed so far
+        :type attempt: int
+        :param idempotent: Explicitly indicates whether the API call is idempotent (defined by the method if ``None``)
+        :type idempotent: bool, None
+        :returns: Boolean value indicating if the API call should be retried
+        """
+        return attempt < self.max_attempts and self.is_retryable_method(method, idempotent)
+
+    def get_delay(self, attempt: int, response=None) -> float:
+        """Calculate the number of seconds to wait before the next attempt.
+
+        :param attempt: The number of attempts that have been performed so far
+        :type attempt: int
+        :param response: The API response for the failed attempt (if any)
+        :returns: The number of seconds to wait
+        """
+        if self.respect_retry_after and response is not None:
+            _retry_after = _parse_retry_after(response)
+            if _retry_after is not None:
+                return min(_retry_after, self.max_backoff)
+        _backoff = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, _backoff) if self.jitter else _backoff
+
+
+def _parse_retry_after(_response) -> Optional[float]:
+    """Return the number of seconds defined in the ``Retry-After`` header of a response if present and valid."""
+    _headers = getattr(_response, 'headers', None) or {}
+    _value = _headers.get(const.HEADERS.RETRY_AFTER)
+    if not _value:
+        return None
+    try:
+        return max(0.0, float(_value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        _retry_at = parsedate_to_datetime(_value)
+    except (TypeError, ValueError):
+        logger.debug('The Retry-After header value could not be parsed and will be ignored')
+        return None
+    if _retry_at.tzinfo is None:
+        _retry_at = _retry_at.replace(tzinfo=UTC)
+    return max(0.0, (_retry_at - datetime.now(UTC)).total_seconds())
@@ -3,14 +3,14 @@
 :Module:            pydplus.utils.version
 :Synopsis:          This module contains the package version information
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     17 May 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
 
+import functools
 import logging
-import tomllib
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Optional
@@ -18,12 +18,17 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
 def get_full_version() -> str:
     """Return the current full version of the ``pydplus`` package.
 
     The package version is retrieved from the installed package metadata, which is
     populated from the ``version`` field in ``pyproject.toml``.
 
+    .. note::
+       The version is only resolved the first time it is requested and is then cached,
+       which can be reset by calling ``get_full_version.cache_clear()``.
+
     :returns: The current package version as a string
     """
     try:
@@ -57,6 +62,8 @@ def get_version_from_pyproject(pyproject_path: Optional[str] = None) -> str:
     :type pyproject_path: str, None
     :returns: The current package version as a string
     """
+    import tomllib
+
     path = Path(pyproject_path) if pyproject_path else Path(__file__).resolve().parents[3] / 'pyproject.toml'
 
     # tomllib.loads() expects a string, while Path.read_bytes() returns bytes
@@ -78,5 +85,8 @@ def get_version_from_pyproject(pyproject_path: Optional[str] = None) -> str:
     return '0.0.0'
 
 
-# Define __version__ for backward compatibility and to utilize as needed
-__version__ = get_full_version()
+def __getattr__(name: str) -> str:
+    """Resolve the ``__version__`` attribute (retained for backward compatibility) when it is first accessed."""
+    if name == '__version__':
+        return get_full_version()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -3,15 +3,20 @@
 :Module:            tests.unit.test_api_oauth
 :Synopsis:          Unit tests for OAuth token refresh and retry behavior in API helpers
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.3-codex)
-:Modified Date:     30 Mar 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
 
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from pydplus import api
+from pydplus import PyDPlus, api, auth
 from pydplus import constants as const
 
 pytestmark = pytest.mark.unit
@@ -55,7 +60,7 @@ class MockOAuthClient:
         }
         return dict(self.base_headers)
 
-    def refresh_oauth_token(self):
+    def refresh_oauth_token(self, rejected_headers=None):
         """Simulate forcing an OAuth token refresh."""
         self.refresh_calls += 1
         self.base_headers = {
@@ -118,3 +123,128 @@ def test_post_retries_once_after_oauth_401(monkeypatch) -> None:
     assert request_auth_headers == ['Bearer ensured-token', 'Bearer refreshed-token']
     assert pydp_object.ensure_calls == 1
     assert pydp_object.refresh_calls == 1
+
+
+@pytest.fixture
+def oauth_client(monkeypatch, sample_base_url: str, sample_connection_info: dict):
+    """Return an OAuth client object whose token requests are counted and slowed down to overlap."""
+    token_requests = []
+    lock = threading.Lock()
+
+    def _fake_request_oauth_access_token(**kwargs):
+        with lock:
+            token_requests.append(kwargs)
+            access_token = f'token-{len(token_requests)}'
+        time.sleep(0.05)
+        now = int(datetime.datetime.now(datetime.UTC).timestamp())
+        return {
+            'access_token': access_token,
+            'token_type': 'Bearer',
+            'expires_in': 3600,
+            'expires_at': now + 3600,
+            'scope': kwargs['oauth_connection_info'][const.CONNECTION_INFO.OAUTH_SCOPE],
+        }
+
+    monkeypatch.setattr(auth, '_request_oauth_access_token', _fake_request_oauth_access_token)
+    sample_connection_info[const.CONNECTION_INFO.OAUTH][const.CONNECTION_INFO.OAUTH_PRIVATE_KEY_JWK] = (
+        '{"kty":"RSA","n":"abc","e":"AQAB","d":"xyz"}'
+    )
+    pydp_object = PyDPlus(
+        base_url=sample_base_url,
+        connection_info=sample_connection_info,
+        connection_type=const.CONNECTION_INFO.OAUTH,
+        auto_connect=False,
+    )
+    return pydp_object, token_requests
+
+
+def test_concurrent_oauth_token_requests_are_single_flight(oauth_client) -> None:
+    """Ensure concurrent threads share a single token request rather than each requesting a token."""
+    pydp_object, token_requests = oauth_client
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        headers = list(executor.map(lambda _: pydp_object._ensure_oauth_headers(), range(32)))
+
+    assert len(token_requests) == 1
+    assert {_headers[const.HEADERS.AUTHORIZATION] for _headers in headers} == {'Bearer token-1'}
+
+
+def test_concurrent_401_refreshes_replace_the_rejected_token_once(oauth_client) -> None:
+    """Ensure threads whose shared token was rejected trigger a single forced refresh."""
+    pydp_object, token_requests = oauth_client
+    rejected_headers = pydp_object._ensure_oauth_headers()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        headers = list(executor.map(lambda _: pydp_object.refresh_oauth_token(rejected_headers=rejected_headers), range(8)))
+
+    assert len(token_requests) == 2
+    assert {_headers[const.HEADERS.AUTHORIZATION] for _headers in headers} == {'Bearer token-2'}
+
+
+def test_oauth_refresh_delay_uses_fraction_of_token_lifetime() -> None:
+    """Ensure the background refresh is scheduled at the configured fraction of the token lifetime."""
+    now = int(datetime.datetime.now(datetime.UTC).timestamp())
+    token_data = {'expires_in': 3600, 'expires_at': now + 3600}
+
+    assert auth._get_oauth_refresh_delay(token_data, 0.75) == pytest.approx(2700, abs=2)
+    assert auth._get_oauth_refresh_delay({'expires_in': 40, 'expires_at': now + 40}, 0.9) == pytest.approx(10, abs=2)
+    assert auth._get_oauth_refresh_delay(None) == const.AUTH_VALUES._OAUTH_REFRESH_MIN_INTERVAL_SECONDS
+
+
+def test_background_oauth_refresh_renews_token_until_closed(monkeypatch, oauth_client) -> None:
+    """Ensure the background refresher renews the token ahead of expiry and stops when the client is closed."""
+    pydp_object, token_requests = oauth_client
+    pydp_object.oauth_auto_refresh = True
+    monkeypatch.setattr(auth, '_get_oauth_refresh_delay', lambda _token_data, _refresh_ratio: 0.01)
+
+    pydp_object.connect()
+    deadline = time.monotonic() + 5
+    while len(token_requests) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    refresher = pydp_object._oauth_refresher
+    pydp_object.close()
+    requests_at_close = len(token_requests)
+    time.sleep(0.1)
+
+    assert requests_at_close >= 3
+    assert not refresher.is_alive()
+    assert len(token_requests) == requests_at_close
+    assert pydp_object.base_headers[const.HEADERS.AUTHORIZATION] == f'Bearer token-{requests_at_close}'
+
+
+def test_background_oauth_refresh_keeps_token_replaced_after_scheduling(monkeypatch, oauth_client) -> None:
+    """Ensure the background refresh is skipped when the token was replaced while the refresh was scheduled."""
+    pydp_object, token_requests = oauth_client
+    pydp_object.oauth_auto_refresh = True
+    delays = []
+    rescheduled = threading.Event()
+
+    def _get_oauth_refresh_delay(_token_data, _refresh_ratio):
+        delays.append(_token_data)
+        if len(delays) == 1:
+            # Simulate a 401 response that replaces the token before the scheduled refresh runs
+            pydp_object.refresh_oauth_token(rejected_headers=dict(pydp_object.base_headers))
+            return 0.01
+        rescheduled.set()
+        return 60
+
+    monkeypatch.setattr(auth, '_get_oauth_refresh_delay', _get_oauth_refresh_delay)
+
+    pydp_object.connect()
+    assert rescheduled.wait(5)
+    pydp_object.close()
+
+    assert len(token_requests) == 2
+    assert pydp_object.base_headers[const.HEADERS.AUTHORIZATION] == 'Bearer token-2'
+
+
+@pytest.mark.parametrize(
+    'settings, exc_type',
+    [({'oauth_refresh_ratio': 1.5}, ValueError), ({'oauth_auto_refresh': 'yes'}, TypeError)],
+)
+def test_background_oauth_refresh_rejects_invalid_settings(
+    sample_base_url: str, sample_connection_info: dict, settings: dict, exc_type
+) -> None:
+    """Ensure invalid background OAuth refresh settings raise an exception."""
+    with pytest.raises(exc_type):
+        PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False, **settings)
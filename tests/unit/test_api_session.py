@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_api_session
+:Synopsis:          Unit tests for the pooled session used by API helpers and OAuth token requests
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import pytest
+import requests
+
+from pydplus import PyDPlus, api, auth
+from pydplus import constants as const
+
+pytestmark = pytest.mark.unit
+
+
+class DummyResponse:
+    """Simple stand-in for an HTTP response object."""
+
+    def __init__(self, status_code: int, payload: dict, text: str = '') -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.text = text
+
+    def json(self):
+        """Return the configured JSON payload."""
+        return self._payload
+
+
+class RecordingSession:
+    """Minimal session stand-in that records the requests performed through it."""
+
+    def __init__(self) -> None:
+        self.calls = []
+        self.closed = False
+
+    def _record(self, method: str, url: str, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return DummyResponse(200, {'method': method})
+
+    def get(self, url, **kwargs):
+        """Record a GET request."""
+        return self._record('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Record a POST request."""
+        return self._record('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        """Record a PUT request."""
+        return self._record('PUT', url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        """Record a PATCH request."""
+        return self._record('PATCH', url, **kwargs)
+
+    def close(self) -> None:
+        """Record that the session was closed."""
+        self.closed = True
+
+
+class MockSessionClient:
+    """Minimal pydplus-like object that owns a session."""
+
+    def __init__(self) -> None:
+        self.strict_mode = True
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.session = RecordingSession()
+
+
+def _unexpected_request(*args, **kwargs):
+    raise AssertionError('The module-level requests functions should not be called when a session is defined')
+
+
+def test_create_session_mounts_pooled_adapter() -> None:
+    """Ensure the created session mounts an HTTP adapter with the configured pool sizes."""
+    session = api.create_session(pool_connections=4, pool_maxsize=25)
+
+    adapter = session.get_adapter('https://example.com')
+    assert isinstance(adapter, requests.adapters.HTTPAdapter)
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 25
+    assert session.headers[const.HEADERS.CONNECTION] == 'keep-alive'
+    session.close()
+
+
+def test_create_session_disables_keep_alive() -> None:
+    """Ensure connections are not reused when keep-alive is disabled."""
+    session = api.create_session(keep_alive=False)
+
+    assert session.headers[const.HEADERS.CONNECTION] == const.HEADERS.CONNECTION_CLOSE
+    session.close()
+
+
+@pytest.mark.parametrize('pool_settings', [{'pool_connections': 0}, {'pool_maxsize': -1}])
+def test_create_session_rejects_non_positive_pool_sizes(pool_settings: dict) -> None:
+    """Ensure non-positive pool sizes raise a ValueError."""
+    with pytest.raises(ValueError):
+        api.create_session(**pool_settings)
+
+
+@pytest.mark.parametrize('pool_settings', [{'pool_connections': '10'}, {'pool_maxsize': True}, {'keep_alive': 'yes'}])
+def test_create_session_rejects_invalid_data_types(pool_settings: dict) -> None:
+    """Ensure invalid pool setting data types raise a TypeError."""
+    with pytest.raises(TypeError):
+        api.create_session(**pool_settings)
+
+
+def test_api_calls_use_client_session(monkeypatch) -> None:
+    """Ensure GET and payload API calls are performed through the session owned by the client object."""
+    pydp_object = MockSessionClient()
+    for _method in ('get', 'post', 'put', 'patch'):
+        monkeypatch.setattr(api.requests, _method, _unexpected_request)
+
+    api.get(pydp_object, 'v1/users/123')
+    api.post(pydp_object, 'v1/users/lookup', payload={'email': 'user@example.com'})
+    api.put(pydp_object, 'v1/users/123/userStatus', payload={'userStatus': 'Enabled'})
+    api.patch(pydp_object, 'v1/users/123', payload='{}')
+
+    assert [_call[0] for _call in pydp_object.session.calls] == ['GET', 'POST', 'PUT', 'PATCH']
+    assert pydp_object.session.calls[0][1] == 'https://example.com/AdminInterface/restapi/v1/users/123'
+    assert pydp_object.session.calls[1][2]['json'] == {'email': 'user@example.com'}
+    assert pydp_object.session.calls[3][2]['data'] == '{}'
+
+
+def test_oauth_token_request_uses_provided_session(monkeypatch) -> None:
+    """Ensure OAuth token requests are performed through the provided session."""
+    session = RecordingSession()
+    session.post = lambda url, **kwargs: DummyResponse(200, {'access_token': 'pooled-token', 'expires_in': 3600})
+    monkeypatch.setattr(auth.requests, 'post', _unexpected_request)
+    monkeypatch.setattr(auth, '_load_oauth_private_key_jwk', lambda **kwargs: {'kty': 'RSA'})
+    monkeypatch.setattr(auth, '_create_private_key_jwt_client_assertion', lambda **kwargs: 'signed-client-assertion')
+
+    token_data = auth.get_oauth_access_token(
+        connection_info={
+            const.CONNECTION_INFO.OAUTH: {
+                const.CONNECTION_INFO.OAUTH_ISSUER_URL: 'https://example.com/oauth',
+                const.CONNECTION_INFO.OAUTH_CLIENT_ID: 'oauth-client-id',
+                const.CONNECTION_INFO.OAUTH_SCOPE: const.OAUTH_SCOPES.USER_READ,
+                const.CONNECTION_INFO.OAUTH_PRIVATE_KEY_JWK: {'kty': 'RSA'},
+            }
+        },
+        session=session,
+    )
+
+    assert token_data[const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN] == 'pooled-token'
+
+
+def test_client_context_manager_closes_session(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the client object owns a pooled session that is closed when the context manager exits."""
+    with PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False) as pydp_object:
+        assert isinstance(pydp_object.session, requests.Session)
+        pydp_object.session = RecordingSession()
+        session = pydp_object.session
+
+    assert session.closed is True
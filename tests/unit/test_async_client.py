@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_async_client
+:Synopsis:          Unit tests for the asyncio client and its asynchronous API and user helpers
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from pydplus import auth, errors
+from pydplus import constants as const
+from pydplus.aio import api as async_api
+from pydplus.aio import users as async_users
+from pydplus.utils.json_codec import JsonCodec
+
+pytestmark = pytest.mark.unit
+
+
+class DummyResponse:
+    """Simple stand-in for an HTTP response object."""
+
+    def __init__(self, status_code: int, payload: dict, text: str = '') -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.text = text
+
+    def json(self):
+        """Return the configured JSON payload."""
+        return self._payload
+
+
+class RecordingAsyncSession:
+    """Minimal asynchronous session stand-in that returns queued responses and records the requests."""
+
+    def __init__(self, responses: list) -> None:
+        self.responses = responses
+        self.calls = []
+        self.closed = False
+
+    async def request(self, method, url, **kwargs):
+        """Record a request and return the next queued response."""
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+    async def post(self, url, **kwargs):
+        """Record an OAuth token request and return the next queued response."""
+        return await self.request(const.API_REQUEST_TYPES.POST, url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Record that the session was closed."""
+        self.closed = True
+
+
+class MockAsyncOAuthClient:
+    """Minimal asynchronous pydplus-like object for API helper tests."""
+
+    def __init__(self, responses: list) -> None:
+        self.strict_mode = True
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.OAUTH
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer original-token'}
+        self.session = RecordingAsyncSession(responses)
+        self.ensure_calls = 0
+        self.refresh_calls = 0
+
+    async def _ensure_oauth_headers(self):
+        """Simulate ensuring non-expired OAuth headers."""
+        self.ensure_calls += 1
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer ensured-token'}
+        return self.base_headers
+
+    async def refresh_oauth_token(self, rejected_headers=None):
+        """Simulate forcing an OAuth token refresh."""
+        self.refresh_calls += 1
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer refreshed-token'}
+        return self.base_headers
+
+
+def test_async_get_retries_once_after_oauth_401() -> None:
+    """Ensure asynchronous GET requests refresh the OAuth token and retry exactly once on 401."""
+    pydp_object = MockAsyncOAuthClient(
+        [DummyResponse(401, {'error': 'invalid_token'}, text='unauthorized'), DummyResponse(200, {'ok': True})]
+    )
+
+    response = asyncio.run(async_api.get(pydp_object, endpoint='v1/users'))
+
+    assert response == {'ok': True}
+    request_auth_headers = [_call[2]['headers'][const.HEADERS.AUTHORIZATION] for _call in pydp_object.session.calls]
+    assert request_auth_headers == ['Bearer ensured-token', 'Bearer refreshed-token']
+    assert pydp_object.ensure_calls == 1
+    assert pydp_object.refresh_calls == 1
+    assert pydp_object.base_headers == {const.HEADERS.AUTHORIZATION: 'Bearer refreshed-token'}
+
+
+def test_async_payload_calls_raise_in_strict_mode() -> None:
+    """Ensure failed payload-based requests raise an exception when Strict Mode is enabled."""
+    pydp_object = MockAsyncOAuthClient([DummyResponse(500, {}, text='server error')])
+
+    with pytest.raises(errors.exceptions.APIRequestError):
+        asyncio.run(async_api.put(pydp_object, endpoint='v1/users/123/userStatus', payload={'userStatus': 'Enabled'}))
+
+
+def test_async_payload_calls_return_failed_responses_without_strict_mode() -> None:
+    """Ensure failed responses are returned when Strict Mode is disabled."""
+    pydp_object = MockAsyncOAuthClient([DummyResponse(404, {'error': 'not found'})])
+    pydp_object.strict_mode = False
+
+    response = asyncio.run(async_api.post(pydp_object, endpoint='v1/users/lookup', payload='{}'))
+
+    assert response == {'error': 'not found'}
+    assert pydp_object.session.calls[0][2]['content'] == '{}'
+
+
+@pytest.mark.parametrize('method', [const.API_REQUEST_TYPES.GET, 'DELETE'])
+def test_async_payload_calls_reject_invalid_methods(method: str) -> None:
+    """Ensure payload-based requests reject methods that do not accept a payload."""
+    pydp_object = MockAsyncOAuthClient([])
+
+    with pytest.raises(errors.exceptions.APIMethodError):
+        asyncio.run(async_api.api_call_with_payload(pydp_object, method, endpoint='v1/users', payload={}))
+
+
+def test_async_get_user_id_uses_lookup_payload() -> None:
+    """Ensure the asynchronous user lookup reuses the synchronous payload and parsing helpers."""
+    pydp_object = MockAsyncOAuthClient([DummyResponse(200, {const.RESPONSE_KEYS.ID: 'user-123'})])
+
+    user_id = asyncio.run(async_users.get_user_id(pydp_object, email='user@example.com'))
+
+    assert user_id == 'user-123'
+    assert pydp_object.session.calls[0][2]['json'][const.QUERY_PARAMS.EMAIL] == 'user@example.com'
+
+
+def test_async_payload_calls_use_the_json_codec_of_the_client_object() -> None:
+    """Ensure asynchronous payloads are encoded and responses decoded by the codec of the client object."""
+    calls = []
+    codec = JsonCodec(
+        name='recording',
+        dumps=lambda _obj: calls.append(('dumps', _obj)) or json.dumps(_obj).encode(),
+        loads=lambda _data: calls.append(('loads', _data)) or json.loads(_data),
+    )
+    response = DummyResponse(200, {})
+    response.content = b'{"id": "user-1"}'
+    pydp_object = MockAsyncOAuthClient([response])
+    pydp_object.json_codec = codec
+
+    assert asyncio.run(async_api.post(pydp_object, endpoint='v1/users', payload={'email': 'a@example.com'})) == {'id': 'user-1'}
+    assert calls == [('dumps', {'email': 'a@example.com'}), ('loads', b'{"id": "user-1"}')]
+    request_kwargs = pydp_object.session.calls[0][2]
+    assert ('json' not in request_kwargs, request_kwargs['content']) == (True, b'{"email": "a@example.com"}')
+    assert request_kwargs['headers'][const.HEADERS.CONTENT_TYPE] == const.CONTENT_TYPES.JSON
+
+
+def test_async_oauth_headers_use_provided_client(monkeypatch) -> None:
+    """Ensure asynchronous OAuth token requests are performed through the provided client."""
+    session = RecordingAsyncSession([DummyResponse(200, {'access_token': 'async-token', 'expires_in': 3600})])
+    monkeypatch.setattr(auth, '_load_oauth_private_key_jwk', lambda **kwargs: {'kty': 'RSA'})
+    monkeypatch.setattr(auth, '_create_private_key_jwt_client_assertion', lambda **kwargs: 'signed-client-assertion')
+
+    headers, token_data = asyncio.run(
+        auth.get_oauth_headers_async(
+            connection_info={
+                const.CONNECTION_INFO.OAUTH: {
+                    const.CONNECTION_INFO.OAUTH_ISSUER_URL: 'https://example.com/oauth',
+                    const.CONNECTION_INFO.OAUTH_CLIENT_ID: 'oauth-client-id',
+                    const.CONNECTION_INFO.OAUTH_SCOPE: const.OAUTH_SCOPES.USER_READ,
+                    const.CONNECTION_INFO.OAUTH_PRIVATE_KEY_JWK: {'kty': 'RSA'},
+                }
+            },
+            client=session,
+        )
+    )
+
+    assert headers[const.HEADERS.AUTHORIZATION] == 'Bearer async-token'
+    assert token_data[const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN] == 'async-token'
+    assert len(session.calls) == 1
+
+
+def test_async_client_connects_lazily_and_closes(monkeypatch, sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the asyncio client connects on the first API call and closes the shared pool on exit."""
+    pytest.importorskip('httpx')
+    from pydplus.aio import AsyncPyDPlus
+
+    monkeypatch.setattr(auth, '_load_legacy_private_key', lambda _connection_info: object())
+    monkeypatch.setattr(
+        auth,
+        'get_legacy_access_token',
+        lambda **kwargs: {const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN: 'legacy-token', const.AUTH_FIELDS.OAUTH_EXPIRES_AT: 2**32},
+    )
+
+    async def _run():
+        async with AsyncPyDPlus(
+            base_url=sample_base_url,
+            connection_info=sample_connection_info,
+            connection_type=const.CONNECTION_INFO.LEGACY,
+        ) as pydp_object:
+            assert pydp_object.connected is False
+            pydp_object.session = RecordingAsyncSession([DummyResponse(200, {'ok': True})])
+            response = await pydp_object.users.enable_user('user-123')
+            return pydp_object, response
+
+    pydp_object, response = asyncio.run(_run())
+
+    assert response == {'ok': True}
+    assert pydp_object.connected is True
+    assert pydp_object.session.closed is True
+    assert pydp_object.session.calls[0][0] == const.API_REQUEST_TYPES.PUT
+
+
+def test_async_client_rejects_synchronous_context_manager(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the asyncio client cannot be used with a synchronous context manager."""
+    pytest.importorskip('httpx')
+    from pydplus.aio import AsyncPyDPlus
+
+    pydp_object = AsyncPyDPlus(base_url=sample_base_url, connection_info=sample_connection_info)
+    with pytest.raises(TypeError):
+        with pydp_object:
+            pass
+    asyncio.run(pydp_object.close())
+
+
+def test_async_client_does_not_expose_synchronous_audit_or_reports(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the asyncio client does not expose the audit log or report methods, which perform synchronous API calls."""
+    pytest.importorskip('httpx')
+    from pydplus.aio import AsyncPyDPlus
+
+    async def _run():
+        async with AsyncPyDPlus(base_url=sample_base_url, connection_info=sample_connection_info) as pydp_object:
+            return pydp_object
+
+    pydp_object = asyncio.run(_run())
+    assert pydp_object.audit is None
+    assert not hasattr(pydp_object, 'reports')
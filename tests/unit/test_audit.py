@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_audit
+:Synopsis:          Unit tests for the audit log exports in pydplus.audit
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import threading
+import time
+from typing import Optional
+
+import pytest
+import requests
+
+from pydplus import audit, errors
+from pydplus import constants as const
+
+pytestmark = pytest.mark.unit
+
+
+class AuditLogSession:
+    """Minimal session stand-in that serves paginated audit log events and records every page request."""
+
+    def __init__(self, total_events: int) -> None:
+        self.events = [
+            {const.RESPONSE_KEYS.ID: f'event-{_index}', const.RESPONSE_KEYS.EVENT_LOG_DATE: f'2026-01-01T00:00:{_index:02d}'}
+            for _index in range(total_events)
+        ]
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, url, headers, params, timeout, verify):
+        """Return the requested page of audit log events."""
+        with self.lock:
+            self.requests.append((url, dict(params)))
+        page_number = params[const.QUERY_PARAMS.PAGE_NUMBER]
+        page_size = params[const.QUERY_PARAMS.PAGE_SIZE]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {
+                const.RESPONSE_KEYS.ELEMENTS: self.events[page_number * page_size : (page_number + 1) * page_size],
+                const.RESPONSE_KEYS.TOTAL_PAGES: -(-len(self.events) // page_size),
+            }
+        ).encode()
+        return response
+
+    @property
+    def pages_requested(self) -> list[int]:
+        """Return the page numbers that were requested."""
+        with self.lock:
+            return [_params[const.QUERY_PARAMS.PAGE_NUMBER] for _url, _params in self.requests]
+
+
+class MockAuditClient:
+    """Minimal pydplus-like object used to export audit logs."""
+
+    def __init__(self, total_events: int) -> None:
+        self.strict_mode = False
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.session = AuditLogSession(total_events)
+
+
+def test_export_yields_events_lazily_with_a_single_prefetched_page() -> None:
+    """Ensure events are yielded page by page in order and that at most the next page is retrieved in advance."""
+    pydp_object = MockAuditClient(total_events=25)
+    start_time = datetime.datetime(2026, 1, 1)
+
+    events = audit.export_admin_logs(pydp_object, start_time, '2026-01-02T00:00:00+00:00', page_size=10)
+    assert pydp_object.session.requests == []
+    assert next(events)[const.RESPONSE_KEYS.ID] == 'event-0'
+    assert set(pydp_object.session.pages_requested) <= {0, 1}
+
+    remaining = list(events)
+    assert [_event[const.RESPONSE_KEYS.ID] for _event in remaining] == [f'event-{_index}' for _index in range(1, 25)]
+    assert pydp_object.session.pages_requested == [0, 1, 2]
+
+    url, params = pydp_object.session.requests[0]
+    assert url.endswith(const.REST_PATHS.ADMIN_LOGS_EXPORT)
+    assert params[const.QUERY_PARAMS.START_TIME_AFTER] == '2026-01-01T00:00:00.000+00:00'
+    assert params[const.QUERY_PARAMS.END_TIME_ON_OR_BEFORE] == '2026-01-02T00:00:00.000+00:00'
+
+
+def test_interrupted_export_resumes_from_checkpoint(tmp_path) -> None:
+    """Ensure an interrupted export resumes after the last yielded event and that mismatched exports are rejected."""
+    pydp_object = MockAuditClient(total_events=25)
+    checkpoint_path = tmp_path / 'audit_checkpoint.json'
+    export_kwargs = {'start_time': '2026-01-01T00:00:00', 'page_size': 10, 'checkpoint_path': checkpoint_path}
+
+    events = audit.export_user_event_logs(pydp_object, **export_kwargs)
+    first_events = [next(events) for _ in range(15)]
+    events.close()
+
+    checkpoint = audit.AuditCheckpoint.load(checkpoint_path)
+    assert (checkpoint.page_number, checkpoint.page_offset, checkpoint.events_exported) == (1, 5, 15)
+    assert checkpoint.last_event_time == first_events[-1][const.RESPONSE_KEYS.EVENT_LOG_DATE]
+    assert checkpoint.completed is False
+
+    remaining = list(audit.export_user_event_logs(pydp_object, prefetch=False, **export_kwargs))
+    exported_ids = [_event[const.RESPONSE_KEYS.ID] for _event in first_events + remaining]
+    assert exported_ids == [f'event-{_index}' for _index in range(25)]
+    assert audit.AuditCheckpoint.load(checkpoint_path).completed is True
+    assert list(audit.export_user_event_logs(pydp_object, **export_kwargs)) == []
+
+    with pytest.raises(errors.exceptions.DataMismatchError):
+        audit.export_admin_logs(pydp_object, **export_kwargs)
+
+
+def test_invalid_export_arguments_raise_exceptions() -> None:
+    """Ensure invalid log types, page sizes, and times raise exceptions before any API call is performed."""
+    pydp_object = MockAuditClient(total_events=0)
+
+    with pytest.raises(ValueError):
+        audit.export_logs(pydp_object, 'system', '2026-01-01')
+    with pytest.raises(ValueError):
+        audit.export_admin_logs(pydp_object, '2026-01-01', page_size=0)
+    with pytest.raises(ValueError):
+        audit.export_admin_logs(pydp_object, 'yesterday')
+    with pytest.raises(TypeError):
+        audit.export_admin_logs(pydp_object, 1767225600)
+    assert pydp_object.session.requests == []
+
+
+class TimedAuditLogSession(AuditLogSession):
+    """Session stand-in that serves the audit log events that occurred within the requested time range."""
+
+    def __init__(self, total_events: int, failing_start_time: Optional[str] = None) -> None:
+        super().__init__(0)
+        start = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+        self.events = [
+            {
+                const.RESPONSE_KEYS.ID: f'event-{_index}',
+                const.RESPONSE_KEYS.EVENT_LOG_DATE: (start + datetime.timedelta(minutes=_index + 1)).isoformat(),
+            }
+            for _index in range(total_events)
+        ]
+        self.failing_start_time = failing_start_time
+
+    def get(self, url, headers, params, timeout, verify):
+        """Return the requested page of the audit log events within the requested time range."""
+        with self.lock:
+            self.requests.append((url, dict(params)))
+        start_time = params[const.QUERY_PARAMS.START_TIME_AFTER]
+        response = requests.Response()
+        if start_time == self.failing_start_time:
+            response.status_code = 500
+            response._content = b'{"error": "internal error"}'
+            return response
+        start = datetime.datetime.fromisoformat(start_time)
+        end = datetime.datetime.fromisoformat(params[const.QUERY_PARAMS.END_TIME_ON_OR_BEFORE])
+        events = [
+            _event
+            for _event in self.events
+            if start < datetime.datetime.fromisoformat(_event[const.RESPONSE_KEYS.EVENT_LOG_DATE]) <= end
+        ]
+        page_number = params[const.QUERY_PARAMS.PAGE_NUMBER]
+        page_size = params[const.QUERY_PARAMS.PAGE_SIZE]
+        response.status_code = 200
+        response._content = json.dumps(
+            {
+                const.RESPONSE_KEYS.ELEMENTS: events[page_number * page_size : (page_number + 1) * page_size],
+                const.RESPONSE_KEYS.TOTAL_PAGES: -(-len(events) // page_size),
+            }
+        ).encode()
+        return response
+
+    @property
+    def windows(self) -> list[tuple[str, str]]:
+        """Return the distinct time ranges that were requested in chronological order."""
+        with self.lock:
+            _windows = {
+                (_params[const.QUERY_PARAMS.START_TIME_AFTER], _params[const.QUERY_PARAMS.END_TIME_ON_OR_BEFORE])
+                for _url, _params in self.requests
+            }
+        return sorted(_windows)
+
+
+def test_parallel_export_merges_non_overlapping_slices_in_order() -> None:
+    """Ensure the time range is split into contiguous slices whose events are merged in chronological order."""
+    pydp_object = MockAuditClient(total_events=0)
+    pydp_object.session = TimedAuditLogSession(total_events=120)
+
+    events = list(
+        audit.export_logs_parallel(
+            pydp_object, const.AUDIT_SETTINGS.ADMIN, '2026-01-01T00:00:00', '2026-01-01T02:00:00', slices=4, page_size=7
+        )
+    )
+
+    assert [_event[const.RESPONSE_KEYS.ID] for _event in events] == [f'event-{_index}' for _index in range(120)]
+    windows = pydp_object.session.windows
+    assert len(windows) == 4
+    assert windows[0][0] == '2026-01-01T00:00:00.000+00:00'
+    assert windows[-1][1] == '2026-01-01T02:00:00.000+00:00'
+    assert all(_previous[1] == _next[0] for _previous, _next in zip(windows, windows[1:]))
+
+
+def test_parallel_export_stops_workers_and_raises_slice_failures() -> None:
+    """Ensure closing a parallel export stops its worker threads and that a failed slice raises an exception."""
+    pydp_object = MockAuditClient(total_events=0)
+    pydp_object.session = TimedAuditLogSession(total_events=400)
+    events = audit.export_logs_parallel(
+        pydp_object, const.AUDIT_SETTINGS.USER, '2026-01-01T00:00:00', '2026-01-01T08:00:00', slices=4, page_size=5
+    )
+    assert next(events)[const.RESPONSE_KEYS.ID] == 'event-0'
+    events.close()
+    time.sleep(0.3)
+    requests_made = len(pydp_object.session.requests)
+    time.sleep(0.3)
+    assert len(pydp_object.session.requests) == requests_made < 80
+
+    pydp_object.session = TimedAuditLogSession(total_events=120, failing_start_time='2026-01-01T01:00:00.000+00:00')
+    with pytest.raises(errors.exceptions.APIRequestError):
+        list(
+            audit.export_logs_parallel(
+                pydp_object, const.AUDIT_SETTINGS.ADMIN, '2026-01-01T00:00:00', '2026-01-01T02:00:00', slices=4
+            )
+        )
+    with pytest.raises(ValueError):
+        audit.export_logs_parallel(pydp_object, const.AUDIT_SETTINGS.ADMIN, '2026-01-02', '2026-01-01')
+
+
+def test_poll_yields_only_new_events_across_the_boundary_second(tmp_path) -> None:
+    """Ensure each poll yields only new events, including late events logged during the boundary second."""
+    pydp_object = MockAuditClient(total_events=0)
+    pydp_object.session = TimedAuditLogSession(total_events=10)
+    state_path = tmp_path / 'audit_tail.json'
+
+    first_poll = audit.poll_logs(pydp_object, const.AUDIT_SETTINGS.ADMIN, state_path, '2026-01-01T00:00:00', page_size=3)
+    assert [_event[const.RESPONSE_KEYS.ID] for _event in first_poll] == [f'event-{_index}' for _index in range(10)]
+    high_water_mark = audit.AuditHighWaterMark.load(state_path)
+    assert high_water_mark.boundary_time == '2026-01-01T00:10:00.000+00:00'
+    assert (high_water_mark.boundary_event_ids, high_water_mark.events_yielded) == (['event-9'], 10)
+
+    # A late event logged during the boundary second and a later event must both be yielded by the next poll
+    pydp_object.session.events += [
+        {const.RESPONSE_KEYS.ID: 'late-event', const.RESPONSE_KEYS.EVENT_LOG_DATE: '2026-01-01T00:10:00.500+00:00'},
+        {const.RESPONSE_KEYS.ID: 'new-event', const.RESPONSE_KEYS.EVENT_LOG_DATE: '2026-01-01T00:11:30+00:00'},
+    ]
+    second_poll = list(audit.poll_logs(pydp_object, const.AUDIT_SETTINGS.ADMIN, state_path))
+    assert [_event[const.RESPONSE_KEYS.ID] for _event in second_poll] == ['late-event', 'new-event']
+    _url, params = pydp_object.session.requests[-1]
+    assert params[const.QUERY_PARAMS.START_TIME_AFTER] == '2026-01-01T00:09:59.999+00:00'
+    assert list(audit.poll_logs(pydp_object, const.AUDIT_SETTINGS.ADMIN, state_path)) == []
+
+    with pytest.raises(errors.exceptions.DataMismatchError):
+        audit.poll_logs(pydp_object, const.AUDIT_SETTINGS.USER, state_path)
+
+
+def test_follow_bounds_the_boundary_event_ids_and_stops(monkeypatch, tmp_path) -> None:
+    """Ensure the IDs kept for the boundary second are bounded and that following stops after the maximum polls."""
+    monkeypatch.setattr(type(const.AUDIT_SETTINGS), 'MAX_BOUNDARY_EVENT_IDS', 3)
+    pydp_object = MockAuditClient(total_events=0)
+    pydp_object.session = TimedAuditLogSession(total_events=0)
+    pydp_object.session.events = [
+        {const.RESPONSE_KEYS.ID: f'event-{_index}', const.RESPONSE_KEYS.EVENT_LOG_DATE: '2026-01-01T00:00:05+00:00'}
+        for _index in range(5)
+    ]
+    state_path = tmp_path / 'audit_tail.json'
+
+    events = audit.follow_logs(
+        pydp_object, const.AUDIT_SETTINGS.USER, state_path, '2026-01-01T00:00:00', poll_interval=0, max_polls=2
+    )
+    # Only the three most recent IDs are kept, so the events of a busier boundary second are yielded again
+    assert [_event[const.RESPONSE_KEYS.ID] for _event in events] == [f'event-{_index}' for _index in range(5)] * 2
+    assert audit.AuditHighWaterMark.load(state_path).boundary_event_ids == ['event-2', 'event-3', 'event-4']
+    assert len({_params[const.QUERY_PARAMS.START_TIME_AFTER] for _url, _params in pydp_object.session.requests}) == 2
+
+    with pytest.raises(ValueError):
+        audit.follow_logs(pydp_object, const.AUDIT_SETTINGS.USER, state_path, poll_interval=-1)
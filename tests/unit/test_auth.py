@@ -3,8 +3,8 @@
 :Module:            tests.unit.test_auth
 :Synopsis:          Unit tests for OAuth and legacy authentication helper functions
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.5-codex)
-:Modified Date:     30 Jun 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
@@ -298,3 +298,138 @@ def test_get_oauth_access_token_refreshes_when_cached_scope_differs(monkeypatch)
     assert observed['called'] is True
     assert token_data['access_token'] == 'fresh-token'
     assert token_data['scope'] == const.OAUTH_SCOPES.USER_MANAGE
+
+
+@pytest.fixture
+def legacy_connection_info(sample_connection_info: dict) -> dict:
+    """Return legacy connection info containing a generated RSA private key in PEM format."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_key_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode(const.UTF8_ENCODING)
+    legacy_connection = {const.CONNECTION_INFO.LEGACY_ACCESS_ID: 'legacy-access-id'}
+    legacy_connection[const.CONNECTION_INFO.LEGACY_PRIVATE_KEY_PEM] = private_key_pem
+    return {const.CONNECTION_INFO.LEGACY: legacy_connection}
+
+
+def test_get_legacy_access_token_renews_jwt_ahead_of_expiry(legacy_connection_info: dict) -> None:
+    """Ensure a legacy JWT is reused while valid and signed again once it is close to expiring."""
+    now = int(datetime.datetime.now(datetime.UTC).timestamp())
+    token_data = auth.get_legacy_access_token('https://example.com', legacy_connection_info)
+
+    assert token_data[const.AUTH_FIELDS.OAUTH_EXPIRES_AT] == pytest.approx(now + 3600, abs=5)
+    assert auth.get_legacy_access_token('https://example.com', legacy_connection_info, token_data=token_data) is token_data
+
+    expiring_token = dict(token_data, **{const.AUTH_FIELDS.OAUTH_EXPIRES_AT: now + 60})
+    renewed_token = auth.get_legacy_access_token('https://example.com', legacy_connection_info, token_data=expiring_token)
+    assert renewed_token is not expiring_token
+    assert renewed_token[const.AUTH_FIELDS.OAUTH_EXPIRES_AT] > now + 3000
+
+
+def test_client_renews_legacy_jwt_without_reloading_private_key(monkeypatch, legacy_connection_info: dict) -> None:
+    """Ensure the client renews an expiring legacy JWT and retries a 401 response using the in-memory private key."""
+    from pydplus import PyDPlus
+
+    loaded_keys, signed_jwts = [], []
+    load_private_key, encode_legacy_jwt = auth._load_private_key, auth._encode_legacy_jwt
+
+    def _counting_load_private_key(*args):
+        loaded_keys.append(args)
+        return load_private_key(*args)
+
+    def _counting_encode_legacy_jwt(*args):
+        signed_jwts.append(args)
+        return encode_legacy_jwt(*args)
+
+    monkeypatch.setattr(auth, '_load_private_key', _counting_load_private_key)
+    monkeypatch.setattr(auth, '_encode_legacy_jwt', _counting_encode_legacy_jwt)
+    pydp_object = PyDPlus(
+        base_url='https://example.com',
+        connection_info=legacy_connection_info,
+        connection_type=const.CONNECTION_INFO.LEGACY,
+    )
+    assert len(signed_jwts) == 1
+
+    # Simulate a JWT that is about to expire and then being rejected by the tenant
+    pydp_object._legacy_token_data[const.AUTH_FIELDS.OAUTH_EXPIRES_AT] = 0
+    responses = [DummyResponse(401, {'error': 'expired'}), DummyResponse(200, {'ok': True})]
+    monkeypatch.setattr(pydp_object.session, 'get', lambda url, headers, params, timeout, verify: responses.pop(0))
+
+    assert pydp_object.get('v1/users/123') == {'ok': True}
+    assert len(signed_jwts) == 3
+    assert len(loaded_keys) == 1
+    assert auth._is_legacy_token_valid(pydp_object._legacy_token_data)
+
+
+def _generate_rsa_private_key_pem() -> bytes:
+    """Return a generated RSA private key in PEM format."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+def test_private_key_file_is_parsed_once_until_modified(monkeypatch, tmp_path) -> None:
+    """Ensure a private key file is only parsed again after it is modified or the cache is cleared."""
+    import os
+
+    parsed_files = []
+    read_private_key_file = auth._read_private_key_file
+
+    def _counting_read_private_key_file(_key_path):
+        parsed_files.append(_key_path)
+        return read_private_key_file(_key_path)
+
+    monkeypatch.setattr(auth, '_read_private_key_file', _counting_read_private_key_file)
+    auth.clear_signing_key_cache()
+    key_file = tmp_path / 'private-key.pem'
+    key_file.write_bytes(_generate_rsa_private_key_pem())
+
+    first_key = auth._load_private_key(str(key_file))
+    assert auth._load_private_key(str(key_file)) is first_key
+    assert len(parsed_files) == 1
+
+    # Simulate a rotated key file with a newer modification time
+    key_file.write_bytes(_generate_rsa_private_key_pem())
+    os.utime(key_file, ns=(key_file.stat().st_atime_ns, key_file.stat().st_mtime_ns + 1_000_000_000))
+    rotated_key = auth._load_private_key(str(key_file))
+    assert rotated_key is not first_key
+    assert len(parsed_files) == 2
+
+    auth.clear_signing_key_cache()
+    auth._load_private_key(str(key_file))
+    assert len(parsed_files) == 3
+
+
+def test_oauth_signing_key_is_cached_by_jwk_thumbprint(monkeypatch) -> None:
+    """Ensure equivalent OAuth JWK data is converted to a signing key once and reused by later client assertions."""
+    import jwt as pyjwt
+    from cryptography.hazmat.primitives import serialization
+
+    private_key = serialization.load_pem_private_key(_generate_rsa_private_key_pem(), password=None)
+    private_key_jwk = json.loads(pyjwt.algorithms.RSAAlgorithm.to_jwk(private_key))
+    conversions = []
+    from_dict = pyjwt.PyJWK.from_dict
+
+    def _counting_from_dict(*args, **kwargs):
+        conversions.append(args)
+        return from_dict(*args, **kwargs)
+
+    monkeypatch.setattr(pyjwt.PyJWK, 'from_dict', _counting_from_dict)
+    auth.clear_signing_key_cache()
+
+    for _ in range(3):
+        assertion = auth._create_private_key_jwt_client_assertion('client-id', 'https://example.com/token', dict(private_key_jwk))
+        assert pyjwt.decode(assertion, private_key.public_key(), algorithms=['RS256'], audience='https://example.com/token')
+
+    assert len(conversions) == 1
+    assert auth._get_jwk_thumbprint(private_key_jwk) == auth._get_jwk_thumbprint(dict(private_key_jwk, kid='other'))
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_bulk
+:Synopsis:          Unit tests for the bulk operation helpers and the bulk user lookup and status functions
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+import requests
+
+from pydplus import bulk, errors, users
+from pydplus import constants as const
+from pydplus.utils.json_codec import JsonCodec
+
+pytestmark = pytest.mark.unit
+
+
+class LookupSession:
+    """Minimal session stand-in that resolves user lookups from a dictionary of known users."""
+
+    def __init__(self, known_users: dict) -> None:
+        self.known_users = known_users
+        self.lookups = []
+        self._lock = threading.Lock()
+
+    def post(self, url, json, headers, params, timeout, verify):
+        """Return the user details for known email addresses and a 404 response otherwise."""
+        email = json[const.QUERY_PARAMS.EMAIL]
+        with self._lock:
+            self.lookups.append(email)
+        response = requests.Response()
+        if email in self.known_users:
+            response.status_code = 200
+            response._content = f'{{"{const.RESPONSE_KEYS.ID}": "{self.known_users[email]}"}}'.encode()
+        else:
+            response.status_code = 404
+            response._content = b'{"error": "not found"}'
+        return response
+
+
+class MockBulkClient:
+    """Minimal pydplus-like object for bulk lookup tests."""
+
+    def __init__(self, known_users: dict) -> None:
+        self.strict_mode = False
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.session = LookupSession(known_users)
+
+
+def test_run_bulk_operation_deduplicates_and_preserves_order() -> None:
+    """Ensure duplicate items are processed once and results follow the input order."""
+    calls = []
+
+    def _double(_value: int) -> int:
+        calls.append(_value)
+        return _value * 2
+
+    results = bulk.run_bulk_operation(_double, iter([3, 1, 3, 2, 1]), max_workers=3)
+
+    assert [_result.item for _result in results] == [3, 1, 2]
+    assert [_result.result for _result in results] == [6, 2, 4]
+    assert all(_result.success for _result in results)
+    assert sorted(calls) == [1, 2, 3]
+
+
+def test_run_bulk_operation_captures_failures_per_item() -> None:
+    """Ensure a failed item does not abort the remaining items."""
+
+    def _check(_value: int) -> int:
+        if _value == 2:
+            raise errors.exceptions.APIRequestError('failed')
+        return _value
+
+    results = bulk.run_bulk_operation(_check, [1, 2, 3])
+
+    assert [_result.success for _result in results] == [True, False, True]
+    assert isinstance(results[1].error, errors.exceptions.APIRequestError)
+
+
+def test_iter_bulk_operation_yields_all_results() -> None:
+    """Ensure streamed results include every unique item."""
+    results = list(bulk.iter_bulk_operation(str, ['a', 'b', 'a'], max_workers=2))
+
+    assert sorted(_result.item for _result in results) == ['a', 'b']
+
+
+def test_iter_bulk_operation_bounds_the_pending_operations() -> None:
+    """Ensure items are submitted through a bounded window rather than all at once."""
+    started = []
+    results = bulk.iter_bulk_operation(started.append, range(1000), max_workers=2)
+
+    next(results)
+    assert len(started) <= 2 * const.CLIENT_SETTINGS.BULK_IN_FLIGHT_PER_WORKER
+    assert len(list(results)) == 999
+    assert sorted(started) == list(range(1000))
+
+
+@pytest.mark.parametrize(
+    'items, max_workers, exc_type',
+    [([1], 0, ValueError), ([1], '4', TypeError), ([1], True, TypeError), ('user@example.com', 2, TypeError)],
+)
+def test_bulk_operation_rejects_invalid_arguments(items, max_workers, exc_type) -> None:
+    """Ensure invalid worker counts and string items raise an exception before any work is performed."""
+    with pytest.raises(exc_type):
+        bulk.run_bulk_operation(str, items, max_workers=max_workers)
+
+
+def test_get_user_ids_many_returns_per_email_results() -> None:
+    """Ensure bulk User ID lookups return per-email results even when Strict Mode is disabled."""
+    pydp_object = MockBulkClient({'a@example.com': 'id-a', 'c@example.com': 'id-c'})
+
+    results = users.get_user_ids_many(
+        pydp_object,
+        ['a@example.com', 'b@example.com', 'c@example.com', 'a@example.com'],
+        max_workers=4,
+    )
+
+    assert [_result.item for _result in results] == ['a@example.com', 'b@example.com', 'c@example.com']
+    assert [_result.result for _result in results] == ['id-a', None, 'id-c']
+    assert isinstance(results[1].error, errors.exceptions.APIRequestError)
+    assert sorted(pydp_object.session.lookups) == ['a@example.com', 'b@example.com', 'c@example.com']
+
+
+def test_get_user_details_many_returns_user_details() -> None:
+    """Ensure bulk user detail lookups return the parsed user details."""
+    pydp_object = MockBulkClient({'a@example.com': 'id-a'})
+
+    results = users.get_user_details_many(pydp_object, ['a@example.com'])
+
+    assert results[0].success is True
+    assert results[0].result == {const.RESPONSE_KEYS.ID: 'id-a'}
+
+
+class StatusSession:
+    """Minimal session stand-in that fails status changes for specific user IDs."""
+
+    def __init__(self, failing_user_ids: set) -> None:
+        self.failing_user_ids = failing_user_ids
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def put(self, url, headers, params, timeout, verify, json=None, data=None):
+        """Return a 500 response for failing user IDs and a 200 response otherwise."""
+        with self._lock:
+            self.urls.append(url)
+        response = requests.Response()
+        failed = any(f'/{_user_id}/' in url for _user_id in self.failing_user_ids)
+        response.status_code = 500 if failed else 200
+        response._content = b'{"error": "server error"}' if failed else b'{}'
+        return response
+
+
+@pytest.mark.parametrize('strict_mode', [True, False])
+def test_disable_users_reports_per_user_results(strict_mode: bool) -> None:
+    """Ensure bulk status changes report failures per user whether or not Strict Mode is enabled."""
+    decoded = []
+    pydp_object = MockBulkClient({})
+    pydp_object.strict_mode = strict_mode
+    pydp_object.session = StatusSession({'user-2'})
+    pydp_object.json_codec = JsonCodec(
+        name='recording', dumps=json.dumps, loads=lambda _data: decoded.append(_data) or json.loads(_data)
+    )
+
+    report = users.disable_users(pydp_object, ['user-1', 'user-2', 'user-3', 'user-1'], max_workers=2)
+
+    assert [_result.item for _result in report.results] == ['user-1', 'user-2', 'user-3']
+    assert [_result.success for _result in report.results] == [True, False, True]
+    assert (report.total, report.succeeded, report.failed) == (3, 2, 1)
+    assert report.failures[0].item == 'user-2'
+    assert report.items_per_second > 0
+    # The responses are decoded with the JSON codec of the client object (failed calls raise in Strict Mode)
+    assert len(decoded) == (2 if strict_mode else 3)
+    assert len(pydp_object.session.urls) == 3
+    if strict_mode:
+        assert isinstance(report.failures[0].error, errors.exceptions.APIRequestError)
+        assert report.failures[0].status_code is None
+    else:
+        assert report.failures[0].error is None
+        assert report.failures[0].status_code == 500
+        assert report.failures[0].result == {'error': 'server error'}
+    assert report.results[0].status_code == 200
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_cache
+:Synopsis:          Unit tests for the TTL and LRU cache and the user lookup cache
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from pydplus import PyDPlus, errors, users
+from pydplus import constants as const
+from pydplus.utils import cache
+from pydplus.utils.cache import TTLCache
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    """Deterministic monotonic clock that can be advanced manually."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> FakeClock:
+    """Patch the monotonic clock used by the cache module with a deterministic clock."""
+    clock = FakeClock()
+    monkeypatch.setattr(cache.time, 'monotonic', clock.monotonic)
+    return clock
+
+
+class LookupSession:
+    """Minimal session stand-in that resolves user lookups and records every API call."""
+
+    def __init__(self, known_users: dict) -> None:
+        self.known_users = known_users
+        self.calls = []
+
+    def post(self, url, json, headers, params, timeout, verify):
+        """Return the user details for known email addresses and a 404 response otherwise."""
+        self.calls.append(('POST', json[const.QUERY_PARAMS.EMAIL]))
+        response = requests.Response()
+        email = json[const.QUERY_PARAMS.EMAIL]
+        if email in self.known_users:
+            response.status_code = 200
+            response._content = f'{{"{const.RESPONSE_KEYS.ID}": "{self.known_users[email]}"}}'.encode()
+        else:
+            response.status_code = 404
+            response._content = b'{"error": "not found"}'
+        return response
+
+    def put(self, url, json, headers, params, timeout, verify):
+        """Return a successful response for user status changes."""
+        self.calls.append(('PUT', url))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{}'
+        return response
+
+
+class MockCachedClient:
+    """Minimal pydplus-like object with an enabled user lookup cache."""
+
+    def __init__(self, known_users: dict, strict_mode: bool = False) -> None:
+        self.strict_mode = strict_mode
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.session = LookupSession(known_users)
+        self.users = SimpleNamespace(lookup_cache=users.UserLookupCache(ttl=300, negative_ttl=30))
+
+
+def test_ttl_cache_expires_entries_and_counts_hits(fake_clock: FakeClock) -> None:
+    """Ensure entries expire after their TTL and that hits and misses are counted."""
+    ttl_cache = TTLCache(ttl=10)
+    ttl_cache.set('a', 1)
+    ttl_cache.set('b', 2, ttl=1)
+
+    fake_clock.now += 5
+    assert (ttl_cache.get('a'), ttl_cache.get('b'), ttl_cache.get('c', 'default')) == (1, None, 'default')
+    fake_clock.now += 5
+    assert ttl_cache.get('a') is None
+    assert (ttl_cache.hits, ttl_cache.misses) == (1, 3)
+
+
+def test_ttl_cache_evicts_least_recently_used_entry(fake_clock: FakeClock) -> None:
+    """Ensure the least recently used entry is evicted once the maximum size is reached."""
+    ttl_cache = TTLCache(maxsize=2)
+    ttl_cache.set('a', 1)
+    ttl_cache.set('b', 2)
+    ttl_cache.get('a')
+    ttl_cache.set('c', 3)
+
+    assert (ttl_cache.get('a'), ttl_cache.get('b'), ttl_cache.get('c')) == (1, None, 3)
+    assert len(ttl_cache) == 2
+    assert ttl_cache.discard_where(lambda _key, _value: _value > 2) == 1
+    assert len(ttl_cache) == 1
+
+
+@pytest.mark.parametrize(
+    'settings, exc_type',
+    [({'maxsize': 0}, ValueError), ({'maxsize': 1.5}, TypeError), ({'ttl': 0}, ValueError), ({'ttl': '60'}, TypeError)],
+)
+def test_ttl_cache_rejects_invalid_settings(settings: dict, exc_type) -> None:
+    """Ensure invalid cache settings raise an exception."""
+    with pytest.raises(exc_type):
+        TTLCache(**settings)
+
+
+def test_user_lookups_are_cached_including_not_found_results(fake_clock: FakeClock) -> None:
+    """Ensure repeated lookups are served from the cache and that 404 results expire after the negative TTL."""
+    pydp_object = MockCachedClient({'a@example.com': 'id-a'})
+
+    assert [users.get_user_id(pydp_object, 'a@example.com') for _ in range(3)] == ['id-a'] * 3
+    assert [users.get_user_id(pydp_object, 'b@example.com') for _ in range(2)] == [''] * 2
+    assert pydp_object.session.calls == [('POST', 'a@example.com'), ('POST', 'b@example.com')]
+
+    fake_clock.now += 31
+    users.get_user_id(pydp_object, 'a@example.com')
+    users.get_user_id(pydp_object, 'b@example.com')
+    assert len(pydp_object.session.calls) == 3
+    assert (pydp_object.users.lookup_cache.hits, pydp_object.users.lookup_cache.misses) == (4, 3)
+
+
+def test_cached_user_lookups_ignore_email_case_and_only_hold_parsed_results() -> None:
+    """Ensure cached lookups are shared by differently cased email addresses and are returned as separate copies."""
+    pydp_object = MockCachedClient({'a@example.com': 'id-a'})
+
+    user_details = users.get_user_details(pydp_object, 'a@example.com')
+    user_details[const.RESPONSE_KEYS.ID] = 'modified'
+    assert users.get_user_details(pydp_object, 'A@Example.com') == {const.RESPONSE_KEYS.ID: 'id-a'}
+    assert len(pydp_object.session.calls) == 1
+
+    responses = [users.get_user_details(pydp_object, 'a@example.com', return_json=False) for _ in range(2)]
+    assert all(isinstance(_response, requests.Response) for _response in responses)
+    assert responses[0] is not responses[1]
+    assert len(pydp_object.session.calls) == 3
+
+
+def test_cached_not_found_lookup_raises_in_strict_mode() -> None:
+    """Ensure a cached 404 lookup is handled in the same way as the original response."""
+    pydp_object = MockCachedClient({}, strict_mode=True)
+
+    for _ in range(2):
+        with pytest.raises(errors.exceptions.APIRequestError):
+            users.get_user_details(pydp_object, 'missing@example.com')
+    assert users.get_user_details(pydp_object, 'missing@example.com', allow_failed_response=True) == {'error': 'not found'}
+    assert len(pydp_object.session.calls) == 1
+
+
+def test_user_status_changes_invalidate_cached_lookups() -> None:
+    """Ensure the cached lookups for a user are discarded when the status of the user is changed."""
+    pydp_object = MockCachedClient({'a@example.com': 'id-a', 'c@example.com': 'id-c'})
+    users.get_user_details(pydp_object, 'a@example.com')
+    users.get_user_details(pydp_object, 'c@example.com')
+
+    users.disable_user(pydp_object, 'id-a')
+    users.get_user_details(pydp_object, 'a@example.com')
+    users.get_user_details(pydp_object, 'c@example.com')
+
+    lookups = [_call[1] for _call in pydp_object.session.calls if _call[0] == 'POST']
+    assert lookups == ['a@example.com', 'c@example.com', 'a@example.com']
+
+
+def test_client_lookup_cache_is_opt_in(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the user lookup cache is disabled by default and can be enabled and disabled on the client object."""
+    pydp_object = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+    assert pydp_object.users.lookup_cache is None
+
+    lookup_cache = pydp_object.users.enable_lookup_cache(maxsize=10, ttl=60, negative_ttl=5)
+    assert (lookup_cache.maxsize, lookup_cache.ttl, lookup_cache.negative_ttl) == (10, 60.0, 5.0)
+    assert users._get_lookup_cache(pydp_object) is lookup_cache
+
+    pydp_object.users.disable_lookup_cache()
+    assert users._get_lookup_cache(pydp_object) is None
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_client_config
+:Synopsis:          Unit tests for the immutable snapshot of a resolved client configuration
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import pickle
+from pathlib import Path
+
+import pytest
+
+from pydplus import PyDPlus, core
+from pydplus import constants as const
+from pydplus.config import ClientConfig
+
+pytestmark = pytest.mark.unit
+
+
+def test_resolved_config_is_frozen_and_picklable(monkeypatch, helper_json_file: Path) -> None:
+    """Ensure the resolved configuration captures the resolved settings and survives a pickle round trip."""
+    monkeypatch.setenv('PYDPLUS_RATE_LIMIT', '5')
+    config = core.resolve_client_config(helper=str(helper_json_file))
+
+    assert (config.base_url, config.connection_type, config.rate_limit) == ('https://example.com', 'legacy', 5.0)
+    assert config.admin_base_rest_url == 'https://example.com' + const.REST_PATHS.ADMIN_BASE
+    assert pickle.loads(pickle.dumps(config)) == config
+    assert hash(pickle.loads(pickle.dumps(config))) == hash(config)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.strict_mode = True
+    with pytest.raises(TypeError):
+        config.connection_info[const.CONNECTION_INFO.LEGACY][const.CONNECTION_INFO.LEGACY_ACCESS_ID] = 'changed'
+
+
+def test_client_from_config_skips_resolution(monkeypatch, helper_json_file: Path) -> None:
+    """Ensure a client object instantiated from a configuration matches the original without resolving it again."""
+    monkeypatch.setenv('PYDPLUS_RATE_LIMIT', '5')
+    with PyDPlus(helper=str(helper_json_file), auto_connect=False) as original:
+        config = original.config
+
+    def _fail(*args, **kwargs):
+        raise AssertionError('The configuration should not be resolved again')
+
+    for _method in ('_get_helper_settings', '_get_env_variables', '_validate_connection_info', '_get_connection_type'):
+        monkeypatch.setattr(PyDPlus, _method, _fail)
+    with PyDPlus(config=config, auto_connect=False) as pydp_object:
+        assert pydp_object.config is config
+        assert (pydp_object.admin_base_rest_url, pydp_object.connection_type) == (
+            original.admin_base_rest_url,
+            original.connection_type,
+        )
+        assert pydp_object.connection_info == original.connection_info
+        assert pydp_object.rate_limiter is not original.rate_limiter
+        assert pydp_object.rate_limiter.rate == 5.0
+
+        # The connection info of the client object is a copy that cannot alter the shared configuration
+        pydp_object.connection_info[const.CONNECTION_INFO.LEGACY][const.CONNECTION_INFO.LEGACY_ACCESS_ID] = 'changed'
+        assert config.connection_info[const.CONNECTION_INFO.LEGACY][const.CONNECTION_INFO.LEGACY_ACCESS_ID] == (
+            'legacy-access-id'
+        )
+
+
+def test_invalid_config_values_raise_exceptions(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure invalid configurations raise exceptions."""
+    with pytest.raises(TypeError):
+        PyDPlus(config={'base_url': sample_base_url}, auto_connect=False)
+    with pytest.raises(ValueError):
+        ClientConfig(
+            base_url=sample_base_url,
+            admin_base_url=sample_base_url,
+            auth_base_url=None,
+            connection_type='basic',
+            connection_info=sample_connection_info,
+        )
+
+
+def test_config_connection_info_round_trips_container_types(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the read-only connection info is converted back to the original lists, tuples, and sets."""
+    connection_info = {
+        **sample_connection_info,
+        'extra': {'hosts': ['a', 'b'], 'pair': ('c', ['d']), 'tags': {'e'}, 'frozen': frozenset({'f'})},
+    }
+    config = ClientConfig(
+        base_url=sample_base_url,
+        admin_base_url=sample_base_url,
+        auth_base_url=None,
+        connection_type=const.CONNECTION_INFO.LEGACY,
+        connection_info=connection_info,
+    )
+
+    assert config.get_connection_info() == connection_info
+    assert [type(_value) for _value in config.get_connection_info()['extra'].values()] == [list, tuple, set, frozenset]
+    assert type(config.get_connection_info()['extra']['pair'][1]) is list
+    assert pickle.loads(pickle.dumps(config)).get_connection_info() == connection_info
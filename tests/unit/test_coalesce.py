@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_coalesce
+:Synopsis:          Unit tests for the coalescing of concurrent identical API calls
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from pydplus import PyDPlus, api, errors, users
+from pydplus import constants as const
+from pydplus.utils.coalesce import RequestCoalescer
+
+pytestmark = pytest.mark.unit
+
+CONCURRENT_CALLS = 8
+
+
+def _wait_for_waiters(coalescer: RequestCoalescer, waiters: int) -> None:
+    """Wait (up to two seconds) until the given number of callers are waiting for the in-flight call."""
+    deadline = time.monotonic() + 2
+    while coalescer.coalesced < waiters and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class GatedSession:
+    """Minimal session stand-in that holds each request until the identical concurrent calls are waiting for it."""
+
+    def __init__(self, coalescer: RequestCoalescer) -> None:
+        self.coalescer = coalescer
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _respond(self, method: str, url: str):
+        with self._lock:
+            self.calls.append((method, url))
+        _wait_for_waiters(self.coalescer, CONCURRENT_CALLS - 1)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = f'{{"{const.RESPONSE_KEYS.ID}": "id-a", "groups": []}}'.encode()
+        return response
+
+    def get(self, url, headers, params, timeout, verify):
+        """Return the user details once the identical calls are waiting."""
+        return self._respond(const.API_REQUEST_TYPES.GET, url)
+
+    def post(self, url, json, headers, params, timeout, verify):
+        """Return the user details once the identical calls are waiting."""
+        return self._respond(const.API_REQUEST_TYPES.POST, url)
+
+    def put(self, url, json, headers, params, timeout, verify):
+        """Return a successful response without waiting as PUT requests are never coalesced."""
+        with self._lock:
+            self.calls.append((const.API_REQUEST_TYPES.PUT, url))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{}'
+        return response
+
+
+class MockCoalescingClient:
+    """Minimal pydplus-like object with a request coalescer."""
+
+    def __init__(self) -> None:
+        self.strict_mode = True
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.request_coalescer = RequestCoalescer()
+        self.session = GatedSession(self.request_coalescer)
+
+
+def _run_concurrently(func) -> list:
+    """Call a function from several threads at once and return the results."""
+    with ThreadPoolExecutor(max_workers=CONCURRENT_CALLS) as executor:
+        return list(executor.map(lambda _: func(), range(CONCURRENT_CALLS)))
+
+
+def test_coalescer_shares_result_and_exceptions() -> None:
+    """Ensure overlapping calls for the same key share a single execution and its exception."""
+    coalescer = RequestCoalescer()
+    executions = []
+
+    def _fail():
+        executions.append(1)
+        _wait_for_waiters(coalescer, CONCURRENT_CALLS - 1)
+        raise errors.exceptions.APIRequestError('failed')
+
+    def _call():
+        with pytest.raises(errors.exceptions.APIRequestError) as exc_info:
+            coalescer.run('key', _fail)
+        return exc_info.value
+
+    exceptions = _run_concurrently(_call)
+
+    assert len(executions) == 1
+    assert len({id(_exc) for _exc in exceptions}) == CONCURRENT_CALLS
+    assert all(str(_exc) == 'failed' for _exc in exceptions)
+    assert coalescer.run('key', lambda: 'new') == 'new'
+
+
+def test_requests_returning_response_objects_are_not_coalesced() -> None:
+    """Ensure API calls that return the response object are never coalesced, as response objects cannot be shared."""
+    pydp_object = MockCoalescingClient()
+
+    assert api._get_request_coalescer(pydp_object, const.API_REQUEST_TYPES.GET, None) is pydp_object.request_coalescer
+    assert api._get_request_coalescer(pydp_object, const.API_REQUEST_TYPES.GET, None, False) is None
+    assert api._get_request_coalescer(pydp_object, const.API_REQUEST_TYPES.POST, True, False) is None
+
+
+def test_concurrent_identical_get_requests_share_one_round_trip() -> None:
+    """Ensure identical GET requests share one request while each caller receives its own copy of the result."""
+    pydp_object = MockCoalescingClient()
+
+    results = _run_concurrently(lambda: api.get(pydp_object, 'v1/users/id-a'))
+
+    assert len(pydp_object.session.calls) == 1
+    assert all(_result == {'id': 'id-a', 'groups': []} for _result in results)
+    assert len({id(_result) for _result in results}) == CONCURRENT_CALLS
+    assert len({id(_result['groups']) for _result in results}) == CONCURRENT_CALLS
+
+
+def test_concurrent_user_lookups_share_one_round_trip() -> None:
+    """Ensure identical user lookups share one request to the lookup endpoint."""
+    pydp_object = MockCoalescingClient()
+
+    user_ids = _run_concurrently(lambda: users.get_user_id(pydp_object, 'a@example.com'))
+
+    assert user_ids == ['id-a'] * CONCURRENT_CALLS
+    assert len(pydp_object.session.calls) == 1
+
+
+def test_concurrent_cache_misses_share_one_user_lookup() -> None:
+    """Ensure identical user lookups that miss the lookup cache share one request and cache its parsed result."""
+    pydp_object = MockCoalescingClient()
+    pydp_object.users = SimpleNamespace(lookup_cache=users.UserLookupCache())
+
+    results = _run_concurrently(lambda: users.get_user_details(pydp_object, 'A@example.com'))
+
+    assert len(pydp_object.session.calls) == 1
+    assert all(_result == {'id': 'id-a', 'groups': []} for _result in results)
+    assert len({id(_result) for _result in results}) == CONCURRENT_CALLS
+    assert users.get_user_id(pydp_object, 'a@example.com') == 'id-a'
+    assert len(pydp_object.session.calls) == 1
+
+
+def test_payload_requests_are_not_coalesced_by_default() -> None:
+    """Ensure API calls with a payload (e.g. status changes) are only coalesced when they opt in."""
+    pydp_object = MockCoalescingClient()
+
+    _run_concurrently(lambda: users.disable_user(pydp_object, 'id-a'))
+
+    assert len(pydp_object.session.calls) == CONCURRENT_CALLS
+    assert pydp_object.request_coalescer.coalesced == 0
+
+
+def test_client_request_coalescing_setting(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure request coalescing is enabled by default and can be disabled."""
+    pydp_object = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+    assert isinstance(pydp_object.request_coalescer, RequestCoalescer)
+
+    pydp_object = PyDPlus(
+        base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False, coalesce_requests=False
+    )
+    assert pydp_object.request_coalescer is None
+
+    with pytest.raises(TypeError):
+        PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False, coalesce_requests='no')
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_download
+:Synopsis:          Unit tests for the chunked downloads of streamed API responses in pydplus.utils.download
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+
+import pytest
+import requests
+
+from pydplus import api
+from pydplus import constants as const
+from pydplus.utils.download import write_chunks
+
+pytestmark = pytest.mark.unit
+
+CONTENT = b''.join(f'user-{_index},user-{_index}@example.com,Enabled\n'.encode() for _index in range(5000))
+
+
+class ChunkedReader(io.BytesIO):
+    """Raw response stand-in that records the size of every read."""
+
+    def __init__(self, content: bytes) -> None:
+        super().__init__(content)
+        self.read_sizes = []
+
+    def read(self, size=-1):
+        """Read the next chunk of content and record the requested size."""
+        self.read_sizes.append(size)
+        return super().read(size)
+
+
+class StreamingSession:
+    """Minimal session stand-in that streams the content of a response."""
+
+    def __init__(self) -> None:
+        self.raw = ChunkedReader(CONTENT)
+        self.streamed = []
+
+    def get(self, url, headers, params, timeout, verify, **kwargs):
+        """Return a response whose content is read from the raw stream."""
+        self.streamed.append(kwargs.get('stream', False))
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = self.raw
+        return response
+
+
+class MockStreamingClient:
+    """Minimal pydplus-like object used to perform streamed API calls."""
+
+    def __init__(self) -> None:
+        self.strict_mode = False
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.session = StreamingSession()
+
+
+def test_streamed_response_is_written_to_disk_in_compressed_chunks(tmp_path) -> None:
+    """Ensure a streamed response is read in chunks and written to a compressed file along with its checksum."""
+    pydp_object = MockStreamingClient()
+    export_path = tmp_path / 'users.csv.gz'
+
+    response = api.get(pydp_object, 'v1/users/export', return_json=False, stream=True)
+    download = write_chunks(response.iter_content(chunk_size=4096), export_path, compress=True)
+
+    assert pydp_object.session.streamed == [True]
+    assert set(pydp_object.session.raw.read_sizes) == {4096}
+    written = export_path.read_bytes()
+    assert gzip.decompress(written) == CONTENT
+    assert (download.path, download.compressed) == (export_path, True)
+    assert (download.bytes_received, download.bytes_written) == (len(CONTENT), len(written))
+    assert download.checksum == hashlib.sha256(written).hexdigest()
+    assert list(tmp_path.iterdir()) == [export_path]
+
+
+def test_write_chunks_to_file_objects_and_failures(tmp_path) -> None:
+    """Ensure content can be written to file-like objects and that interrupted downloads leave no partial file."""
+    buffer = io.BytesIO()
+
+    download = write_chunks([CONTENT[:100], b'', CONTENT[100:]], buffer, checksum_algorithm='md5')
+    assert buffer.getvalue() == CONTENT
+    assert (download.path, download.checksum_algorithm) == (None, 'md5')
+    assert download.checksum == hashlib.md5(CONTENT).hexdigest()
+
+    def _interrupted_chunks():
+        yield CONTENT[:100]
+        raise ConnectionError('The connection was reset')
+
+    with pytest.raises(ConnectionError):
+        write_chunks(_interrupted_chunks(), tmp_path / 'users.csv')
+    assert list(tmp_path.iterdir()) == []
+
+    with pytest.raises(ValueError):
+        write_chunks([CONTENT], tmp_path / 'users.csv', checksum_algorithm='nope')
+    with pytest.raises(TypeError):
+        write_chunks([CONTENT], 42)
+    with pytest.raises(TypeError):
+        write_chunks([CONTENT], buffer, compress='yes')
@@ -3,13 +3,14 @@
 :Module:            tests.unit.test_helper_settings
 :Synopsis:          Unit tests for helper configuration functions in pydplus.utils.helper
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.3-codex)
-:Modified Date:     01 Apr 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -37,7 +38,7 @@ def test_import_helper_file_parses_json_when_extension_uses_dot_prefix(tmp_path:
 
 
 def test_import_helper_file_parses_yaml_content(tmp_path: Path) -> None:
-    """Ensure YAML helper files are parsed with yaml.safe_load."""
+    """Ensure YAML helper files are parsed with a safe YAML loader."""
     helper_file = tmp_path / 'helper.yaml'
     helper_file.write_text('tenant_name: tenant-a\nstrict_mode: yes\n', encoding='utf-8')
 
@@ -47,6 +48,36 @@ def test_import_helper_file_parses_yaml_content(tmp_path: Path) -> None:
     assert parsed[const.HELPER_SETTINGS.STRICT_MODE] is True
 
 
+def test_import_helper_file_caches_parsed_file_until_it_changes(tmp_path: Path, monkeypatch) -> None:
+    """Ensure helper files are parsed once, returned as copies, and parsed again once modified."""
+    parsed_files = []
+    parse_helper_file = helper._parse_helper_file
+
+    def _counting_parse_helper_file(_file_path, _file_type):
+        parsed_files.append(_file_path)
+        return parse_helper_file(_file_path, _file_type)
+
+    monkeypatch.setattr(helper, '_parse_helper_file', _counting_parse_helper_file)
+    helper.clear_helper_file_cache()
+    helper_file = tmp_path / 'helper.yml'
+    helper_file.write_text('tenant_name: tenant-a\n', encoding='utf-8')
+
+    first = helper.import_helper_file(str(helper_file), const.FILE_EXTENSIONS.YML)
+    first[const.HELPER_SETTINGS.TENANT_NAME] = 'modified'
+    assert helper.import_helper_file(str(helper_file), const.FILE_EXTENSIONS.YML) == {'tenant_name': 'tenant-a'}
+    assert len(parsed_files) == 1
+
+    # Simulate an edited helper file with a newer modification time
+    helper_file.write_text('tenant_name: tenant-b\n', encoding='utf-8')
+    os.utime(helper_file, ns=(helper_file.stat().st_atime_ns, helper_file.stat().st_mtime_ns + 1_000_000_000))
+    assert helper.import_helper_file(str(helper_file), const.FILE_EXTENSIONS.YML) == {'tenant_name': 'tenant-b'}
+    assert len(parsed_files) == 2
+
+    helper.clear_helper_file_cache()
+    helper.import_helper_file(str(helper_file), const.FILE_EXTENSIONS.YML)
+    assert len(parsed_files) == 3
+
+
 def test_import_helper_file_raises_invalid_helper_file_type_error(tmp_path: Path) -> None:
     """Ensure unsupported helper file types raise InvalidHelperFileTypeError."""
     helper_path = _write_json_file(tmp_path, 'helper.data', {'ok': True})
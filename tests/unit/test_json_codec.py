@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_json_codec
+:Synopsis:          Unit tests for the pluggable JSON codecs used by pydplus.api
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+import requests
+
+from pydplus import PyDPlus, api
+from pydplus import constants as const
+from pydplus.utils.json_codec import JsonCodec, get_available_json_codecs, get_json_codec
+
+pytestmark = pytest.mark.unit
+
+SAMPLE_PAYLOAD = {'users': [{'id': 'user-1', 'name': 'Zoë', 'active': True, 'score': 1.5, 1: None}]}
+
+
+@pytest.mark.parametrize('name', const.JSON_CODEC_SETTINGS.PREFERRED_CODECS)
+def test_json_codecs_encode_like_the_standard_library(name: str) -> None:
+    """Ensure every installed codec encodes and decodes payloads the same way as the standard library."""
+    if name != const.JSON_CODEC_SETTINGS.STDLIB:
+        pytest.importorskip(name)
+    codec = get_json_codec(name)
+
+    encoded = codec.dumps(SAMPLE_PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == json.loads(json.dumps(SAMPLE_PAYLOAD))
+    assert codec.loads(encoded.decode()) == json.loads(encoded)
+
+
+def test_get_json_codec_selects_installed_codecs() -> None:
+    """Ensure the fastest installed codec is selected automatically and that invalid names raise exceptions."""
+    available = get_available_json_codecs()
+    assert available[-1] == const.JSON_CODEC_SETTINGS.STDLIB
+    assert get_json_codec().name == available[0]
+    assert get_json_codec('JSON') is get_json_codec(const.JSON_CODEC_SETTINGS.STDLIB)
+
+    with pytest.raises(ValueError):
+        get_json_codec('simplejson')
+    with pytest.raises(TypeError):
+        get_json_codec(None)
+
+
+class CodecSession:
+    """Minimal session stand-in that records the payload data and headers of POST requests."""
+
+    def __init__(self) -> None:
+        self.requests = []
+
+    def post(self, url, headers, params, timeout, verify, json=None, data=None):
+        """Record the request and return a JSON response."""
+        self.requests.append({'headers': headers, 'json': json, 'data': data})
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"id": "user-1"}'
+        return response
+
+
+class MockCodecClient:
+    """Minimal pydplus-like object with a custom JSON codec."""
+
+    def __init__(self, json_codec=None) -> None:
+        self.strict_mode = False
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.session = CodecSession()
+        self.json_codec = json_codec
+
+
+def test_api_calls_use_the_json_codec_of_the_client_object() -> None:
+    """Ensure payloads are encoded and responses decoded by the codec of the client object when one is defined."""
+    calls = []
+    codec = JsonCodec(
+        name='recording',
+        dumps=lambda _obj: calls.append(('dumps', _obj)) or json.dumps(_obj).encode(),
+        loads=lambda _data: calls.append(('loads', _data)) or json.loads(_data),
+    )
+    pydp_object = MockCodecClient(codec)
+
+    assert api.post(pydp_object, 'v1/users', payload={'email': 'a@example.com'}) == {'id': 'user-1'}
+    assert calls == [('dumps', {'email': 'a@example.com'}), ('loads', b'{"id": "user-1"}')]
+    request = pydp_object.session.requests[0]
+    assert (request['json'], request['data']) == (None, b'{"email": "a@example.com"}')
+    assert request['headers'][const.HEADERS.CONTENT_TYPE] == const.CONTENT_TYPES.JSON
+
+    # Client objects without a codec leave the encoding to the requests package
+    pydp_object = MockCodecClient()
+    assert api.post(pydp_object, 'v1/users', payload={'email': 'a@example.com'}) == {'id': 'user-1'}
+    assert pydp_object.session.requests[0]['json'] == {'email': 'a@example.com'}
+
+
+def test_client_object_json_codec_setting(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the client object resolves the configured JSON codec and rejects invalid values."""
+    pydp_object = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+    assert pydp_object.json_codec.name == get_available_json_codecs()[0]
+
+    pydp_object = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False, json_codec='json')
+    assert pydp_object.json_codec is get_json_codec(const.JSON_CODEC_SETTINGS.STDLIB)
+
+    with pytest.raises(TypeError):
+        PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False, json_codec=1)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_json_stream
+:Synopsis:          Unit tests for the streamed JSON array responses of pydplus.api.get
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import random
+
+import pytest
+import requests
+
+from pydplus import api, errors
+from pydplus import constants as const
+from pydplus.utils.json_stream import iter_json_array
+
+pytestmark = pytest.mark.unit
+
+SAMPLE_ELEMENTS = [1, 2.5, -3e4, 'é😀"x', None, True, False, {'users': [{'id': 'user-1'}]}, [], *range(500)]
+
+
+def _split_randomly(content: bytes, seed: int) -> list[bytes]:
+    """Split content into chunks of random sizes, which may split multibyte characters and numbers."""
+    rng = random.Random(seed)
+    chunks, position = [], 0
+    while position < len(content):
+        size = rng.randint(1, 40)
+        chunks.append(content[position : position + size])
+        position += size
+    return chunks
+
+
+@pytest.mark.parametrize('use_ijson', [False, True])
+def test_iter_json_array_parses_elements_split_across_chunks(use_ijson: bool) -> None:
+    """Ensure array elements are parsed correctly regardless of where the chunk boundaries fall."""
+    if use_ijson:
+        pytest.importorskip('ijson')
+    content = json.dumps(SAMPLE_ELEMENTS, ensure_ascii=False, indent=2).encode()
+    for seed in range(20):
+        assert list(iter_json_array(_split_randomly(content, seed), use_ijson=use_ijson)) == SAMPLE_ELEMENTS
+
+    for invalid_content in (b'{"elements": []}', b'[1, 2', b'[1 2]', b'[1,]', b'[1] []'):
+        with pytest.raises(ValueError):
+            list(iter_json_array([invalid_content], use_ijson=use_ijson))
+
+
+class StreamingSession:
+    """Minimal session stand-in that streams a JSON response and records whether it was closed."""
+
+    def __init__(self, content: bytes, status_code: int = 200) -> None:
+        self.content = content
+        self.status_code = status_code
+        self.raw = None
+        self.stream_arguments = []
+
+    def get(self, url, headers, params, timeout, verify, **kwargs):
+        """Return a response whose body is read from the raw stream."""
+        self.stream_arguments.append(kwargs.get('stream', False))
+        self.raw = io.BytesIO(self.content)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.raw = self.raw
+        return response
+
+
+class MockStreamingClient:
+    """Minimal pydplus-like object used to perform streamed API calls."""
+
+    def __init__(self, session: StreamingSession) -> None:
+        self.strict_mode = False
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.session = session
+
+
+def test_streamed_get_yields_array_elements_lazily() -> None:
+    """Ensure a streamed GET request yields the array elements as they are read and closes unfinished responses."""
+    users = [{const.RESPONSE_KEYS.ID: f'user-{_index}'} for _index in range(20000)]
+    pydp_object = MockStreamingClient(StreamingSession(json.dumps(users).encode()))
+
+    elements = api.get(pydp_object, 'v1/users', stream=True)
+    assert next(elements) == users[0]
+    assert pydp_object.session.raw.tell() < len(pydp_object.session.content)
+    assert list(elements) == users[1:]
+    assert pydp_object.session.stream_arguments == [True]
+
+    # Closing the generator before the end of the array closes the response and its connection
+    elements = api.get(pydp_object, 'v1/users', stream=True)
+    assert next(elements) == users[0]
+    elements.close()
+    assert pydp_object.session.raw.closed
+
+    pydp_object.session = StreamingSession(b'{"elements": []}')
+    with pytest.raises(errors.exceptions.APIResponseConversionError):
+        list(api.get(pydp_object, 'v1/users', stream=True))
+
+
+def test_streamed_get_handles_failed_responses() -> None:
+    """Ensure failed streamed responses are returned in JSON format or raise an exception like other responses."""
+    pydp_object = MockStreamingClient(StreamingSession(b'{"error": "not found"}', status_code=404))
+
+    assert api.get(pydp_object, 'v1/users', stream=True) == {'error': 'not found'}
+    with pytest.raises(errors.exceptions.APIRequestError):
+        api.get(pydp_object, 'v1/users', stream=True, allow_failed_response=False)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_lazy_connect
+:Synopsis:          Unit tests for deferring the connection of the client object until the first API call
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from pydplus import PyDPlus, auth, users
+from pydplus import constants as const
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingSession:
+    """Minimal session stand-in that records the authorization header of every API call."""
+
+    def __init__(self) -> None:
+        self.authorization_headers = []
+
+    def _respond(self, headers: dict):
+        self.authorization_headers.append(headers.get(const.HEADERS.AUTHORIZATION))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = f'{{"{const.RESPONSE_KEYS.ID}": "id-a"}}'.encode()
+        return response
+
+    def get(self, url, headers, params, timeout, verify):
+        """Return a successful response."""
+        return self._respond(headers)
+
+    def post(self, url, headers, params, timeout, verify, json=None, data=None):
+        """Return a successful response."""
+        return self._respond(headers)
+
+    def close(self) -> None:
+        """Close the session."""
+
+
+@pytest.fixture
+def token_requests(monkeypatch, sample_connection_info: dict) -> list:
+    """Count the OAuth token requests and slow them down so that concurrent connections overlap."""
+    requests_made = []
+    lock = threading.Lock()
+
+    def _fake_request_oauth_access_token(**kwargs):
+        with lock:
+            requests_made.append(kwargs)
+            access_token = f'token-{len(requests_made)}'
+        time.sleep(0.05)
+        now = int(datetime.datetime.now(datetime.UTC).timestamp())
+        return {
+            'access_token': access_token,
+            'token_type': 'Bearer',
+            'expires_in': 3600,
+            'expires_at': now + 3600,
+            'scope': kwargs['oauth_connection_info'][const.CONNECTION_INFO.OAUTH_SCOPE],
+        }
+
+    monkeypatch.setattr(auth, '_request_oauth_access_token', _fake_request_oauth_access_token)
+    sample_connection_info[const.CONNECTION_INFO.OAUTH][const.CONNECTION_INFO.OAUTH_PRIVATE_KEY_JWK] = (
+        '{"kty":"RSA","n":"abc","e":"AQAB","d":"xyz"}'
+    )
+    return requests_made
+
+
+def _get_lazy_client(sample_base_url: str, sample_connection_info: dict) -> PyDPlus:
+    """Instantiate an OAuth client object with a deferred connection and a recording session."""
+    pydp_object = PyDPlus(
+        base_url=sample_base_url,
+        connection_info=sample_connection_info,
+        connection_type=const.CONNECTION_INFO.OAUTH,
+        lazy_connect=True,
+    )
+    pydp_object.session = RecordingSession()
+    return pydp_object
+
+
+def test_lazy_client_connects_once_on_first_concurrent_api_calls(
+    sample_base_url: str, sample_connection_info: dict, token_requests: list
+) -> None:
+    """Ensure instantiation performs no token request and concurrent first API calls connect exactly once."""
+    pydp_object = _get_lazy_client(sample_base_url, sample_connection_info)
+    assert (pydp_object.connected, pydp_object.base_headers, token_requests) == (False, {}, [])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _index: pydp_object.get(f'v1/users/{_index}'), range(8)))
+
+    assert pydp_object.connected is True
+    assert len(token_requests) == 1
+    assert set(pydp_object.session.authorization_headers) == {'Bearer token-1'}
+
+
+def test_lazy_client_connects_on_module_level_api_calls(
+    sample_base_url: str, sample_connection_info: dict, token_requests: list
+) -> None:
+    """Ensure the deferred connection is also established by the module-level API functions."""
+    pydp_object = _get_lazy_client(sample_base_url, sample_connection_info)
+
+    assert users.get_user_id(pydp_object, 'a@example.com') == 'id-a'
+    assert pydp_object.connected is True
+    assert len(token_requests) == 1
+
+
+def test_connect_updates_client_state_after_instantiation(
+    sample_base_url: str, sample_connection_info: dict, token_requests: list
+) -> None:
+    """Ensure calling connect() after instantiating without auto-connect updates the connection state."""
+    pydp_object = PyDPlus(
+        base_url=sample_base_url,
+        connection_info=sample_connection_info,
+        connection_type=const.CONNECTION_INFO.OAUTH,
+        auto_connect=False,
+    )
+
+    pydp_object.connect()
+
+    assert pydp_object.connected is True
+    assert pydp_object.base_headers[const.HEADERS.AUTHORIZATION] == 'Bearer token-1'
+
+
+def test_lazy_connect_must_be_boolean(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure a non-Boolean lazy_connect value raises an exception."""
+    with pytest.raises(TypeError):
+        PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, lazy_connect='yes')
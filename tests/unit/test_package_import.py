@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_package_import
+:Synopsis:          Unit tests for the lazy loading of the client and its dependencies when importing the package
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import pydplus
+
+pytestmark = pytest.mark.unit
+
+SOURCE_DIRECTORY = Path(__file__).resolve().parents[2] / 'src'
+
+
+def _get_loaded_modules(statement: str) -> set[str]:
+    """Execute a statement in a new interpreter and return the names of the modules that were loaded."""
+    _script = f'import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))'
+    _python_path = os.pathsep.join(filter(None, (str(SOURCE_DIRECTORY), os.environ.get('PYTHONPATH'))))
+    _result = subprocess.run(
+        [sys.executable, '-c', _script],
+        capture_output=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=_python_path),
+        text=True,
+    )
+    return set(json.loads(_result.stdout.splitlines()[-1]))
+
+
+def test_package_import_defers_heavy_dependencies() -> None:
+    """Ensure importing the package does not load the client module or its third-party dependencies."""
+    loaded_modules = _get_loaded_modules('import pydplus')
+
+    assert not loaded_modules & {'pydplus.core', 'requests', 'jwt', 'cryptography', 'yaml', 'tomllib'}
+
+
+def test_client_import_defers_signing_and_helper_dependencies() -> None:
+    """Ensure the JWT, cryptography, and YAML packages are only loaded when they are needed."""
+    loaded_modules = _get_loaded_modules('from pydplus import PyDPlus')
+
+    assert 'pydplus.core' in loaded_modules
+    assert not loaded_modules & {'jwt', 'cryptography', 'yaml'}
+
+
+def test_lazy_package_attributes() -> None:
+    """Ensure the lazily imported attributes are available and unknown attributes raise an exception."""
+    from pydplus.core import PyDPlus
+    from pydplus.utils import version
+
+    assert pydplus.PyDPlus is PyDPlus
+    assert pydplus.__version__ == version.get_full_version()
+    assert {'PyDPlus', 'core', '__version__'} <= set(dir(pydplus))
+    with pytest.raises(AttributeError):
+        pydplus.missing_attribute
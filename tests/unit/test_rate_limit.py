@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_rate_limit
+:Synopsis:          Unit tests for the client-side token bucket rate limiter
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pydplus import PyDPlus, api
+from pydplus import constants as const
+from pydplus.utils import rate_limit
+from pydplus.utils.rate_limit import TokenBucket
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    """Deterministic monotonic clock whose sleep calls advance the current time."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record the sleep duration and advance the clock."""
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> FakeClock:
+    """Patch the time functions used by the rate limit module with a deterministic clock."""
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(rate_limit.time, 'sleep', clock.sleep)
+    return clock
+
+
+def test_token_bucket_allows_burst_then_paces_requests(fake_clock: FakeClock) -> None:
+    """Ensure the burst capacity is available immediately and later requests wait for replenished tokens."""
+    limiter = TokenBucket(rate=2, burst=3)
+
+    waits = [limiter.acquire() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert fake_clock.sleeps == [0.5, 0.5]
+
+
+def test_token_bucket_replenishes_up_to_burst(fake_clock: FakeClock) -> None:
+    """Ensure idle time replenishes tokens without exceeding the burst capacity."""
+    limiter = TokenBucket(rate=10)
+    for _ in range(10):
+        limiter.acquire()
+
+    fake_clock.now += 60
+    waits = [limiter.acquire() for _ in range(11)]
+
+    assert waits[:10] == [0.0] * 10
+    assert waits[10] == pytest.approx(0.1)
+
+
+def test_token_bucket_async_acquire_waits(fake_clock: FakeClock, monkeypatch) -> None:
+    """Ensure the asynchronous acquire method waits with asyncio rather than blocking."""
+    async_sleeps = []
+
+    async def _fake_async_sleep(seconds: float) -> None:
+        async_sleeps.append(seconds)
+
+    monkeypatch.setattr(rate_limit.asyncio, 'sleep', _fake_async_sleep)
+    limiter = TokenBucket(rate=4, burst=1)
+
+    asyncio.run(limiter.acquire_async())
+    asyncio.run(limiter.acquire_async())
+
+    assert async_sleeps == [pytest.approx(0.25)]
+    assert fake_clock.sleeps == []
+
+
+@pytest.mark.parametrize(
+    'settings, exc_type',
+    [
+        ({'rate': 0}, ValueError),
+        ({'rate': float('inf')}, ValueError),
+        ({'rate': '10'}, TypeError),
+        ({'rate': 10, 'burst': 0}, ValueError),
+        ({'rate': 10, 'burst': 2.5}, TypeError),
+    ],
+)
+def test_token_bucket_rejects_invalid_settings(settings: dict, exc_type) -> None:
+    """Ensure invalid rate limit settings raise an exception."""
+    with pytest.raises(exc_type):
+        TokenBucket(**settings)
+
+
+def test_client_rate_limit_from_argument(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the rate limiter is defined using the constructor arguments."""
+    pydp_object = PyDPlus(
+        base_url=sample_base_url,
+        connection_info=sample_connection_info,
+        auto_connect=False,
+        rate_limit=5,
+        rate_limit_burst=8,
+    )
+
+    assert (pydp_object.rate_limiter.rate, pydp_object.rate_limiter.burst) == (5.0, 8)
+
+
+def test_client_rate_limit_disabled_by_default(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure rate limiting is disabled when no rate limit is configured."""
+    pydp_object = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+
+    assert pydp_object.rate_limiter is None
+
+
+def test_client_rate_limit_from_environment(monkeypatch, sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the rate limiter is defined using the environment variables."""
+    monkeypatch.setenv(const.ENV_VARIABLES.RATE_LIMIT, '2.5')
+    monkeypatch.setenv(const.ENV_VARIABLES.RATE_LIMIT_BURST, '4')
+
+    pydp_object = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+
+    assert (pydp_object.rate_limiter.rate, pydp_object.rate_limiter.burst) == (2.5, 4)
+
+
+def test_client_rate_limit_rejects_invalid_environment(monkeypatch, sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure a non-numeric rate limit environment variable raises a ValueError."""
+    monkeypatch.setenv(const.ENV_VARIABLES.RATE_LIMIT, 'fast')
+
+    with pytest.raises(ValueError):
+        PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+
+
+def test_api_calls_pass_through_rate_limiter(monkeypatch) -> None:
+    """Ensure GET and payload API calls acquire a token from the rate limiter of the client object."""
+
+    class _CountingLimiter:
+        def __init__(self) -> None:
+            self.acquired = 0
+
+        def acquire(self) -> float:
+            self.acquired += 1
+            return 0.0
+
+    class _Response:
+        status_code = 200
+
+        @staticmethod
+        def json():
+            return {}
+
+    class _Client:
+        strict_mode = True
+        verify_ssl = True
+        connection_type = const.CONNECTION_INFO.LEGACY
+        admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        auth_base_rest_url = None
+        base_headers = {}
+        session = None
+        rate_limiter = _CountingLimiter()
+
+    monkeypatch.setattr(api.requests, 'get', lambda url, headers, params, timeout, verify: _Response())
+    monkeypatch.setattr(api.requests, 'put', lambda url, json, headers, params, timeout, verify: _Response())
+
+    api.get(_Client, 'v1/users/123')
+    api.put(_Client, 'v1/users/123/userStatus', payload={'userStatus': 'Enabled'})
+
+    assert _Client.rate_limiter.acquired == 2
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_retry
+:Synopsis:          Unit tests for the retry policy and the retry handling of API calls
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from pydplus import PyDPlus, api
+from pydplus import constants as const
+from pydplus.aio import api as async_api
+from pydplus.utils.retry import RetryPolicy
+
+pytestmark = pytest.mark.unit
+
+
+class DummyResponse:
+    """Simple stand-in for an HTTP response object."""
+
+    def __init__(self, status_code: int, headers: dict = None) -> None:
+        self.status_code = status_code
+        self.headers = {} if headers is None else headers
+        self.text = ''
+
+    @staticmethod
+    def json():
+        """Return an empty JSON payload."""
+        return {}
+
+
+class QueuedSession:
+    """Minimal session stand-in that returns (or raises) queued outcomes and counts the requests per method."""
+
+    def __init__(self, outcomes: list) -> None:
+        self.outcomes = outcomes
+        self.calls = []
+
+    def _next(self, method: str):
+        self.calls.append(method)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def get(self, url, headers, params, timeout, verify):
+        """Return the next queued GET outcome."""
+        return self._next(const.API_REQUEST_TYPES.GET)
+
+    def post(self, url, json, headers, params, timeout, verify):
+        """Return the next queued POST outcome."""
+        return self._next(const.API_REQUEST_TYPES.POST)
+
+    def put(self, url, json, headers, params, timeout, verify):
+        """Return the next queued PUT outcome."""
+        return self._next(const.API_REQUEST_TYPES.PUT)
+
+    async def request(self, method, url, **kwargs):
+        """Return the next queued outcome for an asynchronous request."""
+        return self._next(method)
+
+
+class MockRetryClient:
+    """Minimal pydplus-like object with a retry policy that does not use jitter."""
+
+    def __init__(self, outcomes: list, retry_policy: RetryPolicy = None) -> None:
+        self.strict_mode = True
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {}
+        self.session = QueuedSession(outcomes)
+        self.retry_policy = RetryPolicy(jitter=False) if retry_policy is None else retry_policy
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list:
+    """Record the delays between attempts rather than sleeping."""
+    delays = []
+    monkeypatch.setattr(api.time, 'sleep', delays.append)
+    return delays
+
+
+def test_get_retries_transient_status_codes_with_backoff(sleeps: list) -> None:
+    """Ensure GET requests are retried with exponential backoff until a successful response is returned."""
+    client = MockRetryClient([DummyResponse(503), DummyResponse(502), DummyResponse(200)])
+
+    assert api.get(client, 'v1/users/123') == {}
+    assert client.session.calls == [const.API_REQUEST_TYPES.GET] * 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_after_header_defines_the_delay(sleeps: list) -> None:
+    """Ensure the Retry-After header is honoured in both the seconds and HTTP-date formats."""
+    retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+    client = MockRetryClient(
+        [
+            DummyResponse(429, {const.HEADERS.RETRY_AFTER: '7'}),
+            DummyResponse(503, {const.HEADERS.RETRY_AFTER: retry_at}),
+            DummyResponse(200),
+        ]
+    )
+
+    api.get(client, 'v1/users/123')
+
+    assert sleeps[0] == 7.0
+    assert 25 < sleeps[1] <= 30
+
+
+def test_post_is_only_retried_when_idempotent(sleeps: list) -> None:
+    """Ensure POST requests are not retried after a 503 response unless they are explicitly idempotent."""
+    client = MockRetryClient([DummyResponse(503)])
+    response = api.post(client, 'v1/users/lookup', payload={}, allow_failed_response=True, return_json=False)
+    assert response.status_code == 503
+    assert client.session.calls == [const.API_REQUEST_TYPES.POST]
+
+    client = MockRetryClient([DummyResponse(503), DummyResponse(200)])
+    api.post(client, 'v1/users/lookup', payload={}, idempotent=True)
+    assert client.session.calls == [const.API_REQUEST_TYPES.POST] * 2
+
+
+def test_post_is_retried_after_too_many_requests(sleeps: list) -> None:
+    """Ensure POST requests are retried after a 429 response as the request was not processed."""
+    client = MockRetryClient([DummyResponse(429), DummyResponse(200)])
+
+    api.post(client, 'v1/users/lookup', payload={})
+
+    assert client.session.calls == [const.API_REQUEST_TYPES.POST] * 2
+
+
+def test_connection_errors_are_retried_until_attempts_are_exhausted(sleeps: list) -> None:
+    """Ensure connection errors are retried for PUT requests and raised once the maximum attempts are reached."""
+    outcomes = [requests.exceptions.ConnectionError('reset')] * 2 + [DummyResponse(200)]
+    client = MockRetryClient(outcomes)
+    api.put(client, 'v1/users/123/userStatus', payload={})
+    assert client.session.calls == [const.API_REQUEST_TYPES.PUT] * 3
+
+    client = MockRetryClient([requests.exceptions.Timeout('slow')] * 3)
+    with pytest.raises(requests.exceptions.Timeout):
+        api.put(client, 'v1/users/123/userStatus', payload={})
+    assert len(client.session.calls) == 3
+
+
+def test_per_call_retry_policy_overrides_client_policy(sleeps: list) -> None:
+    """Ensure a retry policy provided for an API call takes precedence over the policy of the client object."""
+    client = MockRetryClient([DummyResponse(503), DummyResponse(200)])
+
+    response = api.get(
+        client, 'v1/users/123', retry_policy=RetryPolicy(max_attempts=1), allow_failed_response=True, return_json=False
+    )
+
+    assert response.status_code == 503
+    assert sleeps == []
+
+
+def test_async_api_call_retries_transient_status_codes(monkeypatch) -> None:
+    """Ensure asynchronous API calls are retried without blocking the event loop."""
+    delays = []
+
+    async def _fake_async_sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    monkeypatch.setattr(async_api.asyncio, 'sleep', _fake_async_sleep)
+    client = MockRetryClient([DummyResponse(504), DummyResponse(200)])
+
+    assert asyncio.run(async_api.get(client, 'v1/users/123')) == {}
+    assert delays == [0.5]
+
+
+def test_retry_policy_backoff_is_capped_and_jittered() -> None:
+    """Ensure the backoff never exceeds the maximum and that jitter stays within the calculated backoff."""
+    policy = RetryPolicy(max_attempts=10, backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.get_delay(_attempt) for _attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    jittered = RetryPolicy(backoff_factor=1, max_backoff=5)
+    assert all(0 <= jittered.get_delay(3) <= 4 for _ in range(50))
+
+
+@pytest.mark.parametrize(
+    'settings, exc_type',
+    [
+        ({'max_attempts': 0}, ValueError),
+        ({'max_attempts': 2.0}, TypeError),
+        ({'backoff_factor': -1}, ValueError),
+        ({'max_backoff': '30'}, TypeError),
+    ],
+)
+def test_retry_policy_rejects_invalid_settings(settings: dict, exc_type) -> None:
+    """Ensure invalid retry policy settings raise an exception."""
+    with pytest.raises(exc_type):
+        RetryPolicy(**settings)
+
+
+def test_client_retry_policy(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the client object uses the default retry policy unless a valid policy is provided."""
+    pydp_object = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+    assert pydp_object.retry_policy == RetryPolicy()
+
+    policy = RetryPolicy(max_attempts=5)
+    pydp_object = PyDPlus(
+        base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False, retry_policy=policy
+    )
+    assert pydp_object.retry_policy is policy
+
+    with pytest.raises(TypeError):
+        PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False, retry_policy=3)
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_token_store
+:Synopsis:          Unit tests for the OAuth token stores and the sharing of access tokens between clients
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pydplus import PyDPlus, auth
+from pydplus import constants as const
+from pydplus.token_store import FileTokenStore, MemoryTokenStore, get_token_store_key
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def token_requests(monkeypatch, sample_connection_info: dict) -> list:
+    """Count the OAuth token requests and slow them down so that concurrent requests overlap."""
+    requests_made = []
+    lock = threading.Lock()
+
+    def _fake_request_oauth_access_token(**kwargs):
+        with lock:
+            requests_made.append(kwargs)
+            access_token = f'token-{len(requests_made)}'
+        time.sleep(0.05)
+        now = int(datetime.datetime.now(datetime.UTC).timestamp())
+        return {
+            'access_token': access_token,
+            'token_type': 'Bearer',
+            'expires_in': 3600,
+            'expires_at': now + 3600,
+            'scope': kwargs['oauth_connection_info'][const.CONNECTION_INFO.OAUTH_SCOPE],
+        }
+
+    monkeypatch.setattr(auth, '_request_oauth_access_token', _fake_request_oauth_access_token)
+    sample_connection_info[const.CONNECTION_INFO.OAUTH][const.CONNECTION_INFO.OAUTH_PRIVATE_KEY_JWK] = (
+        '{"kty":"RSA","n":"abc","e":"AQAB","d":"xyz"}'
+    )
+    return requests_made
+
+
+def _get_access_token(connection_info: dict, token_store, token_data: dict = None, force_refresh: bool = False) -> str:
+    """Retrieve an OAuth access token using a token store and return the access token string."""
+    token_data = auth.get_oauth_access_token(
+        connection_info=connection_info, token_data=token_data, force_refresh=force_refresh, token_store=token_store
+    )
+    return token_data[const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN]
+
+
+def test_file_token_store_round_trip_uses_private_files(tmp_path) -> None:
+    """Ensure token data is stored in files that are only accessible by the current user."""
+    store = FileTokenStore(tmp_path / 'tokens')
+    key = get_token_store_key('https://example.com/oauth', 'client-id', 'rsa.user.read')
+
+    assert store.get(key) is None
+    store.set(key, {'access_token': 'token-1'})
+
+    assert store.get(key) == {'access_token': 'token-1'}
+    token_files = list((tmp_path / 'tokens').glob('*.json'))
+    assert [_file.name for _file in token_files] == [f'{key}.json']
+    assert stat.S_IMODE(token_files[0].stat().st_mode) == 0o600
+    assert stat.S_IMODE((tmp_path / 'tokens').stat().st_mode) == 0o700
+
+    store.delete(key)
+    assert store.get(key) is None
+
+
+def test_file_token_store_restricts_existing_directory(tmp_path) -> None:
+    """Ensure an existing token directory that other users can access is restricted to the current user."""
+    directory = tmp_path / 'shared' / 'tokens'
+    directory.mkdir(parents=True)
+    directory.chmod(0o755)
+
+    FileTokenStore(directory)
+
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+
+
+def test_file_token_store_ignores_unreadable_token_file(tmp_path) -> None:
+    """Ensure a corrupted token file is treated as a missing token."""
+    store = FileTokenStore(tmp_path)
+    (tmp_path / 'corrupted.json').write_text('{"access_token": ', encoding='utf-8')
+
+    assert store.get('corrupted') is None
+
+
+def test_token_store_key_ignores_scope_order() -> None:
+    """Ensure the token store key identifies the issuer, client, and set of scopes."""
+    key = get_token_store_key('https://example.com/oauth', 'client-id', 'rsa.user.read+rsa.group.read')
+
+    assert key == get_token_store_key('https://example.com/oauth', 'client-id', 'rsa.group.read rsa.user.read')
+    assert key != get_token_store_key('https://example.com/oauth', 'other-client-id', 'rsa.user.read+rsa.group.read')
+
+
+def test_file_token_store_shares_a_single_token_between_workers(tmp_path, token_requests: list, sample_connection_info) -> None:
+    """Ensure workers with their own file token store on the same directory share a single token request."""
+    stores = [FileTokenStore(tmp_path) for _ in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        access_tokens = list(executor.map(lambda _store: _get_access_token(sample_connection_info, _store), stores))
+
+    assert len(token_requests) == 1
+    assert set(access_tokens) == {'token-1'}
+
+
+def test_async_workers_share_a_single_token_through_the_file_token_store(
+    monkeypatch, tmp_path, token_requests: list, sample_connection_info
+) -> None:
+    """Ensure asynchronous token requests use the token store without blocking the event loop while waiting."""
+
+    async def _fake_request_oauth_access_token_async(oauth_connection_info, client, timeout):
+        await asyncio.sleep(0)
+        return await asyncio.to_thread(auth._request_oauth_access_token, oauth_connection_info=oauth_connection_info)
+
+    monkeypatch.setattr(auth, '_request_oauth_access_token_async', _fake_request_oauth_access_token_async)
+
+    async def _get_async_access_token(_store) -> str:
+        _headers, _token_data = await auth.get_oauth_headers_async(sample_connection_info, client=None, token_store=_store)
+        return _token_data[const.AUTH_FIELDS.OAUTH_ACCESS_TOKEN]
+
+    async def _run() -> tuple:
+        _ticks = []
+
+        async def _tick() -> None:
+            while True:
+                _ticks.append(1)
+                await asyncio.sleep(0.005)
+
+        _ticker = asyncio.create_task(_tick())
+        _access_tokens = await asyncio.gather(*(_get_async_access_token(FileTokenStore(tmp_path)) for _ in range(8)))
+        _ticker.cancel()
+        return _access_tokens, len(_ticks)
+
+    access_tokens, ticks = asyncio.run(_run())
+
+    assert len(token_requests) == 1
+    assert set(access_tokens) == {'token-1'}
+    assert ticks > 1
+    assert _get_access_token(sample_connection_info, FileTokenStore(tmp_path)) == 'token-1'
+
+
+def test_forced_refresh_reuses_token_already_replaced_in_store(token_requests: list, sample_connection_info) -> None:
+    """Ensure a forced refresh only requests a new token when the stored token is the token being replaced."""
+    store = MemoryTokenStore()
+    stale_token_data = auth.get_oauth_access_token(connection_info=sample_connection_info, token_store=store)
+
+    # The first worker to reject the token requests a new one and the second reuses the replacement from the store
+    assert _get_access_token(sample_connection_info, store, stale_token_data, force_refresh=True) == 'token-2'
+    assert _get_access_token(sample_connection_info, store, stale_token_data, force_refresh=True) == 'token-2'
+    assert len(token_requests) == 2
+
+
+def test_clients_sharing_a_token_store_reuse_tokens(sample_base_url, token_requests: list, sample_connection_info) -> None:
+    """Ensure client objects that share a token store request a single access token."""
+    store = MemoryTokenStore()
+    clients = [
+        PyDPlus(
+            base_url=sample_base_url,
+            connection_info=sample_connection_info,
+            connection_type=const.CONNECTION_INFO.OAUTH,
+            token_store=store,
+        )
+        for _ in range(3)
+    ]
+
+    assert len(token_requests) == 1
+    assert {_client.base_headers[const.HEADERS.AUTHORIZATION] for _client in clients} == {'Bearer token-1'}
+
+
+def test_client_token_store(sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure each client object uses its own memory token store unless a valid token store is provided."""
+    first_client = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+    second_client = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+    assert isinstance(first_client.token_store, MemoryTokenStore)
+    assert first_client.token_store is not second_client.token_store
+
+    with pytest.raises(TypeError):
+        PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False, token_store={})
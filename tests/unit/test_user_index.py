@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+:Module:            tests.unit.test_user_index
+:Synopsis:          Unit tests for the persistent index of email addresses to User IDs
+:Created By:        Jeff Shurtliff
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
+"""
+
+from __future__ import annotations
+
+import stat
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from pydplus import PyDPlus, errors, user_index, users
+from pydplus import constants as const
+from pydplus.user_index import UserIndex
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    """Deterministic wall clock that can be advanced manually."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def fake_clock(monkeypatch) -> FakeClock:
+    """Patch the wall clock used by the user index module with a deterministic clock."""
+    clock = FakeClock()
+    monkeypatch.setattr(user_index.time, 'time', clock.time)
+    return clock
+
+
+class LookupSession:
+    """Minimal session stand-in that resolves user lookups and records every API call."""
+
+    def __init__(self, known_users: dict) -> None:
+        self.known_users = known_users
+        self.calls = []
+
+    def post(self, url, json, headers, params, timeout, verify):
+        """Return the user details for known email addresses and a 404 response otherwise."""
+        email = json[const.QUERY_PARAMS.EMAIL]
+        self.calls.append(('POST', email))
+        response = requests.Response()
+        if email in self.known_users:
+            response.status_code = 200
+            response._content = f'{{"{const.RESPONSE_KEYS.ID}": "{self.known_users[email]}"}}'.encode()
+        else:
+            response.status_code = 404
+            response._content = b'{"error": "not found"}'
+        return response
+
+    def put(self, url, json, headers, params, timeout, verify):
+        """Return a successful response for user status changes."""
+        self.calls.append(('PUT', url))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{}'
+        return response
+
+
+class MockIndexedClient:
+    """Minimal pydplus-like object with an enabled user index."""
+
+    def __init__(self, known_users: dict, index: UserIndex) -> None:
+        self.strict_mode = False
+        self.verify_ssl = True
+        self.connection_type = const.CONNECTION_INFO.LEGACY
+        self.admin_base_rest_url = 'https://example.com/AdminInterface/restapi'
+        self.auth_base_rest_url = None
+        self.base_headers = {const.HEADERS.AUTHORIZATION: 'Bearer legacy-token'}
+        self.session = LookupSession(known_users)
+        self.users = SimpleNamespace(lookup_cache=None, user_index=index)
+
+
+def _get_lookups(pydp_object: MockIndexedClient) -> list:
+    """Return the email addresses that were looked up using the API."""
+    return [_call[1] for _call in pydp_object.session.calls if _call[0] == 'POST']
+
+
+def test_user_index_persists_entries_until_they_are_stale(tmp_path, fake_clock: FakeClock) -> None:
+    """Ensure entries are persisted to a private file, normalized by email address, and expire after the maximum age."""
+    index_path = tmp_path / 'user_index.sqlite3'
+    with UserIndex(index_path, max_age=60) as index:
+        index.set('A@Example.com', 'id-a', {'id': 'id-a', 'status': 'enabled'})
+        index.set('b@example.com', 'id-b')
+
+    with UserIndex(index_path, max_age=60) as index:
+        entry = index.get('a@example.com ')
+        assert (entry.email, entry.user_id, entry.details) == ('a@example.com', 'id-a', {'id': 'id-a', 'status': 'enabled'})
+        fake_clock.now += 61
+        assert index.get('a@example.com') is None
+        assert index.get('a@example.com', max_age=120).user_id == 'id-a'
+        assert index.get_stale_emails(['b@example.com', 'c@example.com', 'b@example.com']) == ['b@example.com', 'c@example.com']
+        assert (index.hits, index.misses) == (2, 3)
+        assert index.prune() == 2
+        assert len(index) == 0
+
+    assert stat.S_IMODE(index_path.stat().st_mode) == 0o600
+    with pytest.raises(ValueError):
+        UserIndex(index_path, max_age=0)
+
+
+def test_user_id_lookups_are_resolved_from_the_index(tmp_path) -> None:
+    """Ensure lookups populate the index, indexed User IDs skip the API call, and not found users are removed."""
+    index = UserIndex(tmp_path / 'user_index.sqlite3')
+    index.set('gone@example.com', 'id-gone')
+    pydp_object = MockIndexedClient({'a@example.com': 'id-a'}, index)
+
+    assert users.get_user_details(pydp_object, 'a@example.com') == {'id': 'id-a'}
+    assert users.get_user_id(pydp_object, 'a@example.com') == 'id-a'
+    assert _get_lookups(pydp_object) == ['a@example.com']
+
+    users.get_user_details(pydp_object, 'gone@example.com')
+    assert index.get('gone@example.com') is None
+
+
+def test_unsynced_user_lookups_bypass_the_index(tmp_path) -> None:
+    """Ensure lookups that search unsynchronized users neither use nor populate the user index."""
+    index = UserIndex(tmp_path / 'user_index.sqlite3')
+    index.set('a@example.com', 'id-indexed')
+    pydp_object = MockIndexedClient({'a@example.com': 'id-a', 'b@example.com': 'id-b'}, index)
+
+    assert users.get_user_id(pydp_object, 'a@example.com', search_unsynced=True) == 'id-a'
+    results = users.get_user_ids_many(pydp_object, ['a@example.com', 'b@example.com'], search_unsynced=True)
+    assert [_result.result for _result in results] == ['id-a', 'id-b']
+    assert index.get('b@example.com') is None
+    assert users.get_user_id(pydp_object, 'a@example.com') == 'id-indexed'
+    assert _get_lookups(pydp_object) == ['a@example.com', 'a@example.com', 'b@example.com']
+
+
+def test_bulk_lookups_only_fetch_missing_and_stale_entries(tmp_path, fake_clock: FakeClock) -> None:
+    """Ensure bulk User ID lookups and index refreshes only call the API for missing or stale entries."""
+    index = UserIndex(tmp_path / 'user_index.sqlite3', max_age=60)
+    index.set('a@example.com', 'id-a')
+    pydp_object = MockIndexedClient({'a@example.com': 'id-a', 'b@example.com': 'id-b'}, index)
+
+    results = users.get_user_ids_many(pydp_object, ['a@example.com', 'b@example.com'])
+    assert [_result.result for _result in results] == ['id-a', 'id-b']
+    assert _get_lookups(pydp_object) == ['b@example.com']
+
+    fake_clock.now += 30
+    users.disable_user(pydp_object, 'id-b')
+    fake_clock.now += 40
+    refreshed = users.refresh_user_index(pydp_object, ['a@example.com', 'b@example.com'], max_workers=1)
+    assert [_result.item for _result in refreshed] == ['a@example.com', 'b@example.com']
+    assert users.refresh_user_index(pydp_object, ['a@example.com', 'b@example.com']) == []
+    assert _get_lookups(pydp_object) == ['b@example.com', 'a@example.com', 'b@example.com']
+
+
+def test_refresh_user_index_requires_enabled_index() -> None:
+    """Ensure refreshing the user index raises an exception when the index is not enabled."""
+    pydp_object = SimpleNamespace(users=SimpleNamespace(user_index=None))
+
+    with pytest.raises(errors.exceptions.FeatureNotConfiguredError):
+        users.refresh_user_index(pydp_object, ['a@example.com'])
+
+
+def test_client_user_index_is_opt_in(monkeypatch, tmp_path, sample_base_url: str, sample_connection_info: dict) -> None:
+    """Ensure the user index is disabled by default and that the default index file is specific to the tenant."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    pydp_object = PyDPlus(base_url=sample_base_url, connection_info=sample_connection_info, auto_connect=False)
+    assert pydp_object.users.user_index is None
+
+    index = pydp_object.users.enable_user_index(max_age=120)
+    assert index.max_age == 120.0
+    assert index.path.parent == tmp_path.joinpath(*const.USER_INDEX_SETTINGS.DEFAULT_DIRECTORY_PARTS)
+    assert index.path.name.startswith('user_index_')
+    assert users._get_user_index(pydp_object) is index
+
+    pydp_object.close()
+    assert pydp_object.users.user_index is None
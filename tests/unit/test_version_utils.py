@@ -3,8 +3,8 @@
 :Module:            tests.unit.test_version_utils
 :Synopsis:          Unit tests for pydplus.utils.version helpers
 :Created By:        Jeff Shurtliff
-:Last Modified:     Jeff Shurtliff (via GPT-5.3-codex)
-:Modified Date:     30 Mar 2026
+:Last Modified:     Jeff Shurtliff
+:Modified Date:     17 Oct 2026
 """
 
 from __future__ import annotations
@@ -18,6 +18,14 @@ from pydplus.utils import version as version_utils
 pytestmark = pytest.mark.unit
 
 
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    """Clear the cached package version before and after each test."""
+    version_utils.get_full_version.cache_clear()
+    yield
+    version_utils.get_full_version.cache_clear()
+
+
 def test_get_major_minor_version_returns_first_two_segments() -> None:
     """Ensure major.minor values are extracted from semantic versions."""
     assert version_utils.get_major_minor_version('2.7.9') == '2.7'
@@ -62,3 +70,18 @@ def test_get_version_from_pyproject_defaults_when_version_missing(tmp_path) -> N
     pyproject_file.write_text('[tool.poetry]\nname = "pydplus"\n', encoding='utf-8')
 
     assert version_utils.get_version_from_pyproject(str(pyproject_file)) == '0.0.0'
+
+
+def test_get_full_version_is_resolved_once(monkeypatch) -> None:
+    """Ensure the package version is only resolved the first time it is requested."""
+    lookups = []
+
+    def _count_version_lookup(_package_name: str) -> str:
+        lookups.append(_package_name)
+        return '7.8.9'
+
+    monkeypatch.setattr(version_utils, 'version', _count_version_lookup)
+
+    assert [version_utils.get_full_version() for _ in range(3)] == ['7.8.9'] * 3
+    assert version_utils.__version__ == '7.8.9'
+    assert lookups == ['pydplus']